@@ -0,0 +1,81 @@
+import unittest
+import random
+import time
+from aminer.analysis.EventCorrelationDetector import EventCorrelationDetector, set_random_seed
+from aminer.input.LogAtom import LogAtom
+from aminer.parsing.ParserMatch import ParserMatch
+from aminer.parsing.MatchElement import MatchElement
+from unit.TestBase import TestBase
+
+
+class EventCorrelationDetectorPerformanceTest(TestBase):
+    """These unittests measure the events per second the EventCorrelationDetector processes when replaying fixed synthetic traces."""
+
+    result_string = "The %s processed in average %d events per second while %s with %s\n"
+    result = ""
+    iterations = 3
+
+    @classmethod
+    def tearDownClass(cls):
+        """Run the TestBase tearDownClass method and print the results."""
+        super(EventCorrelationDetectorPerformanceTest, cls).tearDownClass()
+        print()
+        print(cls.result)
+
+    @staticmethod
+    def generate_trace(seed, length, event_types, repetitions):
+        """
+        Generate bursts of three consecutive event types, where every event is repeated in the burst, followed by pauses.
+        @return a list of log atoms with increasing timestamps.
+        """
+        rnd = random.Random(seed)
+        log_atoms = []
+        t = 1000.0
+        while len(log_atoms) < length:
+            start = rnd.randrange(event_types)
+            for i in range(3):
+                path = f"event/e{(start + i) % event_types}"
+                match_element = MatchElement(path, path.encode(), path.encode(), None)
+                for _ in range(repetitions):
+                    t += 0.001
+                    log_atoms.append(LogAtom(path.encode(), ParserMatch(match_element), t, None))
+            t += rnd.choice([1.0, 3.0, 6.0])
+        return log_atoms[:length]
+
+    def run_test(self, log_atoms, description, **kwargs):
+        """Measure the events per second while learning and checking rules and while only checking the learned rules."""
+        learn_avg = 0
+        check_avg = 0
+        for _ in range(self.iterations):
+            set_random_seed(1)
+            ecd = EventCorrelationDetector(self.aminer_config, [self.stream_printer_event_handler], check_rules_flag=True, learn_mode=True,
+                                           **kwargs)
+            start = time.perf_counter()
+            for log_atom in log_atoms:
+                ecd.receive_atom(log_atom)
+            learn_avg += len(log_atoms) / (time.perf_counter() - start)
+            self.assertTrue(ecd.forward_rules or ecd.back_rules)
+            ecd.learn_mode = False
+            start = time.perf_counter()
+            for log_atom in log_atoms:
+                ecd.receive_atom(log_atom)
+            check_avg += len(log_atoms) / (time.perf_counter() - start)
+            self.reset_output_stream()
+        type(self).result = self.result + self.result_string % (
+            EventCorrelationDetector.__name__, learn_avg / self.iterations, "learning and checking rules", description)
+        type(self).result = self.result + self.result_string % (
+            EventCorrelationDetector.__name__, check_avg / self.iterations, "checking the learned rules", description)
+
+    def test1repeated_events(self):
+        """Replay bursts of 20 event types, where every event is repeated 100 times."""
+        self.run_test(self.generate_trace(1, 20000, 20, 100), "bursts of 20 event types repeated 100 times.", max_hypotheses=5000,
+                      max_observations=100)
+
+    def test2many_event_types(self):
+        """Replay bursts of 50 event types, where every event occurs once, with many candidates for new hypotheses."""
+        self.run_test(self.generate_trace(2, 20000, 50, 1), "bursts of 50 event types occurring once.", max_hypotheses=5000,
+                      max_observations=100, candidates_size=50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ from aminer.events.StreamPrinterEventHandler import StreamPrinterEventHandler
 from aminer.input.LogAtom import LogAtom
 from aminer.AnalysisChild import AnalysisContext
 from aminer.parsing.MatchContext import MatchContext
+from aminer.parsing.JsonModelElement import JsonModelElement
 import time
 import random
 from time import process_time
@@ -27,6 +28,7 @@ class JsonModelElementPerformanceTest(TestBase):
     """These unittests test the performance of the JsonModelElement."""
 
     result_string = "The JsonModelElement could in average handle %d LogAtoms %s\n"
+    strict_json_result_string = "The JsonModelElement could in average handle %d LogAtoms with strict_json=%s %s\n"
     result = ""
     iterations = 10
     waiting_time = 1
@@ -81,6 +83,33 @@ class JsonModelElementPerformanceTest(TestBase):
                     self.state = json_machine(found_json)
                     break
             stream_data = stream_data[i+1:]
+        avg, results = self.measure_performance(json_me, json_data)
+        type(self).result = self.result + self.result_string % (avg, results)
+
+    def test2_suricata_eve_data_strict_json(self):
+        """Compare the performance of the JsonModelElement with and without strict_json with the Suricata EVE demo data."""
+        with open("demo/aminerJsonInputDemo/json_logs/eve.json", "rb") as f:
+            json_data = [line for line in f.read().split(b"\n") if line]
+        spec = importlib.util.spec_from_file_location("aminer_config", "/usr/lib/logdata-anomaly-miner/aminer/YamlConfig.py")
+        aminer_config = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(aminer_config)
+        aminer_config.load_yaml("demo/aminerJsonInputDemo/json-eve-demo.yml")
+        yml_context = AnalysisContext(aminer_config)
+        yml_context.build_analysis_pipeline()
+        json_me = yml_context.atomizer_factory.parsing_model
+        strict_json_me = JsonModelElement(json_me.element_id, json_me.key_parser_dict, json_me.optional_key_prefix,
+                                          json_me.nullable_key_prefix, json_me.allow_all_fields, strict_json=True)
+        # The EVE data is well-formed JSON, so both modes must return the same results.
+        for d in json_data:
+            match_element = json_me.get_match_element("path", MatchContext(d))
+            self.assertIsNotNone(match_element)
+            self.assertEqual(match_element.match_object, strict_json_me.get_match_element("path", MatchContext(d)).match_object)
+        for model_element in (json_me, strict_json_me):
+            avg, results = self.measure_performance(model_element, json_data)
+            type(self).result = self.result + self.strict_json_result_string % (avg, model_element.strict_json, results)
+
+    def measure_performance(self, json_me, json_data):
+        """Measure the average number of LogAtoms handled per waiting_time in every iteration."""
         results = [None] * self.iterations
         avg = 0
         z = 0
@@ -91,7 +120,7 @@ class JsonModelElementPerformanceTest(TestBase):
             z = z + 1
             avg = avg + result * len(json_data)
         avg = int(avg / self.iterations)
-        type(self).result = self.result + self.result_string % (avg, results)
+        return avg, results
 
 
 if __name__ == "__main__":
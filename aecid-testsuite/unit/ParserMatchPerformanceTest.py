@@ -0,0 +1,92 @@
+import unittest
+from aminer.parsing.ParserMatch import ParserMatch
+from aminer.parsing.MatchElement import MatchElement
+from unit.TestBase import TestBase
+from collections import deque
+import timeit
+
+
+def legacy_get_match_dictionary(match_element):
+    """Build the match dictionary like ParserMatch.get_match_dictionary did before the repeated paths were indexed."""
+    stack = deque()
+    stack.append([match_element])
+    result_dict = {}
+    while stack:
+        match_list = stack.pop()
+        counter_dict = {}
+        for test_match in match_list:
+            if test_match.path in counter_dict.keys():  # skipcq: PYL-C0201
+                counter_dict[test_match.path] = 0
+                result_dict[test_match.path] = []
+            else:
+                counter_dict[test_match.path] = None
+        for test_match in match_list:
+            path = test_match.path
+            if counter_dict[path] is not None:
+                try:
+                    pos = next(i for i, x in enumerate(result_dict[test_match.path]) if not isinstance(x, list) and isinstance(
+                        test_match.match_object, type(x.match_object)) and test_match.match_object == x.match_object)
+                    path += f"/{pos}"
+                except StopIteration:
+                    path += "/%d" % counter_dict[path]
+                    counter_dict[test_match.path] += 1
+                result_dict[test_match.path].append(test_match)
+            result_dict[path] = test_match
+            children = test_match.children
+            if children is not None:
+                stack.append(children)
+    return result_dict
+
+
+class ParserMatchPerformanceTest(TestBase):
+    """These unittests test the performance of ParserMatch.get_match_dictionary compared to the previous implementation."""
+
+    result_string = "The %s could in average build %d match dictionaries per second (previous implementation: %d) for %s\n"
+    result = ""
+    iterations = 10
+    number = 20
+
+    @classmethod
+    def tearDownClass(cls):
+        """Run the TestBase tearDownClass method and print the results."""
+        super(ParserMatchPerformanceTest, cls).tearDownClass()
+        print()
+        print(cls.result)
+
+    def run_test(self, match_element, description):
+        """Measure the match dictionaries built per second by both implementations and check if the results are the same."""
+        self.assertEqual(ParserMatch(match_element).get_match_dictionary(), legacy_get_match_dictionary(match_element))
+        avg = 0
+        legacy_avg = 0
+        for _ in range(self.iterations):
+            avg += self.number / timeit.timeit(lambda: ParserMatch(match_element).get_match_dictionary(), number=self.number)
+            legacy_avg += self.number / timeit.timeit(lambda: legacy_get_match_dictionary(match_element), number=self.number)
+        type(self).result = self.result + self.result_string % (
+            ParserMatch.__name__, avg / self.iterations, legacy_avg / self.iterations, description)
+
+    def test1deep_model(self):
+        """Build the match dictionary of a model with 100 nested sequences of three elements each."""
+        depth = 100
+        path = "model"
+        paths = []
+        for i in range(depth):
+            path += f"/seq{i}"
+            paths.append(path)
+        match_element = None
+        for i, path in enumerate(reversed(paths)):
+            children = [MatchElement(f"{path}/fixed", b"fixed", b"fixed", None), MatchElement(f"{path}/value", b"1", i, None)]
+            if match_element is not None:
+                children.append(match_element)
+            match_element = MatchElement(path, b"", b"", children)
+        self.run_test(match_element, f"a model with {depth} nested sequences.")
+
+    def test2repeated_paths(self):
+        """Build the match dictionaries of lists with the same path for all elements, e.g. JSON lists."""
+        for count in (10, 100, 1000):
+            children = [MatchElement("model/list/value", str(i % (count // 2)).encode(), i % (count // 2), None) for i in range(count)]
+            match_element = MatchElement("model/list", b"", b"", children)
+            self.run_test(match_element, f"a list of {count} elements with {count // 2} different values.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import random
+import timeit
+from aminer.AminerConfig import build_persistence_file_name
+from aminer.util import PersistenceUtil
+from unit.TestBase import TestBase
+
+
+class PersistenceCodecPerformanceTest(TestBase):
+    """These unittests compare the time needed to store and load persistence data with the json and the binary persistence codec."""
+
+    result_string = "The %s codec could in average store %d and load %d persistence files per second with %s\n"
+    result = ""
+    iterations = 5
+    number = 3
+
+    @classmethod
+    def tearDownClass(cls):
+        """Run the TestBase tearDownClass method and print the results."""
+        super(PersistenceCodecPerformanceTest, cls).tearDownClass()
+        print()
+        print(cls.result)
+
+    def tearDown(self):
+        """Reset the persistence codec and run the TestBase tearDown method."""
+        PersistenceUtil.set_persistence_codec(PersistenceUtil.PERSISTENCE_CODEC_JSON)
+        super().tearDown()
+
+    def run_test(self, persistence_data, description):
+        """Measure the persistence files stored and loaded per second with both codecs and check if the data is loaded correctly."""
+        for codec in PersistenceUtil.PERSISTENCE_CODECS:
+            PersistenceUtil.set_persistence_codec(codec)
+            file_name = build_persistence_file_name(self.aminer_config, self.__class__.__name__, codec)
+            PersistenceUtil.store_json(file_name, persistence_data)
+            if codec == PersistenceUtil.PERSISTENCE_CODEC_BINARY:
+                self.assertEqual(PersistenceUtil.load_json(file_name), persistence_data)
+            store_avg = 0
+            load_avg = 0
+            for _ in range(self.iterations):
+                store_avg += self.number / timeit.timeit(lambda: PersistenceUtil.store_json(file_name, persistence_data), number=self.number)
+                load_avg += self.number / timeit.timeit(lambda: PersistenceUtil.load_json(file_name), number=self.number)
+            type(self).result = self.result + self.result_string % (codec, store_avg / self.iterations, load_avg / self.iterations, description)
+
+    def test1event_type_detector_model(self):
+        """Store and load data structured like the persistence of an EventTypeDetector with 100 event types and 10 variables each."""
+        random.seed(1)
+        events = 100
+        variables = 10
+        values = 100
+        found_keys = [[f"/model/event{event}/var{var}" for var in range(variables)] for event in range(events)]
+        variable_key_list = [[f"/model/event{event}/var{var}" for var in range(variables)] for event in range(events)]
+        event_values = [[[random.choice([str(random.randint(0, 1000)), random.random() * 100]) for _ in range(values)]
+                         for _ in range(variables)] for _ in range(events)]
+        longest_path = [f"/model/event{event}" for event in range(events)]
+        check_variables = [[True] * variables for _ in range(events)]
+        num_event_lines = [random.randint(0, 100000) for _ in range(events)]
+        id_path_list_tuples = [(f"/model/event{event}/id", event) for event in range(events)]
+        self.run_test([found_keys, variable_key_list, event_values, longest_path, check_variables, num_event_lines, id_path_list_tuples],
+                      f"an EventTypeDetector model with {events} event types, {variables} variables and {values} values each.")
+
+    def test2variable_type_detector_model(self):
+        """Store and load data structured like the persistence of a VariableTypeDetector with 100 event types and 10 variables each."""
+        random.seed(2)
+        events = 100
+        variables = 10
+        values = 100
+        var_type = [[["emp", random.random(), random.random()] if var % 2 else ["d", [str(i) for i in range(10)], [0.1] * 10, True]
+                     for var in range(variables)] for _ in range(events)]
+        alternative_distribution_types = [[[["norm", random.random(), random.random(), random.random()]] for _ in range(variables)]
+                                          for _ in range(events)]
+        var_type_history_list = [[[[random.random() for _ in range(20)] for _ in range(3)] for _ in range(variables)] for _ in range(events)]
+        failed_indicators = [[random.randint(0, 10) for _ in range(variables)] for _ in range(events)]
+        distr_val = [[[random.random() for _ in range(values)] for _ in range(variables)] for _ in range(events)]
+        self.run_test([var_type, alternative_distribution_types, var_type_history_list, [], failed_indicators, distr_val],
+                      f"a VariableTypeDetector model with {events} event types, {variables} variables and {values} values each.")
+
+    def test3value_combo_model(self):
+        """Store and load data structured like the persistence of a NewMatchPathValueComboDetector with 10000 value combinations."""
+        random.seed(3)
+        combos = 10000
+        known_values = [(f"user{random.randint(0, 1000)}".encode(), f"10.0.{random.randint(0, 255)}.{random.randint(0, 255)}".encode(),
+                         random.randint(0, 65535)) for _ in range(combos)]
+        self.run_test(sorted(set(known_values)), f"a NewMatchPathValueComboDetector model with {combos} value combinations.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -177,12 +177,27 @@ class DummyMatchContext:
 
     def __init__(self, match_data: bytes):
         """Initiate the Dummy class."""
-        self.match_data = match_data
+        self.data = match_data
+        self.offset = 0
         self.match_string = b''
 
+    @property
+    def match_data(self):
+        """Get the remaining data."""
+        return self.data[self.offset:]
+
+    @match_data.setter
+    def match_data(self, match_data: bytes):
+        """Set the remaining data."""
+        if len(match_data) <= len(self.data) and self.data.endswith(match_data):
+            self.offset = len(self.data) - len(match_data)
+        else:
+            self.data = match_data
+            self.offset = 0
+
     def update(self, match_string: bytes):
         """Update the data."""
-        self.match_data = self.match_data[len(match_string):]
+        self.offset += len(match_string)
         self.match_string += match_string
 
 
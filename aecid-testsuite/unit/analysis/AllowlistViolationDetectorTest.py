@@ -1,7 +1,10 @@
 import unittest
-from aminer.analysis.Rules import PathExistsMatchRule
+import re
+from aminer.analysis.Rules import PathExistsMatchRule, ValueMatchRule, ValueListMatchRule, StringRegexMatchRule, AndMatchRule, \
+    EventGenerationMatchAction
 from aminer.parsing.FixedDataModelElement import FixedDataModelElement
 from aminer.parsing.MatchContext import MatchContext
+from aminer.parsing.MatchElement import MatchElement
 from aminer.input.LogAtom import LogAtom
 from aminer.parsing.ParserMatch import ParserMatch
 from aminer.analysis.AllowlistViolationDetector import AllowlistViolationDetector
@@ -102,6 +105,69 @@ class AllowlistViolationDetectorTest(TestBase):
         self.assertRaises(TypeError, AllowlistViolationDetector, self.aminer_config, allowlist_rules, [self.stream_printer_event_handler], log_resource_ignore_list=set())
         AllowlistViolationDetector(self.aminer_config, allowlist_rules, [self.stream_printer_event_handler], log_resource_ignore_list=["file:///tmp/syslog"])
 
+    def test3indexed_rules(self):
+        """Test if indexed rules without side effects are matched correctly and rules with match actions are evaluated in order."""
+        fixed_string = b"fixed String"
+        egma = EventGenerationMatchAction("Test.%s" % self.__class__.__name__, "Match action", [self.stream_printer_event_handler])
+        value_rule = ValueMatchRule("match/s1", "other String")
+        value_list_rule = ValueListMatchRule("match/s2", [b"other", fixed_string])
+        regex_rule1 = StringRegexMatchRule("match/s3", re.compile(b"other"))
+        regex_rule2 = StringRegexMatchRule("match/s3", re.compile(b"fix+ed"))
+        and_rule = AndMatchRule([PathExistsMatchRule("match/s4"), ValueMatchRule("match/s4", b"other String")])
+        action_rule = PathExistsMatchRule("match/s5", egma)
+        allowlist_violation_detector = AllowlistViolationDetector(self.aminer_config, [
+            value_rule, value_list_rule, regex_rule1, regex_rule2, and_rule, action_rule], [self.stream_printer_event_handler],
+            output_logline=False)
+
+        t = time.time()
+        for element_id, expected in (("s1", False), ("s2", True), ("s3", True), ("s4", False), ("s5", True)):
+            fixed_dme = FixedDataModelElement(element_id, fixed_string)
+            match_context = MatchContext(fixed_string)
+            match_element = fixed_dme.get_match_element("match", match_context)
+            log_atom = LogAtom(fixed_string, ParserMatch(match_element), t, allowlist_violation_detector)
+            self.assertEqual(allowlist_violation_detector.receive_atom(log_atom), expected)
+            if element_id == "s5":
+                self.assertTrue(self.output_stream.getvalue().startswith("%s Match action\n" % datetime.fromtimestamp(t).strftime(
+                    "%Y-%m-%d %H:%M:%S")))
+            elif expected:
+                self.assertEqual(self.output_stream.getvalue(), "")
+            else:
+                self.assertIn("No allowlisting for current atom", self.output_stream.getvalue())
+            self.reset_output_stream()
+        self.assertEqual(regex_rule1.log_success, 0)
+        self.assertEqual(regex_rule2.log_success, 1)
+        self.assertEqual(value_list_rule.log_success, 1)
+
+    def test4mistyped_rules(self):
+        """Test if ValueMatchRules with values of other types than the match_object are evaluated in the configured order."""
+        t = time.time()
+        value_rule = ValueMatchRule("match/s1", b"1")
+        path_rule = PathExistsMatchRule("match/s1")
+        allowlist_violation_detector = AllowlistViolationDetector(self.aminer_config, [value_rule, path_rule], [
+            self.stream_printer_event_handler], output_logline=False)
+        log_atom = LogAtom(b"1", ParserMatch(MatchElement("match/s1", b"1", 1, None)), t, allowlist_violation_detector)
+        self.assertRaises(TypeError, allowlist_violation_detector.receive_atom, log_atom)
+        self.assertEqual(path_rule.log_total, 0)
+
+        value_rule = ValueMatchRule("match/s1", 1)
+        allowlist_violation_detector = AllowlistViolationDetector(self.aminer_config, [value_rule, path_rule], [
+            self.stream_printer_event_handler], output_logline=False)
+        log_atom = LogAtom(b"1", ParserMatch(MatchElement("match/s1", b"1", b"1", None)), t, allowlist_violation_detector)
+        self.assertRaises(TypeError, allowlist_violation_detector.receive_atom, log_atom)
+        self.assertEqual(path_rule.log_total, 0)
+
+        # The ValueMatchRule converts the string to bytes before the ValueListMatchRule is evaluated.
+        value_rule = ValueMatchRule("match/s1", b"other")
+        value_list_rule = ValueListMatchRule("match/s1", [b"1"])
+        allowlist_violation_detector = AllowlistViolationDetector(self.aminer_config, [value_rule, value_list_rule], [
+            self.stream_printer_event_handler], output_logline=False)
+        log_atom = LogAtom(b"1", ParserMatch(MatchElement("match/s1", b"1", "1", None)), t, allowlist_violation_detector)
+        self.assertTrue(allowlist_violation_detector.receive_atom(log_atom))
+        self.assertEqual(log_atom.parser_match.get_match_dictionary()["match/s1"].match_object, b"1")
+        self.assertEqual(value_rule.log_total, 1)
+        self.assertEqual(value_list_rule.log_success, 1)
+        self.assertEqual(self.output_stream.getvalue(), "")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -485,6 +485,48 @@ class EventCountClusterDetectorTest(TestBase):
         self.assertRaises(TypeError, EventCountClusterDetector, self.aminer_config, [self.stream_printer_event_handler], log_resource_ignore_list=set())
         EventCountClusterDetector(self.aminer_config, [self.stream_printer_event_handler], log_resource_ignore_list=["file:///tmp/syslog"])
 
+    def test7check(self):
+        """The scores must be computed for all known count vectors and the count vector models must follow the changes of the known_counts."""
+        eccd = EventCountClusterDetector(self.aminer_config, [self.stream_printer_event_handler], target_path_list=["/p/value"], id_path_list=["/p/id"],
+            window_size=10, num_windows=3, confidence_factor=0.5, idf=False, norm=False, learn_mode=True, output_logline=False)
+        eccd.known_counts[("x",)] = []
+        self.assertEqual(eccd.check(("x",), {("a",): 1}), 1)
+        eccd.add_to_model(("x",), {("a",): 1, ("b",): 1})
+        eccd.add_to_model(("x",), {("c",): 1, ("b",): 1})
+        # a: |2 - 1| + b: |0 - 1| = 2 and max(2, 1) + max(0, 1) = 3 for the first vector, 4 / 4 for the second vector.
+        self.assertAlmostEqual(eccd.check(("x",), {("a",): 2}), 2 / 3)
+        # the new log event d increases the distance to both vectors.
+        self.assertAlmostEqual(eccd.check(("x",), {("a",): 2, ("d",): 1}), 3 / 4)
+        self.assertEqual(eccd.check(("x",), {("a",): 1, ("b",): 2}), -1)
+        self.assertEqual(eccd.check(("x",), {}), 1)
+
+        eccd.norm = True
+        # a: |1 - 0.5| + b: |0 - 0.5| = 1 and max(1, 0.5) + max(0, 0.5) = 1.5 for the first vector.
+        self.assertAlmostEqual(eccd.check(("x",), {("a",): 2}), 2 / 3)
+        self.assertEqual(eccd.check(("x",), {("a",): 2, ("b",): 2}), -1)
+
+        eccd.norm = False
+        eccd.idf = True
+        eccd.idf_total = {("x",), ("y",)}
+        eccd.idf_counts = {("a",): {("x",), ("y",)}, ("b",): {("x",)}, ("c",): {("x",)}}
+        eccd.idf_version += 1
+        # see test1receive_atom for the computation of the idf weighted score.
+        self.assertAlmostEqual(eccd.check(("x",), {("a",): 1}), 0.477 / 0.653, places=3)
+        eccd.idf = False
+
+        # the oldest vectors are removed from the model.
+        for count_vector in ({("d",): 1}, {("e",): 1}, {("f",): 2}, {("d",): 1}):
+            eccd.add_to_model(("x",), count_vector)
+        self.assertEqual(eccd.known_counts[("x",)], [{("d",): 1}, {("e",): 1}, {("f",): 2}])
+        model = eccd.get_count_vector_model(("x",))
+        self.assertEqual(len(model), 3)
+        self.assertEqual(sorted(model.column_index.keys()), [("d",), ("e",), ("f",)])
+        for row, count_vector in zip(model.matrix, eccd.known_counts[("x",)]):
+            self.assertEqual({log_event: row[column] for log_event, column in model.column_index.items() if row[column]}, count_vector)
+        self.assertEqual(list(model.row_sums), [1, 1, 2])
+        self.assertEqual(eccd.check(("x",), {("f",): 2}), -1)
+        self.assertEqual(eccd.check(("x",), {("a",): 1}), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import time
 import unittest
-from aminer.analysis.EventTypeDetector import EventTypeDetector
+import numpy as np
+from aminer.analysis.EventTypeDetector import EventTypeDetector, ValueBuffer
 from aminer.input.LogAtom import LogAtom
 from aminer.parsing.ParserMatch import ParserMatch
 from aminer.parsing.MatchElement import MatchElement
@@ -528,6 +529,34 @@ class EventTypeDetectorTest(TestBase):
         self.assertRaises(TypeError, EventTypeDetector, self.aminer_config, [self.stream_printer_event_handler], log_resource_ignore_list=set())
         EventTypeDetector(self.aminer_config, [self.stream_printer_event_handler], log_resource_ignore_list=["file:///tmp/syslog"])
 
+    def test5value_buffer(self):
+        """The ValueBuffer must behave like a list of the values, keep the last values contiguous and share float values without copies."""
+        buffer = ValueBuffer(4, [1.0, "a"])
+        self.assertEqual(buffer, [1.0, "a"])
+        buffer.append(2.5)
+        buffer.append("a")
+        buffer.append(3.0)
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(buffer, [1.0, "a", 2.5, "a", 3.0])
+        self.assertEqual(buffer[-1], 3.0)
+        self.assertEqual(buffer[1:3], ["a", 2.5])
+        self.assertEqual(buffer[-2:], ["a", 3.0])
+        self.assertRaises(IndexError, buffer.__getitem__, 5)
+        self.assertIs(buffer[1], buffer[3])
+
+        # the float values are only shared if no strings are in the requested range.
+        self.assertRaises(ValueError, buffer.get_float_array, 2)
+        buffer.keep_last(1)
+        self.assertEqual(buffer, [3.0])
+        buffer.append(4.0)
+        array = buffer.get_float_array(2)
+        self.assertTrue(np.array_equal(array, [3.0, 4.0]))
+        self.assertTrue(np.shares_memory(array, buffer.numbers))
+        self.assertFalse(array.flags.writeable)
+        self.assertEqual(sorted(ValueBuffer(2, [3.0, 1.0, 2.0])), [1.0, 2.0, 3.0])
+        buffer.clear()
+        self.assertEqual(buffer, [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -584,6 +584,42 @@ class HistogramAnalysisTest(TestBase):
         self.assertRaises(TypeError, PathDependentHistogramAnalysis, self.aminer_config, "path", mtbd, 100, [self.stream_printer_event_handler], log_resource_ignore_list=set())
         PathDependentHistogramAnalysis(self.aminer_config, "path", mtbd, 100, [self.stream_printer_event_handler], log_resource_ignore_list=["file:///tmp/syslog"])
 
+    def test7batch_binning(self):
+        """This test case checks if buffered values are binned in batches in the same way as single values."""
+        for bin_definition in (LinearNumericBinDefinition(-2, 3, 5, True), LinearNumericBinDefinition(-2, 3, 5, False),
+                               ModuloTimeBinDefinition(86400, 3600, 0, 1, 24, False)):
+            histogram_data = HistogramData("path", bin_definition)
+            buffered_histogram_data = HistogramData("path", bin_definition)
+            buffered_histogram_data.value_batch_size = 4
+            for value in (-3, -2, 0.5, 1, 4, 12.9, 13, 100, 57599, 57600, 61200.5, 86400, b"value", True):
+                if isinstance(value, bytes) and not isinstance(bin_definition, ModuloTimeBinDefinition) or \
+                        bin_definition.get_bin(value) is None:
+                    continue
+                histogram_data.add_value(value)
+                buffered_histogram_data.buffer_value(value)
+            buffered_histogram_data.flush_values()
+            self.assertEqual(buffered_histogram_data.pending_values, [])
+            self.assertEqual(buffered_histogram_data.bin_data, histogram_data.bin_data)
+            self.assertEqual(buffered_histogram_data.total_elements, histogram_data.total_elements)
+            self.assertEqual(buffered_histogram_data.binned_elements, histogram_data.binned_elements)
+            self.assertEqual(buffered_histogram_data.to_string("  "), histogram_data.to_string("  "))
+
+        # outliers are discarded without outlier bins.
+        histogram_data = HistogramData("path", LinearNumericBinDefinition(0, 1, 10, False))
+        histogram_data.buffer_value(-1)
+        histogram_data.buffer_value(10)
+        histogram_data.buffer_value(5)
+        histogram_data.flush_values()
+        self.assertEqual(histogram_data.total_elements, 1)
+        self.assertEqual(histogram_data.bin_data[5], 1)
+
+        # the p-values are cached by the number of values in the bin and the total number of values.
+        lnbd = LinearNumericBinDefinition(0, 1, 10, True)
+        p_value = lnbd.get_bin_p_value(2, 10, 2)
+        self.assertEqual(lnbd.p_value_cache, {(2, 10): p_value})
+        self.assertEqual(lnbd.get_bin_p_value(3, 10, 2), p_value)
+        self.assertEqual(len(lnbd.p_value_cache), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from aminer.parsing.ParserMatch import ParserMatch
+from aminer.parsing.MatchElement import MatchElement
 from aminer.input.LogAtom import LogAtom
 from aminer.analysis.MissingMatchPathValueDetector import MissingMatchPathValueDetector, MissingMatchPathListValueDetector
 import time
@@ -504,6 +505,45 @@ class MissingMatchPathValueDetectorTest(TestBase):
         self.assertRaises(TypeError, MissingMatchPathValueDetector, self.aminer_config, ["path"], [self.stream_printer_event_handler], log_resource_ignore_list=set())
         MissingMatchPathValueDetector(self.aminer_config, ["path"], [self.stream_printer_event_handler], log_resource_ignore_list=["file:///tmp/syslog"])
 
+    def test8check_timeouts(self):
+        """Timeout checks must only look at the values being overdue and report them in the order they were learned."""
+        mmpvd = MissingMatchPathValueDetector(self.aminer_config, ["host"], [self.stream_printer_event_handler], learn_mode=True,
+                                              default_interval=100, realert_interval=1000, combine_values=False)
+
+        def receive(host, timestamp):
+            data = f"host{host}".encode()
+            self.assertTrue(mmpvd.receive_atom(LogAtom(data, ParserMatch(MatchElement("host", data, data, None)), timestamp, mmpvd)))
+
+        for host in range(100):
+            receive(host, 1000)
+        receive(0, 1050)
+        receive(0, 1090)
+        self.assertEqual(self.output_stream.getvalue(), "")
+        self.assertEqual(mmpvd.log_timeout_checks, 102)
+        self.assertEqual(mmpvd.log_checked_values, 0)
+
+        # all values except host0 are overdue.
+        receive(0, 1150)
+        output = self.output_stream.getvalue()
+        self.assertEqual(output.count("overdue 50s (interval 100)"), 99)
+        self.assertLess(output.index("'host1' overdue"), output.index("'host2' overdue"))
+        self.assertLess(output.index("'host2' overdue"), output.index("'host99' overdue"))
+        self.assertNotIn("'host0'", output)
+        self.assertEqual(mmpvd.log_checked_values, 100)
+        self.assertEqual(mmpvd.expected_values_dict["host1"], [1000, 100, 2150, "host"])
+        self.reset_output_stream()
+
+        # the reported values must not be checked again before they are realerted.
+        receive(0, 1160)
+        self.assertEqual(self.output_stream.getvalue(), "")
+        self.assertEqual(mmpvd.log_checked_values, 100)
+        receive(0, 2150)
+        output = self.output_stream.getvalue()
+        self.assertEqual(output.count("overdue 1050s (interval 100)"), 99)
+        self.assertIn("'host0' overdue 890s (interval 100)", output)
+        self.assertEqual(mmpvd.log_checked_values, 200)
+        self.assertEqual(len(mmpvd.scheduled_checks), 100)
+
 
 if __name__ == "__main__":
     unittest.main()
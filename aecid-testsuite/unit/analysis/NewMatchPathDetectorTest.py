@@ -1,7 +1,9 @@
+import os
 import unittest
 from aminer.analysis.NewMatchPathDetector import NewMatchPathDetector
 from aminer.input.LogAtom import LogAtom
 import time
+from aminer.util import PersistenceUtil
 from datetime import datetime
 from aminer.parsing.ParserMatch import ParserMatch
 from unit.TestBase import TestBase, DummyFixedDataModelElement, DummyMatchContext
@@ -122,8 +124,17 @@ class NewMatchPathDetectorTest(TestBase):
         self.assertTrue(nmpd.receive_atom(log_atom2))
         self.assertEqual(nmpd.known_path_set, {"/s1", "/d1"})
         nmpd.do_persist()
+        # The new values are appended to the journal until it is compacted into the persistence file.
+        with open(nmpd.persistence_file_name + ".journal", "r") as f:
+            self.assertEqual(sorted(f.read().splitlines()), ['"string:/d1"', '"string:/s1"'])
+        self.assertFalse(os.path.exists(nmpd.persistence_file_name))
+        nmpd.persistence_journal.min_compaction_records = 0
+        nmpd.do_persist()
+        PersistenceUtil.wait_for_compactions()
         with open(nmpd.persistence_file_name, "r") as f:
             self.assertEqual(f.read(), '["string:/d1", "string:/s1"]')
+        self.assertFalse(os.path.exists(nmpd.persistence_file_name + ".journal"))
+        self.assertFalse(os.path.exists(nmpd.persistence_file_name + ".journal.compacting"))
 
         nmpd.known_path_set = set()
         nmpd.load_persistence_data()
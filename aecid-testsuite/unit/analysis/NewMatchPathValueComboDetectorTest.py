@@ -1,8 +1,10 @@
+import os
 import unittest
 from aminer.parsing.ParserMatch import ParserMatch
 from aminer.analysis.NewMatchPathValueComboDetector import NewMatchPathValueComboDetector
 from aminer.input.LogAtom import LogAtom
 import time
+from aminer.util import PersistenceUtil
 from unit.TestBase import TestBase, DummyMatchContext, DummyFixedDataModelElement, DummySequenceModelElement
 from datetime import datetime
 from aminer.AminerConfig import DEFAULT_PERSISTENCE_PERIOD
@@ -144,8 +146,17 @@ class NewMatchPathValueComboDetectorTest(TestBase):
         self.assertTrue(nmpvcd.receive_atom(log_atom2))
         self.assertEqual(nmpvcd.known_values_set, {(b"ddd ", b"25538"), (b" pid=", b"25537")})
         nmpvcd.do_persist()
+        # The new values are appended to the journal until it is compacted into the persistence file.
+        with open(nmpvcd.persistence_file_name + ".journal", "r") as f:
+            self.assertEqual(sorted(f.read().splitlines()), ['["bytes: pid=", "bytes:25537"]', '["bytes:ddd ", "bytes:25538"]'])
+        self.assertFalse(os.path.exists(nmpvcd.persistence_file_name))
+        nmpvcd.persistence_journal.min_compaction_records = 0
+        nmpvcd.do_persist()
+        PersistenceUtil.wait_for_compactions()
         with open(nmpvcd.persistence_file_name, "r") as f:
             self.assertEqual(f.read(), '[["bytes: pid=", "bytes:25537"], ["bytes:ddd ", "bytes:25538"]]')
+        self.assertFalse(os.path.exists(nmpvcd.persistence_file_name + ".journal"))
+        self.assertFalse(os.path.exists(nmpvcd.persistence_file_name + ".journal.compacting"))
 
         nmpvcd.known_values_set = set()
         nmpvcd.load_persistence_data()
@@ -1,7 +1,7 @@
 import unittest
 import time
 from datetime import datetime
-from aminer.analysis.SlidingEventFrequencyDetector import SlidingEventFrequencyDetector
+from aminer.analysis.SlidingEventFrequencyDetector import SlidingEventFrequencyDetector, EventTimeWindow, BucketedEventTimeWindow
 from aminer.input.LogAtom import LogAtom
 from aminer.parsing.MatchElement import MatchElement
 from aminer.parsing.ParserMatch import ParserMatch
@@ -384,6 +384,75 @@ class SlidingEventFrequencyDetectorTest(TestBase):
         self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, log_resource_ignore_list=set())
         SlidingEventFrequencyDetector(self.aminer_config, [self.stream_printer_event_handler], 300, log_resource_ignore_list=["file:///tmp/syslog"])
 
+        self.assertRaises(ValueError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, bucket_size=-1)
+        self.assertRaises(ValueError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, bucket_size=0)
+        self.assertRaises(ValueError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, window_size=10, bucket_size=11)
+        self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, bucket_size=True)
+        self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, bucket_size="123")
+        self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, bucket_size=[])
+        SlidingEventFrequencyDetector(self.aminer_config, [self.stream_printer_event_handler], 300, bucket_size=None)
+        SlidingEventFrequencyDetector(self.aminer_config, [self.stream_printer_event_handler], 300, window_size=10, bucket_size=10)
+        SlidingEventFrequencyDetector(self.aminer_config, [self.stream_printer_event_handler], 300, window_size=10, bucket_size=0.5)
+
+    def test3event_time_window(self):
+        """The counts must only contain the times within the window, also when times are received out of order."""
+        window = EventTimeWindow()
+        for timestamp in range(200):
+            window.append(timestamp)
+            self.assertEqual(window.count(timestamp - 10), min(timestamp + 1, 11))
+        self.assertEqual(len(window), 200)
+        self.assertEqual(window.prune(189), 189)
+        self.assertEqual(list(window), list(range(189, 200)))
+        self.assertEqual(window.count(195), 5)
+        self.assertEqual(window.prune(189), 0)
+        window.append(150)
+        self.assertEqual(window.count(150), 12)
+        self.assertEqual(window.count(195), 5)
+        self.assertEqual(window.prune(195), 6)
+        self.assertEqual(list(window), [195, 196, 197, 198, 199, 150])
+        self.assertEqual(window.prune(300), 6)
+        self.assertEqual(len(window), 0)
+
+    def test4bucketed_event_time_window(self):
+        """The counts must contain the occurrences of all buckets ending within the window and the memory must be bounded."""
+        window = BucketedEventTimeWindow(5)
+        for timestamp in range(200):
+            window.append(timestamp)
+            self.assertEqual(window.count(timestamp - 10), min(timestamp + 1, 11 + (timestamp - 10) % 5))
+            self.assertLessEqual(len(window.buckets), 3)
+        window.append(193)
+        self.assertEqual(window.count(189), 16)
+        self.assertEqual(window.prune(190), 5 + 185)
+        self.assertEqual(len(window), 11)
+        self.assertEqual(window.prune(190), 0)
+
+        # anomalies must also be detected with buckets.
+        t = time.time()
+        sefd = SlidingEventFrequencyDetector(self.aminer_config, [self.stream_printer_event_handler], target_path_list=["/value"], scoring_path_list=["/value"], window_size=10, set_upper_limit=2, output_logline=False, bucket_size=1)
+        for i, timestamp in enumerate([t + 1, t + 2, t + 3, t + 4, t + 20]):
+            log_atom = LogAtom(b"a", ParserMatch(MatchElement("/value", b"a", b"a", None)), timestamp, None)
+            sefd.receive_atom(log_atom)
+            self.assertEqual(len(sefd.counts[("a",)]), [1, 2, 3, 4, 1][i])
+        self.assertIn("Frequency exceeds range for the first time", self.output_stream.getvalue())
+        self.assertIn("Frequency anomaly detected", self.output_stream.getvalue())
+        self.assertEqual(list(sefd.scoring_value_list[("a",)]), ["a"])
+
+    def test5get_memory_sizes(self):
+        """The memory of every event must be reported and must not grow with bucketed windows."""
+        sefd = SlidingEventFrequencyDetector(self.aminer_config, [self.stream_printer_event_handler], window_size=1000, set_upper_limit=100000, output_logline=False)
+        bucketed_sefd = SlidingEventFrequencyDetector(self.aminer_config, [self.stream_printer_event_handler], window_size=1000, set_upper_limit=100000, output_logline=False, bucket_size=100)
+        memory_sizes = []
+        for timestamp in range(10000):
+            log_atom = LogAtom(b"a", ParserMatch(MatchElement("/value", b"a", b"a", None)), timestamp, None)
+            sefd.receive_atom(log_atom)
+            bucketed_sefd.receive_atom(log_atom)
+            if timestamp in (1000, 9999):
+                memory_sizes.append(bucketed_sefd.get_memory_sizes()[("/value",)])
+        self.assertEqual(list(sefd.get_memory_sizes().keys()), [("/value",)])
+        self.assertGreater(sefd.get_memory_sizes()[("/value",)], 10000 * 8)
+        self.assertLess(memory_sizes[1], 2 * memory_sizes[0])
+        self.assertEqual(len(bucketed_sefd.counts[("/value",)].buckets), 11)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,193 @@
+import threading
+import time
+import unittest
+from aminer.events.AsyncEventHandler import AsyncEventHandler
+from aminer.events.EventInterfaces import EventHandlerInterface
+from aminer.events.JsonConverterHandler import JsonConverterHandler
+from aminer.events.ScoringEventHandler import ScoringEventHandler
+from aminer.input.LogAtom import LogAtom
+from aminer.parsing.MatchContext import MatchContext
+from aminer.parsing.FixedDataModelElement import FixedDataModelElement
+from aminer.parsing.ParserMatch import ParserMatch
+from unit.TestBase import TestBase
+
+
+class BlockingEventHandler(EventHandlerInterface):
+    """This event handler stores the event messages and blocks on the first event until it is released."""
+
+    def __init__(self):
+        self.event_messages = []
+        self.first_event_received = threading.Event()
+        self.release_event = threading.Event()
+
+    def receive_event(self, event_type, event_message, sorted_loglines, event_data, log_atom, event_source):
+        """Store the event message and wait for the release on the first event."""
+        self.event_messages.append(event_message)
+        if len(self.event_messages) == 1:
+            self.first_event_received.set()
+            self.release_event.wait(10)
+
+
+class BatchEventHandler(EventHandlerInterface):
+    """This event handler supports batches and signals when a batch was received."""
+
+    supports_batches = True
+
+    def __init__(self):
+        self.event_data_list = []
+        self.batch_received = threading.Event()
+
+    def receive_event(self, event_type, event_message, sorted_loglines, event_data, log_atom, event_source):
+        """Store the event data."""
+        self.event_data_list.append(event_data)
+        self.batch_received.set()
+
+
+class AsyncEventHandlerTest(TestBase):
+    """Unittests for the AsyncEventHandler."""
+
+    event_type = 'Analysis.TestDetector'
+    resource_name = b'testresource'
+    sorted_log_lines = ['Event happend at /path/ 5 times.']
+    match_context = MatchContext(b' pid=')
+    fixed_dme = FixedDataModelElement('s1', b' pid=')
+    match_element = fixed_dme.get_match_element("match", match_context)
+
+    def setUp(self):
+        """Set up the log atom."""
+        super().setUp()
+        self.log_atom = LogAtom(self.fixed_dme.fixed_data, ParserMatch(self.match_element), time.time(), self)
+
+    def send_events(self, async_event_handler, event_messages):
+        """Send events with the event_messages to the async_event_handler."""
+        for event_message in event_messages:
+            async_event_handler.receive_event(self.event_type, event_message, self.sorted_log_lines, {}, self.log_atom, self)
+
+    def test1forward_events(self):
+        """The events must be forwarded in order and result in the same output as when the event handler is used directly."""
+        self.analysis_context.register_component(self, 'TestDetector')
+        async_event_handler = AsyncEventHandler(self.stream_printer_event_handler, self.analysis_context)
+        self.send_events(async_event_handler, ['first event', 'second event'])
+        async_event_handler.flush()
+        async_output = self.output_stream.getvalue()
+        self.reset_output_stream()
+        self.send_events(self.stream_printer_event_handler, ['first event', 'second event'])
+        self.assertEqual(async_output, self.output_stream.getvalue())
+        self.assertEqual(async_event_handler.get_queue_statistics()['HandledEvents'], 2)
+        async_event_handler.close()
+        self.assertIsNone(async_event_handler.worker_thread)
+
+    def test2overflow_policy_drop_oldest(self):
+        """The oldest events in the queue must be dropped when the queue is full."""
+        blocking_event_handler = BlockingEventHandler()
+        async_event_handler = AsyncEventHandler(blocking_event_handler, self.analysis_context, queue_size=2, overflow_policy='drop_oldest')
+        self.send_events(async_event_handler, ['1'])
+        self.assertTrue(blocking_event_handler.first_event_received.wait(10))
+        self.send_events(async_event_handler, ['2', '3', '4', '5'])
+        self.assertEqual(async_event_handler.get_queue_statistics()['QueueDepth'], 2)
+        blocking_event_handler.release_event.set()
+        async_event_handler.close()
+        self.assertEqual(blocking_event_handler.event_messages, ['1', '4', '5'])
+        statistics = async_event_handler.get_queue_statistics()
+        self.assertEqual(statistics['QueuedEvents'], 5)
+        self.assertEqual(statistics['DroppedEvents'], 2)
+        self.assertEqual(statistics['MaxQueueDepth'], 2)
+
+    def test3overflow_policy_sample(self):
+        """Only every sample_interval-th overflowing event must be kept when the queue is full."""
+        blocking_event_handler = BlockingEventHandler()
+        async_event_handler = AsyncEventHandler(
+            blocking_event_handler, self.analysis_context, queue_size=1, overflow_policy='sample', sample_interval=2)
+        self.send_events(async_event_handler, ['1'])
+        self.assertTrue(blocking_event_handler.first_event_received.wait(10))
+        self.send_events(async_event_handler, ['2', '3', '4', '5', '6'])
+        blocking_event_handler.release_event.set()
+        async_event_handler.close()
+        self.assertEqual(blocking_event_handler.event_messages, ['1', '6'])
+        self.assertEqual(async_event_handler.get_queue_statistics()['DroppedEvents'], 4)
+
+    def test4overflow_policy_block(self):
+        """No event must be dropped when the queue is full, but the sender must wait until the event was taken from the queue."""
+        blocking_event_handler = BlockingEventHandler()
+        async_event_handler = AsyncEventHandler(blocking_event_handler, self.analysis_context, queue_size=1)
+        self.send_events(async_event_handler, ['1'])
+        self.assertTrue(blocking_event_handler.first_event_received.wait(10))
+        self.send_events(async_event_handler, ['2'])
+        timer = threading.Timer(0.2, blocking_event_handler.release_event.set)
+        timer.start()
+        start_time = time.time()
+        self.send_events(async_event_handler, ['3'])
+        self.assertGreater(time.time() - start_time, 0.1)
+        async_event_handler.close()
+        timer.join()
+        self.assertEqual(blocking_event_handler.event_messages, ['1', '2', '3'])
+        statistics = async_event_handler.get_queue_statistics()
+        self.assertEqual(statistics['DroppedEvents'], 0)
+        self.assertGreater(statistics['MaxLatency'], 0.1)
+
+        # The statistics must be reset after they were logged.
+        async_event_handler.log_statistics('AsyncEventHandler')
+        statistics = async_event_handler.get_queue_statistics()
+        self.assertEqual(statistics['QueuedEvents'], 0)
+        self.assertEqual(statistics['HandledEvents'], 0)
+        self.assertEqual(statistics['MaxLatency'], 0)
+
+    def test5output_event_handlers(self):
+        """Only events of detectors with the AsyncEventHandler in their output_event_handlers must be forwarded."""
+        self.analysis_context.register_component(self, 'TestDetector')
+        async_event_handler = AsyncEventHandler(self.stream_printer_event_handler, self.analysis_context)
+        self.output_event_handlers = []
+        self.send_events(async_event_handler, ['first event'])
+        async_event_handler.flush()
+        self.assertEqual(self.output_stream.getvalue(), '')
+        self.output_event_handlers = [async_event_handler]
+        self.send_events(async_event_handler, ['second event'])
+        async_event_handler.close()
+        self.assertIn('second event', self.output_stream.getvalue())
+
+    def test6validate_input(self):
+        """Check if the parameters are validated."""
+        self.assertRaises(TypeError, AsyncEventHandler, None, self.analysis_context)
+        self.assertRaises(TypeError, AsyncEventHandler, self.stream_printer_event_handler, self.analysis_context, queue_size=1.5)
+        self.assertRaises(TypeError, AsyncEventHandler, self.stream_printer_event_handler, self.analysis_context, queue_size=True)
+        self.assertRaises(ValueError, AsyncEventHandler, self.stream_printer_event_handler, self.analysis_context, queue_size=0)
+        self.assertRaises(ValueError, AsyncEventHandler, self.stream_printer_event_handler, self.analysis_context, sample_interval=0)
+        self.assertRaises(ValueError, AsyncEventHandler, self.stream_printer_event_handler, self.analysis_context,
+                          overflow_policy='drop_newest')
+        AsyncEventHandler(self.stream_printer_event_handler, self.analysis_context, queue_size=1, overflow_policy='sample', sample_interval=1)
+
+    def test7batch_timeout(self):
+        """The batches of a wrapped JsonConverterHandler must be sent by the background thread when the batch_timeout elapsed."""
+        self.analysis_context.register_component(self, 'TestDetector')
+        batch_event_handler = BatchEventHandler()
+        json_converter_handler = JsonConverterHandler(
+            [batch_event_handler], self.analysis_context, pretty_print=False, batch_size=10, batch_timeout=0.2)
+        async_event_handler = AsyncEventHandler(json_converter_handler, self.analysis_context)
+        self.assertEqual(async_event_handler.batch_event_handlers, [json_converter_handler])
+        start_time = time.time()
+        self.send_events(async_event_handler, ['first event', 'second event'])
+        async_event_handler.flush()
+        self.assertEqual(batch_event_handler.event_data_list, [])
+        # No further events are received, so only the background thread can send the batch.
+        self.assertTrue(batch_event_handler.batch_received.wait(10))
+        self.assertGreaterEqual(time.time() - start_time, 0.2)
+        self.assertEqual(len(batch_event_handler.event_data_list), 1)
+        self.assertEqual(len(batch_event_handler.event_data_list[0].split('\n')), 2)
+        async_event_handler.close()
+        self.assertIsNone(async_event_handler.worker_thread)
+        self.assertEqual(len(batch_event_handler.event_data_list), 1)
+
+        # The JsonConverterHandlers wrapped in a ScoringEventHandler are found too.
+        scoring_event_handler = ScoringEventHandler([json_converter_handler], self.analysis_context)
+        self.assertEqual(AsyncEventHandler(scoring_event_handler, self.analysis_context).batch_event_handlers, [json_converter_handler])
+
+        # Without batches the background thread waits for events only.
+        json_converter_handler = JsonConverterHandler([batch_event_handler], self.analysis_context, batch_timeout=0.2)
+        async_event_handler = AsyncEventHandler(json_converter_handler, self.analysis_context)
+        self.assertEqual(async_event_handler.batch_event_handlers, [])
+        self.assertIsNone(async_event_handler.get_batch_wait_time())
+        self.assertEqual(AsyncEventHandler(self.stream_printer_event_handler, self.analysis_context).batch_event_handlers, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
+import json
 import time
 import unittest
+from aminer.events.EventInterfaces import EventHandlerInterface
 from aminer.events.JsonConverterHandler import JsonConverterHandler
 from aminer.input.LogAtom import LogAtom
 from aminer.parsing.MatchContext import MatchContext
@@ -8,6 +10,19 @@ from aminer.parsing.ParserMatch import ParserMatch
 from unit.TestBase import TestBase
 
 
+class BatchEventHandler(EventHandlerInterface):
+    """This event handler supports batches and stores the received event data."""
+
+    supports_batches = True
+
+    def __init__(self):
+        self.event_data_list = []
+
+    def receive_event(self, event_type, event_message, sorted_loglines, event_data, log_atom, event_source):
+        """Store the event data."""
+        self.event_data_list.append(event_data)
+
+
 class JsonConverterHandlerTest(TestBase):
     """Unittests for the JsonConverterHandler."""
 
@@ -45,6 +60,97 @@ class JsonConverterHandlerTest(TestBase):
         self.assertEqual(self.output_stream.getvalue(), self.expected_string % (
             self.__class__.__name__, self.description, self.event_message, self.persistence_id, round(self.t, 2), detection_timestamp, ""))
 
+    def test2receive_compact_event(self):
+        """The json output without pretty printing must be in a single line and contain the same data."""
+        log_atom = LogAtom(self.fixed_dme.fixed_data, ParserMatch(self.match_element), self.t, self)
+        self.analysis_context.register_component(self, self.description)
+        json_converter_handler = JsonConverterHandler([self.stream_printer_event_handler], self.analysis_context, pretty_print=False)
+        event_data = {'AnalysisComponent': {'AffectedParserPaths': ['test/path/1', 'test/path/2']}}
+        json_converter_handler.receive_event(self.test_detector, self.event_message, self.sorted_log_lines, event_data, log_atom, self)
+        compact_output = self.output_stream.getvalue()
+        self.reset_output_stream()
+        json_converter_handler = JsonConverterHandler([self.stream_printer_event_handler], self.analysis_context)
+        event_data = {'AnalysisComponent': {'AffectedParserPaths': ['test/path/1', 'test/path/2']}}
+        json_converter_handler.receive_event(self.test_detector, self.event_message, self.sorted_log_lines, event_data, log_atom, self)
+        self.assertEqual(compact_output.strip().count('\n'), 0)
+        compact_data = json.loads(compact_output)
+        self.assertEqual(compact_output, json.dumps(compact_data) + '\n')
+        pretty_data = json.loads(self.output_stream.getvalue())
+        del compact_data['LogData']['DetectionTimestamp']
+        del pretty_data['LogData']['DetectionTimestamp']
+        self.assertEqual(compact_data, pretty_data)
+
+    def test3receive_batches(self):
+        """Event handlers supporting batches must receive newline-delimited json batches, other event handlers single events."""
+        log_atom = LogAtom(self.fixed_dme.fixed_data, ParserMatch(self.match_element), self.t, self)
+        self.analysis_context.register_component(self, self.description)
+        batch_event_handler = BatchEventHandler()
+        json_converter_handler = JsonConverterHandler(
+            [batch_event_handler, self.stream_printer_event_handler], self.analysis_context, batch_size=2, batch_timeout=10)
+        for i in range(3):
+            event_data = {'AnalysisComponent': {'AffectedParserPaths': ['test/path/%d' % i]}}
+            json_converter_handler.receive_event(self.test_detector, self.event_message, self.sorted_log_lines, event_data, log_atom, self)
+        self.assertEqual(self.output_stream.getvalue().count('"AnalysisComponentIdentifier"'), 3)
+        self.assertEqual(len(batch_event_handler.event_data_list), 1)
+        self.assertEqual([json.loads(line)['AnalysisComponent']['AffectedParserPaths'] for line in
+                          batch_event_handler.event_data_list[0].split('\n')], [['test/path/0'], ['test/path/1']])
+
+        # The last batch is only sent when the batch_timeout elapsed or when all batches are flushed.
+        json_converter_handler.flush_batches(time.time())
+        self.assertEqual(len(batch_event_handler.event_data_list), 1)
+        json_converter_handler.flush_batches(time.time() + 10)
+        self.assertEqual(len(batch_event_handler.event_data_list), 2)
+        self.assertEqual(json.loads(batch_event_handler.event_data_list[1])['AnalysisComponent']['AffectedParserPaths'], ['test/path/2'])
+        json_converter_handler.flush_batches()
+        self.assertEqual(len(batch_event_handler.event_data_list), 2)
+
+        # Without a batch_size the events are sent one by one.
+        json_converter_handler = JsonConverterHandler([batch_event_handler], self.analysis_context, pretty_print=False)
+        event_data = {'AnalysisComponent': {'AffectedParserPaths': ['test/path/3']}}
+        json_converter_handler.receive_event(self.test_detector, self.event_message, self.sorted_log_lines, event_data, log_atom, self)
+        self.assertEqual(len(batch_event_handler.event_data_list), 3)
+
+    def test4renamed_component(self):
+        """The cached component data must not be used after the component was renamed."""
+        log_atom = LogAtom(self.fixed_dme.fixed_data, ParserMatch(self.match_element), self.t, self)
+        self.analysis_context.register_component(self, self.description)
+        batch_event_handler = BatchEventHandler()
+        json_converter_handler = JsonConverterHandler([batch_event_handler], self.analysis_context)
+        json_converter_handler.receive_event(self.test_detector, self.event_message, self.sorted_log_lines, {}, log_atom, self)
+        self.analysis_context.registered_components_by_name[self.description] = None
+        self.analysis_context.registered_components_by_name['renamedDescription'] = self
+        json_converter_handler.receive_event(self.test_detector, self.event_message, self.sorted_log_lines, {}, log_atom, self)
+        self.assertEqual([json.loads(event_data)['AnalysisComponent']['AnalysisComponentName'] for event_data in
+                          batch_event_handler.event_data_list], [self.description, 'renamedDescription'])
+
+    def test5validate_input(self):
+        """Check if the batch parameters are validated."""
+        self.assertRaises(TypeError, JsonConverterHandler, [], self.analysis_context, batch_size=1.5)
+        self.assertRaises(TypeError, JsonConverterHandler, [], self.analysis_context, batch_size=True)
+        self.assertRaises(ValueError, JsonConverterHandler, [], self.analysis_context, batch_size=0)
+        self.assertRaises(TypeError, JsonConverterHandler, [], self.analysis_context, batch_timeout="1")
+        self.assertRaises(ValueError, JsonConverterHandler, [], self.analysis_context, batch_timeout=-1)
+        JsonConverterHandler([], self.analysis_context, batch_size=100, batch_timeout=0.5)
+
+    def test6serialize_special_values(self):
+        """Single events must be serialized like with json.dumps, while batched events write UTF-8 and NaN as null."""
+        log_atom = LogAtom(self.fixed_dme.fixed_data, ParserMatch(self.match_element), self.t, self)
+        self.analysis_context.register_component(self, self.description)
+        batch_event_handler = BatchEventHandler()
+        json_converter_handler = JsonConverterHandler([batch_event_handler], self.analysis_context, pretty_print=False)
+        event_data = {'Value': float('nan'), 'Text': 'Gr\u00fc\u00dfe'}
+        json_converter_handler.receive_event(self.test_detector, self.event_message, self.sorted_log_lines, event_data, log_atom, self)
+        self.assertIn('"Value": NaN, "Text": "Gr\\u00fc\\u00dfe"', batch_event_handler.event_data_list[0])
+
+        json_converter_handler = JsonConverterHandler([batch_event_handler], self.analysis_context, batch_size=2)
+        event_data = {'Value': float('nan'), 'Text': 'Gr\u00fc\u00dfe'}
+        json_converter_handler.receive_event(self.test_detector, self.event_message, self.sorted_log_lines, event_data, log_atom, self)
+        json_converter_handler.receive_event(
+            self.test_detector, self.event_message, self.sorted_log_lines, {'Value': 2**70}, log_atom, self)
+        json_lines = batch_event_handler.event_data_list[1].split('\n')
+        self.assertIn('"Value":null,"Text":"Gr\u00fc\u00dfe"', json_lines[0])
+        self.assertEqual(json.loads(json_lines[1])['Value'], 2**70)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,35 @@
 import unittest
 from aminer.input.ByteStreamLineAtomizer import ByteStreamLineAtomizer
+from aminer.input.InputInterfaces import AtomHandlerInterface
+from aminer.input.ParserProcessPool import ParserProcessPool
 from aminer.parsing.MatchContext import MatchContext
 from aminer.parsing.AnyByteDataModelElement import AnyByteDataModelElement
+from aminer.parsing.DecimalIntegerValueModelElement import DecimalIntegerValueModelElement
+from aminer.parsing.FixedDataModelElement import FixedDataModelElement
+from aminer.parsing.SequenceModelElement import SequenceModelElement
+import os
+import signal
 import sys
+from io import StringIO
 from unit.TestBase import TestBase
 
 
+class CollectingAtomHandler(AtomHandlerInterface):
+    """Store all received log atoms and refuse them after max_atoms atoms were received."""
+
+    def __init__(self, max_atoms=None):
+        super().__init__()
+        self.log_atoms = []
+        self.max_atoms = max_atoms
+
+    def receive_atom(self, log_atom):
+        """Store the log atom if max_atoms is not reached."""
+        if self.max_atoms is not None and len(self.log_atoms) >= self.max_atoms:
+            return False
+        self.log_atoms.append(log_atom)
+        return True
+
+
 class ByteStreamLineAtomizerTest(TestBase):
     """Unittests for the ByteStreamLineAtomizer."""
 
@@ -121,6 +145,131 @@ class ByteStreamLineAtomizerTest(TestBase):
             single_line_json_data.rsplit(b'}', 2)[0]) + 1)
         self.assertEqual(self.output_stream.getvalue(), '')
 
+    def test8parallel_parsing(self):
+        """Check if lines parsed by the ParserProcessPool are dispatched in the original order with the same parser matches."""
+        model = SequenceModelElement('seq', [FixedDataModelElement('fixed', b'value '), DecimalIntegerValueModelElement('value')])
+        data = b''.join(b'value %d\n' % i for i in range(250)) + b'unparsed\n' + b'x' * 50 + b'\nvalue 250\nvalue 2'
+        parser_process_pool = ParserProcessPool(2, 100)
+        handler = CollectingAtomHandler()
+        atomizer = ByteStreamLineAtomizer(
+            model, [handler], [self.stream_printer_event_handler], 40, [], use_real_time=True, parser_process_pool=parser_process_pool)
+        sequential_handler = CollectingAtomHandler()
+        sequential_atomizer = ByteStreamLineAtomizer(
+            model, [sequential_handler], [self.stream_printer_event_handler], 40, [], use_real_time=True)
+        try:
+            self.assertEqual(atomizer.consume_data(data, False), sequential_atomizer.consume_data(data, False))
+        finally:
+            parser_process_pool.close()
+        self.assertEqual(len(handler.log_atoms), 252)
+        self.assertEqual(len(handler.log_atoms), len(sequential_handler.log_atoms))
+        for log_atom, sequential_log_atom in zip(handler.log_atoms, sequential_handler.log_atoms):
+            self.assertEqual(log_atom.raw_data, sequential_log_atom.raw_data)
+            self.assertEqual(log_atom.source, atomizer)
+            if sequential_log_atom.parser_match is None:
+                self.assertIsNone(log_atom.parser_match)
+            else:
+                self.assertEqual(log_atom.parser_match.get_match_element().annotate_match(""),
+                                 sequential_log_atom.parser_match.get_match_element().annotate_match(""))
+        self.assertEqual(handler.log_atoms[100].parser_match.get_match_dictionary()["/seq/value"].match_object, 100)
+        self.assertIsNone(handler.log_atoms[250].parser_match)
+        self.assertEqual(self.output_stream.getvalue().count("Overlong line detected"), 2)
+
+    def test9parallel_parsing_blocked_downstream(self):
+        """Check if the consumed length and the last unconsumed log atom are correct when the downstream handler refuses atoms."""
+        model = SequenceModelElement('seq', [FixedDataModelElement('fixed', b'value '), DecimalIntegerValueModelElement('value')])
+        data = b''.join(b'value %d\n' % i for i in range(20))
+        parser_process_pool = ParserProcessPool(2, 10)
+        handler = CollectingAtomHandler(5)
+        atomizer = ByteStreamLineAtomizer(
+            model, [handler], [self.stream_printer_event_handler], 300, [], use_real_time=True, parser_process_pool=parser_process_pool)
+        try:
+            consumed_length = atomizer.consume_data(data, False)
+            self.assertEqual(consumed_length, len(b''.join(b'value %d\n' % i for i in range(5))))
+            self.assertEqual(atomizer.last_unconsumed_log_atom.raw_data, b'value 5')
+            self.assertEqual(atomizer.consume_data(data[consumed_length:], False), -1)
+            handler.max_atoms = None
+            self.assertEqual(atomizer.consume_data(data[consumed_length:], False), len(data) - consumed_length)
+        finally:
+            parser_process_pool.close()
+        self.assertEqual([log_atom.parser_match.get_match_dictionary()["/seq/value"].match_object for log_atom in handler.log_atoms],
+                         list(range(20)))
+
+    def test13consume_bytearray_buffer(self):
+        """Check if the lines are copied out of a bytearray buffer and the buffer can be resized afterwards like in the LogStream."""
+        handler = CollectingAtomHandler()
+        any_dme = AnyByteDataModelElement('s')
+        byte_stream_line_atomizer = ByteStreamLineAtomizer(any_dme, [handler], [self.stream_printer_event_handler], 10, [], use_real_time=True)
+        stream_data = bytearray(b'line1\nline2\nlongerthanallowed\nend')
+        consumed_length = byte_stream_line_atomizer.consume_data(stream_data, True)
+        self.assertEqual(consumed_length, len(stream_data))
+        del stream_data[:consumed_length]
+        self.assertEqual(stream_data, bytearray())
+        self.assertEqual([log_atom.raw_data for log_atom in handler.log_atoms], [b'line1', b'line2'])
+        self.assertTrue(all(type(log_atom.raw_data) is bytes for log_atom in handler.log_atoms))
+        self.assertEqual(self.output_stream.getvalue(), 'Overlong line detected (1 lines)\n  longerthanallowed\n\nIncomplete last line (1 lines)\n  end\n\n')
+
+
+    def test10json_format_chunked_data(self):
+        """Check if json objects split over several consume_data calls result in the same log atoms as when the data is consumed at once."""
+        json_data = b'{"a": 1, "b": "}{"}\n{\n\t"a": 2,\n\t"b": {"c": "\\""}\n}\n\n{"a": 3}{"a": 4}\n'
+        any_dme = AnyByteDataModelElement('s')
+        handler = CollectingAtomHandler()
+        byte_stream_line_atomizer = ByteStreamLineAtomizer(
+            any_dme, [handler], [self.stream_printer_event_handler], 300, [], json_format=True, use_real_time=True)
+        self.assertEqual(byte_stream_line_atomizer.consume_data(json_data, False), len(json_data))
+        expected_raw_data = [log_atom.raw_data for log_atom in handler.log_atoms]
+        self.assertEqual(expected_raw_data, [b'{"a": 1, "b": "}{"}', b'{\n\t"a": 2,\n\t"b": {"c": "\\""}\n}', b'\n{"a": 3}', b'{"a": 4}'])
+        for chunk_size in range(1, 12):
+            handler.log_atoms = []
+            stream_data = bytearray()
+            for pos in range(0, len(json_data), chunk_size):
+                stream_data += json_data[pos:pos + chunk_size]
+                consumed_length = byte_stream_line_atomizer.consume_data(stream_data, False)
+                if consumed_length > 0:
+                    del stream_data[:consumed_length]
+            # whitespace after an object is only consumed with the object if it was already available.
+            self.assertEqual(stream_data.strip(), b'')
+            self.assertEqual([log_atom.raw_data.strip() for log_atom in handler.log_atoms],
+                             [raw_data.strip() for raw_data in expected_raw_data])
+        self.assertEqual(self.output_stream.getvalue(), '')
+
+    def test11overlong_line_terminated_by_end_of_stream(self):
+        """Check if an overlong line in a bytearray buffer is reported when the stream ends before the end of the line."""
+        any_dme = AnyByteDataModelElement('s')
+        byte_stream_line_atomizer = ByteStreamLineAtomizer(any_dme, [], [self.stream_printer_event_handler], 10, [], use_real_time=True)
+        stream_data = bytearray(b'a' * 20)
+        self.assertEqual(byte_stream_line_atomizer.consume_data(stream_data, False), len(stream_data))
+        self.assertEqual(self.output_stream.getvalue(), 'Start of overlong line detected (1 lines)\n  %s\n\n' % ('a' * 20))
+        self.reset_output_stream()
+        stream_data = bytearray(b'b' * 5)
+        self.assertEqual(byte_stream_line_atomizer.consume_data(stream_data, True), len(stream_data))
+        self.assertEqual(self.output_stream.getvalue(), 'Overlong line terminated by end of stream (1 lines)\n  bbbbb\n\n')
+        self.assertFalse(byte_stream_line_atomizer.in_overlong_line_flag)
+
+    def test12parallel_parsing_dead_worker(self):
+        """Check if the lines are parsed in the analysis process when a worker process was killed instead of blocking forever."""
+        model = SequenceModelElement('seq', [FixedDataModelElement('fixed', b'value '), DecimalIntegerValueModelElement('value')])
+        data = b''.join(b'value %d\n' % i for i in range(20))
+        parser_process_pool = ParserProcessPool(2, 10)
+        handler = CollectingAtomHandler()
+        atomizer = ByteStreamLineAtomizer(
+            model, [handler], [self.stream_printer_event_handler], 300, [], use_real_time=True, parser_process_pool=parser_process_pool)
+        old_stderr = sys.stderr
+        sys.stderr = StringIO()
+        try:
+            parser_process_pool.start()
+            worker = next(iter(parser_process_pool.executor._processes.values()))
+            os.kill(worker.pid, signal.SIGKILL)
+            worker.join()
+            self.assertEqual(atomizer.consume_data(data, False), len(data))
+            self.assertIn("A parser worker process terminated abruptly", sys.stderr.getvalue())
+        finally:
+            sys.stderr = old_stderr
+            parser_process_pool.close()
+        self.assertIsNone(parser_process_pool.executor)
+        self.assertEqual([log_atom.parser_match.get_match_dictionary()["/seq/value"].match_object for log_atom in handler.log_atoms],
+                         list(range(20)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from aminer.input.JsonObjectScanner import JsonObjectScanner, SCAN_COMPLETE, SCAN_INCOMPLETE, SCAN_INVALID, SCAN_OVERLONG
+from unit.TestBase import TestBase
+
+
+class JsonObjectScannerTest(TestBase):
+    """Unittests for the JsonObjectScanner."""
+
+    def test1complete_objects(self):
+        """The end of single- and multi-lined objects must be found, also if strings contain brackets, quotes or backslashes."""
+        scanner = JsonObjectScanner()
+        for json_data in [b'{}', b'{"a": 1, "b": {"c": [1, {"d": null}]}}', b'{\n\t"a": "}]{[,",\n\t"b": [\n\t\t"\\"}"\n\t]\n}',
+                          b'{"a\\\\": "\\\\", "b": "\\u00e4"}', b' \n\t{ }', '{"ä": "ö"}'.encode()]:
+            self.assertEqual(scanner.scan(json_data + b'{"a": 1}\n', 0, 1000), (SCAN_COMPLETE, len(json_data)))
+            self.assertEqual(scanner.scan(b'\n' + json_data, 1, 1000), (SCAN_COMPLETE, len(json_data) + 1))
+
+    def test2invalid_objects(self):
+        """Data not starting with an object, mismatching brackets and keys not starting with a quote must be invalid."""
+        scanner = JsonObjectScanner()
+        for json_data in [b'some log line', b'[1, 2]', b' }', b'{"a": [1}', b'{"a": {"b": 1]}', b'{ garbage', b'{"a": 1, b}', b'{"a": 1,}']:
+            self.assertEqual(scanner.scan(json_data, 0, 1000), (SCAN_INVALID, None))
+        # the scanner must not keep any state after invalid data.
+        self.assertEqual(scanner.scan(b'{"a": 1}', 0, 1000), (SCAN_COMPLETE, 8))
+
+    def test3incomplete_objects(self):
+        """The scan of incomplete objects must be continued with more data without scanning the object again."""
+        json_data = b'{\n\t"a": "}\\"{",\n\t"b": {"c": [1, 2]},\n\t"d": "\\\\"\n}'
+        for split in range(len(json_data)):
+            scanner = JsonObjectScanner()
+            self.assertEqual(scanner.scan(b'xx' + json_data[:split], 2, 1000), (SCAN_INCOMPLETE, None))
+            self.assertEqual(scanner.scan(json_data[:split] + json_data[split:] + b'{}', 0, 1000), (SCAN_COMPLETE, len(json_data)))
+
+        # only the new data is scanned when the scan is continued.
+        scanner = JsonObjectScanner()
+        self.assertEqual(scanner.scan(b'{"a": [1, 2', 0, 1000), (SCAN_INCOMPLETE, None))
+        self.assertEqual(scanner.offset, 11)
+        self.assertEqual(scanner.closing_brackets, bytearray(b'}]'))
+        self.assertEqual(scanner.scan(b'{"a": [1, 2]}', 0, 1000), (SCAN_COMPLETE, 13))
+        self.assertEqual(scanner.offset, 0)
+        self.assertEqual(scanner.closing_brackets, bytearray())
+
+        # a backslash at the end of the data must be scanned again with the escaped character.
+        scanner = JsonObjectScanner()
+        self.assertEqual(scanner.scan(b'{"a": "\\', 0, 1000), (SCAN_INCOMPLETE, None))
+        self.assertEqual(scanner.scan(b'{"a": "\\""}', 0, 1000), (SCAN_COMPLETE, 11))
+
+        # the state is discarded when the data is shorter than the previously scanned data.
+        scanner = JsonObjectScanner()
+        self.assertEqual(scanner.scan(b'{"a": "bcd', 0, 1000), (SCAN_INCOMPLETE, None))
+        self.assertEqual(scanner.scan(b'{}', 0, 1000), (SCAN_COMPLETE, 2))
+
+    def test4overlong_objects(self):
+        """Objects must be overlong if their last bracket is not within max_length + 1 bytes."""
+        json_data = b'{"a": 1, "b": 2}'
+        scanner = JsonObjectScanner()
+        self.assertEqual(scanner.scan(json_data + b'\n', 0, len(json_data) - 1), (SCAN_COMPLETE, len(json_data)))
+        self.assertEqual(scanner.scan(json_data + b'\n', 0, len(json_data) - 2), (SCAN_OVERLONG, None))
+        self.assertEqual(scanner.scan(json_data[:-1], 0, len(json_data) - 2), (SCAN_INCOMPLETE, None))
+        scanner.reset()
+        self.assertEqual(scanner.scan(b'xx' + json_data, 2, 5), (SCAN_OVERLONG, None))
+        self.assertEqual(scanner.scan(json_data, 0, 100), (SCAN_COMPLETE, len(json_data)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -107,7 +107,7 @@ class LogStreamTest(TestBase):
 
         print("Listening...")
         unix_socket_log_data_resource.fill_buffer()
-        self.assertEqual(repr(unix_socket_log_data_resource.buffer), repr(b'data'))
+        self.assertEqual(bytes(unix_socket_log_data_resource.buffer), b'data')
         print('Data received: %s' % unix_socket_log_data_resource.buffer.decode())
 
         unix_socket_log_data_resource.update_position(len(unix_socket_log_data_resource.buffer))
@@ -161,6 +161,74 @@ class LogStreamTest(TestBase):
         log_stream.add_next_resource(fileLogDataResource3)
         self.assertRaises(OSError, log_stream.roll_over)
 
+    def test7file_log_data_resource_small_consumptions(self):
+        """
+        Consume the buffer of a FileLogDataResource in small steps and refill it in between.
+        The buffer must always contain the unconsumed data and the repositioning digest must be the same as for the consumed data.
+        """
+        with open(self.logfile, "rb") as f:
+            data = f.read()
+        file_log_data_resource = FileLogDataResource(self.file + self.logfile, -1, 1000)
+        file_log_data_resource.open(False)
+        self.assertIsInstance(file_log_data_resource.buffer, bytearray)
+        consumed_length = 0
+        while file_log_data_resource.fill_buffer() > 0:
+            for _ in range(3):
+                length = min(7, len(file_log_data_resource.buffer))
+                file_log_data_resource.update_position(length)
+                consumed_length += length
+            self.assertEqual(file_log_data_resource.buffer, data[consumed_length:consumed_length + len(file_log_data_resource.buffer)])
+        file_log_data_resource.update_position(len(file_log_data_resource.buffer))
+        self.assertEqual(file_log_data_resource.total_consumed_length, len(data))
+        # skipcq: BAN-B324, PTC-W1003
+        self.assertEqual(file_log_data_resource.get_repositioning_data()[2], base64.b64encode(hashlib.md5(data).digest()))
+        file_log_data_resource.close()
+
+
+    def test8file_log_data_resource_mapped_replay(self):
+        """
+        Replay a memory mapped file with a LogStream. All lines must be consumed and the repositioning data must be the same as when
+        reading the file. Data appended after the mapping was created is read afterwards.
+        """
+        with open(self.logfile, "rb") as f:
+            data = f.read()
+
+        class AtomCollector:
+            """Collect the raw data of all received log atoms."""
+
+            def __init__(self):
+                self.lines = []
+
+            def receive_atom(self, log_atom):
+                """Store the raw data."""
+                self.lines.append(log_atom.raw_data)
+                return True
+
+        atom_collector = AtomCollector()
+        byte_stream_line_atomizer = ByteStreamLineAtomizer(AnyByteDataModelElement('a1'), [atom_collector], [], 2000, [], eol_sep=b'\r\n',
+                                                           use_real_time=True)
+        file_log_data_resource = FileLogDataResource(self.file + self.logfile, -1)
+        file_log_data_resource.mapped_block_size = 10000
+        file_log_data_resource.open(False)
+        self.assertTrue(file_log_data_resource.map_file())
+        log_stream = LogStream(file_log_data_resource, byte_stream_line_atomizer)
+        while log_stream.handle_stream() >= 0:
+            pass
+        self.assertIsNone(file_log_data_resource.mapped_data)
+        self.assertEqual(atom_collector.lines, data.split(b'\r\n')[:-1])
+        self.assertEqual(file_log_data_resource.total_consumed_length, len(data))
+        # skipcq: BAN-B324, PTC-W1003
+        self.assertEqual(file_log_data_resource.get_repositioning_data()[2], base64.b64encode(hashlib.md5(data).digest()))
+
+        # The end of the file was reached, so there is nothing left to be mapped.
+        self.assertFalse(file_log_data_resource.map_file())
+        with open(self.logfile, "ab") as f:
+            f.write(b"appended line\r\n")
+        log_stream.last_consume_state = 0
+        log_stream.handle_stream()
+        self.assertEqual(atom_collector.lines[-1], b"appended line")
+        self.assertEqual(file_log_data_resource.total_consumed_length, len(data) + 15)
+        file_log_data_resource.close()
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from aminer.AnalysisChild import AnalysisChild
 from aminer.input.SimpleByteStreamLineAtomizerFactory import SimpleByteStreamLineAtomizerFactory
 from aminer.parsing.AnyByteDataModelElement import AnyByteDataModelElement
 from aminer.analysis.NewMatchPathDetector import NewMatchPathDetector
@@ -24,6 +25,28 @@ class SimpleByteStreamLineAtomizerFactoryTest(TestBase):
         self.assertEqual(byte_stream_line_atomizer.parsing_model, any_byte_data_model_element)
         self.assertEqual(byte_stream_line_atomizer.max_line_length, 65536)
 
+    def test2close_parser_process_pool(self):
+        """Check if the worker processes of the ParserProcessPool are stopped when the AnalysisChild shuts down."""
+        any_byte_data_model_element = AnyByteDataModelElement('a1')
+        new_match_path_detector = NewMatchPathDetector(self.aminer_config, [], 'Default', False)
+        analysis_child = AnalysisChild('aminer', self.aminer_config)
+        analysis_child.analysis_context.atomizer_factory = SimpleByteStreamLineAtomizerFactory(
+            any_byte_data_model_element, [new_match_path_detector], [], None, use_real_time=True, parser_process_count=2)
+        parser_process_pool = analysis_child.analysis_context.atomizer_factory.parser_process_pool
+        self.assertIsNone(parser_process_pool.executor)
+        # All workers are forked when the factory is started, so no worker is forked while other threads are running.
+        analysis_child.analysis_context.atomizer_factory.start()
+        workers = list(parser_process_pool.executor._processes.values())
+        self.assertEqual(len(workers), 2)
+        byte_stream_line_atomizer = analysis_child.analysis_context.atomizer_factory.get_atomizer_for_resource(None)
+        data = b'line 1\nline 2\n'
+        self.assertEqual(byte_stream_line_atomizer.consume_data(data, False), len(data))
+        self.assertEqual(list(parser_process_pool.executor._processes.values()), workers)
+        analysis_child.shutdown_analysis()
+        self.assertIsNone(parser_process_pool.executor)
+        for worker in workers:
+            self.assertFalse(worker.is_alive())
+
 
 if __name__ == "__main__":
     unittest.main()
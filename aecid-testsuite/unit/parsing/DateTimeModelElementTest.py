@@ -639,7 +639,42 @@ class DateTimeModelElementTest(TestBase):
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, ())
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, model_element)
 
-    def test25performance(self):  # skipcq: PYL-R0201
+    def test25parse_cache(self):
+        """Check if the seconds of repeated date prefixes are taken from the cache and the year wraparound is still detected."""
+        date_time_model_element = DateTimeModelElement(self.id_, b"%d.%m.%Y %H:%M:%S.%f%z", timezone.utc)
+        self.assertEqual(date_time_model_element.cache_prefix_length, 19)
+        for data, date, total_seconds in ((b"07.02.2019 11:40:00.5 UTC+01: it works", b"07.02.2019 11:40:00.5 UTC+01", 1549536000.5),
+                                          (b"07.02.2019 11:40:00.25: it works", b"07.02.2019 11:40:00.25", 1549539600.25),
+                                          (b"07.02.2019 11:40:01: it works", b"07.02.2019 11:40:01", None)):
+            match_context = DummyMatchContext(data)
+            match_element = date_time_model_element.get_match_element(self.path, match_context)
+            if total_seconds is None:
+                self.assertIsNone(match_element)
+            else:
+                self.compare_match_results(data, match_element, match_context, self.id_, self.path, date, total_seconds, None)
+        self.assertEqual(date_time_model_element.get_cache_statistics(), {
+            "CacheHits": 1, "CacheMisses": 2, "HitRate": 1 / 3, "CachedDates": 1})
+
+        # The cached seconds must only be used with the start year they were calculated with.
+        date_time_model_element = DateTimeModelElement(self.id_, b"%d.%m %H:%M:%S", timezone.utc, start_year=2020)
+        for data, total_seconds in ((b"31.12 23:59:00", 1609459140), (b"01.01 00:00:00", 1609459200), (b"31.12 23:59:00", 1609459140),
+                                    (b"01.01 00:00:00", 1609459200), (b"01.01 00:00:00", 1609459200)):
+            match_element = date_time_model_element.get_match_element(self.path, DummyMatchContext(data))
+            self.assertEqual(match_element.match_object, total_seconds)
+        self.assertEqual(date_time_model_element.start_year, 2021)
+        self.assertEqual(date_time_model_element.cache_hits, 2)
+
+        # Formats depending on the current date and epoch seconds are not cached.
+        self.assertIsNone(DateTimeModelElement(self.id_, b"%H:%M:%S").cache_prefix_length)
+        date_time_model_element = DateTimeModelElement(self.id_, b"%s", timestamp_scale=1000)
+        self.assertIsNone(date_time_model_element.cache_prefix_length)
+        match_context = DummyMatchContext(b"1549539600250: it works")
+        match_element = date_time_model_element.get_match_element(self.path, match_context)
+        self.compare_match_results(b"1549539600250: it works", match_element, match_context, self.id_, self.path, b"1549539600250",
+                                   1549539600.25, None)
+        self.assertIsNone(date_time_model_element.get_match_element(self.path, DummyMatchContext(b"it works")))
+
+    def test26performance(self):  # skipcq: PYL-R0201
         """Test the performance of the implementation."""
         run_test = False
         import_setup = """
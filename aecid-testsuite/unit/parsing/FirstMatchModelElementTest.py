@@ -1,5 +1,6 @@
 import unittest
 from aminer.parsing.FirstMatchModelElement import FirstMatchModelElement
+from aminer.parsing.FixedDataModelElement import FixedDataModelElement
 from aminer.parsing.MatchContext import MatchContext
 from aminer.parsing.MatchElement import MatchElement
 from unit.TestBase import TestBase, DummyMatchContext, DummyFixedDataModelElement
@@ -114,6 +115,60 @@ class FirstDataModelElementTest(TestBase):
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, ())
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, model_element)
 
+    def test6build_match_function(self):
+        """Check if the compiled match function returns the same results as get_match_element."""
+        first_match_me = FirstMatchModelElement(self.id_, self.children)
+        match_function = first_match_me.build_match_function(self.path)
+        data = b"Random string24. Random string23."
+        value = b"Random string2"
+        match_context = DummyMatchContext(data)
+        match_element = match_function(match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_ + "/me3", self.path, value, value, None)
+
+        data = b"Random string42"
+        match_context = DummyMatchContext(data)
+        match_element = match_function(match_context)
+        self.compare_no_match_results(data, match_element, match_context)
+
+    def test7start_byte_dispatch(self):
+        """Check if only children possibly matching the first byte are tried and the order of the children is kept."""
+        fixed1 = FixedDataModelElement("fixed1", b"Random")
+        fixed2 = FixedDataModelElement("fixed2", b"The first")
+        unrestricted = DummyFixedDataModelElement("unrestricted", b"The")
+        fixed3 = FixedDataModelElement("fixed3", b"The")
+        first_match_me = FirstMatchModelElement(self.id_, [fixed1, fixed2, unrestricted, fixed3])
+        self.assertIsNone(first_match_me.get_start_bytes())
+        self.assertEqual(first_match_me.child_indices_by_start_byte, {ord(b"R"): (0, 2), ord(b"T"): (1, 2, 3)})
+        self.assertEqual(first_match_me.unrestricted_child_indices, (2,))
+
+        data = b"The second string."
+        match_context = DummyMatchContext(data)
+        match_element = first_match_me.get_match_element(self.path, match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_ + "/unrestricted", self.path, b"The", b"The", None)
+
+        data = b"Random string."
+        match_context = DummyMatchContext(data)
+        match_element = first_match_me.build_match_function(self.path)(match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_ + "/fixed1", self.path, b"Random", b"Random", None)
+
+        data = b"Some string."
+        match_context = DummyMatchContext(data)
+        match_element = first_match_me.get_match_element(self.path, match_context)
+        self.compare_no_match_results(data, match_element, match_context)
+
+        data = b""
+        match_context = DummyMatchContext(data)
+        match_element = first_match_me.get_match_element(self.path, match_context)
+        self.compare_no_match_results(data, match_element, match_context)
+        self.assertEqual(first_match_me.get_branch_statistics(), [
+            ("fixed1", 1, 1), ("fixed2", 1, 0), ("unrestricted", 3, 1), ("fixed3", 0, 0)])
+        first_match_me.log_statistics("FirstMatchModelElement")
+        self.assertEqual(first_match_me.get_branch_statistics(), [
+            ("fixed1", 0, 0), ("fixed2", 0, 0), ("unrestricted", 0, 0), ("fixed3", 0, 0)])
+
+        first_match_me = FirstMatchModelElement(self.id_, [fixed1, fixed2, fixed3])
+        self.assertEqual(first_match_me.get_start_bytes(), {ord(b"R"), ord(b"T")})
+
 
 if __name__ == "__main__":
     unittest.main()
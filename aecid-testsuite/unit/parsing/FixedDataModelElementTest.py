@@ -77,6 +77,19 @@ class FixedDataModelElementTest(TestBase):
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, ())
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, model_element)
 
+    def test6build_match_function(self):
+        """Check if the compiled match function returns the same results as get_match_element."""
+        fixed_string = b"fixed data."
+        match_function = FixedDataModelElement(self.id_, fixed_string).build_match_function(self.path)
+        match_context = DummyMatchContext(self.data)
+        match_element = match_function(match_context)
+        self.compare_match_results(self.data, match_element, match_context, self.id_, self.path, fixed_string, fixed_string, None)
+
+        match_function = FixedDataModelElement(self.id_, b"Hello World.").build_match_function(self.path)
+        match_context = DummyMatchContext(self.data)
+        match_element = match_function(match_context)
+        self.compare_no_match_results(self.data, match_element, match_context)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -106,6 +106,21 @@ class FixedWordlistDataModelElementTest(TestBase):
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, ())
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, model_element)
 
+    def test6build_match_function(self):
+        """Check if the compiled match function returns the same results as get_match_element."""
+        fixed_wordlist_dme = FixedWordlistDataModelElement(self.id_, self.wordlist)
+        match_function = fixed_wordlist_dme.build_match_function(self.path)
+        data = b"word, wordlist"
+        value = b"word"
+        match_context = DummyMatchContext(data)
+        match_element = match_function(match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_, self.path, value, 1, None)
+
+        data = b"wor wordlist"
+        match_context = DummyMatchContext(data)
+        match_element = match_function(match_context)
+        self.compare_no_match_results(data, match_element, match_context)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -914,5 +914,48 @@ class JsonModelElementTest(TestBase):
         self.assertRaises(ValueError, JsonModelElement, self.id_, self.key_parser_dict, optional_key_prefix="+", nullable_key_prefix="+")
 
 
+    def test19get_match_element_strict_json(self):
+        """Well-formed JSON data must be parsed the same way with strict_json, but data needing repairs must not match."""
+        for key_parser_dict, data in [
+                (self.key_parser_dict, self.single_line_json), (self.key_parser_dict, self.multi_line_json),
+                (self.key_parser_dict, self.everything_new_line_json), (self.key_parser_dict_array, self.single_line_json_array),
+                (self.key_parser_dict_array_of_arrays, self.array_of_arrays),
+                (self.key_parser_dict_newline_in_string, br'{"a": "quote \" and backslash \\ and umlaut \u00e4"}')]:
+            match_context = MatchContext(data)
+            strict_match_context = MatchContext(data)
+            match_element = JsonModelElement(self.id_, key_parser_dict).get_match_element(self.path, match_context)
+            strict_match_element = JsonModelElement(self.id_, key_parser_dict, strict_json=True).get_match_element(
+                self.path, strict_match_context)
+            self.assertIsNotNone(strict_match_element)
+            self.assertEqual(strict_match_element.match_object, json.loads(data))
+            if b"\\u" not in data:
+                self.assertEqual(strict_match_element.match_object, match_element.match_object)
+                self.assertEqual([child.match_object for child in strict_match_element.children],
+                                 [child.match_object for child in match_element.children])
+            self.assertEqual(strict_match_context.match_data, match_context.match_data)
+
+        for data in [b'{"a": "\n"}', br'{"a": "\d"}', b'{"a": "\t\n\r"}']:
+            match_context = MatchContext(data)
+            self.assertIsNotNone(JsonModelElement(self.id_, self.key_parser_dict_newline_in_string).get_match_element(
+                self.path, match_context))
+            match_context = MatchContext(data)
+            self.assertIsNone(JsonModelElement(self.id_, self.key_parser_dict_newline_in_string, strict_json=True).get_match_element(
+                self.path, match_context))
+            self.assertEqual(match_context.match_data, data)
+
+    def test20strict_json_input_validation(self):
+        """Check if strict_json is validated."""
+        self.assertRaises(TypeError, JsonModelElement, self.id_, self.key_parser_dict, strict_json="")
+        self.assertRaises(TypeError, JsonModelElement, self.id_, self.key_parser_dict, strict_json=None)
+        self.assertRaises(TypeError, JsonModelElement, self.id_, self.key_parser_dict, strict_json=b"path")
+        self.assertRaises(TypeError, JsonModelElement, self.id_, self.key_parser_dict, strict_json=123)
+        self.assertRaises(TypeError, JsonModelElement, self.id_, self.key_parser_dict, strict_json=123.22)
+        self.assertRaises(TypeError, JsonModelElement, self.id_, self.key_parser_dict, strict_json={"id": "path"})
+        self.assertRaises(TypeError, JsonModelElement, self.id_, self.key_parser_dict, strict_json=["path"])
+        self.assertRaises(TypeError, JsonModelElement, self.id_, self.key_parser_dict, strict_json=[])
+        self.assertRaises(TypeError, JsonModelElement, self.id_, self.key_parser_dict, strict_json=())
+        self.assertRaises(TypeError, JsonModelElement, self.id_, self.key_parser_dict, strict_json=set())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -90,6 +90,26 @@ class MatchContextTest(TestBase):
         self.assertRaises(TypeError, match_context.update, 123)
         self.assertRaises(TypeError, match_context.update, 123.22)
 
+    def test7match_data_compatibility(self):
+        """Check if the match_data property moves the offset without copying the data when a suffix of the data is set."""
+        data = b"this is an example of a log line."
+        match_context = MatchContext(data)
+        self.assertIs(match_context.match_data, data)
+        match_context.update(b"this is an example")
+        self.assertIs(match_context.data, data)
+        self.assertEqual(match_context.offset, 18)
+        self.assertEqual(match_context.match_data, b" of a log line.")
+
+        match_context.match_data = data[5:]
+        self.assertIs(match_context.data, data)
+        self.assertEqual(match_context.offset, 5)
+        self.assertEqual(match_context.match_data, b"is an example of a log line.")
+
+        match_context.match_data = b"other data"
+        self.assertEqual(match_context.data, b"other data")
+        self.assertEqual(match_context.offset, 0)
+        self.assertEqual(match_context.match_data, b"other data")
+
 
 if __name__ == "__main__":
     unittest.main()
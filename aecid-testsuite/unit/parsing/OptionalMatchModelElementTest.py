@@ -87,6 +87,23 @@ class OptionalMatchModelElementTest(TestBase):
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, ())
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, model_element)
 
+    def test6build_match_function(self):
+        """Check if the compiled match function returns the same results as get_match_element."""
+        fixed_dme = DummyFixedDataModelElement(self.fixed_id, self.fixed_data)
+        optional_match = OptionalMatchModelElement(self.id_, fixed_dme)
+        match_function = optional_match.build_match_function(self.path)
+        data = b"fixed data string."
+        value = self.fixed_data
+        match_context = DummyMatchContext(data)
+        match_element = match_function(match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_, self.path, value, value, [
+            fixed_dme.get_match_element("%s/%s" % (self.path, self.id_), DummyMatchContext(data))])
+
+        data = b"other fixed string"
+        match_context = DummyMatchContext(data)
+        match_element = match_function(match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_, self.path, b"", None, None)
+
 
 if __name__ == "__main__":
     unittest.main()
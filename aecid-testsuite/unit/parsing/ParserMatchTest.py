@@ -1,4 +1,5 @@
 import unittest
+from aminer.parsing import ParserMatch as ParserMatchModule
 from aminer.parsing.ParserMatch import ParserMatch
 from aminer.parsing.MatchElement import MatchElement
 from unit.TestBase import TestBase
@@ -49,6 +50,36 @@ class ParserMatchTest(TestBase):
         self.assertRaises(TypeError, ParserMatch, ())
         self.assertRaises(TypeError, ParserMatch, set())
 
+    def test4get_match_dictionary_repeated_paths(self):
+        """Test if sibling MatchElements with the same path are indexed by their distinct match objects."""
+        c1 = MatchElement("list/value", b"1", 1, None)
+        c2 = MatchElement("list/value", b"2", 2, None)
+        c3 = MatchElement("list/value", b"1", 1, None)
+        c4 = MatchElement("list/value", b"3", 3, None)
+        root_element = MatchElement("list", b"1 2 1 3", b"1 2 1 3", [c1, c2, c3, c4])
+
+        dictionary = ParserMatch(root_element).get_match_dictionary()
+        self.assertEqual(dictionary["list"], root_element)
+        self.assertEqual(dictionary["list/value"], [c1, c2, c3, c4])
+        self.assertEqual(dictionary["list/value/0"], c3)
+        self.assertEqual(dictionary["list/value/1"], c2)
+        self.assertEqual(dictionary["list/value/2"], c4)
+        self.assertEqual(len(dictionary), 5)
+
+    def test5indexed_paths_cache_size(self):
+        """Check if the cache of the indexed paths is cleared when it is full."""
+        cache_size = ParserMatchModule.indexed_paths_cache_size
+        ParserMatchModule.indexed_paths_cache_size = 10
+        try:
+            children = [MatchElement("list/value", b"%d" % i, i, None) for i in range(25)]
+            root_element = MatchElement("list", b"", b"", children)
+            dictionary = ParserMatch(root_element).get_match_dictionary()
+            self.assertLessEqual(len(ParserMatchModule.indexed_paths), 10)
+            for i in range(25):
+                self.assertEqual(dictionary[f"list/value/{i}"], children[i])
+        finally:
+            ParserMatchModule.indexed_paths_cache_size = cache_size
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -207,6 +207,26 @@ class RepeatedElementDataModelElementTest(TestBase):
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, ())
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, model_element)
 
+    def test8build_match_function(self):
+        """Check if the compiled match function returns the same results as get_match_element."""
+        fixed_dme = DummyFixedDataModelElement(self.fixed_id, self.fixed_data)
+        repeated_dme = RepeatedElementDataModelElement(self.id_, fixed_dme, min_repeat=2, max_repeat=3)
+        match_function = repeated_dme.build_match_function(self.path)
+        data = b"fixed data fixed data fixed data other data"
+        value = b"fixed data fixed data fixed data "
+        match_context = DummyMatchContext(data)
+        match_element = match_function(match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_, self.path, value, value, [
+            fixed_dme.get_match_element("%s/%s/0" % (self.path, self.id_), DummyMatchContext(data)),
+            fixed_dme.get_match_element("%s/%s/1" % (self.path, self.id_), DummyMatchContext(data)),
+            fixed_dme.get_match_element("%s/%s/2" % (self.path, self.id_), DummyMatchContext(data))
+        ])
+
+        data = b"fixed data fixed data fixed data fixed data "
+        match_context = DummyMatchContext(data)
+        match_element = match_function(match_context)
+        self.compare_no_match_results(data, match_element, match_context)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -91,6 +91,21 @@ class SequenceModelElementTest(TestBase):
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, ())
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, model_element)
 
+    def test5build_match_function(self):
+        """Check if the compiled match function returns the same results as get_match_element."""
+        sequence_me = SequenceModelElement(self.id_, self.children)
+        match_function = sequence_me.build_match_function(self.path)
+        data = b"string0 string1 string2 other string follows"
+        value = b"string0 string1 string2"
+        match_context = DummyMatchContext(data)
+        match_element = match_function(match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_, self.path, value, value, self.match_elements)
+
+        data = b"string0 string1 string3"
+        match_context = DummyMatchContext(data)
+        match_element = match_function(match_context)
+        self.compare_no_match_results(data, match_element, match_context)
+
 
 if __name__ == "__main__":
     unittest.main()
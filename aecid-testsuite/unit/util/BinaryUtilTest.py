@@ -0,0 +1,43 @@
+import unittest
+import numpy as np
+from aminer.util.BinaryUtil import dump_as_binary, load_binary, BINARY_FORMAT_HEADER
+from unit.TestBase import TestBase
+
+
+class BinaryUtilTest(TestBase):
+    """Unittests for the BinaryUtil class."""
+
+    def test1dump_load(self):
+        """The objects must be loaded with the same types and values they were dumped with."""
+        objects = [None, True, False, 0, -1, 2**63 - 1, -2**63, 2**100, -2**100, 1.5, float("inf"), "", "string äöü", b"", b"\x00\xff bytes",
+                   [], [1, "2", b"3"], (1, (2, "3")), {b"1", "2", 3}, frozenset({1, 2}), {"key": "value", (1, b"2"): [None], 3: {4: 5.0}},
+                   [{"nested": [{"list": ({"tuple"},)}]}]]
+        for obj in objects:
+            data = dump_as_binary(obj)
+            self.assertTrue(data.startswith(BINARY_FORMAT_HEADER))
+            loaded = load_binary(data)
+            self.assertEqual(loaded, obj)
+            self.assertEqual(type(loaded), type(obj))
+
+        # numpy arrays and scalars
+        for array in (np.arange(12, dtype=np.int64).reshape(3, 4), np.array([1.5, -2.0], dtype=np.float32), np.zeros(0)):
+            loaded = load_binary(dump_as_binary({"array": array}))["array"]
+            self.assertEqual(loaded.dtype, array.dtype)
+            self.assertEqual(loaded.shape, array.shape)
+            self.assertTrue(np.array_equal(loaded, array))
+            loaded[...] = 0
+        self.assertEqual(load_binary(dump_as_binary([np.int64(5), np.float64(1.5)])), [5, 1.5])
+
+    def test2invalid_data(self):
+        """Invalid, truncated or unencodeable data must raise an error."""
+        data = dump_as_binary({"key": ["value", 1]})
+        self.assertRaises(ValueError, load_binary, b'{"key": "value"}')
+        self.assertRaises(ValueError, load_binary, data[:-3])
+        self.assertRaises(ValueError, load_binary, data + b"\x00")
+        self.assertRaises(ValueError, load_binary, BINARY_FORMAT_HEADER + b"\xff")
+        self.assertRaises(Exception, dump_as_binary, object())
+        self.assertRaises(Exception, dump_as_binary, np.array([object()]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 import sys
 import os
 import tempfile
+import shutil
 from io import StringIO
 from aminer.analysis.NewMatchPathDetector import NewMatchPathDetector
 from aminer.input.LogAtom import LogAtom
@@ -14,6 +15,8 @@ from aminer.parsing.DecimalIntegerValueModelElement import DecimalIntegerValueMo
 from aminer.parsing.FirstMatchModelElement import FirstMatchModelElement
 from aminer.analysis.NewMatchPathValueComboDetector import NewMatchPathValueComboDetector
 from aminer.util import SecureOSFunctions
+from aminer.util import BinaryUtil
+from aminer.AminerConfig import build_persistence_file_name, KEY_PERSISTENCE_DIR
 from unit.TestBase import TestBase
 
 
@@ -181,6 +184,173 @@ class PersistenceUtilTest(TestBase):
         os.rmdir(os.path.join(new_base_path, "backup"))
         os.rmdir(new_base_path)
 
+    def test9persistence_journal(self):
+        """Test if the journal records are appended, replayed and compacted into the persistence file."""
+        file_name = build_persistence_file_name(self.aminer_config, "Journal", "Default")
+        journal = PersistenceUtil.PersistenceJournal(file_name)
+        journal.min_compaction_records = 3
+        self.assertEqual(journal.load(), (None, []))
+        journal.add_record((b"a", 1))
+        journal.add_record("b")
+        journal.persist(lambda: self.fail("The journal must not be compacted yet."))
+        self.assertFalse(os.path.exists(file_name))
+        self.assertEqual(PersistenceUtil.PersistenceJournal(file_name).load(), (None, [[b"a", 1], "b"]))
+
+        # An incomplete last record is ignored when loading the journal.
+        with open(journal.journal_file_name, "a") as f:
+            f.write('"string:inc')
+        old_stderr = sys.stderr
+        sys.stderr = StringIO()
+        self.assertEqual(PersistenceUtil.PersistenceJournal(file_name).load(), (None, [[b"a", 1], "b"]))
+        sys.stderr = old_stderr
+        with open(journal.journal_file_name, "w") as f:
+            f.write('"string:a"\n"string:b"\n')
+
+        # The records of a journal left by a failed compaction must be kept.
+        os.rename(journal.journal_file_name, journal.compacted_journal_file_name)
+        journal = PersistenceUtil.PersistenceJournal(file_name)
+        journal.min_compaction_records = 3
+        self.assertEqual(journal.load(), (None, ["a", "b"]))
+        journal.add_record("c")
+        journal.persist(lambda: self.fail("The journal must not be compacted yet."))
+        self.assertEqual(PersistenceUtil.load_journal_records(journal.journal_file_name), ["c"])
+        journal.add_record("d")
+        journal.persist(lambda: ["a", "b", "c", "d"])
+        journal.add_record("e")
+        journal.persist(lambda: self.fail("The journal must not be compacted again."))
+        PersistenceUtil.wait_for_compactions()
+        self.assertEqual(PersistenceUtil.load_json(file_name), ["a", "b", "c", "d"])
+        self.assertFalse(os.path.exists(journal.compacted_journal_file_name))
+        self.assertEqual(PersistenceUtil.PersistenceJournal(file_name).load(), (["a", "b", "c", "d"], ["e"]))
+
+        # Finished compactions are removed from the compaction threads when the next compaction starts.
+        journal.compact(["a", "b", "c", "d", "e"])
+        finished_compaction_thread = journal.compaction_thread
+        journal.wait_for_compaction()
+        self.assertIn(finished_compaction_thread, PersistenceUtil.compaction_threads)
+        journal.compact(["a", "b", "c", "d", "e"])
+        self.assertNotIn(finished_compaction_thread, PersistenceUtil.compaction_threads)
+        PersistenceUtil.wait_for_compactions()
+        self.assertEqual(PersistenceUtil.compaction_threads, [])
+        self.assertEqual(PersistenceUtil.PersistenceJournal(file_name).load(), (["a", "b", "c", "d", "e"], []))
+
+    def test10binary_persistence_codec(self):
+        """Test if the binary codec is used to store the data, files are loaded with either codec and the converter works."""
+        file_name = build_persistence_file_name(self.aminer_config, "Codec", "Default")
+        data = {"key": [b"value", (1, 2)], 3: {"set"}}
+        self.assertRaises(ValueError, PersistenceUtil.set_persistence_codec, "msgpack")
+        PersistenceUtil.set_persistence_codec(PersistenceUtil.PERSISTENCE_CODEC_BINARY)
+        try:
+            PersistenceUtil.store_json(file_name, data)
+        finally:
+            PersistenceUtil.set_persistence_codec(PersistenceUtil.PERSISTENCE_CODEC_JSON)
+        with open(file_name, "rb") as f:
+            self.assertTrue(f.read().startswith(BinaryUtil.BINARY_FORMAT_HEADER))
+        self.assertEqual(PersistenceUtil.load_json(file_name), data)
+
+        # convert the persistence directory back to json. Backups, journals and other files are not converted.
+        persistence_dir = self.aminer_config.config_properties[KEY_PERSISTENCE_DIR]
+        backup_file_name = os.path.join(persistence_dir, "backup", "Codec", "Default")
+        PersistenceUtil.create_missing_directories(backup_file_name)
+        PersistenceUtil.copytree(os.path.join(persistence_dir, "Codec"), os.path.join(persistence_dir, "backup", "Codec"))
+        journal = PersistenceUtil.PersistenceJournal(file_name)
+        journal.add_record(b"record")
+        journal.persist(lambda: self.fail("The journal must not be compacted."))
+        other_file_name = os.path.join(persistence_dir, "Codec", "Other")
+        with open(other_file_name, "wb") as f:
+            f.write(b"no persistence")
+        old_stderr = sys.stderr
+        sys.stderr = StringIO()
+        self.assertEqual(PersistenceUtil.convert_persistence(persistence_dir, PersistenceUtil.PERSISTENCE_CODEC_JSON), 1)
+        sys.stderr = old_stderr
+        # json does not preserve tuples, sets and integer keys.
+        with open(file_name, "rb") as f:
+            self.assertTrue(f.read().startswith(b"{"))
+        self.assertEqual(PersistenceUtil.load_json(file_name), {"key": [b"value", [1, 2]], "3": ["set"]})
+        with open(backup_file_name, "rb") as f:
+            self.assertTrue(f.read().startswith(BinaryUtil.BINARY_FORMAT_HEADER))
+        with open(other_file_name, "rb") as f:
+            self.assertEqual(f.read(), b"no persistence")
+        self.assertEqual(PersistenceUtil.load_journal_records(journal.journal_file_name), [b"record"])
+        self.assertEqual(PersistenceUtil.convert_persistence(persistence_dir, PersistenceUtil.PERSISTENCE_CODEC_JSON), 0)
+        self.assertRaises(ValueError, PersistenceUtil.convert_persistence, persistence_dir, "msgpack")
+
+    def test11background_persistence(self):
+        """Test if snapshots of the persistence data are written in the background and persist_all waits until they were written."""
+        file_name = build_persistence_file_name(self.aminer_config, "Background", "Default")
+        other_file_name = build_persistence_file_name(self.aminer_config, "Background", "Other")
+        data = {"key": [b"value", ["list"]], "set": {1, 2}}
+        snapshot = PersistenceUtil.copy_persistence_data(data)
+        self.assertEqual(snapshot, data)
+        data["key"][1].append("modified")
+        data["set"].add(3)
+        self.assertEqual(snapshot, {"key": [b"value", ["list"]], "set": {1, 2}})
+
+        PersistenceUtil.set_background_persistence(True)
+        try:
+            writer = PersistenceUtil.persistence_writer
+            PersistenceUtil.store_json(file_name, data)
+            # The data must not change when the original data is modified after it was stored.
+            data["key"][1].append("after store")
+            PersistenceUtil.store_json(other_file_name, [1])
+            PersistenceUtil.store_json(other_file_name, [2])
+            PersistenceUtil.wait_for_persistence_writes()
+            self.assertEqual(PersistenceUtil.load_json(file_name), {"key": [b"value", ["list", "modified"]], "set": [1, 2, 3]})
+            self.assertEqual(PersistenceUtil.load_json(other_file_name), [2])
+            self.assertEqual(writer.written_count + writer.superseded_count, 3)
+        finally:
+            PersistenceUtil.set_background_persistence(False)
+        self.assertIsNone(PersistenceUtil.persistence_writer)
+        self.assertIsNone(writer.worker_thread)
+
+    def test12create_backup(self):
+        """Test if snapshot backups hard-link unchanged files, old backups are pruned and backups can still be restored."""
+        base_path = "/tmp/persistence"
+        restore_path = "/tmp/persistence1"
+        os.makedirs(os.path.join(base_path, "Detector"))
+        for name, data in (("Unchanged", b"unchanged"), ("Changed", b"old")):
+            with open(os.path.join(base_path, "Detector", name), "wb") as f:
+                f.write(data)
+            os.utime(os.path.join(base_path, "Detector", name), ns=(1000000000, 1000000000))
+        self.assertEqual(PersistenceUtil.create_backup(base_path, "2021-01-01-00-00-00"), (2, 0))
+        self.assertRaises(FileExistsError, PersistenceUtil.create_backup, base_path, "2021-01-01-00-00-00")
+        self.assertRaises(ValueError, PersistenceUtil.create_backup, base_path, "2021-01-02-00-00-00", "rsync")
+        self.assertRaises(ValueError, PersistenceUtil.create_backup, base_path, "2021-01-02-00-00-00", retention=-1)
+
+        with open(os.path.join(base_path, "Detector", "Changed"), "wb") as f:
+            f.write(b"new")
+        os.makedirs(os.path.join(base_path, "New"))
+        with open(os.path.join(base_path, "New", "Default"), "wb") as f:
+            f.write(b"new")
+        # An incomplete backup left by a failed backup is replaced.
+        os.makedirs(os.path.join(base_path, "backup", PersistenceUtil.INCOMPLETE_BACKUP_PREFIX + "2021-01-02-00-00-00"))
+        self.assertEqual(PersistenceUtil.create_backup(base_path, "2021-01-02-00-00-00", PersistenceUtil.BACKUP_MODE_SNAPSHOT), (2, 1))
+        first_backup = os.path.join(base_path, "backup", "2021-01-01-00-00-00")
+        second_backup = os.path.join(base_path, "backup", "2021-01-02-00-00-00")
+        self.assertTrue(os.path.samefile(os.path.join(first_backup, "Detector", "Unchanged"), os.path.join(
+            second_backup, "Detector", "Unchanged")))
+        with open(os.path.join(second_backup, "Detector", "Changed"), "rb") as f:
+            self.assertEqual(f.read(), b"new")
+        with open(os.path.join(first_backup, "Detector", "Changed"), "rb") as f:
+            self.assertEqual(f.read(), b"old")
+        self.assertEqual(PersistenceUtil.list_backups(base_path), ["2021-01-01-00-00-00", "2021-01-02-00-00-00"])
+
+        # The oldest backups are deleted, while the hard-linked files stay in the newer backups.
+        self.assertEqual(PersistenceUtil.create_backup(base_path, "2021-01-03-00-00-00", PersistenceUtil.BACKUP_MODE_SNAPSHOT, 2), (0, 3))
+        self.assertEqual(PersistenceUtil.list_backups(base_path), ["2021-01-02-00-00-00", "2021-01-03-00-00-00"])
+        with open(os.path.join(base_path, "backup", "2021-01-03-00-00-00", "Detector", "Unchanged"), "rb") as f:
+            self.assertEqual(f.read(), b"unchanged")
+
+        # Restoring a backup must not link the persistence files to the files of the backup.
+        PersistenceUtil.clear_persistence(base_path)
+        PersistenceUtil.copytree(second_backup, restore_path)
+        with open(os.path.join(restore_path, "Detector", "Unchanged"), "rb") as f:
+            self.assertEqual(f.read(), b"unchanged")
+        self.assertFalse(os.path.samefile(os.path.join(restore_path, "Detector", "Unchanged"), os.path.join(
+            second_backup, "Detector", "Unchanged")))
+        shutil.rmtree(base_path)
+        shutil.rmtree(restore_path)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -161,6 +161,28 @@ class SecureOSFunctionsTestLocal(TestBase):
         connection.close()
         server.close()
 
+    def test8secure_unlink_replace_file(self):
+        """Files must be renamed and removed relative to the base directory, if it was opened."""
+        with open("/tmp/lib/aminer/util/log/test.log", "w") as f:
+            f.write("test")
+        self.assertRaises(ValueError, SecureOSFunctions.secure_unlink_file, "util/log/test.log")
+        self.assertRaises(ValueError, SecureOSFunctions.secure_replace_file, "util/log/test.log", "/tmp/lib/aminer/util/log/test2.log")
+        SecureOSFunctions.secure_replace_file("/tmp/lib/aminer/util/log/test.log", "/tmp/lib/aminer/util/log/test2.log")
+        self.assertFalse(os.path.exists("/tmp/lib/aminer/util/log/test.log"))
+        with open("/tmp/lib/aminer/util/log/test2.log") as f:
+            self.assertEqual(f.read(), "test")
+
+        SecureOSFunctions.secure_open_base_directory("/tmp/lib/aminer/util")
+        with open("/tmp/lib/aminer/util/log/test.log", "w") as f:
+            f.write("replaced")
+        SecureOSFunctions.secure_replace_file(b"/tmp/lib/aminer/util/log/test.log", b"/tmp/lib/aminer/util/log/test2.log")
+        with open("/tmp/lib/aminer/util/log/test2.log") as f:
+            self.assertEqual(f.read(), "replaced")
+        SecureOSFunctions.secure_unlink_file("/tmp/lib/aminer/util/log/test2.log")
+        self.assertFalse(os.path.exists("/tmp/lib/aminer/util/log/test2.log"))
+        self.assertRaises(FileNotFoundError, SecureOSFunctions.secure_unlink_file, "/tmp/lib/aminer/util/log/test2.log")
+        SecureOSFunctions.close_base_directory()
+
 
 if __name__ == "__main__":
     unittest.main()
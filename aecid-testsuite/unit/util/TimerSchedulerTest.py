@@ -0,0 +1,55 @@
+import unittest
+from aminer.util.TimerScheduler import TimerScheduler
+from unit.TestBase import TestBase
+
+
+class TimerSchedulerTest(TestBase):
+    """Unittests for the TimerScheduler class."""
+
+    def test1run_due_timers(self):
+        """Only the due callbacks must be invoked in the order of their trigger times and they must be scheduled again."""
+        invocations = []
+
+        def build_callback(name, delay):
+            def callback(trigger_time):
+                invocations.append((name, trigger_time))
+                return delay
+            return callback
+
+        timer_scheduler = TimerScheduler()
+        self.assertIsNone(timer_scheduler.get_next_trigger_time())
+        timer_scheduler.schedule(20, build_callback("b", 10))
+        timer_scheduler.schedule(10, build_callback("a", 5))
+        timer_scheduler.schedule(50, build_callback("c", None))
+        self.assertEqual(timer_scheduler.get_next_trigger_time(), 10)
+
+        self.assertEqual(timer_scheduler.run_due_timers(5), 0)
+        self.assertEqual(invocations, [])
+        self.assertEqual(timer_scheduler.run_due_timers(20), 2)
+        self.assertEqual(invocations, [("a", 20), ("b", 20)])
+        self.assertEqual(timer_scheduler.get_next_trigger_time(), 25)
+        self.assertEqual(timer_scheduler.run_due_timers(25, 1000), 1)
+        self.assertEqual(invocations[-1], ("a", 1000))
+
+        # The callback returning None must not be scheduled again.
+        self.assertEqual(timer_scheduler.run_due_timers(60), 3)
+        self.assertEqual(len(timer_scheduler.timer_heap), 2)
+        self.assertEqual(timer_scheduler.run_due_timers(60), 0)
+
+    def test2callback_due_again_immediately(self):
+        """A callback requesting to be invoked again immediately must only be invoked once per run."""
+        invocations = []
+
+        def callback(trigger_time):
+            invocations.append(trigger_time)
+            return 0
+
+        timer_scheduler = TimerScheduler()
+        timer_scheduler.schedule(0, callback)
+        self.assertEqual(timer_scheduler.run_due_timers(1), 1)
+        self.assertEqual(timer_scheduler.run_due_timers(1), 1)
+        self.assertEqual(invocations, [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
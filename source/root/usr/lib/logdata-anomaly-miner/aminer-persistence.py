@@ -6,7 +6,7 @@ import argparse
 sys.path = sys.path[1:] + ['/usr/lib/logdata-anomaly-miner', '/etc/aminer/conf-enabled']
 from aminer.AminerConfig import load_config, KEY_AMINER_USER, KEY_AMINER_GROUP, KEY_PERSISTENCE_DIR  # skipcq: FLK-E402
 from aminer.util.StringUtil import colflame, flame, supports_color  # skipcq: FLK-E402
-from aminer.util.PersistenceUtil import clear_persistence, copytree  # skipcq: FLK-E402
+from aminer.util.PersistenceUtil import clear_persistence, copytree, convert_persistence, PERSISTENCE_CODECS  # skipcq: FLK-E402
 from metadata import __version_string__  # skipcq: FLK-E402
 
 
@@ -32,7 +32,9 @@ def main():
     parser.add_argument('-r', '--restore', type=str, help='restore a persistence backup')
     parser.add_argument('-u', '--user', type=str, help='set the aminer user. Only used with --restore')
     parser.add_argument('-g', '--group', type=str, help='set the aminer group. Only used with --restore')
-    parser.add_argument('-p', '--persistence-dir', type=str, help='set the persistence directory. Only used with --restore')
+    parser.add_argument('-p', '--persistence-dir', type=str, help='set the persistence directory. Only used with --restore and --convert')
+    parser.add_argument('-C', '--convert', choices=PERSISTENCE_CODECS, type=str,
+                        help='convert all persistence files to the persistence codec. The aminer must not be running.')
 
     args = parser.parse_args()
 
@@ -52,15 +54,15 @@ def main():
             print('The restore path must be absolute.', file=sys.stderr)
             sys.exit(1)
         absolute_persistence_path = args.restore
-    if '.' in args.user or '/' in args.user:
+    if args.user is not None and ('.' in args.user or '/' in args.user):
         print(f"The aminer user {args.user} must not contain any . or /", file=sys.stderr)
         sys.exit(1)
     aminer_user = args.user
-    if '.' in args.group or '/' in args.group:
+    if args.group is not None and ('.' in args.group or '/' in args.group):
         print(f"The aminer group {args.group} must not contain any . or /", file=sys.stderr)
         sys.exit(1)
     aminer_grp = args.group
-    if not args.persistence_dir.startswith('/'):
+    if args.persistence_dir is not None and not args.persistence_dir.startswith('/'):
         print('The persistence_dir path must be absolute.', file=sys.stderr)
         sys.exit(1)
     persistence_dir = args.persistence_dir
@@ -94,5 +96,14 @@ def main():
                     os.chown(os.path.join(dirpath, filename), child_user_id, child_group_id)
             print(f"Restored persistence from {absolute_persistence_path} successfully.")
 
+    if args.convert is not None:
+        if persistence_dir is None:
+            if config_file_name is not None:
+                persistence_dir = load_config(config_file_name).config_properties.get(KEY_PERSISTENCE_DIR, '/var/lib/aminer')
+            else:
+                persistence_dir = '/var/lib/aminer'
+        converted_files = convert_persistence(persistence_dir, args.convert)
+        print(f"Converted {converted_files} persistence files in {persistence_dir} to {args.convert}.")
+
 
 main()
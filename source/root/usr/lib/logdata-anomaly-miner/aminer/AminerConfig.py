@@ -26,6 +26,14 @@ DEFAULT_PERSISTENCE_DIR = '/var/lib/aminer'
 DEFAULT_LOG_DIR = '/var/lib/aminer/log'
 KEY_PERSISTENCE_PERIOD = 'Core.PersistencePeriod'
 DEFAULT_PERSISTENCE_PERIOD = 600
+KEY_PERSISTENCE_CODEC = 'Core.PersistenceCodec'
+DEFAULT_PERSISTENCE_CODEC = 'json'
+KEY_BACKGROUND_PERSISTENCE = 'Core.BackgroundPersistence'
+DEFAULT_BACKGROUND_PERSISTENCE = False
+KEY_BACKUP_MODE = 'Core.BackupMode'
+DEFAULT_BACKUP_MODE = 'copy'
+KEY_BACKUP_RETENTION = 'Core.BackupRetention'
+DEFAULT_BACKUP_RETENTION = 0
 KEY_REMOTE_CONTROL_SOCKET_PATH = 'RemoteControlSocket'
 KEY_LOG_PREFIX = 'LogPrefix'
 KEY_RESOURCES_MAX_MEMORY_USAGE = 'Resources.MaxMemoryUsage'
@@ -12,8 +12,6 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 import aminer
 import resource
-import os
-import shutil
 from time import time
 from datetime import datetime
 import logging
@@ -22,7 +20,8 @@ from aminer.input.InputInterfaces import AtomHandlerInterface
 from aminer.util import PersistenceUtil
 from aminer import AnalysisChild, AminerConfig
 from aminer.AminerConfig import KEY_PERSISTENCE_PERIOD, KEY_LOG_STAT_LEVEL, KEY_LOG_DEBUG_LEVEL, KEY_LOG_STAT_PERIOD,\
-    KEY_RESOURCES_MAX_MEMORY_USAGE, KEY_LOG_PREFIX, KEY_PERSISTENCE_DIR, DEFAULT_PERSISTENCE_DIR, KEY_LOG_SOURCES_LIST, DEBUG_LOG_NAME
+    KEY_RESOURCES_MAX_MEMORY_USAGE, KEY_LOG_PREFIX, KEY_PERSISTENCE_DIR, DEFAULT_PERSISTENCE_DIR, KEY_LOG_SOURCES_LIST, DEBUG_LOG_NAME,\
+    KEY_BACKUP_MODE, DEFAULT_BACKUP_MODE, KEY_BACKUP_RETENTION, DEFAULT_BACKUP_RETENTION
 
 attr_str = '"%s": %s,\n'
 component_not_found = 'Event history component not found.'
@@ -340,12 +339,12 @@ class AminerRemoteControlExecutionMethods:
     def create_backup(self, analysis_context):
         """Create a backup with the current datetime string."""
         backup_time = time()
-        backup_time_str = datetime.fromtimestamp(backup_time).strftime('%Y-%m-%d-%H-%M-%S')
-        persistence_dir = analysis_context.aminer_config.config_properties[KEY_PERSISTENCE_DIR]
+        backup_time_str = datetime.fromtimestamp(backup_time).strftime(PersistenceUtil.BACKUP_TIME_FORMAT)
+        config_properties = analysis_context.aminer_config.config_properties
+        persistence_dir = config_properties[KEY_PERSISTENCE_DIR]
         persistence_dir = persistence_dir.rstrip('/')
-        backup_path = persistence_dir + '/backup/'
-        backup_path_with_date = os.path.join(backup_path, backup_time_str)
-        shutil.copytree(persistence_dir, backup_path_with_date, ignore=shutil.ignore_patterns('backup*'))
+        PersistenceUtil.create_backup(persistence_dir, backup_time_str, config_properties.get(KEY_BACKUP_MODE, DEFAULT_BACKUP_MODE),
+                                      config_properties.get(KEY_BACKUP_RETENTION, DEFAULT_BACKUP_RETENTION))
         msg = f"Created backup {backup_time_str}"
         self.REMOTE_CONTROL_RESPONSE = f"Created backup {backup_time_str}"
         logging.getLogger(DEBUG_LOG_NAME).info(msg)
@@ -353,9 +352,7 @@ class AminerRemoteControlExecutionMethods:
     def list_backups(self, analysis_context):
         """List all available backups from the persistence directory."""
         persistence_dir = analysis_context.aminer_config.config_properties.get(KEY_PERSISTENCE_DIR, DEFAULT_PERSISTENCE_DIR)
-        for _dirpath, dirnames, _filenames in os.walk(os.path.join(persistence_dir, 'backup')):
-            self.REMOTE_CONTROL_RESPONSE = f'"backups": {dirnames}'
-            break
+        self.REMOTE_CONTROL_RESPONSE = f'"backups": {PersistenceUtil.list_backups(persistence_dir)}'
         self.REMOTE_CONTROL_RESPONSE = self.REMOTE_CONTROL_RESPONSE.replace("'", '"')
 
     def allowlist_event_in_component(self, analysis_context, component_name, event_data, allowlisting_data=None):
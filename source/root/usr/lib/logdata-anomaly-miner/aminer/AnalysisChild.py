@@ -13,11 +13,11 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
 import base64
-import errno
 import fcntl
+import functools
 import json
 import os
-import select
+import selectors
 import socket
 import struct
 import sys
@@ -26,17 +26,21 @@ import traceback
 import resource
 import logging
 from datetime import datetime
-import shutil
+import threading
 
 from aminer.AminerConfig import DEBUG_LOG_NAME, build_persistence_file_name, KEY_RESOURCES_MAX_MEMORY_USAGE, KEY_LOG_STAT_PERIOD,\
     DEFAULT_STAT_PERIOD, KEY_PERSISTENCE_DIR, DEFAULT_PERSISTENCE_DIR, REMOTE_CONTROL_LOG_NAME, KEY_PERSISTENCE_PERIOD,\
-    DEFAULT_PERSISTENCE_PERIOD
+    DEFAULT_PERSISTENCE_PERIOD, KEY_PERSISTENCE_CODEC, DEFAULT_PERSISTENCE_CODEC, KEY_BACKGROUND_PERSISTENCE,\
+    DEFAULT_BACKGROUND_PERSISTENCE, KEY_BACKUP_MODE, DEFAULT_BACKUP_MODE, KEY_BACKUP_RETENTION, DEFAULT_BACKUP_RETENTION
 from aminer.events.StreamPrinterEventHandler import StreamPrinterEventHandler
 from aminer.events.JsonConverterHandler import JsonConverterHandler
-from aminer.input.LogStream import LogStream
+from aminer.events.AsyncEventHandler import AsyncEventHandler
+from aminer.events.ScoringEventHandler import ScoringEventHandler
+from aminer.input.LogStream import LogStream, FileLogDataResource
 from aminer.util import PersistenceUtil
 from aminer.util import SecureOSFunctions
 from aminer.util.TimeTriggeredComponentInterface import TimeTriggeredComponentInterface
+from aminer.util.TimerScheduler import TimerScheduler
 from aminer.util import JsonUtil
 from aminer.AminerRemoteControlExecutionMethods import AminerRemoteControlExecutionMethods
 
@@ -189,7 +193,14 @@ class AnalysisContext:
                     print(msg, file=sys.stderr)
                     sys.exit(1)
             elif isinstance(event_handler, JsonConverterHandler):
+                event_handler.flush_batches()
                 self.close_event_handler_streams(event_handler.json_event_handlers)
+            elif isinstance(event_handler, ScoringEventHandler):
+                self.close_event_handler_streams(event_handler.event_handlers, reopen)
+            elif isinstance(event_handler, AsyncEventHandler):
+                # Handle the queued events before closing the streams.
+                event_handler.flush()
+                self.close_event_handler_streams([event_handler.event_handler], reopen)
 
 
 suspended_flag = False
@@ -203,6 +214,9 @@ class AnalysisChild(TimeTriggeredComponentInterface):
 
     time_trigger_class = AnalysisContext.TIME_TRIGGER_CLASS_REALTIME
     offline_mode = False
+    # The maximum number of seconds to wait for input, so the shutdown flag and blocked log streams are checked regularly.
+    max_select_timeout = 1
+    backup_period = 3600 * 24
 
     def __init__(self, program_name, aminer_config):
         self.program_name = program_name
@@ -213,10 +227,18 @@ class AnalysisChild(TimeTriggeredComponentInterface):
         self.persistence_file_name = build_persistence_file_name(
             self.analysis_context.aminer_config, self.__class__.__name__ + '/RepositioningData')
         self.next_persist_time = time.time() + self.aminer_config.config_properties.get(KEY_PERSISTENCE_PERIOD, DEFAULT_PERSISTENCE_PERIOD)
+        PersistenceUtil.set_persistence_codec(self.aminer_config.config_properties.get(KEY_PERSISTENCE_CODEC, DEFAULT_PERSISTENCE_CODEC))
+        PersistenceUtil.set_background_persistence(
+            self.aminer_config.config_properties.get(KEY_BACKGROUND_PERSISTENCE, DEFAULT_BACKGROUND_PERSISTENCE))
 
         self.repositioning_data_dict = {}
+        self.real_time_scheduler = None
+        self.analysis_time_scheduler = None
+        self.scheduled_real_time_component_count = 0
+        self.scheduled_analysis_time_component_count = 0
         self.master_control_socket = None
         self.remote_control_socket = None
+        self.backup_thread = None
 
         # This dictionary provides a lookup list from file descriptor to associated object for handling the data to and from the given
         # descriptor. Currently supported handler objects are:
@@ -225,6 +247,10 @@ class AnalysisChild(TimeTriggeredComponentInterface):
         # * LogStreams
         # * Remote control connections
         self.tracked_fds_dict = {}
+        # The tracked fds stay registered in the selector until they are untracked. Regular files can not be registered with epoll and are
+        # kept in the list of always readable fds instead.
+        self.selector = selectors.DefaultSelector()
+        self.always_readable_fds = []
 
         # Override the signal handler to allow graceful shutdown.
         def graceful_shutdown_handler(_signo, _stack_frame):
@@ -252,7 +278,7 @@ class AnalysisChild(TimeTriggeredComponentInterface):
         # the parent/child communication socket on fd 3. This also duplicates the fd, so close the old one.
         self.master_control_socket = socket.fromfd(master_fd, socket.AF_UNIX, socket.SOCK_DGRAM, 0)
         os.close(master_fd)
-        self.tracked_fds_dict[self.master_control_socket.fileno()] = self.master_control_socket
+        self.track_fd(self.master_control_socket.fileno(), self.master_control_socket)
 
         # Locate the real analysis configuration.
         self.analysis_context.build_analysis_pipeline()
@@ -262,9 +288,6 @@ class AnalysisChild(TimeTriggeredComponentInterface):
             logging.getLogger(DEBUG_LOG_NAME).critical(msg)
             return 1
 
-        real_time_triggered_components = self.analysis_context.real_time_triggered_components
-        analysis_time_triggered_components = self.analysis_context.analysis_time_triggered_components
-
         max_memory_mb = self.analysis_context.aminer_config.config_properties.get(KEY_RESOURCES_MAX_MEMORY_USAGE, None)
         if max_memory_mb is not None:
             try:
@@ -277,6 +300,9 @@ class AnalysisChild(TimeTriggeredComponentInterface):
                 logging.getLogger(DEBUG_LOG_NAME).critical(msg)
                 return 1
 
+        # Start the resources of the atomizer factory, e.g. forking parser worker processes, while no other threads are running.
+        self.analysis_context.atomizer_factory.start()
+
         # Load continuation data for last known log streams. The loaded data has to be a dictionary with repositioning information for
         # each stream. The data is used only when creating the first stream with that name.
         self.repositioning_data_dict = PersistenceUtil.load_json(self.persistence_file_name)
@@ -286,181 +312,310 @@ class AnalysisChild(TimeTriggeredComponentInterface):
         # A list of LogStreams where handleStream() blocked due to downstream not being able to consume the data yet.
         blocked_log_streams = []
 
-        # Always start when number is None.
-        next_real_time_trigger_time = None
-        next_analysis_time_trigger_time = None
-        next_backup_time_trigger_time = None
-        log_stat_period = self.analysis_context.aminer_config.config_properties.get(
-            KEY_LOG_STAT_PERIOD, DEFAULT_STAT_PERIOD)
-        next_statistics_log_time = time.time() + log_stat_period
+        # All components are triggered at the start, the statistics and backups only after their period.
+        current_time = time.time()
+        self.real_time_scheduler = TimerScheduler()
+        self.analysis_time_scheduler = TimerScheduler()
+        self.scheduled_real_time_component_count = 0
+        self.scheduled_analysis_time_component_count = 0
+        self.schedule_time_triggered_components()
+        self.real_time_scheduler.schedule(current_time + self.analysis_context.aminer_config.config_properties.get(
+            KEY_LOG_STAT_PERIOD, DEFAULT_STAT_PERIOD), self.log_component_statistics)
+        self.real_time_scheduler.schedule(current_time + self.backup_period, self.backup_persistence_data)
+        self.real_time_scheduler.schedule(current_time + self.max_select_timeout, self.flush_event_handler_batches)
 
         delayed_return_status = 0
         while self.run_analysis_loop_flag:
-            # Build the list of inputs to select for anew each time: the LogStream file descriptors may change due to rollover.
-            input_select_fd_list = []
-            output_select_fd_list = []
-            for fd_handler_object in self.tracked_fds_dict.values():
-                if isinstance(fd_handler_object, LogStream):
-                    stream_fd = fd_handler_object.get_current_fd()
-                    if stream_fd < 0:
-                        continue
-                    input_select_fd_list.append(stream_fd)
-                elif isinstance(fd_handler_object, AnalysisChildRemoteControlHandler):
-                    fd_handler_object.add_select_fds(input_select_fd_list, output_select_fd_list)
-                else:
-                    # This has to be a socket, just add the file descriptor.
-                    input_select_fd_list.append(fd_handler_object.fileno())
-
             # Loop over the list in reverse order to avoid skipping elements in remove.
             if not suspended_flag:
                 for log_stream in reversed(blocked_log_streams):
                     current_stream_fd = log_stream.handle_stream()
                     if current_stream_fd >= 0:
-                        self.tracked_fds_dict[current_stream_fd] = log_stream
-                        input_select_fd_list.append(current_stream_fd)
+                        self.track_fd(current_stream_fd, log_stream)
                         blocked_log_streams.remove(log_stream)
 
-            read_list = None
-            write_list = None
+            # Regular files are always readable, so do not wait when any of them is tracked.
+            timeout = 0
+            if not self.always_readable_fds:
+                timeout = self.get_timer_timeout()
             try:
-                (read_list, write_list, _except_list) = select.select(input_select_fd_list, output_select_fd_list, [], 1)
-            except select.error as select_error:
-                # Interrupting signals, e.g. for shutdown are OK.
-                if select_error[0] == errno.EINTR:
-                    continue
+                ready_list = [(key.fd, events) for key, events in self.selector.select(timeout)]
+            except OSError as select_error:
                 msg = f"Unexpected select result {str(select_error)}"
                 print(msg, file=sys.stderr)
                 logging.getLogger(DEBUG_LOG_NAME).error(msg)
                 delayed_return_status = 1
                 break
-            for read_fd in read_list:
-                fd_handler_object = self.tracked_fds_dict[read_fd]
-                if isinstance(fd_handler_object, LogStream):
-                    # Handle this LogStream. Only when downstream processing blocks, add the stream to the blocked stream list.
-                    handle_result = fd_handler_object.handle_stream()
-                    if handle_result < 0:
-                        # No need to care if current internal file descriptor in LogStream has changed in handleStream(),
-                        # this will be handled when unblocking.
-                        del self.tracked_fds_dict[read_fd]
-                        blocked_log_streams.append(fd_handler_object)
-                    elif handle_result != read_fd:
-                        # The current fd has changed, update the tracking list.
-                        del self.tracked_fds_dict[read_fd]
-                        self.tracked_fds_dict[handle_result] = fd_handler_object
+            for ready_fd in self.always_readable_fds:
+                ready_list.append((ready_fd, selectors.EVENT_READ))
+            for ready_fd, events in ready_list:
+                # The fd might have been untracked while handling a previous fd in this round.
+                fd_handler_object = self.tracked_fds_dict.get(ready_fd)
+                if fd_handler_object is None:
                     continue
+                if events & selectors.EVENT_READ:
+                    self.handle_readable_fd(ready_fd, fd_handler_object, blocked_log_streams)
+                elif events & selectors.EVENT_WRITE:
+                    self.handle_writable_fd(ready_fd, fd_handler_object)
 
-                if isinstance(fd_handler_object, AnalysisChildRemoteControlHandler):
-                    try:
-                        fd_handler_object.do_receive()
-                    except ConnectionError as receiveException:
-                        msg = f"Unclean termination of remote control: {str(receiveException)}"
-                        logging.getLogger(DEBUG_LOG_NAME).error(msg)
-                        print(msg, file=sys.stderr)
-                    if fd_handler_object.is_dead():
-                        logging.getLogger(DEBUG_LOG_NAME).debug('Deleting fd %s from tracked_fds_dict.', str(read_fd))
-                        del self.tracked_fds_dict[read_fd]
-                    # Reading is only attempted when output buffer was already flushed. Try processing the next request to fill the output
-                    # buffer for next round.
-                    else:
-                        fd_handler_object.do_process(self.analysis_context)
-                    continue
+            self.handle_time_triggers()
 
-                if fd_handler_object == self.master_control_socket:
-                    self.handle_master_control_socket_receive()
-                    continue
+            if len(self.tracked_fds_dict) == 1 and self.offline_mode:
+                self.run_analysis_loop_flag = False
 
-                if fd_handler_object == self.remote_control_socket:
-                    # We received a remote connection, accept it unconditionally. Users should make sure, that they do not exhaust
-                    # resources by hogging open connections.
-                    (control_client_socket, _remote_address) = self.remote_control_socket.accept()
-                    # Keep track of information received via this remote control socket.
-                    remote_control_handler = AnalysisChildRemoteControlHandler(control_client_socket)
-                    self.tracked_fds_dict[control_client_socket.fileno()] = remote_control_handler
-                    continue
+        # Analysis loop is only left on shutdown.
+        self.shutdown_analysis()
+        return delayed_return_status
+
+    def shutdown_analysis(self):
+        """Try to persist everything, wait until the background writes are finished and release all resources of the analysis."""
+        PersistenceUtil.persist_all()
+        PersistenceUtil.set_background_persistence(False)
+        if self.backup_thread is not None:
+            self.backup_thread.join()
+        for sock in self.tracked_fds_dict.values():
+            sock.close()
+        self.selector.close()
+        self.analysis_context.close_event_handler_streams(self.analysis_context.atomizer_factory.event_handler_list)
+        self.analysis_context.atomizer_factory.close()
 
-                msg = f"Unhandled object type {type(fd_handler_object)}"
+    def track_fd(self, fd, fd_handler_object, events=selectors.EVENT_READ):
+        """
+        Track a file descriptor and register it in the selector, so the registration persists until the fd is untracked.
+        @param fd the file descriptor.
+        @param fd_handler_object the object handling the data of the file descriptor.
+        @param events the selector events to wait for.
+        """
+        self.tracked_fds_dict[fd] = fd_handler_object
+        try:
+            self.selector.register(fd, events)
+        except PermissionError:
+            # Regular files can not be registered with epoll. They are always readable, so they are handled in each round like
+            # select() would have reported them.
+            self.always_readable_fds.append(fd)
+
+    def untrack_fd(self, fd):
+        """Stop tracking a file descriptor and remove its registration from the selector."""
+        del self.tracked_fds_dict[fd]
+        if fd in self.always_readable_fds:
+            self.always_readable_fds.remove(fd)
+        else:
+            self.selector.unregister(fd)
+
+    def update_remote_control_events(self, fd, remote_control_handler):
+        """Wait for the remote control connection to become writable when there is output data to send, otherwise for input data."""
+        if remote_control_handler.output_buffer:
+            events = selectors.EVENT_WRITE
+        else:
+            events = selectors.EVENT_READ
+        if self.selector.get_key(fd).events != events:
+            self.selector.modify(fd, events)
+
+    def handle_readable_fd(self, read_fd, fd_handler_object, blocked_log_streams):
+        """Handle a file descriptor with available input data."""
+        if isinstance(fd_handler_object, LogStream):
+            # Handle this LogStream. Only when downstream processing blocks, add the stream to the blocked stream list.
+            if self.offline_mode:
+                handle_result = self.replay_log_stream(fd_handler_object)
+            else:
+                handle_result = fd_handler_object.handle_stream()
+            if handle_result < 0:
+                # No need to care if current internal file descriptor in LogStream has changed in handleStream(),
+                # this will be handled when unblocking.
+                self.untrack_fd(read_fd)
+                blocked_log_streams.append(fd_handler_object)
+            elif handle_result != read_fd:
+                # The current fd has changed, update the tracking list.
+                self.untrack_fd(read_fd)
+                self.track_fd(handle_result, fd_handler_object)
+            return
+
+        if isinstance(fd_handler_object, AnalysisChildRemoteControlHandler):
+            try:
+                fd_handler_object.do_receive()
+            except ConnectionError as receiveException:
+                msg = f"Unclean termination of remote control: {str(receiveException)}"
                 logging.getLogger(DEBUG_LOG_NAME).error(msg)
-                raise Exception(msg)
+                print(msg, file=sys.stderr)
+            if fd_handler_object.is_dead():
+                logging.getLogger(DEBUG_LOG_NAME).debug('Deleting fd %s from tracked_fds_dict.', str(read_fd))
+                self.untrack_fd(read_fd)
+            # Reading is only attempted when output buffer was already flushed. Try processing the next request to fill the output
+            # buffer for next round.
+            else:
+                fd_handler_object.do_process(self.analysis_context)
+                self.update_remote_control_events(read_fd, fd_handler_object)
+            return
 
-            for write_fd in write_list:
-                fd_handler_object = self.tracked_fds_dict[write_fd]
-                if isinstance(fd_handler_object, AnalysisChildRemoteControlHandler):
-                    buffer_flushed_flag = False
-                    try:
-                        buffer_flushed_flag = fd_handler_object.do_send()
-                    except OSError as sendError:
-                        msg = f"Error at sending data via remote control: {str(sendError)}"
-                        print(msg, file=sys.stderr)
-                        logging.getLogger(DEBUG_LOG_NAME).error(msg)
-                        try:
-                            fd_handler_object.terminate()
-                        except ConnectionError as terminateException:
-                            msg = f"Unclean termination of remote control: {str(terminateException)}"
-                            print(msg, file=sys.stderr)
-                            logging.getLogger(DEBUG_LOG_NAME).error(msg)
-                    if buffer_flushed_flag:
-                        fd_handler_object.do_process(self.analysis_context)
-                    if fd_handler_object.is_dead():
-                        del self.tracked_fds_dict[write_fd]
-                    continue
-                msg = f"Unhandled object type {type(fd_handler_object)}"
+        if fd_handler_object == self.master_control_socket:
+            self.handle_master_control_socket_receive()
+            return
+
+        if fd_handler_object == self.remote_control_socket:
+            # We received a remote connection, accept it unconditionally. Users should make sure, that they do not exhaust
+            # resources by hogging open connections.
+            (control_client_socket, _remote_address) = self.remote_control_socket.accept()
+            # Keep track of information received via this remote control socket.
+            remote_control_handler = AnalysisChildRemoteControlHandler(control_client_socket)
+            self.track_fd(control_client_socket.fileno(), remote_control_handler)
+            return
+
+        msg = f"Unhandled object type {type(fd_handler_object)}"
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise Exception(msg)
+
+    def handle_writable_fd(self, write_fd, fd_handler_object):
+        """Handle a file descriptor ready for sending output data."""
+        if isinstance(fd_handler_object, AnalysisChildRemoteControlHandler):
+            buffer_flushed_flag = False
+            try:
+                buffer_flushed_flag = fd_handler_object.do_send()
+            except OSError as sendError:
+                msg = f"Error at sending data via remote control: {str(sendError)}"
+                print(msg, file=sys.stderr)
                 logging.getLogger(DEBUG_LOG_NAME).error(msg)
-                raise Exception(msg)
+                try:
+                    fd_handler_object.terminate()
+                except ConnectionError as terminateException:
+                    msg = f"Unclean termination of remote control: {str(terminateException)}"
+                    print(msg, file=sys.stderr)
+                    logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            if buffer_flushed_flag:
+                fd_handler_object.do_process(self.analysis_context)
+            if fd_handler_object.is_dead():
+                self.untrack_fd(write_fd)
+            else:
+                self.update_remote_control_events(write_fd, fd_handler_object)
+            return
+        msg = f"Unhandled object type {type(fd_handler_object)}"
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise Exception(msg)
 
-            # Handle the real time events.
-            real_time = time.time()
-            if next_real_time_trigger_time is None or real_time >= next_real_time_trigger_time:
-                next_trigger_offset = 3600
-                for component in real_time_triggered_components:
-                    if not suspended_flag:
-                        next_trigger_request = component.do_timer(real_time)
-                    next_trigger_offset = min(next_trigger_offset, next_trigger_request)
-                next_real_time_trigger_time = real_time + next_trigger_offset
-
-            if real_time >= next_statistics_log_time:
-                next_statistics_log_time = real_time + log_stat_period
-                logging.getLogger(DEBUG_LOG_NAME).debug('Statistics logs are written..')
-                # log the statistics for every component.
-                for component_name in self.analysis_context.registered_components_by_name:
-                    component = self.analysis_context.registered_components_by_name[component_name]
-                    component.log_statistics(component_name)
-
-            # Handle the analysis time events. The analysis time will be different when an analysis time component is registered.
-            analysis_time = self.analysis_context.analysis_time
-            if analysis_time is None:
-                analysis_time = real_time
-            if next_analysis_time_trigger_time is None or analysis_time >= next_analysis_time_trigger_time:
-                next_trigger_offset = 3600
-                for component in analysis_time_triggered_components:
-                    if not suspended_flag:
-                        next_trigger_request = component.do_timer(real_time)
-                    next_trigger_offset = min(next_trigger_offset, next_trigger_request)
-                next_analysis_time_trigger_time = analysis_time + next_trigger_offset
-
-            # backup the persistence data.
-            backup_time = time.time()
-            backup_time_str = datetime.fromtimestamp(backup_time).strftime('%Y-%m-%d-%H-%M-%S')
-            persistence_dir = self.analysis_context.aminer_config.config_properties.get(
-                KEY_PERSISTENCE_DIR, DEFAULT_PERSISTENCE_DIR)
-            persistence_dir = persistence_dir.rstrip('/')
-            backup_path = persistence_dir + '/backup/'
-            backup_path_with_date = os.path.join(backup_path, backup_time_str)
-            if next_backup_time_trigger_time is None or backup_time >= next_backup_time_trigger_time:
-                next_trigger_offset = 3600 * 24
-                if next_backup_time_trigger_time is not None:
-                    shutil.copytree(persistence_dir, backup_path_with_date, ignore=shutil.ignore_patterns('backup*'))
-                    logging.getLogger(DEBUG_LOG_NAME).info('Persistence backup created in %s.', backup_path_with_date)
-                next_backup_time_trigger_time = backup_time + next_trigger_offset
+    def schedule_time_triggered_components(self):
+        """Schedule the time triggered components registered since the last call, e.g. via remote control. They are triggered at once."""
+        real_time_triggered_components = self.analysis_context.real_time_triggered_components
+        while self.scheduled_real_time_component_count < len(real_time_triggered_components):
+            component = real_time_triggered_components[self.scheduled_real_time_component_count]
+            self.real_time_scheduler.schedule(0, functools.partial(self.trigger_component, component))
+            self.scheduled_real_time_component_count += 1
+        analysis_time_triggered_components = self.analysis_context.analysis_time_triggered_components
+        while self.scheduled_analysis_time_component_count < len(analysis_time_triggered_components):
+            component = analysis_time_triggered_components[self.scheduled_analysis_time_component_count]
+            self.analysis_time_scheduler.schedule(0, functools.partial(self.trigger_component, component))
+            self.scheduled_analysis_time_component_count += 1
 
-            if len(self.tracked_fds_dict) == 1 and self.offline_mode:
-                self.run_analysis_loop_flag = False
+    # skipcq: PYL-R0201
+    def trigger_component(self, component, trigger_time):
+        """
+        Trigger a time triggered component unless the aminer is suspended.
+        @return the number of seconds until the component has to be triggered again.
+        """
+        if suspended_flag:
+            return self.max_select_timeout
+        return component.do_timer(trigger_time)
 
-        # Analysis loop is only left on shutdown. Try to persist everything and leave.
-        PersistenceUtil.persist_all()
-        for sock in self.tracked_fds_dict.values():
-            sock.close()
-        self.analysis_context.close_event_handler_streams(self.analysis_context.atomizer_factory.event_handler_list)
-        return delayed_return_status
+    def log_component_statistics(self, _trigger_time):
+        """
+        Log the statistics of every registered component and of the asynchronous event handlers.
+        @return the number of seconds until the statistics have to be logged again.
+        """
+        logging.getLogger(DEBUG_LOG_NAME).debug('Statistics logs are written..')
+        for component_name, component in self.analysis_context.registered_components_by_name.items():
+            # Renamed components leave None under their old name.
+            if component is not None:
+                component.log_statistics(component_name)
+        for event_handler in self.analysis_context.atomizer_factory.event_handler_list:
+            if isinstance(event_handler, AsyncEventHandler):
+                event_handler.log_statistics(event_handler.handler_name)
+        return self.analysis_context.aminer_config.config_properties.get(KEY_LOG_STAT_PERIOD, DEFAULT_STAT_PERIOD)
+
+    def flush_event_handler_batches(self, trigger_time):
+        """
+        Send the batches of the JsonConverterHandlers, when the oldest event in a batch waited longer than the batch_timeout.
+        The batches of handlers wrapped in an AsyncEventHandler are flushed by its background thread, as the event handlers might not be
+        thread safe.
+        @return the number of seconds until the batches have to be checked again.
+        """
+        event_handlers = list(self.analysis_context.atomizer_factory.event_handler_list)
+        while event_handlers:
+            event_handler = event_handlers.pop()
+            if isinstance(event_handler, JsonConverterHandler):
+                event_handler.flush_batches(trigger_time)
+            elif isinstance(event_handler, ScoringEventHandler):
+                event_handlers += event_handler.event_handlers
+        return self.max_select_timeout
+
+    def backup_persistence_data(self, trigger_time):
+        """
+        Back up the persistence directory in a background thread, so the analysis is not blocked while the files are copied.
+        @return the number of seconds until the next backup.
+        """
+        if self.backup_thread is not None and self.backup_thread.is_alive():
+            msg = 'Skipping the persistence backup, as the previous backup is still running.'
+            logging.getLogger(DEBUG_LOG_NAME).warning(msg)
+            return self.backup_period
+        backup_time_str = datetime.fromtimestamp(trigger_time).strftime(PersistenceUtil.BACKUP_TIME_FORMAT)
+        self.backup_thread = threading.Thread(target=self.create_persistence_backup, args=(backup_time_str,), name='PersistenceBackup',
+                                              daemon=True)
+        self.backup_thread.start()
+        return self.backup_period
+
+    def create_persistence_backup(self, backup_name):
+        """Create a backup of the persistence directory with the configured backup mode and retention."""
+        config_properties = self.analysis_context.aminer_config.config_properties
+        persistence_dir = config_properties.get(KEY_PERSISTENCE_DIR, DEFAULT_PERSISTENCE_DIR).rstrip('/')
+        try:
+            copied_files, linked_files = PersistenceUtil.create_backup(
+                persistence_dir, backup_name, config_properties.get(KEY_BACKUP_MODE, DEFAULT_BACKUP_MODE),
+                config_properties.get(KEY_BACKUP_RETENTION, DEFAULT_BACKUP_RETENTION))
+        except Exception as e:  # skipcq: PYL-W0703
+            msg = f'Failed to create the persistence backup {backup_name}: {e}'
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            print('ERROR: ' + msg, file=sys.stderr)
+            return
+        logging.getLogger(DEBUG_LOG_NAME).info('Persistence backup created in %s (%d files copied, %d files linked).', os.path.join(
+            persistence_dir, PersistenceUtil.BACKUP_DIR_NAME, backup_name), copied_files, linked_files)
+
+    def get_analysis_time(self, real_time):
+        """Get the analysis time, which is the real time when no analysis time component set it."""
+        if self.analysis_context.analysis_time is None:
+            return real_time
+        return self.analysis_context.analysis_time
+
+    def get_timer_timeout(self):
+        """Get the number of seconds until the next timer is due. The timeout is limited to max_select_timeout to react on signals."""
+        timeout = self.max_select_timeout
+        real_time = time.time()
+        next_trigger_time = self.real_time_scheduler.get_next_trigger_time()
+        if next_trigger_time is not None:
+            timeout = min(timeout, next_trigger_time - real_time)
+        next_trigger_time = self.analysis_time_scheduler.get_next_trigger_time()
+        if next_trigger_time is not None:
+            timeout = min(timeout, next_trigger_time - self.get_analysis_time(real_time))
+        return max(timeout, 0)
+
+    def handle_time_triggers(self):
+        """Run the timers of the real time and analysis time triggered components, the statistics and the backups being due."""
+        self.schedule_time_triggered_components()
+        real_time = time.time()
+        self.real_time_scheduler.run_due_timers(real_time)
+        # The analysis time triggered components are also invoked with the real time.
+        self.analysis_time_scheduler.run_due_timers(self.get_analysis_time(real_time), real_time)
+
+    def replay_log_stream(self, log_stream):
+        """
+        Replay the data of a LogStream in offline mode. Regular files are mapped into memory and the data is handed to the atomizer in large
+        blocks without waiting for the stream to become readable. The time triggers are handled after each block.
+        @return the result of the last handle_stream() call.
+        """
+        handle_result = 0
+        while handle_result >= 0 and self.run_analysis_loop_flag:
+            # Map the file again after a rollover to the next resource.
+            if isinstance(log_stream.log_data_resource, FileLogDataResource):
+                log_stream.log_data_resource.map_file()
+            handle_result = log_stream.handle_stream()
+            self.handle_time_triggers()
+        return handle_result
 
     def handle_master_control_socket_receive(self):
         """
@@ -475,7 +630,6 @@ class AnalysisChild(TimeTriggeredComponentInterface):
                 del self.repositioning_data_dict[annotation_data]
             res = None
             if annotation_data.startswith(b'file://'):
-                from aminer.input.LogStream import FileLogDataResource
                 res = FileLogDataResource(annotation_data, received_fd, repositioning_data=repositioning_data)
             elif annotation_data.startswith(b'unix://'):
                 from aminer.input.LogStream import UnixSocketLogDataResource
@@ -491,7 +645,7 @@ class AnalysisChild(TimeTriggeredComponentInterface):
             if log_stream is None:
                 stream_atomizer = self.analysis_context.atomizer_factory.get_atomizer_for_resource(res.get_resource_name())
                 log_stream = LogStream(res, stream_atomizer)
-                self.tracked_fds_dict[res.get_file_descriptor()] = log_stream
+                self.track_fd(res.get_file_descriptor(), log_stream)
                 self.log_streams_by_name[res.get_resource_name()] = log_stream
             else:
                 log_stream.add_next_resource(res)
@@ -502,7 +656,7 @@ class AnalysisChild(TimeTriggeredComponentInterface):
                 raise Exception(msg)
             self.remote_control_socket = socket.fromfd(received_fd, socket.AF_UNIX, socket.SOCK_STREAM, 0)
             os.close(received_fd)
-            self.tracked_fds_dict[self.remote_control_socket.fileno()] = self.remote_control_socket
+            self.track_fd(self.remote_control_socket.fileno(), self.remote_control_socket)
         else:
             msg = f"Unhandled type info on received fd: {repr(received_type_info)}"
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
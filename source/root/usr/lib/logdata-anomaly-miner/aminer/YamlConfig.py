@@ -268,10 +268,12 @@ def build_parsing_model(data=None):
                 key_parser_dict = parse_json_yaml(item['key_parser_dict'], parser_model_dict)
                 if 'start' in item and item['start'] is True:
                     start = item['type'].func(
-                        item['name'], key_parser_dict, item['optional_key_prefix'], item['nullable_key_prefix'], item['allow_all_fields'])
+                        item['name'], key_parser_dict, item['optional_key_prefix'], item['nullable_key_prefix'], item['allow_all_fields'],
+                        item['strict_json'])
                 else:
                     parser_model_dict[item['id']] = item['type'].func(
-                        item['name'], key_parser_dict, item['optional_key_prefix'], item['nullable_key_prefix'], item['allow_all_fields'])
+                        item['name'], key_parser_dict, item['optional_key_prefix'], item['nullable_key_prefix'], item['allow_all_fields'],
+                        item['strict_json'])
             elif item['type'].name == 'XmlModelElement':
                 key_parser_dict = parse_json_yaml(item['key_parser_dict'], parser_model_dict)
                 if 'start' in item and item['start'] is True:
@@ -330,6 +332,9 @@ def build_input_pipeline(analysis_context, parsing_model, parser_model_dict):
         replace(b"\\\\", b"\\").replace(b"\\b", b"\b")
     json_format = yaml_data['Input']['json_format']
     xml_format = yaml_data['Input']['xml_format']
+    parser_process_count = yaml_data['Input']['parser_process_count']
+    parser_batch_size = yaml_data['Input']['parser_batch_size']
+    compile_parsing_model = yaml_data['Input']['compile_parsing_model']
     if yaml_data['Input']['multi_source'] is True:
         from aminer.input.SimpleMultisourceAtomSync import SimpleMultisourceAtomSync
         if yaml_data['Input']['adjust_timestamps'] is True:
@@ -366,7 +371,8 @@ def build_input_pipeline(analysis_context, parsing_model, parser_model_dict):
     analysis_context.atomizer_factory = SimpleByteStreamLineAtomizerFactory(
         parsing_model, atom_handler_list, anomaly_event_handlers, default_timestamp_path_list=timestamp_paths, eol_sep=eol_sep,
         json_format=json_format, xml_format=xml_format, parser_model_dict=parser_model_dict, log_resources=log_resources,
-        use_real_time=use_real_time, continuous_timestamp_missing_warning=continuous_timestamp_missing_warning)
+        use_real_time=use_real_time, continuous_timestamp_missing_warning=continuous_timestamp_missing_warning,
+        parser_process_count=parser_process_count, parser_batch_size=parser_batch_size, compile_parsing_model=compile_parsing_model)
     return anomaly_event_handlers, atom_filter
 
 
@@ -562,7 +568,8 @@ def build_analysis_components(analysis_context, anomaly_event_handlers, atom_fil
                                     window_size=item['window_size'], set_upper_limit=item['set_upper_limit'],
                                     local_maximum_threshold=item['local_maximum_threshold'], learn_mode=learn,
                                     output_logline=item['output_logline'], ignore_list=item['ignore_list'],
-                                    constraint_list=item['constraint_list'], log_resource_ignore_list=item['log_resource_ignore_list'])
+                                    constraint_list=item['constraint_list'], log_resource_ignore_list=item['log_resource_ignore_list'],
+                                    bucket_size=item['bucket_size'])
             elif item['type'].name == 'LinearNumericBinDefinition':
                 if comp_name is None:
                     msg = f'The {item["type"].name} must have an id!'
@@ -1000,14 +1007,16 @@ def build_event_handlers(analysis_context, anomaly_event_handlers):
                     ctx = func(analysis_context)
                 if item['json'] is True or item['type'].name == 'KafkaEventHandler' or item['type'].name == 'ZmqEventHandler':
                     from aminer.events.JsonConverterHandler import JsonConverterHandler
-                    if item['pretty'] is True:
-                        ctx = JsonConverterHandler([ctx], analysis_context, pretty_print=True)
-                    else:
-                        ctx = JsonConverterHandler([ctx], analysis_context, pretty_print=False)
+                    ctx = JsonConverterHandler([ctx], analysis_context, pretty_print=item['pretty'] is True, batch_size=item['batch_size'],
+                                               batch_timeout=item['batch_timeout'])
                 if item['score']:
                     from aminer.events.ScoringEventHandler import ScoringEventHandler
                     ctx = ScoringEventHandler([ctx], analysis_context, weights=item['weights'], auto_weights=item['auto_weights'],
                                               auto_weights_history_length=item['auto_weights_history_length'])
+                if item['async']:
+                    from aminer.events.AsyncEventHandler import AsyncEventHandler
+                    ctx = AsyncEventHandler(ctx, analysis_context, queue_size=item['queue_size'], overflow_policy=item['overflow_policy'],
+                                            sample_interval=item['sample_interval'], handler_name=item['id'])
                 anomaly_event_handlers.append(ctx)
             return event_handler_id_list
         raise KeyError()
@@ -16,7 +16,7 @@ import logging
 from aminer.input.InputInterfaces import AtomHandlerInterface
 from aminer.AminerConfig import CONFIG_KEY_LOG_LINE_PREFIX, DEFAULT_LOG_LINE_PREFIX, DEBUG_LOG_NAME
 from aminer import AminerConfig
-from aminer.analysis.Rules import MatchRule
+from aminer.analysis.Rules import MatchRule, FirstMatchRuleIndex
 
 
 class AllowlistViolationDetector(AtomHandlerInterface):
@@ -29,7 +29,8 @@ class AllowlistViolationDetector(AtomHandlerInterface):
     def __init__(self, aminer_config, allowlist_rules, anomaly_event_handlers, output_logline=True, log_resource_ignore_list=None):
         """
         Initialize the detector.
-        @param allowlist_rules list of rules executed until the first rule matches.
+        @param allowlist_rules list of rules executed until the first rule matches. Rules without match actions are indexed by their
+               required paths and values, so they are not necessarily executed in the given order.
         """
         super().__init__(aminer_config=aminer_config, anomaly_event_handlers=anomaly_event_handlers, output_logline=output_logline,
                          allowlist_rules=allowlist_rules, log_resource_ignore_list=log_resource_ignore_list,
@@ -43,6 +44,7 @@ class AllowlistViolationDetector(AtomHandlerInterface):
                 msg = "allowlist_rules values must be of the type MatchRule."
                 logging.getLogger(DEBUG_LOG_NAME).error(msg)
                 raise TypeError(msg)
+        self.rule_index = FirstMatchRuleIndex(self.allowlist_rules)
 
     def receive_atom(self, log_atom):
         """
@@ -55,10 +57,9 @@ class AllowlistViolationDetector(AtomHandlerInterface):
                 return False
         self.log_total += 1
         event_data = {}
-        for rule in self.allowlist_rules:
-            if rule.match(log_atom):
-                self.log_success += 1
-                return True
+        if self.rule_index.match(log_atom):
+            self.log_success += 1
+            return True
         original_log_line_prefix = self.aminer_config.config_properties.get(CONFIG_KEY_LOG_LINE_PREFIX, DEFAULT_LOG_LINE_PREFIX)
         try:
             data = log_atom.raw_data.decode(AminerConfig.ENCODING)
@@ -108,6 +108,10 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
         self.forward_rules = {}
         self.back_rules_inv = {}
         self.forward_rules_inv = {}
+        # The (trigger_event, implied_event) tuples of all hypotheses and rules, so new hypotheses are checked for duplicates without
+        # searching the lists of hypotheses and rules.
+        self.back_implications = set()
+        self.forward_implications = set()
 
         # Compute the initial minimum amount of positive evaluations for hypotheses to become rules.
         # For rules, this value can be different and will be computed based on the sample observations.
@@ -203,6 +207,8 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
 
         # Store last seen sample event to improve output.
         self.sample_events[log_event] = log_atom.raw_data
+        # Triggers before this timestamp are too old to be resolved.
+        min_trigger_timestamp = log_atom.atom_time - self.hypothesis_max_delta_time
 
         if self.check_rules_flag:
             # Only check rules without generating new hypotheses.
@@ -216,18 +222,10 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
             # Resolve triggered implication A => B when B occurs.
             if log_event in self.forward_rules_inv:
                 for rule in self.forward_rules_inv[log_event]:
-                    # Find first non-observed trigger timestamp
-                    trigger_timestamp_index = -1
-                    for trigger_timestamp in rule.rule_trigger_timestamps:
-                        trigger_timestamp_index += 1
-                        if trigger_timestamp != "obs":
-                            break
-                    if trigger_timestamp_index != -1 and \
-                            rule.rule_trigger_timestamps[trigger_timestamp_index] != "obs" and \
-                            rule.rule_trigger_timestamps[trigger_timestamp_index] >= log_atom.atom_time - self.hypothesis_max_delta_time:
-                        # Implication was triggered; append positive evaluation and mark as seen.
+                    # Mark the first non-observed trigger timestamp as seen if the implication was triggered.
+                    if rule.rule_trigger_timestamps.observe(min_trigger_timestamp):
+                        # Implication was triggered; append positive evaluation.
                         rule.add_rule_observation(1)
-                        rule.rule_trigger_timestamps[trigger_timestamp_index] = "obs"
 
             # Clean up triggered/resolved implications.
             while len(self.forward_rule_queue) > 0:
@@ -236,49 +234,18 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                     # Triggered timestamp was already deleted somewhere else.
                     self.forward_rule_queue.popleft()
                     continue
-                if rule.rule_trigger_timestamps[0] == "obs":
+                if rule.rule_trigger_timestamps.observed > 0:
                     # Remove triggered timestamp.
                     rule.rule_trigger_timestamps.popleft()
                     self.forward_rule_queue.popleft()
                     continue
-                if rule.rule_trigger_timestamps[0] < log_atom.atom_time - self.hypothesis_max_delta_time:
+                if rule.rule_trigger_timestamps.timestamps[0] < min_trigger_timestamp:
                     # Too much time has elapsed; append negative evaluation.
                     rule.add_rule_observation(0)
                     rule.rule_trigger_timestamps.popleft()
                     self.forward_rule_queue.popleft()
                     if not rule.evaluate_rule():
-                        if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
-                            self.stop_learning_timestamp = max(
-                                self.stop_learning_timestamp, log_atom.atom_time + self.stop_learning_no_anomaly_time)
-                        try:
-                            data = log_atom.raw_data.decode(AminerConfig.ENCODING)
-                        except UnicodeError:
-                            data = repr(log_atom.raw_data)
-                        original_log_line_prefix = self.aminer_config.config_properties.get(
-                            CONFIG_KEY_LOG_LINE_PREFIX, DEFAULT_LOG_LINE_PREFIX)
-                        tmp_string = f"Rule: {str(rule.trigger_event)} -> {str(rule.implied_event)}\n  Expected: " \
-                                     f"{str(rule.min_eval_true)}/{str(rule.max_observations)}\n  Observed: " \
-                                     f"{str(sum(rule.rule_observations))}/{str(len(rule.rule_observations))}"
-                        if self.output_logline:
-                            sorted_log_lines = [tmp_string + "\n" + original_log_line_prefix + data]
-                        else:
-                            sorted_log_lines = [tmp_string + data]
-                        for listener in self.anomaly_event_handlers:
-                            implied_event = None
-                            trigger_event = None
-                            if rule.implied_event in self.sample_events:
-                                implied_event = self.sample_events[rule.implied_event]
-                            if rule.trigger_event in self.sample_events:
-                                trigger_event = self.sample_events[rule.trigger_event]
-                            listener.receive_event(
-                                "analysis.EventCorrelationDetector",
-                                f"Correlation rule violated! Event {repr(implied_event)} is missing, but should follow event "
-                                f"{repr(trigger_event)}", sorted_log_lines,
-                                {"RuleInfo": {"Rule": str(rule.trigger_event) + "->" + str(rule.implied_event),
-                                              "Expected": str(rule.min_eval_true) + "/" + str(rule.max_observations),
-                                              "Observed": str(sum(rule.rule_observations)) + "/" + str(len(rule.rule_observations))}},
-                                log_atom, self)
-                        rule.rule_observations = deque([])
+                        self.send_rule_violation_event(rule, log_atom, True)
                     continue
                 break
 
@@ -291,52 +258,13 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
             # Resolve triggered implication B <= A when A occurs.
             if log_event in self.back_rules:
                 for rule in self.back_rules[log_event]:
-                    # Find first non-observed trigger timestamp
-                    trigger_timestamp_index = -1
-                    for trigger_timestamp in rule.rule_trigger_timestamps:
-                        trigger_timestamp_index += 1
-                        if trigger_timestamp != "obs":
-                            break
-                    if trigger_timestamp_index != -1 and \
-                            rule.rule_trigger_timestamps[trigger_timestamp_index] != "obs" and \
-                            rule.rule_trigger_timestamps[trigger_timestamp_index] >= log_atom.atom_time - self.hypothesis_max_delta_time:
+                    # Mark the first non-observed trigger timestamp as seen if the implication was triggered.
+                    if rule.rule_trigger_timestamps.observe(min_trigger_timestamp):
                         rule.add_rule_observation(1)
-                        rule.rule_trigger_timestamps[trigger_timestamp_index] = "obs"
                     else:
                         rule.add_rule_observation(0)
                         if not rule.evaluate_rule():
-                            if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
-                                self.stop_learning_timestamp = max(
-                                    self.stop_learning_timestamp, log_atom.atom_time + self.stop_learning_no_anomaly_time)
-                            try:
-                                data = log_atom.raw_data.decode(AminerConfig.ENCODING)
-                            except UnicodeError:
-                                data = repr(log_atom.raw_data)
-                            original_log_line_prefix = self.aminer_config.config_properties.get(
-                                CONFIG_KEY_LOG_LINE_PREFIX, DEFAULT_LOG_LINE_PREFIX)
-                            tmp_string = f"Rule: {str(rule.implied_event)} <- {str(rule.trigger_event)}\n  Expected: " \
-                                         f"{str(rule.min_eval_true)}/{str(rule.max_observations)}\n  Observed: " \
-                                         f"{str(sum(rule.rule_observations))}/{str(len(rule.rule_observations))}"
-                            if self.output_logline:
-                                sorted_log_lines = [tmp_string + "\n" + original_log_line_prefix + data]
-                            else:
-                                sorted_log_lines = [tmp_string + data]
-                            for listener in self.anomaly_event_handlers:
-                                implied_event = None
-                                trigger_event = None
-                                if rule.implied_event in self.sample_events:
-                                    implied_event = self.sample_events[rule.implied_event]
-                                if rule.trigger_event in self.sample_events:
-                                    trigger_event = self.sample_events[rule.trigger_event]
-                                listener.receive_event(
-                                    "analysis.EventCorrelationDetector",
-                                    f"Correlation rule violated! Event {repr(implied_event)} is missing, but should precede event "
-                                    f"{repr(trigger_event)}", sorted_log_lines,
-                                    {"RuleInfo": {"Rule": str(rule.implied_event) + "<-" + str(rule.trigger_event),
-                                                  "Expected": str(rule.min_eval_true) + "/" + str(rule.max_observations),
-                                                  "Observed": str(sum(rule.rule_observations)) + "/" + str(len(rule.rule_observations))}},
-                                    log_atom, self)
-                            rule.rule_observations = deque([])
+                            self.send_rule_violation_event(rule, log_atom, False)
 
             # Clean up triggered/resolved implications.
             while len(self.back_rule_queue) > 0:
@@ -344,11 +272,11 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                 if len(rule.rule_trigger_timestamps) == 0:
                     self.back_rule_queue.popleft()
                     continue
-                if rule.rule_trigger_timestamps[0] == "obs":
+                if rule.rule_trigger_timestamps.observed > 0:
                     rule.rule_trigger_timestamps.popleft()
                     self.back_rule_queue.popleft()
                     continue
-                if rule.rule_trigger_timestamps[0] < log_atom.atom_time - self.hypothesis_max_delta_time:
+                if rule.rule_trigger_timestamps.timestamps[0] < min_trigger_timestamp:
                     rule.rule_trigger_timestamps.popleft()
                     self.back_rule_queue.popleft()
                     continue
@@ -371,20 +299,9 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
             if log_event in self.forward_hypotheses_inv:
                 delete_hypotheses = []
                 for implication in self.forward_hypotheses_inv[log_event]:
-                    # Find first non-observed trigger timestamp
-                    trigger_timestamp_index = -1
-                    for trigger_timestamp in implication.hypothesis_trigger_timestamps:
-                        trigger_timestamp_index += 1
-                        if trigger_timestamp != "obs":
-                            break
-                    if trigger_timestamp_index != -1 and \
-                            str(implication.hypothesis_trigger_timestamps[trigger_timestamp_index]) != "obs" and \
-                            implication.hypothesis_trigger_timestamps[trigger_timestamp_index] >= log_atom.atom_time - \
-                            self.hypothesis_max_delta_time and \
-                            implication.stable == 0:
+                    # Mark the first non-observed trigger timestamp as observed if the implication was triggered.
+                    if implication.stable == 0 and implication.hypothesis_trigger_timestamps.observe(min_trigger_timestamp):
                         implication.add_hypothesis_observation(1, log_atom.atom_time)
-                        # Mark this timestamp as observed
-                        implication.hypothesis_trigger_timestamps[trigger_timestamp_index] = "obs"
                         # Since only true observations occur here, check for instability not necessary.
                         if implication.compute_hypothesis_stability() == 1:
                             # Update p and min_eval_true according to the results in the sample.
@@ -419,12 +336,12 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                     # Triggered timestamp was already deleted somewhere else.
                     self.forward_hypotheses_queue.popleft()
                     continue
-                if implication.hypothesis_trigger_timestamps[0] == "obs":
+                if implication.hypothesis_trigger_timestamps.observed > 0:
                     # Remove triggered timestamp.
                     implication.hypothesis_trigger_timestamps.popleft()
                     self.forward_hypotheses_queue.popleft()
                     continue
-                if implication.hypothesis_trigger_timestamps[0] < log_atom.atom_time - self.hypothesis_max_delta_time:
+                if implication.hypothesis_trigger_timestamps.timestamps[0] < min_trigger_timestamp:
                     # Too much time has elapsed; append negative evaluation.
                     implication.hypothesis_trigger_timestamps.popleft()
                     implication.add_hypothesis_observation(0, log_atom.atom_time)
@@ -434,6 +351,7 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                         self.sum_unstable_unknown_hypotheses = self.sum_unstable_unknown_hypotheses - 1
                         self.forward_hypotheses[implication.trigger_event].remove(implication)
                         self.forward_hypotheses_inv[implication.implied_event].remove(implication)
+                        self.forward_implications.discard((implication.trigger_event, implication.implied_event))
                         if len(self.forward_hypotheses[implication.trigger_event]) == 0:
                             del self.forward_hypotheses[implication.trigger_event]
                         if len(self.forward_hypotheses_inv[implication.implied_event]) == 0:
@@ -454,18 +372,9 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                 delete_hypotheses = []
                 for implication in self.back_hypotheses[log_event]:
                     if implication.stable == 0:
-                        # Find first non-observed trigger timestamp
-                        trigger_timestamp_index = -1
-                        for trigger_timestamp in implication.hypothesis_trigger_timestamps:
-                            trigger_timestamp_index += 1
-                            if trigger_timestamp != "obs":
-                                break
-                        if trigger_timestamp_index != -1 and \
-                                str(implication.hypothesis_trigger_timestamps[trigger_timestamp_index]) != "obs" and \
-                                implication.hypothesis_trigger_timestamps[trigger_timestamp_index] >= log_atom.atom_time - \
-                                self.hypothesis_max_delta_time:
+                        # Mark the first non-observed trigger timestamp as observed if the implication was triggered.
+                        if implication.hypothesis_trigger_timestamps.observe(min_trigger_timestamp):
                             implication.add_hypothesis_observation(1, log_atom.atom_time)
-                            implication.hypothesis_trigger_timestamps[trigger_timestamp_index] = "obs"
                             # Since only true observations occur here, check for instability not necessary.
                             if implication.compute_hypothesis_stability() == 1:
                                 # Update p and min_eval_true according to the results in the sample.
@@ -496,6 +405,7 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                                 self.sum_unstable_unknown_hypotheses = self.sum_unstable_unknown_hypotheses - 1
                                 delete_hypotheses.append(implication)
                                 self.back_hypotheses_inv[implication.implied_event].remove(implication)
+                                self.back_implications.discard((implication.trigger_event, implication.implied_event))
                                 if len(self.back_hypotheses_inv[implication.implied_event]) == 0:
                                     del self.back_hypotheses_inv[implication.implied_event]
                 for delete_hypothesis in delete_hypotheses:
@@ -509,11 +419,11 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                 if len(implication.hypothesis_trigger_timestamps) == 0:
                     self.back_hypotheses_queue.popleft()
                     continue
-                if implication.hypothesis_trigger_timestamps[0] == "obs":
+                if implication.hypothesis_trigger_timestamps.observed > 0:
                     implication.hypothesis_trigger_timestamps.popleft()
                     self.back_hypotheses_queue.popleft()
                     continue
-                if implication.hypothesis_trigger_timestamps[0] < log_atom.atom_time - self.hypothesis_max_delta_time:
+                if implication.hypothesis_trigger_timestamps.timestamps[0] < min_trigger_timestamp:
                     implication.hypothesis_trigger_timestamps.popleft()
                     self.back_hypotheses_queue.popleft()
                     continue
@@ -529,26 +439,11 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                     for candidate in self.hypothesis_candidates:
                         candidate_event = candidate[0]
                         # Chronological implication is: candidate_event <= log_event
+                        if (log_event, candidate_event) in self.back_implications:
+                            # Only add hypotheses that are not already present as hypotheses or rules.
+                            continue
                         implication = Implication(log_event, candidate_event, log_atom.atom_time, self.max_observations, self.min_eval_true)
-                        if log_event in self.back_hypotheses:
-                            # Only add hypotheses that are not already present as hypotheses.
-                            continue_outer = False
-                            for imp in self.back_hypotheses[log_event]:
-                                if candidate_event == imp.implied_event:
-                                    continue_outer = True
-                                    break
-                            if continue_outer:
-                                continue
-                        if log_event in self.back_rules:
-                            # Only add hypotheses that are not already present as rules.
-                            continue_outer = False
-                            for imp in self.back_rules[log_event]:
-                                if candidate_event == imp.implied_event:
-                                    continue_outer = True
-                                    break
-                            if continue_outer:
-                                continue
-                        # At this point it is known that the implication is new, otherwise a continue statement would have been reached
+                        self.back_implications.add((log_event, candidate_event))
                         if log_event in self.back_hypotheses:
                             self.back_hypotheses[log_event].append(implication)
                         else:
@@ -564,27 +459,12 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                         # Chronological implication is: candidate_event => log_event
                         # Skip event A => event A since already covered by back hypotheses
                         if log_event != candidate_event:
+                            if (candidate_event, log_event) in self.forward_implications:
+                                # Only add hypotheses that are not already present as hypotheses or rules.
+                                continue
                             implication = Implication(candidate_event, log_event, log_atom.atom_time, self.max_observations,
                                                       self.min_eval_true)
-                            if candidate_event in self.forward_hypotheses:
-                                # Only add hypotheses that are not already present as hypotheses.
-                                continue_outer = False
-                                for imp in self.forward_hypotheses[candidate_event]:
-                                    if log_event == imp.implied_event:
-                                        continue_outer = True
-                                        break
-                                if continue_outer:
-                                    continue
-                            if candidate_event in self.forward_rules:
-                                # Only add hypotheses that are not already present as rules.
-                                continue_outer = False
-                                for imp in self.forward_rules[candidate_event]:
-                                    if log_event == imp.implied_event:
-                                        continue_outer = True
-                                        break
-                                if continue_outer:
-                                    continue
-                            # At this point it is known that the implication is new, otherwise a continue statement would have been reached
+                            self.forward_implications.add((candidate_event, log_event))
                             if candidate_event in self.forward_hypotheses:
                                 self.forward_hypotheses[candidate_event].append(implication)
                             else:
@@ -611,6 +491,7 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                             self.sum_unstable_unknown_hypotheses = self.sum_unstable_unknown_hypotheses - 1
                             outdated_hypotheses_indexes.append(i)
                             self.back_hypotheses_inv[implication.implied_event].remove(implication)
+                            self.back_implications.discard((implication.trigger_event, implication.implied_event))
                             if len(self.back_hypotheses_inv[implication.implied_event]) == 0:
                                 del self.back_hypotheses_inv[implication.implied_event]
                         i = i + 1
@@ -631,6 +512,7 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                             self.sum_unstable_unknown_hypotheses = self.sum_unstable_unknown_hypotheses - 1
                             outdated_hypotheses_indexes.append(i)
                             self.forward_hypotheses_inv[implication.implied_event].remove(implication)
+                            self.forward_implications.discard((implication.trigger_event, implication.implied_event))
                             if len(self.forward_hypotheses_inv[implication.implied_event]) == 0:
                                 del self.forward_hypotheses_inv[implication.implied_event]
                         i = i + 1
@@ -656,6 +538,43 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
         self.log_success += 1
         return True
 
+    def send_rule_violation_event(self, rule, log_atom, forward):
+        """
+        Send an event for a violated rule to the event handlers and start new observations for the rule.
+        @param rule the violated rule.
+        @param log_atom the log atom which caused the violation.
+        @param forward True if the rule is a forward rule (A => B), False if it is a back rule (B <= A).
+        """
+        if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
+            self.stop_learning_timestamp = max(self.stop_learning_timestamp, log_atom.atom_time + self.stop_learning_no_anomaly_time)
+        try:
+            data = log_atom.raw_data.decode(AminerConfig.ENCODING)
+        except UnicodeError:
+            data = repr(log_atom.raw_data)
+        original_log_line_prefix = self.aminer_config.config_properties.get(CONFIG_KEY_LOG_LINE_PREFIX, DEFAULT_LOG_LINE_PREFIX)
+        expected = f"{rule.min_eval_true}/{rule.max_observations}"
+        observed = f"{rule.rule_evaluated_true}/{len(rule.rule_observations)}"
+        if forward:
+            rule_string = f"{rule.trigger_event}->{rule.implied_event}"
+            tmp_string = f"Rule: {rule.trigger_event} -> {rule.implied_event}\n  Expected: {expected}\n  Observed: {observed}"
+            direction = "follow"
+        else:
+            rule_string = f"{rule.implied_event}<-{rule.trigger_event}"
+            tmp_string = f"Rule: {rule.implied_event} <- {rule.trigger_event}\n  Expected: {expected}\n  Observed: {observed}"
+            direction = "precede"
+        if self.output_logline:
+            sorted_log_lines = [tmp_string + "\n" + original_log_line_prefix + data]
+        else:
+            sorted_log_lines = [tmp_string + data]
+        implied_event = self.sample_events.get(rule.implied_event)
+        trigger_event = self.sample_events.get(rule.trigger_event)
+        event_message = f"Correlation rule violated! Event {repr(implied_event)} is missing, but should {direction} event " \
+                        f"{repr(trigger_event)}"
+        event_data = {"RuleInfo": {"Rule": rule_string, "Expected": expected, "Observed": observed}}
+        for listener in self.anomaly_event_handlers:
+            listener.receive_event("analysis.EventCorrelationDetector", event_message, sorted_log_lines, event_data, log_atom, self)
+        rule.reset_rule_observations()
+
     def do_timer(self, trigger_time):
         """Check if current ruleset should be persisted."""
         if self.next_persist_time is None:
@@ -695,6 +614,7 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                 rule = Implication(trigger_event, implied_event, None, max_obs, min_eval_t)
                 rule.stable = 1
                 if implication_direction == "back":
+                    self.back_implications.add((trigger_event, implied_event))
                     if trigger_event in self.back_rules:
                         self.back_rules[trigger_event].append(rule)
                     else:
@@ -704,6 +624,7 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
                     else:
                         self.back_rules_inv[implied_event] = [rule]
                 elif implication_direction == "forward":
+                    self.forward_implications.add((trigger_event, implied_event))
                     if trigger_event in self.forward_rules:
                         self.forward_rules[trigger_event].append(rule)
                     else:
@@ -773,6 +694,58 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
         return f"Blocklisted path {event_data} in {event_type}."
 
 
+class TriggerQueue:
+    """
+    This class stores the timestamps when an implication was triggered in chronological order. Triggers are always observed in the order
+    they were added and removed from the start of the queue, so the observed triggers are counted instead of replacing them with markers
+    and the first trigger which was not observed yet is found without searching the queue.
+    """
+
+    __slots__ = ("timestamps", "observed")
+
+    def __init__(self):
+        self.timestamps = deque()
+        # The number of triggers at the start of the queue which were already observed.
+        self.observed = 0
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __iter__(self):
+        """Iterate the triggers with "obs" for the observed triggers."""
+        for i, timestamp in enumerate(self.timestamps):
+            yield "obs" if i < self.observed else timestamp
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def append(self, timestamp):
+        """Add a trigger timestamp."""
+        self.timestamps.append(timestamp)
+
+    def observe(self, min_timestamp):
+        """
+        Mark the first trigger which was not observed yet as observed.
+        @param min_timestamp the trigger is only observed if it did not happen before this timestamp.
+        @return True if a trigger was observed.
+        """
+        if self.observed < len(self.timestamps) and self.timestamps[self.observed] >= min_timestamp:
+            self.observed += 1
+            return True
+        return False
+
+    def popleft(self):
+        """Remove the first trigger."""
+        self.timestamps.popleft()
+        if self.observed > 0:
+            self.observed -= 1
+
+    def clear(self):
+        """Remove all triggers."""
+        self.timestamps.clear()
+        self.observed = 0
+
+
 class Implication:
     """Define the shape of an implication rule."""
 
@@ -783,9 +756,11 @@ class Implication:
         self.max_observations = max_observations
         self.min_eval_true = min_eval_true
         self.most_recent_observation_timestamp = generation_time
-        self.hypothesis_trigger_timestamps = deque([])
-        self.rule_trigger_timestamps = deque([])
+        self.hypothesis_trigger_timestamps = TriggerQueue()
+        self.rule_trigger_timestamps = TriggerQueue()
         self.rule_observations = deque([])
+        # The number of positive evaluations in rule_observations.
+        self.rule_evaluated_true = 0
         # Hypothesis is only generated for observed implication. Thus, initialized with 1.
         self.hypothesis_observations = 1
         self.hypothesis_evaluated_true = 1
@@ -816,15 +791,18 @@ class Implication:
     def add_rule_observation(self, result):
         """Add a new rule to the observations."""
         if len(self.rule_observations) >= self.max_observations:
-            self.rule_observations.popleft()
+            self.rule_evaluated_true -= self.rule_observations.popleft()
         self.rule_observations.append(result)
+        self.rule_evaluated_true += result
+
+    def reset_rule_observations(self):
+        """Remove all rule observations."""
+        self.rule_observations = deque([])
+        self.rule_evaluated_true = 0
 
     def evaluate_rule(self):
         """Evaluate a rule."""
-        ones = 0
-        for obs in self.rule_observations:
-            ones = ones + obs
-        return (len(self.rule_observations) - ones) <= (self.max_observations - self.min_eval_true)
+        return (len(self.rule_observations) - self.rule_evaluated_true) <= (self.max_observations - self.min_eval_true)
 
     def __repr__(self):
         return str(self.trigger_event[-1]).split("/")[-1] + "->" + str(self.implied_event[-1]).split("/")[-1] + ", eval=" + str(
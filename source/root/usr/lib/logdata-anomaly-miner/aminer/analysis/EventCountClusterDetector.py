@@ -12,7 +12,7 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 import os
 import logging
-import math
+import numpy as np
 from aminer.AminerConfig import DEBUG_LOG_NAME, build_persistence_file_name, KEY_PERSISTENCE_PERIOD, DEFAULT_PERSISTENCE_PERIOD,\
     STAT_LOG_NAME, CONFIG_KEY_LOG_LINE_PREFIX, DEFAULT_LOG_LINE_PREFIX
 from aminer import AminerConfig
@@ -23,6 +23,60 @@ from aminer.util import PersistenceUtil
 from aminer.util.TimeTriggeredComponentInterface import TimeTriggeredComponentInterface
 
 
+# The number of known count vectors compared at once. The comparison stops after the first block containing a similar vector.
+CHECK_BLOCK_SIZE = 256
+
+
+class CountVectorModel:
+    """
+    This class stores the known count vectors of one id tuple as the rows of a matrix. The columns are the log events occurring in any of
+    the vectors, so the distances of a count vector to all known count vectors are computed with vectorised operations.
+    """
+
+    def __init__(self, count_vectors):
+        """
+        Initialize the model.
+        @param count_vectors the list of known count vectors, i.e., dictionaries of log events and their counts.
+        """
+        self.column_index = {}
+        self.matrix = np.zeros((0, 0))
+        # The sums of all counts of the rows used for normalizing the vectors.
+        self.row_sums = np.zeros(0)
+        self.idf_weights = None
+        self.idf_version = None
+        for count_vector in count_vectors:
+            self.append(count_vector)
+
+    def __len__(self):
+        """Return the number of known count vectors."""
+        return self.matrix.shape[0]
+
+    def append(self, count_vector):
+        """Add a count vector as the last row of the matrix."""
+        for log_event in count_vector:
+            if log_event not in self.column_index:
+                self.column_index[log_event] = len(self.column_index)
+        if self.matrix.shape[1] < len(self.column_index):
+            self.matrix = np.pad(self.matrix, ((0, 0), (0, len(self.column_index) - self.matrix.shape[1])))
+            self.idf_weights = None
+        row = np.zeros(len(self.column_index))
+        for log_event, count in count_vector.items():
+            row[self.column_index[log_event]] = count
+        self.matrix = np.vstack((self.matrix, row))
+        self.row_sums = np.append(self.row_sums, sum(count_vector.values()))
+
+    def remove_first(self):
+        """Remove the first (= oldest) count vector and the columns of log events which do not occur in any vector anymore."""
+        self.matrix = self.matrix[1:]
+        self.row_sums = self.row_sums[1:]
+        used_columns = self.matrix.any(axis=0)
+        if 2 * np.count_nonzero(used_columns) < len(used_columns):
+            log_events = [log_event for log_event, column in self.column_index.items() if used_columns[column]]
+            self.column_index = {log_event: column for column, log_event in enumerate(log_events)}
+            self.matrix = self.matrix[:, used_columns]
+            self.idf_weights = None
+
+
 class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, EventSourceInterface, PersistableComponentInterface):
     """This class creates events when dissimilar event or value count vectors occur."""
 
@@ -69,6 +123,9 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
         self.known_counts = {}
         self.idf_total = set()
         self.idf_counts = {}
+        # The version is increased whenever the idf statistics change to know when the cached idf weights have to be computed again.
+        self.idf_version = 0
+        self.count_vector_models = {}
         self.log_windows = 0
 
         self.persistence_file_name = build_persistence_file_name(aminer_config, self.__class__.__name__, persistence_id)
@@ -158,11 +215,15 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
 
         # Update statistics for idf computation
         if self.idf and self.id_path_list:
-            self.idf_total.add(id_tuple)
-            if log_event in self.idf_counts:
-                self.idf_counts[log_event].add(id_tuple)
-            else:
+            if id_tuple not in self.idf_total:
+                self.idf_total.add(id_tuple)
+                self.idf_version += 1
+            if log_event not in self.idf_counts:
                 self.idf_counts[log_event] = set([id_tuple])  # skipcq: PTC-W0018
+                self.idf_version += 1
+            elif id_tuple not in self.idf_counts[log_event]:
+                self.idf_counts[log_event].add(id_tuple)
+                self.idf_version += 1
 
         if id_tuple not in self.next_check_time:
             # First processed log atom, initialize next check time.
@@ -198,10 +259,27 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
         if count_vector in self.known_counts[id_tuple]:
             # Avoid that model has identical count vectors multiple times
             return
+        model = self.count_vector_models.get(id_tuple)
         if len(self.known_counts[id_tuple]) >= self.num_windows:
             # Drop first (= oldest) count vector
             self.known_counts[id_tuple] = self.known_counts[id_tuple][1:]
+            if model is not None:
+                model.remove_first()
         self.known_counts[id_tuple].append(count_vector)
+        if model is not None:
+            model.append(count_vector)
+
+    def get_count_vector_model(self, id_tuple):
+        """Return the CountVectorModel of the known count vectors of the id_tuple and create it if it does not exist or is outdated."""
+        model = self.count_vector_models.get(id_tuple)
+        if model is None or len(model) != len(self.known_counts[id_tuple]):
+            model = CountVectorModel(self.known_counts[id_tuple])
+            self.count_vector_models[id_tuple] = model
+        return model
+
+    def get_idf_weights(self, log_events):
+        """Return an array of the idf weights of the log events (weight rare value higher than ones that occur with many id_values)."""
+        return np.log10((1 + len(self.idf_total)) / np.array([len(self.idf_counts[log_event]) for log_event in log_events], dtype=float))
 
     def detect(self, log_atom, id_tuple, count_vector):
         """Create anomaly event when anomaly score is too high."""
@@ -238,45 +316,57 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
 
     def check(self, id_tuple, count_vector):
         """Computes the manhattan metric for the count vector and each count vector present in the model."""
-        min_score = 1
-        for known_count in self.known_counts[id_tuple]:
-            # Iterate over all count vectors in the model
-            manh = 0
-            manh_max = 0
-            for element in set(list(known_count.keys()) + list(count_vector.keys())):
-                # Iterate over each val that occurs in one of the vectors
-                idf_fact = 1
-                if self.idf and self.id_path_list:
-                    # Compute idf (weight rare value higher than ones that occur with many id_values)
-                    idf_fact = math.log10((1 + len(self.idf_total)) / len(self.idf_counts[element]))
-                norm_sum_known = 1
-                norm_sum_count = 1
-                if self.norm:
-                    # Normalize vectors by dividing through sum
-                    norm_sum_known = sum(known_count.values())
-                    norm_sum_count = sum(count_vector.values())
-                if element not in known_count:
-                    manh += count_vector[element] * idf_fact / norm_sum_count
-                    manh_max += count_vector[element] * idf_fact / norm_sum_count
-                elif element not in count_vector:
-                    manh += known_count[element] * idf_fact / norm_sum_known
-                    manh_max += known_count[element] * idf_fact / norm_sum_known
-                else:
-                    manh += abs(count_vector[element] * idf_fact / norm_sum_count - known_count[element] * idf_fact / norm_sum_known)
-                    manh_max += max(count_vector[element] * idf_fact / norm_sum_count, known_count[element] * idf_fact / norm_sum_known)
-            score = 0
-            if manh_max != 0:
-                # manh_max is zero when both vectors are empty, in this case, score remains at default 0, and normalize in all other cases
-                score = manh / manh_max
-            if score <= self.confidence_factor:
+        if not self.known_counts[id_tuple]:
+            return 1
+        model = self.get_count_vector_model(id_tuple)
+        # Split the count vector into the counts of log events in the model and the counts of new log events.
+        counts = np.zeros(len(model.column_index))
+        new_log_events = []
+        new_counts = []
+        for log_event, count in count_vector.items():
+            column = model.column_index.get(log_event)
+            if column is None:
+                new_log_events.append(log_event)
+                new_counts.append(count)
+            else:
+                counts[column] = count
+        new_counts = np.array(new_counts, dtype=float)
+        if self.idf and self.id_path_list:
+            if model.idf_weights is None or model.idf_version != self.idf_version:
+                model.idf_weights = self.get_idf_weights(model.column_index)
+                model.idf_version = self.idf_version
+            counts *= model.idf_weights
+            if new_log_events:
+                new_counts *= self.get_idf_weights(new_log_events)
+        if self.norm:
+            # Normalize vectors by dividing through sum
+            norm_sum_count = sum(count_vector.values())
+            if norm_sum_count != 0:
+                counts /= norm_sum_count
+                new_counts /= norm_sum_count
+        # New log events only occur in the count vector, so they increase manh and manh_max of all known vectors by the same value.
+        new_sum = new_counts.sum()
+
+        for block_start in range(0, len(model), CHECK_BLOCK_SIZE):
+            known = model.matrix[block_start:block_start + CHECK_BLOCK_SIZE]
+            if self.idf and self.id_path_list:
+                known = known * model.idf_weights
+            if self.norm:
+                norm_sum_known = model.row_sums[block_start:block_start + CHECK_BLOCK_SIZE]
+                known = known / np.where(norm_sum_known == 0, 1, norm_sum_known)[:, np.newaxis]
+            manh = np.abs(known - counts).sum(axis=1) + new_sum
+            manh_max = np.maximum(known, counts).sum(axis=1) + new_sum
+            # manh_max is zero when both vectors are empty, in this case, score remains at default 0, and normalize in all other cases
+            scores = np.divide(manh, manh_max, out=np.zeros(len(manh)), where=manh_max != 0)
+            if (scores <= self.confidence_factor).any():
                 # Found similar vector; abort early to avoid spending time on more checks
                 # Return -1 since "true" score is unknown as not all vectors in the model were checked
                 return -1
-            if min_score is None:
-                min_score = score
+            if block_start == 0:
+                min_score = scores.min()
             else:
-                min_score = min(min_score, score)
-        return min_score
+                min_score = min(min_score, scores.min())
+        return min(1, float(min_score))
 
     def do_timer(self, trigger_time):
         """Check if current ruleset should be persisted."""
@@ -334,6 +424,8 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
                 for id_elem in elem[1]:
                     id_elem_set.add(tuple(id_elem))
                 self.idf_counts[tuple(elem[0])] = id_elem_set
+            self.count_vector_models = {}
+            self.idf_version += 1
             logging.getLogger(DEBUG_LOG_NAME).debug("%s loaded persistence data.", self.__class__.__name__)
 
     def allowlist_event(self, event_type, event_data, allowlisting_data):
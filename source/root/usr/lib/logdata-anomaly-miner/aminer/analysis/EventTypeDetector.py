@@ -12,7 +12,10 @@ FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
 You should have received a copy of the GNU General Public License along with
 this program. If not, see <http://www.gnu.org/licenses/>.
 """
+import re
 import logging
+from functools import total_ordering
+import numpy as np
 
 from aminer import AminerConfig
 from aminer.AminerConfig import build_persistence_file_name, KEY_PERSISTENCE_PERIOD, DEFAULT_PERSISTENCE_PERIOD, DEBUG_LOG_NAME
@@ -22,6 +25,153 @@ from aminer.util.TimeTriggeredComponentInterface import TimeTriggeredComponentIn
 from aminer.util import PersistenceUtil
 
 
+# Values starting with other characters than these ones after optional spaces can not be converted to floats.
+FLOAT_START_REGEX = re.compile(r" *[-+]?[0-9.iInN]")
+
+
+def get_value(match_element):
+    """Return the value of the match element as float if it can be converted to a float, otherwise as string."""
+    match_object = match_element.match_object
+    if isinstance(match_object, (bytes, bytearray)):
+        raw_match_object = repr(bytes(match_object))[2:-1]
+        if raw_match_object != "" and FLOAT_START_REGEX.match(raw_match_object) is not None:
+            try:
+                return float(raw_match_object)
+            except ValueError:
+                pass
+    else:
+        try:
+            return float(match_object)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    if isinstance(match_element.match_string, bytes):
+        return repr(match_element.match_string)[2:-1]
+    return match_element.match_string
+
+
+@total_ordering
+class ValueBuffer:
+    """
+    This class stores the values of one variable in preallocated columns and behaves like a list of the values. Floats are stored in a
+    NumPy array and strings as interned objects in a list of the same size. Removing all but the last values moves them to the start of the
+    columns, so the values are always contiguous and the float values can be shared with other components without copying them.
+    """
+
+    __slots__ = ("numbers", "strings", "length", "last_string_index", "interned_strings")
+
+    def __init__(self, capacity, values=()):
+        """
+        Initialize the buffer.
+        @param capacity the number of values which can be stored before the columns have to be enlarged.
+        @param values the initial values.
+        """
+        capacity = max(capacity, len(values), 1)
+        self.numbers = np.zeros(capacity)
+        self.strings = [None] * capacity
+        self.length = 0
+        # The index of the last string value or -1 if all values are floats.
+        self.last_string_index = -1
+        self.interned_strings = {}
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        """Return the number of values."""
+        return self.length
+
+    def __iter__(self):
+        """Iterate over the values."""
+        return iter(self.get_list(0, self.length))
+
+    def __getitem__(self, index):
+        """Return the value at the index or a list of the values in the slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step != 1:
+                return self.get_list(0, self.length)[index]
+            return self.get_list(start, max(start, stop))
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("ValueBuffer index out of range")
+        string = self.strings[index]
+        if string is not None:
+            return string
+        return float(self.numbers[index])
+
+    def __eq__(self, other):
+        """Compare the values like lists."""
+        if isinstance(other, (ValueBuffer, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __lt__(self, other):
+        """Compare the values like lists."""
+        if isinstance(other, (ValueBuffer, list)):
+            return list(self) < list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        """Return the representation of the values as list."""
+        return repr(list(self))
+
+    def get_list(self, start, stop):
+        """Return a list of the values from the start to the stop index."""
+        values = self.numbers[start:stop].tolist()
+        if self.last_string_index >= start:
+            for index, string in enumerate(self.strings[start:stop]):
+                if string is not None:
+                    values[index] = string
+        return values
+
+    def append(self, value):
+        """Append a float or string value."""
+        if self.length == len(self.strings):
+            self.numbers = np.append(self.numbers, np.zeros(len(self.strings)))
+            self.strings += [None] * len(self.strings)
+        if isinstance(value, float):
+            self.numbers[self.length] = value
+        else:
+            self.strings[self.length] = self.interned_strings.setdefault(value, value)
+            self.last_string_index = self.length
+        self.length += 1
+
+    def keep_last(self, num_values):
+        """Remove all values except the last num_values values."""
+        if num_values >= self.length:
+            return
+        offset = self.length - num_values
+        self.numbers[:num_values] = self.numbers[offset:self.length]
+        self.strings[:num_values] = self.strings[offset:self.length]
+        self.strings[num_values:self.length] = [None] * offset
+        self.length = num_values
+        self.last_string_index -= offset
+        if self.last_string_index < 0:
+            self.last_string_index = -1
+        if len(self.interned_strings) > len(self.strings):
+            # Forget the strings which were removed with their values to bound the memory.
+            self.interned_strings = {string: string for string in self.strings[:num_values] if string is not None}
+
+    def clear(self):
+        """Remove all values."""
+        self.keep_last(0)
+        self.interned_strings = {}
+
+    def get_float_array(self, num_values):
+        """
+        Return the last num_values values as read-only view of the float column without copying them.
+        @throws ValueError when one of the values is a string.
+        """
+        start = max(self.length - num_values, 0)
+        if self.last_string_index >= start:
+            msg = "The values contain strings, which can not be converted to floats."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        values = self.numbers[start:self.length]
+        values.flags.writeable = False
+        return values
+
+
 class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, PersistableComponentInterface):
     """This class keeps track of the found event types and the values of each variable."""
 
@@ -84,10 +234,11 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, P
             if log_atom.source.resource_name.decode() == source:
                 return False
         self.log_total += 1
+        match_dictionary = log_atom.parser_match.get_match_dictionary()
         valid_log_atom = False
         if self.target_path_list:
             for path in self.target_path_list:
-                if path in log_atom.parser_match.get_match_dictionary().keys():
+                if path in match_dictionary.keys():
                     valid_log_atom = True
                     break
         if self.target_path_list and not valid_log_atom:
@@ -101,7 +252,7 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, P
             # Otherwise, the empty tuple () is used as the only key of the current_sequences dict.
             id_tuple = ()
             for id_path in self.id_path_list:
-                id_match = log_atom.parser_match.get_match_dictionary().get(id_path)
+                id_match = match_dictionary.get(id_path)
                 if id_match is None:
                     if self.allow_missing_id is True:
                         # Insert placeholder for id_path that is not available
@@ -128,23 +279,23 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, P
         else:
             # Searches if the event type has previously appeared
             current_index = -1
+            match_keys = set(match_dictionary)
             for event_index in range(self.num_events):
-                if self.longest_path[event_index] in log_atom.parser_match.get_match_dictionary() and set(
-                        log_atom.parser_match.get_match_dictionary()) == self.found_keys[event_index]:
+                if self.longest_path[event_index] in match_dictionary and match_keys == self.found_keys[event_index]:
                     current_index = event_index
 
         # Initialize a new event type if the event type of the new line has not appeared
         if current_index == -1:
             current_index = self.num_events
             self.num_events += 1
-            self.found_keys.append(set(log_atom.parser_match.get_match_dictionary().keys()))
+            self.found_keys.append(set(match_dictionary.keys()))
 
             # Initialize the list of the keys to the variables
             self.variable_key_list.append(list(self.found_keys[current_index]))
             # Delete the entries with value None or timestamps as values
             for var_index in range(len(self.variable_key_list[current_index]) - 1, -1, -1):
-                if (type(log_atom.parser_match.get_match_dictionary()[self.variable_key_list[current_index][var_index]]).__name__ !=
-                        "MatchElement") or (log_atom.parser_match.get_match_dictionary()[self.variable_key_list[
+                if (type(match_dictionary[self.variable_key_list[current_index][var_index]]).__name__ !=
+                        "MatchElement") or (match_dictionary[self.variable_key_list[
                         current_index][var_index]].match_object is None):
                     del self.variable_key_list[current_index][var_index]
                 elif (self.target_path_list is not None) and self.variable_key_list[current_index][var_index] not in self.target_path_list:
@@ -205,7 +356,7 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, P
         for key in self.found_keys:
             tmp_list[0].append(list(key))
         tmp_list.append(self.variable_key_list)
-        tmp_list.append(self.values)
+        tmp_list.append([[list(values) for values in event_values] for event_values in self.values])
         tmp_list.append(self.longest_path)
         tmp_list.append(self.check_variables)
         tmp_list.append(self.num_event_lines)
@@ -221,7 +372,7 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, P
             for key in persistence_data[0]:
                 self.found_keys.append(set(key))
             self.variable_key_list = persistence_data[1]
-            self.values = persistence_data[2]
+            self.values = [[ValueBuffer(self.max_num_vals + 1, values) for values in event_values] for event_values in persistence_data[2]]
             self.longest_path = persistence_data[3]
             self.check_variables = persistence_data[4]
             self.num_event_lines = persistence_data[5]
@@ -238,51 +389,47 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, P
         """Initialize the variable_key_list and the list for the values."""
         # Initializes the value list
         if not self.values:
-            self.values = [[[] for _ in range(len(self.variable_key_list[current_index]))]]
+            self.values = [[ValueBuffer(self.max_num_vals + 1) for _ in range(len(self.variable_key_list[current_index]))]]
         else:
-            self.values.append([[] for _ in range(len(self.variable_key_list[current_index]))])
+            self.values.append([ValueBuffer(self.max_num_vals + 1) for _ in range(len(self.variable_key_list[current_index]))])
 
     def append_values(self, log_atom, current_index):
         """Add the values of the variables of the current line to self.values."""
+        match_dictionary = log_atom.parser_match.get_match_dictionary()
+        check_variables = self.check_variables[current_index]
+        event_values = self.values[current_index]
         for var_index, var_key in enumerate(self.variable_key_list[current_index]):
             # Skips the variable if check_variable is False, or if the var_key is not included in the match_dict
-            if not self.check_variables[current_index][var_index]:
+            if not check_variables[var_index]:
                 continue
-            if var_key not in log_atom.parser_match.get_match_dictionary():
-                self.values[current_index][var_index] = []
-                self.check_variables[current_index][var_index] = False
+            match_element = match_dictionary.get(var_key)
+            if match_element is None:
+                event_values[var_index] = []
+                check_variables[var_index] = False
                 continue
-
-            raw_match_object = ""
-            if isinstance(log_atom.parser_match.get_match_dictionary()[var_key].match_object, bytearray):
-                raw_match_object = repr(
-                    bytes(log_atom.parser_match.get_match_dictionary()[var_key].match_object))[2:-1]
-            elif isinstance(log_atom.parser_match.get_match_dictionary()[var_key].match_object, bytes):
-                raw_match_object = repr(log_atom.parser_match.get_match_dictionary()[var_key].match_object)[2:-1]
-
-            # Try to convert the values to floats and add them as values
-            try:
-                if raw_match_object != "":
-                    self.values[current_index][var_index].append(float(raw_match_object))
-                else:
-                    self.values[current_index][var_index].append(
-                        float(log_atom.parser_match.get_match_dictionary()[var_key].match_object))
-            # Add the strings as values
-            except:  # skipcq: FLK-E722
-                if isinstance(log_atom.parser_match.get_match_dictionary()[var_key].match_string, bytes):
-                    self.values[current_index][var_index].append(
-                        repr(log_atom.parser_match.get_match_dictionary()[var_key].match_string)[2:-1])
-                else:
-                    self.values[current_index][var_index].append(log_atom.parser_match.get_match_dictionary()[var_key].match_string)
+            values = event_values[var_index]
+            if not isinstance(values, ValueBuffer):
+                # The values were replaced with a list by another component.
+                values = event_values[var_index] = ValueBuffer(self.max_num_vals + 1, values)
+            values.append(get_value(match_element))
 
         # Reduce the numbers of entries in the value list
-        if len(self.variable_key_list[current_index]) > 0 and len([i for i in self.check_variables[current_index] if i]) > 0 and \
-                len(self.values[current_index][self.check_variables[current_index].index(True)]) > self.max_num_vals:
-            for var_index in range(len(self.variable_key_list[current_index])):  # skipcq: PTC-W0060
+        if True in check_variables and len(event_values[check_variables.index(True)]) > self.max_num_vals:
+            for var_index, values in enumerate(event_values):
                 # Skips the variable if check_variable is False
-                if not self.check_variables[current_index][var_index]:
+                if not check_variables[var_index]:
                     continue
-                self.values[current_index][var_index] = self.values[current_index][var_index][-self.min_num_vals:]
+                values.keep_last(self.min_num_vals)
+
+    def get_values_array(self, event_index, var_index, num_values):
+        """
+        Return the last num_values values of a variable as float array. The array is a read-only view of the stored values if they are
+        stored in a ValueBuffer.
+        """
+        values = self.values[event_index][var_index]
+        if isinstance(values, ValueBuffer):
+            return values.get_float_array(num_values)
+        return np.array(values[-num_values:], dtype=float)
 
     def get_event_type(self, event_index):
         """Return a string which includes information about the event type."""
@@ -79,6 +79,9 @@ date_string = "%Y-%m-%d %H:%M:%S"
 class BinDefinition(metaclass=abc.ABCMeta):
     """This class defines the bins of the histogram."""
 
+    # BinDefinitions with this flag implement get_bins, so numeric values can be binned in batches.
+    batch_binning = False
+
     @abc.abstractmethod
     def __init__(self):
         """Initiate the BinDefinition."""
@@ -115,6 +118,10 @@ class BinDefinition(metaclass=abc.ABCMeta):
 class LinearNumericBinDefinition(BinDefinition):
     """This class defines the linear numeric bins."""
 
+    batch_binning = True
+    # The maximum number of cached p-values. The cache is cleared when it is full.
+    p_value_cache_size = 10000
+
     def __init__(self, lower_limit, bin_size, bin_count, outlier_bins_flag=False):
         if isinstance(lower_limit, bool) or not isinstance(lower_limit, (float, int)):
             msg = "lower_limit has to be of the type float or integer."
@@ -147,6 +154,7 @@ class LinearNumericBinDefinition(BinDefinition):
         self.outlier_bins_flag = outlier_bins_flag
         self.bin_names = None
         self.expected_bin_ratio = 1.0 / float(bin_count)
+        self.p_value_cache = {}
 
     def has_outlier_bins(self):
         """
@@ -193,6 +201,22 @@ class LinearNumericBinDefinition(BinDefinition):
             return pos
         return None
 
+    def get_bins(self, values):
+        """
+        Get the numbers of the bins a batch of values belongs to. The bins are calculated in the same way as in get_bin.
+        @param values a numpy float array of numeric values, which can be represented exactly as floats.
+        @return a numpy integer array with the bin numbers. Outliers have the bin number -1 when outlier bins were not requested.
+        """
+        # Positions beyond the last bin are limited before the conversion to integers to avoid overflows.
+        positions = numpy.minimum((values - self.lower_limit) / self.bin_size, self.bin_count).astype(numpy.int64)
+        below_limit = values < self.lower_limit
+        if self.outlier_bins_flag:
+            positions += 1
+            positions[below_limit] = 0
+        else:
+            positions[below_limit | (positions == self.bin_count)] = -1
+        return positions
+
     def get_bin_p_value(self, bin_pos, total_values, bin_values):
         """
         Calculate a p-Value, how likely the observed number of elements in this bin is.
@@ -202,9 +226,15 @@ class LinearNumericBinDefinition(BinDefinition):
             return None
         if self.outlier_bins_flag and (bin_pos == 0 or bin_pos > self.bin_count):
             return None
-        p_value = binomial_test(bin_values, total_values, self.expected_bin_ratio)
-        if not isinstance(p_value, (numpy.floating, float)):
-            p_value = p_value.pvalue
+        # The p-value only depends on the number of values in the bin and the total number of values.
+        p_value = self.p_value_cache.get((bin_values, total_values))
+        if p_value is None:
+            p_value = binomial_test(bin_values, total_values, self.expected_bin_ratio)
+            if not isinstance(p_value, (numpy.floating, float)):
+                p_value = p_value.pvalue
+            if len(self.p_value_cache) >= self.p_value_cache_size:
+                self.p_value_cache = {}
+            self.p_value_cache[(bin_values, total_values)] = p_value
         return p_value
 
 
@@ -253,13 +283,27 @@ class ModuloTimeBinDefinition(LinearNumericBinDefinition):
         time_value = (value % self.modulo_value) / self.time_unit
         return super(ModuloTimeBinDefinition, self).get_bin(time_value)
 
+    def get_bins(self, values):
+        """
+        Get the numbers of the bins a batch of values belongs to. The bins are calculated in the same way as in get_bin.
+        @param values a numpy float array of numeric values, which can be represented exactly as floats.
+        @return a numpy integer array with the bin numbers. Outliers have the bin number -1 when outlier bins were not requested.
+        """
+        return super(ModuloTimeBinDefinition, self).get_bins(numpy.mod(values, self.modulo_value) / self.time_unit)
+
 
 class HistogramData:
     """
     This class defines the properties of one histogram to create and performs the accounting and reporting.
     When the Python scipy package is available, reports will also include probability score created using binomial testing.
+    Numeric values added with buffer_value are binned in batches, when the BinDefinition supports it.
     """
 
+    # The maximum number of buffered values before they are binned.
+    value_batch_size = 10000
+    # Only integers up to this magnitude can be represented exactly as floats.
+    max_batch_value = 2 ** 53
+
     def __init__(self, property_path, bin_definition):
         """Create the histogram data structures."""
         if not isinstance(property_path, str):
@@ -281,26 +325,58 @@ class HistogramData:
         self.has_outlier_bins_flag = bin_definition.has_outlier_bins()
         self.total_elements = 0
         self.binned_elements = 0
+        self.pending_values = []
+        self.batch_value_types = (int, float) if bin_definition.batch_binning else ()
 
     def add_value(self, value):
-        """Add one value to the histogram."""
+        """Add one value to the histogram. Outliers are discarded when the BinDefinition has no outlier bins."""
         bin_pos = self.bin_definition.get_bin(value)
+        if bin_pos is None:
+            return
         self.bin_data[bin_pos] += 1
         self.total_elements += 1
         if self.has_outlier_bins_flag and bin_pos != 0 and bin_pos + 1 != len(self.bin_names):
             self.binned_elements += 1
 
+    def buffer_value(self, value):
+        """
+        Add one value to the histogram. Numeric values are only binned, when the buffer is full or flush_values is called, so the bin data
+        and the numbers of elements have to be read after flush_values.
+        """
+        if type(value) in self.batch_value_types and -self.max_batch_value <= value <= self.max_batch_value:
+            self.pending_values.append(value)
+            if len(self.pending_values) >= self.value_batch_size:
+                self.flush_values()
+        else:
+            self.add_value(value)
+
+    def flush_values(self):
+        """Bin all buffered values in one batch."""
+        if not self.pending_values:
+            return
+        bins = self.bin_definition.get_bins(numpy.array(self.pending_values, dtype=numpy.float64))
+        self.pending_values = []
+        bins = bins[bins >= 0]
+        counts = numpy.bincount(bins, minlength=len(self.bin_data))
+        for bin_pos in numpy.flatnonzero(counts):
+            self.bin_data[bin_pos] += int(counts[bin_pos])
+        self.total_elements += len(bins)
+        if self.has_outlier_bins_flag:
+            self.binned_elements += len(bins) - int(counts[0]) - int(counts[-1])
+
     def reset(self):
         """Remove all values from this histogram."""
         self.total_elements = 0
         self.binned_elements = 0
         self.bin_data = [0] * len(self.bin_data)
+        self.pending_values = []
 
     def clone(self):
         """
         Clone this object so that calls to add_value do not influence the old object anymore.
         This behavior is a mixture of shallow and deep copy.
         """
+        self.flush_values()
         histogram_data = HistogramData(self.property_path, self.bin_definition)
         histogram_data.bin_names = self.bin_names
         histogram_data.bin_data = self.bin_data[:]
@@ -310,6 +386,7 @@ class HistogramData:
 
     def to_string(self, indent):
         """Get a string representation of this histogram."""
+        self.flush_values()
         result = f'{indent}Property "{self.property_path}" ({self.total_elements} elements):'
         f_elements = float(self.total_elements)
         base_element = self.binned_elements if self.has_outlier_bins_flag else self.total_elements
@@ -381,7 +458,7 @@ class HistogramAnalysis(AtomHandlerInterface):
             if match is None:
                 continue
             self.log_success += 1
-            data_item.add_value(match.match_object)
+            data_item.buffer_value(match.match_object)
 
         timestamp = log_atom.get_timestamp()
         if self.next_report_time < timestamp:
@@ -404,6 +481,7 @@ class HistogramAnalysis(AtomHandlerInterface):
         res = []
         h = []
         for data_item in self.histogram_data:
+            data_item.flush_values()
             d = {}
             bins = {}
             i = 0
@@ -523,7 +601,7 @@ class PathDependentHistogramAnalysis(AtomHandlerInterface):
                 if isinstance(match.match_object, bytes):
                     match.match_object = match.match_object.decode(AminerConfig.ENCODING)
                 histogram_mapping[1].target_path = mapped_path
-                histogram_mapping[1].add_value(match_value)
+                histogram_mapping[1].buffer_value(match_value)
                 histogram_mapping[2] = log_atom.parser_match
             else:
                 # We need to split the current set here. Keep the current statistics for all the missingPaths but clone the data for the
@@ -532,7 +610,7 @@ class PathDependentHistogramAnalysis(AtomHandlerInterface):
                 match = match_dict.get(mapped_path, None)
                 match_value = match.match_object
                 histogram_mapping[1].target_path = mapped_path
-                new_histogram.add_value(match_value)
+                new_histogram.buffer_value(match_value)
                 new_path_set = histogram_mapping[0] - missing_paths
                 new_histogram_mapping = [new_path_set, new_histogram, log_atom.parser_match]
                 for mapped_path in new_path_set:
@@ -542,7 +620,7 @@ class PathDependentHistogramAnalysis(AtomHandlerInterface):
 
         if unmapped_path:
             histogram = HistogramData(self.target_path, self.bin_definition)
-            histogram.add_value(match_value)
+            histogram.buffer_value(match_value)
             new_record = [set(unmapped_path), histogram, log_atom.parser_match]
             for path in unmapped_path:
                 new_record[1].property_path = path
@@ -573,6 +651,7 @@ class PathDependentHistogramAnalysis(AtomHandlerInterface):
             path = all_path_set.pop()
             histogram_mapping = self.histogram_data.get(path)
             data_item = histogram_mapping[1]
+            data_item.flush_values()
             bins = {}
             i = 0
             while i < len(data_item.bin_names):
@@ -10,7 +10,9 @@ FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
 You should have received a copy of the GNU General Public License along with
 this program. If not, see <http://www.gnu.org/licenses/>.
 """
+import heapq
 import logging
+import math
 
 from aminer.AminerConfig import build_persistence_file_name, DEBUG_LOG_NAME, KEY_PERSISTENCE_PERIOD, DEFAULT_PERSISTENCE_PERIOD,\
     STAT_LOG_NAME
@@ -30,6 +32,7 @@ class MissingMatchPathValueDetector(
     NewMatchPathValueDetector. For each unique value extracted by paths, a tracking record is added to expected_values_dict.
     It stores three numbers: the timestamp the extracted value was last seen, the maximum allowed gap between observations and the next
     alerting time when currently in error state. When in normal (alerting) state, the value is zero.
+    The time when each value has to be checked next is kept in a heap, so timeout checks only look at the values which are overdue.
     """
 
     time_trigger_class = AnalysisContext.TIME_TRIGGER_CLASS_REALTIME
@@ -62,12 +65,17 @@ class MissingMatchPathValueDetector(
             stop_learning_no_anomaly_time=stop_learning_no_anomaly_time, log_resource_ignore_list=log_resource_ignore_list,
             mutable_default_args=["log_resource_ignore_list"]
         )
-        # This timestamp is compared with timestamp values from log atoms for activation of alerting logic. The first timestamp from logs
-        # above this value will trigger alerting.
-        self.next_check_timestamp = 0
         self.last_seen_timestamp = 0
         self.log_learned_values = 0
         self.log_new_learned_values = []
+        self.log_timeout_checks = 0
+        self.log_checked_values = 0
+        # The heap contains tuples of the check time, a sequence number keeping the order in which the values were added and the value.
+        # Entries are not removed when the check time of a value changes, instead the current entry of each value is stored in
+        # scheduled_checks and outdated entries are skipped when they are popped from the heap.
+        self.check_heap = []
+        self.scheduled_checks = {}
+        self.next_sequence_number = 0
 
         if not self.target_path_list:
             msg = "target_path_list must not be None or empty."
@@ -109,7 +117,7 @@ class MissingMatchPathValueDetector(
             detector_info = self.expected_values_dict.get(value)
             if detector_info is None and self.learn_mode:
                 self.expected_values_dict[value] = [timestamp, self.default_interval, 0, target_path]
-                self.next_check_timestamp = min(self.next_check_timestamp, timestamp + self.default_interval)
+                self.schedule_check(value)
                 self.log_learned_values += 1
                 self.log_new_learned_values.append(value)
                 if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
@@ -124,11 +132,10 @@ class MissingMatchPathValueDetector(
             if detector_info is not None:
                 # Just update the last seen value and switch from non-reporting error state to normal state.
                 detector_info[0] = timestamp
-                if detector_info[2] != 0:
-                    if timestamp >= detector_info[2]:
-                        detector_info[2] = 0
-                    # Delta of this detector might be lower than the default maximum recheck time.
-                    self.next_check_timestamp = min(self.next_check_timestamp, timestamp + detector_info[1])
+                if detector_info[2] != 0 and timestamp >= detector_info[2]:
+                    detector_info[2] = 0
+                # Checks are only scheduled again if they are due earlier, later checks are rescheduled when the old check time is reached.
+                self.schedule_check(value)
         self.log_success += 1
         return True
 
@@ -159,91 +166,108 @@ class MissingMatchPathValueDetector(
             path_list = str(path_list)
         return path_list, value_list
 
+    def schedule_check(self, value):
+        """
+        Schedule the next check of a value if it was not scheduled yet or if the check is due earlier than the scheduled check.
+        A value has to be checked when its interval has passed since it was last seen and its next alerting time is reached.
+        """
+        detector_info = self.expected_values_dict[value]
+        check_time = max(detector_info[0] + detector_info[1], detector_info[2])
+        scheduled_check = self.scheduled_checks.get(value)
+        if scheduled_check is None:
+            sequence_number = self.next_sequence_number
+            self.next_sequence_number += 1
+        elif check_time < scheduled_check[0]:
+            sequence_number = scheduled_check[1]
+        else:
+            return
+        self.scheduled_checks[value] = (check_time, sequence_number)
+        heapq.heappush(self.check_heap, (check_time, sequence_number, value))
+
     def check_timeouts(self, timestamp, log_atom):
         """Check if there was any timeout on a channel, thus triggering event dispatching."""
         old_last_seen_timestamp = self.last_seen_timestamp
         self.last_seen_timestamp = max(self.last_seen_timestamp, timestamp)
-        if self.last_seen_timestamp > self.next_check_timestamp:
-            missing_value_list = []
-            # Start with a large recheck interval. It will be lowered if any of the expectation intervals is below that.
-            if self.next_check_timestamp == 0:
-                self.next_check_timestamp = self.last_seen_timestamp + self.realert_interval
-            for value, detector_info in self.expected_values_dict.items():
-                value_overdue_time = int(self.last_seen_timestamp - detector_info[0] - detector_info[1])
-                if detector_info[2] != 0:
-                    next_check_delta = detector_info[2] - self.last_seen_timestamp
-                    if next_check_delta > 0:
-                        # Already alerted but not ready for realerting yet.
-                        self.next_check_timestamp = min(self.next_check_timestamp, detector_info[2])
-                        continue
-                else:
-                    # No alerting yet, see if alerting is required.
-                    if value_overdue_time < 0:
-                        old = self.next_check_timestamp
-                        self.next_check_timestamp = min(self.next_check_timestamp, self.last_seen_timestamp - value_overdue_time)
-                        if old > self.next_check_timestamp or self.next_check_timestamp < detector_info[2]:
-                            break
-                # avoid early re-alerting
-                if value_overdue_time > 0:
-                    missing_value_list.append([detector_info[3], value, value_overdue_time, detector_info[1]])
-                    # Set the next alerting time.
-                    detector_info[2] = self.last_seen_timestamp + self.realert_interval
-                    self.expected_values_dict[value] = detector_info
-                # Workaround:
-                # also check for long gaps between same tokens where the last_seen_timestamp gets updated
-                # on the arrival of tokens following a longer gap
-                elif self.last_seen_timestamp - detector_info[0] > detector_info[1]:
-                    value_overdue_time = self.last_seen_timestamp - old_last_seen_timestamp - detector_info[1]
-                    missing_value_list.append([detector_info[3], value, value_overdue_time, detector_info[1]])
-                    # Set the next alerting time.
-                    detector_info[2] = self.last_seen_timestamp + self.realert_interval
-                    self.expected_values_dict[value] = detector_info
-            if missing_value_list:
-                if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
-                    self.stop_learning_timestamp = max(
-                        self.stop_learning_timestamp, log_atom.atom_time + self.stop_learning_no_anomaly_time)
-                message_part = []
-                affected_log_atom_values = []
-                for target_path_list, value, overdue_time, interval in missing_value_list:
-                    e = {}
-                    try:
-                        if isinstance(value, list):
-                            data = []
-                            for val in value:
-                                if isinstance(val, bytes):
-                                    data.append(val.decode(AminerConfig.ENCODING))
-                                else:
-                                    data.append(val)
-                            data = str(data)
-                        else:
-                            if isinstance(value, bytes):
-                                data = value.decode(AminerConfig.ENCODING)
+        self.log_timeout_checks += 1
+        missing_values = []
+        checked_values = []
+        while self.check_heap and self.check_heap[0][0] <= self.last_seen_timestamp:
+            check_time, sequence_number, value = heapq.heappop(self.check_heap)
+            if self.scheduled_checks.get(value) != (check_time, sequence_number):
+                # The value was removed or scheduled again after this entry was added.
+                continue
+            detector_info = self.expected_values_dict.get(value)
+            if detector_info is None:
+                del self.scheduled_checks[value]
+                continue
+            # Keep the sequence number, so the value is scheduled again with the same order.
+            self.scheduled_checks[value] = (math.inf, sequence_number)
+            checked_values.append(value)
+            if detector_info[2] > self.last_seen_timestamp:
+                # Already alerted but not ready for realerting yet.
+                continue
+            value_overdue_time = int(self.last_seen_timestamp - detector_info[0] - detector_info[1])
+            # Workaround:
+            # also check for long gaps between same tokens where the last_seen_timestamp gets updated
+            # on the arrival of tokens following a longer gap
+            if value_overdue_time <= 0 and self.last_seen_timestamp - detector_info[0] > detector_info[1]:
+                value_overdue_time = self.last_seen_timestamp - old_last_seen_timestamp - detector_info[1]
+            elif value_overdue_time <= 0:
+                continue
+            missing_values.append((sequence_number, [detector_info[3], value, value_overdue_time, detector_info[1]]))
+            # Set the next alerting time.
+            detector_info[2] = self.last_seen_timestamp + self.realert_interval
+        self.log_checked_values += len(checked_values)
+        for value in checked_values:
+            self.schedule_check(value)
+        if missing_values:
+            # Report the values in the order in which they were added.
+            missing_value_list = [missing_value for _, missing_value in sorted(missing_values)]
+            if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
+                self.stop_learning_timestamp = max(
+                    self.stop_learning_timestamp, log_atom.atom_time + self.stop_learning_no_anomaly_time)
+            message_part = []
+            affected_log_atom_values = []
+            for target_path_list, value, overdue_time, interval in missing_value_list:
+                e = {}
+                try:
+                    if isinstance(value, list):
+                        data = []
+                        for val in value:
+                            if isinstance(val, bytes):
+                                data.append(val.decode(AminerConfig.ENCODING))
                             else:
-                                data = repr(value)
-                    except UnicodeError:
-                        data = repr(value)
-                    if self.__class__.__name__ == "MissingMatchPathValueDetector":
-                        e["TargetPathList"] = target_path_list
-                        message_part.append(f"  {target_path_list}: {data} overdue {overdue_time}s (interval {interval})\n")
+                                data.append(val)
+                        data = str(data)
                     else:
-                        target_paths = ""
-                        for target_path in self.target_path_list:
-                            target_paths += target_path + ", "
-                        e["TargetPathList"] = self.target_path_list
-                        message_part.append(f"  {target_paths[:-2]}: {data} overdue {overdue_time}s (interval {interval})\n")
-                    e["Value"] = str(value)
-                    e["OverdueTime"] = str(overdue_time)
-                    e["Interval"] = str(interval)
-                    affected_log_atom_values.append(e)
-                affected_log_atom_paths = []
-                for path in log_atom.parser_match.get_match_dictionary().keys():
-                    if path in self.target_path_list:
-                        affected_log_atom_paths.append(path)
-                analysis_component = {"AffectedLogAtomPaths": affected_log_atom_paths,
-                                      "AffectedLogAtomValues": affected_log_atom_values}
-                event_data = {"AnalysisComponent": analysis_component}
-                for listener in self.anomaly_event_handlers:
-                    self.send_event_to_handlers(listener, event_data, log_atom, ["".join(message_part).strip()])
+                        if isinstance(value, bytes):
+                            data = value.decode(AminerConfig.ENCODING)
+                        else:
+                            data = repr(value)
+                except UnicodeError:
+                    data = repr(value)
+                if self.__class__.__name__ == "MissingMatchPathValueDetector":
+                    e["TargetPathList"] = target_path_list
+                    message_part.append(f"  {target_path_list}: {data} overdue {overdue_time}s (interval {interval})\n")
+                else:
+                    target_paths = ""
+                    for target_path in self.target_path_list:
+                        target_paths += target_path + ", "
+                    e["TargetPathList"] = self.target_path_list
+                    message_part.append(f"  {target_paths[:-2]}: {data} overdue {overdue_time}s (interval {interval})\n")
+                e["Value"] = str(value)
+                e["OverdueTime"] = str(overdue_time)
+                e["Interval"] = str(interval)
+                affected_log_atom_values.append(e)
+            affected_log_atom_paths = []
+            for path in log_atom.parser_match.get_match_dictionary().keys():
+                if path in self.target_path_list:
+                    affected_log_atom_paths.append(path)
+            analysis_component = {"AffectedLogAtomPaths": affected_log_atom_paths,
+                                  "AffectedLogAtomValues": affected_log_atom_values}
+            event_data = {"AnalysisComponent": analysis_component}
+            for listener in self.anomaly_event_handlers:
+                self.send_event_to_handlers(listener, event_data, log_atom, ["".join(message_part).strip()])
         return True
 
     def send_event_to_handlers(self, anomaly_event_handler, event_data, log_atom, message_part):
@@ -281,6 +305,7 @@ class MissingMatchPathValueDetector(
                     value[1] = self.default_interval
                     value[2] = value[0] + self.default_interval
                 self.expected_values_dict[key] = value
+                self.schedule_check(key)
             logging.getLogger(DEBUG_LOG_NAME).debug("%s loaded persistence data.", self.__class__.__name__)
 
     def do_persist(self):
@@ -307,10 +332,13 @@ class MissingMatchPathValueDetector(
             new_interval = self.default_interval
         if new_interval < 0:
             del self.expected_values_dict[event_data[0]]
+            self.scheduled_checks.pop(event_data[0], None)
             logging.getLogger(DEBUG_LOG_NAME).debug("%s removed check value %s.", self.__class__.__name__, str(event_data[0]))
         else:
             self.expected_values_dict[event_data[0]] = [self.last_seen_timestamp, new_interval, 0, event_data[1]]
-            self.next_check_timestamp = 0
+            # The new interval might be shorter than the old one, so the check is scheduled from scratch.
+            self.scheduled_checks.pop(event_data[0], None)
+            self.schedule_check(event_data[0])
         return f"Updated '{event_data[0]}' in '{event_data[1]}' to new interval {new_interval}."
 
     def log_statistics(self, component_name):
@@ -320,16 +348,22 @@ class MissingMatchPathValueDetector(
         """
         if AminerConfig.STAT_LEVEL == 1:
             logging.getLogger(STAT_LOG_NAME).info(
-                "'%s' processed %d out of %d log atoms successfully and learned %d new values in the last 60 minutes.",
-                component_name, self.log_success, self.log_total, self.log_learned_values)
+                "'%s' processed %d out of %d log atoms successfully and learned %d new values in the last 60 minutes. %d timeout checks "
+                "looked at %d values.", component_name, self.log_success, self.log_total, self.log_learned_values, self.log_timeout_checks,
+                self.log_checked_values)
         elif AminerConfig.STAT_LEVEL == 2:
             logging.getLogger(STAT_LOG_NAME).info(
                 "'%s' processed %d out of %d log atoms successfully and learned %d new values in the last 60 minutes. Following new values"
-                " were learned: %s", component_name, self.log_success, self.log_total, self.log_learned_values, self.log_new_learned_values)
+                " were learned: %s. %d timeout checks looked at %d values (%.2f per check), %d checks of %d expected values are scheduled.",
+                component_name, self.log_success, self.log_total, self.log_learned_values, self.log_new_learned_values,
+                self.log_timeout_checks, self.log_checked_values, self.log_checked_values / max(self.log_timeout_checks, 1),
+                len(self.check_heap), len(self.expected_values_dict))
         self.log_success = 0
         self.log_total = 0
         self.log_learned_values = 0
         self.log_new_learned_values = []
+        self.log_timeout_checks = 0
+        self.log_checked_values = 0
 
 
 class MissingMatchPathListValueDetector(MissingMatchPathValueDetector):
@@ -55,6 +55,7 @@ class NewMatchPathDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
         self.known_path_set = set()
 
         self.persistence_file_name = build_persistence_file_name(aminer_config, self.__class__.__name__, persistence_id)
+        self.persistence_journal = PersistenceUtil.PersistenceJournal(self.persistence_file_name)
         PersistenceUtil.add_persistable_component(self)
         self.load_persistence_data()
 
@@ -80,6 +81,7 @@ class NewMatchPathDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
                 unknown_path_list.append(path)
                 if self.learn_mode:
                     self.known_path_set.add(path)
+                    self.persistence_journal.add_record(path)
                     self.log_learned_paths += 1
                     self.log_new_learned_paths.append(path)
                     if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
@@ -118,14 +120,14 @@ class NewMatchPathDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
 
     def do_persist(self):
         """Immediately write persistence data to storage."""
-        PersistenceUtil.store_json(self.persistence_file_name, sorted(list(self.known_path_set)))
+        self.persistence_journal.persist(lambda: sorted(list(self.known_path_set)))
         logging.getLogger(DEBUG_LOG_NAME).debug("%s persisted data.", self.__class__.__name__)
 
     def load_persistence_data(self):
         """Load the persistence data from storage."""
-        persistence_data = PersistenceUtil.load_json(self.persistence_file_name)
-        if persistence_data is not None:
-            self.known_path_set = set(persistence_data)
+        persistence_data, journal_records = self.persistence_journal.load()
+        if persistence_data is not None or journal_records:
+            self.known_path_set = set(persistence_data or []).union(journal_records)
             logging.getLogger(DEBUG_LOG_NAME).debug("%s loaded persistence data.", self.__class__.__name__)
 
     def allowlist_event(self, event_type, event_data, allowlisting_data):
@@ -147,6 +149,7 @@ class NewMatchPathDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             raise TypeError(msg)
         self.known_path_set.add(event_data)
+        self.persistence_journal.add_record(event_data)
         return f"Allowlisted path(es) {event_data} in {event_type}."
 
     def log_statistics(self, component_name):
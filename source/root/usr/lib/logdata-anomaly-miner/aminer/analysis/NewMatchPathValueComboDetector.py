@@ -68,15 +68,16 @@ class NewMatchPathValueComboDetector(
 
         self.persistence_file_name = build_persistence_file_name(aminer_config, self.__class__.__name__, persistence_id)
         self.known_values_set = set()
+        self.persistence_journal = PersistenceUtil.PersistenceJournal(self.persistence_file_name)
         self.load_persistence_data()
         PersistenceUtil.add_persistable_component(self)
 
     def load_persistence_data(self):
         """Load the persistence data from storage."""
-        persistence_data = PersistenceUtil.load_json(self.persistence_file_name)
-        if persistence_data is not None:
+        persistence_data, journal_records = self.persistence_journal.load()
+        if persistence_data is not None or journal_records:
             # Set and tuples were stored as list of lists. Transform the inner lists to tuples to allow hash operation needed by set.
-            self.known_values_set = {tuple(record) for record in persistence_data}
+            self.known_values_set = {tuple(record) for record in (persistence_data or []) + journal_records}
             logging.getLogger(DEBUG_LOG_NAME).debug("%s loaded persistence data.", self.__class__.__name__)
 
     def receive_atom(self, log_atom):
@@ -119,6 +120,7 @@ class NewMatchPathValueComboDetector(
         if match_value_tuple not in self.known_values_set:
             if self.learn_mode:
                 self.known_values_set.add(match_value_tuple)
+                self.persistence_journal.add_record(match_value_tuple)
                 self.log_learned_path_value_combos += 1
                 self.log_new_learned_values.append(match_value_tuple)
                 if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
@@ -156,7 +158,7 @@ class NewMatchPathValueComboDetector(
 
     def do_persist(self):
         """Immediately write persistence data to storage."""
-        PersistenceUtil.store_json(self.persistence_file_name, sorted(list(self.known_values_set)))
+        self.persistence_journal.persist(lambda: sorted(list(self.known_values_set)))
         logging.getLogger(DEBUG_LOG_NAME).debug("%s persisted data.", self.__class__.__name__)
 
     def allowlist_event(self, event_type, event_data, allowlisting_data):
@@ -182,6 +184,7 @@ class NewMatchPathValueComboDetector(
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             raise TypeError(msg)
         self.known_values_set.add(event_data)
+        self.persistence_journal.add_record(event_data)
         return f"Allowlisted path(es) {', '.join(self.target_path_list)} with {event_data}."
 
     def add_to_persistency_event(self, event_type, event_data):
@@ -215,6 +218,7 @@ class NewMatchPathValueComboDetector(
         match_value_tuple = tuple(match_value_list)
         if match_value_tuple not in self.known_values_set:
             self.known_values_set.add(match_value_tuple)
+            self.persistence_journal.add_record(match_value_tuple)
             self.log_learned_path_value_combos += 1
             self.log_new_learned_values.append(match_value_tuple)
         return f"Added values [{', '.join(event_data)}] of paths [{', '.join(self.target_path_list)}] to the persistence."
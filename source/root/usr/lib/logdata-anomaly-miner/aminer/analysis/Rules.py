@@ -102,11 +102,37 @@ class MatchRule(metaclass=abc.ABCMeta):
 
     log_success = 0
     log_total = 0
+    # Rules of classes with this flag have no side effects besides their statistics and match actions. Without match actions they can be
+    # skipped or evaluated out of order by the FirstMatchRuleIndex.
+    side_effect_free_class = False
 
     @abc.abstractmethod
     def match(self, log_atom):
         """Check if this rule matches. On match an optional match_action could be triggered."""
 
+    def is_side_effect_free(self):
+        """Check if neither this rule nor any of its subrules has side effects, i.e., a match action or a debug output."""
+        if not self.side_effect_free_class or getattr(self, "match_action", None) is not None:
+            return False
+        return all(rule.is_side_effect_free() for rule in self.get_sub_rules())
+
+    def get_sub_rules(self):
+        """Get the list of all rules, which may be evaluated by this rule."""
+        sub_rules = list(getattr(self, "sub_rules", []))
+        if hasattr(self, "rule_lookup_dict"):
+            sub_rules += list(self.rule_lookup_dict.values())
+        if getattr(self, "default_rule", None) is not None:
+            sub_rules.append(self.default_rule)
+        if hasattr(self, "sub_rule"):
+            sub_rules.append(self.sub_rule)
+        return sub_rules
+
+    def get_required_paths(self):
+        """Get the set of paths, which must exist in the match dictionary for this rule to match."""
+        if getattr(self, "target_path", None) is not None:
+            return frozenset([self.target_path])
+        return frozenset()
+
     def log_statistics(self, rule_id):
         """Log statistics of an MatchRule. Override this method for more sophisticated statistics output of the MatchRule."""
         if AminerConfig.STAT_LEVEL > 0:
@@ -130,6 +156,8 @@ class MatchRule(metaclass=abc.ABCMeta):
 class AndMatchRule(MatchRule):
     """This class provides a rule to match all subRules (logical and)."""
 
+    side_effect_free_class = True
+
     def __init__(self, sub_rules, match_action=None):
         """
         Create the rule.
@@ -165,6 +193,10 @@ class AndMatchRule(MatchRule):
         self.log_success += 1
         return True
 
+    def get_required_paths(self):
+        """Get the set of paths, which must exist in the match dictionary for this rule to match."""
+        return frozenset().union(*[rule.get_required_paths() for rule in self.sub_rules])
+
     def __str__(self):
         result = ""
         preamble = ""
@@ -177,6 +209,8 @@ class AndMatchRule(MatchRule):
 class OrMatchRule(MatchRule):
     """This class provides a rule to match any subRules (logical or)."""
 
+    side_effect_free_class = True
+
     def __init__(self, sub_rules, match_action=None):
         """
         Create the rule.
@@ -196,6 +230,7 @@ class OrMatchRule(MatchRule):
             msg = "match_action has to be of type MatchAction."
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             raise TypeError(msg)
+        self.rule_index = FirstMatchRuleIndex(sub_rules)
 
     def match(self, log_atom):
         """
@@ -204,14 +239,17 @@ class OrMatchRule(MatchRule):
         @return True when any subrule matched.
         """
         self.log_total += 1
-        for rule in self.sub_rules:
-            if rule.match(log_atom):
-                if self.match_action is not None:
-                    self.match_action.match_action(log_atom)
-                self.log_success += 1
-                return True
+        if self.rule_index.match(log_atom):
+            if self.match_action is not None:
+                self.match_action.match_action(log_atom)
+            self.log_success += 1
+            return True
         return False
 
+    def get_required_paths(self):
+        """Get the set of paths, which must exist in the match dictionary for this rule to match."""
+        return frozenset.intersection(*[rule.get_required_paths() for rule in self.sub_rules])
+
     def __str__(self):
         result = ""
         preamble = ""
@@ -228,6 +266,8 @@ class ParallelMatchRule(MatchRule):
     stop after the first positive match. This does only make sense when all subrules have match actions associated.
     """
 
+    side_effect_free_class = True
+
     def __init__(self, sub_rules, match_action=None):
         """
         Create the rule.
@@ -265,6 +305,10 @@ class ParallelMatchRule(MatchRule):
             self.log_success += 1
         return match_flag
 
+    def get_required_paths(self):
+        """Get the set of paths, which must exist in the match dictionary for this rule to match."""
+        return frozenset.intersection(*[rule.get_required_paths() for rule in self.sub_rules])
+
     def __str__(self):
         result = ""
         preamble = ""
@@ -280,6 +324,8 @@ class ValueDependentDelegatedMatchRule(MatchRule):
     The result of this rule is the result of the selected delegation rule.
     """
 
+    side_effect_free_class = True
+
     def __init__(self, target_path_list, rule_lookup_dict, default_rule=None, match_action=None):
         """
         Create the rule.
@@ -350,6 +396,8 @@ class ValueDependentDelegatedMatchRule(MatchRule):
 class NegationMatchRule(MatchRule):
     """Match elements of this class return true when the subrule did not match."""
 
+    side_effect_free_class = True
+
     def __init__(self, sub_rule, match_action=None):
         self.sub_rule = sub_rule
         self.match_action = match_action
@@ -379,6 +427,8 @@ class NegationMatchRule(MatchRule):
 class PathExistsMatchRule(MatchRule):
     """Match elements of this class return true when the given target_path was found in the parsed match data."""
 
+    side_effect_free_class = True
+
     def __init__(self, target_path, match_action=None):
         self.target_path = target_path
         self.match_action = match_action
@@ -412,6 +462,8 @@ class PathExistsMatchRule(MatchRule):
 class ValueMatchRule(MatchRule):
     """Match elements of this class return true when the given target_path exists and has exactly the given parsed value."""
 
+    side_effect_free_class = True
+
     def __init__(self, target_path, value, match_action=None):
         self.target_path = target_path
         self.value = value
@@ -461,6 +513,8 @@ class ValueMatchRule(MatchRule):
 class ValueListMatchRule(MatchRule):
     """Match elements of this class return true when the given path exists and has exactly one of the values included in the value list."""
 
+    side_effect_free_class = True
+
     def __init__(self, target_path, target_value_list, match_action=None):
         self.target_path = target_path
         self.target_value_list = target_value_list
@@ -505,6 +559,8 @@ class ValueListMatchRule(MatchRule):
 class ValueRangeMatchRule(MatchRule):
     """Match elements of this class return true when the given target_path exists and the value is included in [lower, upper] range."""
 
+    side_effect_free_class = True
+
     def __init__(self, target_path, lower_limit, upper_limit, match_action=None):
         self.target_path = target_path
         self.lower_limit = lower_limit
@@ -556,6 +612,8 @@ class ValueRangeMatchRule(MatchRule):
 class StringRegexMatchRule(MatchRule):
     """Elements of this class return true when the given path exists and the string repr of the value matches the regular expression."""
 
+    side_effect_free_class = True
+
     def __init__(self, target_path, match_regex, match_action=None):
         self.target_path = target_path
         self.match_regex = match_regex
@@ -600,6 +658,8 @@ class ModuloTimeMatchRule(MatchRule):
     [lower, upper] range.
     """
 
+    side_effect_free_class = True
+
     def __init__(self, target_path, seconds_modulo, lower_limit, upper_limit, match_action=None, tzinfo=None):
         """
         @param target_path the target_path to the datetime object to use to evaluate the modulo time rules on.
@@ -692,6 +752,8 @@ class ValueDependentModuloTimeMatchRule(MatchRule):
     [lower, upper] range selected by values from the match.
     """
 
+    side_effect_free_class = True
+
     def __init__(self, target_path, seconds_modulo, target_path_list=None, limit_lookup_dict=None, default_limit=None, match_action=None,
                  tzinfo=None):
         """
@@ -800,6 +862,8 @@ class IPv4InRFC1918MatchRule(MatchRule):
     This could also be done by distinct range match elements, but as this kind of matching is common, have an own element for it.
     """
 
+    side_effect_free_class = True
+
     def __init__(self, target_path, match_action=None):
         self.target_path = target_path
         self.match_action = match_action
@@ -892,3 +956,174 @@ class DebugHistoryMatchRule(MatchRule):
     def get_history(self):
         """Get the history object from this debug rule."""
         return self.object_history
+
+
+class FirstMatchRuleIndex:
+    """
+    This class evaluates a list of rules until the first rule matches, like the OrMatchRule, without checking every rule on its own.
+    Consecutive rules without side effects are compiled into a SideEffectFreeRuleGroup, where the rules are indexed by the paths they
+    require. As the result of such a group does not depend on the order of its rules, rules skipped by the index are not counted in their
+    statistics. Rules with side effects, e.g., match actions, are always evaluated in the configured order.
+    """
+
+    def __init__(self, rules):
+        """
+        Compile the rules.
+        @param rules the list of rules, which must not be changed afterwards.
+        """
+        self.rules = rules
+        self.segments = []
+        rule_group = None
+        for rule in rules:
+            if rule.is_side_effect_free():
+                if rule_group is None:
+                    rule_group = SideEffectFreeRuleGroup()
+                    self.segments.append(rule_group)
+                rule_group.add_rule(rule)
+            else:
+                rule_group = None
+                self.segments.append(rule)
+        for segment in self.segments:
+            if isinstance(segment, SideEffectFreeRuleGroup):
+                segment.compile_regexes()
+
+    def match(self, log_atom):
+        """
+        Check if any of the rules matches.
+        @return True when any rule matched.
+        """
+        for segment in self.segments:
+            if segment.match(log_atom):
+                return True
+        return False
+
+
+class SideEffectFreeRuleGroup:
+    """
+    This class matches a group of rules without side effects using indices over their required paths.
+    PathExistsMatchRules are looked up by their paths, ValueMatchRules and ValueListMatchRules are dispatched by hash lookups of the
+    values and the regular expressions of the StringRegexMatchRules for a path are merged into a single alternation. Other rules are only
+    evaluated when all their required paths exist. Candidate rules found in the indices are evaluated to confirm the match and update
+    their statistics.
+    ValueMatchRules raise a TypeError or convert the match_object to bytes, when the types of their value and the match_object differ.
+    When a ValueMatchRule of the group could do so for a log atom, all rules are evaluated in the configured order instead.
+    """
+
+    def __init__(self):
+        self.rules = []
+        # The paths of all ValueMatchRules in the group including subrules. The paths are mapped to False, when the value of any rule is
+        # neither bytes nor a string, as the rule can not be evaluated without side effects then.
+        self.value_rule_paths = {}
+        self.path_rules = {}
+        # ValueMatchRules compare strings and bytes by encoding the strings, so all values are stored as bytes.
+        self.value_rules = {}
+        self.value_list_rules = {}
+        self.regex_rules = {}
+        self.compiled_regexes = []
+        self.other_rules = []
+
+    def add_rule(self, rule):
+        """Add a rule without side effects to the indices."""
+        self.rules.append(rule)
+        rules = [rule]
+        while rules:
+            sub_rule = rules.pop()
+            if isinstance(sub_rule, ValueMatchRule):
+                self.value_rule_paths[sub_rule.target_path] = self.value_rule_paths.get(sub_rule.target_path, True) and isinstance(
+                    sub_rule.value, (bytes, str))
+            rules += sub_rule.get_sub_rules()
+        rule_type = type(rule)
+        if rule_type is PathExistsMatchRule:
+            self.path_rules.setdefault(rule.target_path, rule)
+        elif rule_type is ValueMatchRule and isinstance(rule.value, (bytes, str)):
+            value = rule.value.encode() if isinstance(rule.value, str) else rule.value
+            self.value_rules.setdefault(rule.target_path, {}).setdefault(value, []).append(rule)
+        elif rule_type is ValueListMatchRule and all(is_hashable(value) for value in rule.target_value_list):
+            value_dict = self.value_list_rules.setdefault(rule.target_path, {})
+            for value in set(rule.target_value_list):
+                value_dict.setdefault(value, []).append(rule)
+        elif rule_type is StringRegexMatchRule and rule.match_regex.groups == 0:
+            key = (rule.target_path, type(rule.match_regex.pattern), rule.match_regex.flags)
+            self.regex_rules.setdefault(key, []).append(rule)
+        else:
+            self.other_rules.append((tuple(rule.get_required_paths()), rule))
+
+    def compile_regexes(self):
+        """Merge the regular expressions of all StringRegexMatchRules with the same path into a single alternation."""
+        for (target_path, pattern_type, flags), rules in self.regex_rules.items():
+            # Every alternative is a group, so the lastindex of a match identifies the matching rule.
+            if pattern_type is bytes:
+                pattern = b"|".join(b"(" + rule.match_regex.pattern + b")" for rule in rules)
+            else:
+                pattern = "|".join("(" + rule.match_regex.pattern + ")" for rule in rules)
+            try:
+                self.compiled_regexes.append((target_path, re.compile(pattern, flags), rules))
+            except re.error:
+                self.other_rules += [(tuple(rule.get_required_paths()), rule) for rule in rules]
+        self.regex_rules = {}
+
+    def match(self, log_atom):
+        """
+        Check if any of the rules matches.
+        @return True when any rule matched.
+        """
+        match_dict = log_atom.parser_match.get_match_dictionary()
+        for target_path, bytes_or_str_values in self.value_rule_paths.items():
+            match_element = match_dict.get(target_path)
+            if match_element is not None and (not bytes_or_str_values or isinstance(match_element, list) or not isinstance(
+                    match_element.match_object, bytes)):
+                for rule in self.rules:
+                    if rule.match(log_atom):
+                        return True
+                return False
+
+        for target_path, rule in self.path_rules.items():
+            if target_path in match_dict and rule.match(log_atom):
+                return True
+
+        for target_path, value_dict in self.value_rules.items():
+            match_element = match_dict.get(target_path)
+            if match_element is None:
+                continue
+            for rule in value_dict.get(match_element.match_object, []):
+                if rule.match(log_atom):
+                    return True
+
+        for target_path, value_dict in self.value_list_rules.items():
+            match_element = match_dict.get(target_path)
+            if match_element is None:
+                continue
+            try:
+                rules = value_dict.get(match_element.match_object, [])
+            except (AttributeError, TypeError):
+                rules = [rule for rule_list in value_dict.values() for rule in rule_list]
+            for rule in rules:
+                if rule.match(log_atom):
+                    return True
+
+        for target_path, regex, rules in self.compiled_regexes:
+            match_element = match_dict.get(target_path)
+            if match_element is None:
+                continue
+            if isinstance(match_element, list):
+                for rule in rules:
+                    if rule.match(log_atom):
+                        return True
+                continue
+            regex_match = regex.match(match_element.match_string)
+            if regex_match is not None and rules[regex_match.lastindex - 1].match(log_atom):
+                return True
+
+        for required_paths, rule in self.other_rules:
+            if all(path in match_dict for path in required_paths) and rule.match(log_atom):
+                return True
+        return False
+
+
+def is_hashable(value):
+    """Check if the value can be used as key of an index."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
@@ -11,21 +11,170 @@ You should have received a copy of the GNU General Public License along with
 this program. If not, see <http://www.gnu.org/licenses/>.
 """
 import os
+import sys
 import logging
 from collections import deque
+from itertools import islice
 
 from aminer.AminerConfig import STAT_LOG_NAME, CONFIG_KEY_LOG_LINE_PREFIX, DEFAULT_LOG_LINE_PREFIX, DEBUG_LOG_NAME
 from aminer import AminerConfig
 from aminer.input.InputInterfaces import AtomHandlerInterface
 
 
+class EventTimeWindow:
+    """
+    This class stores the occurrence times of one event in the order they were received. Times are only removed when the window is
+    pruned, so the stored times can contain times before the current window. These times are skipped by an index, which is only moved
+    forward, instead of counting all stored times, so the current count is determined in amortised constant time.
+    """
+
+    __slots__ = ("times", "start", "window_start", "last_time", "ordered")
+
+    def __init__(self):
+        """Initialize the window."""
+        self.times = []
+        # The index of the first time which was not pruned yet.
+        self.start = 0
+        # The index of the first time within the window of the last count.
+        self.window_start = 0
+        self.last_time = None
+        # The index is only valid while the times are received in ascending order.
+        self.ordered = True
+
+    def __len__(self):
+        """Return the number of stored times."""
+        return len(self.times) - self.start
+
+    def __iter__(self):
+        """Iterate over the stored times."""
+        return islice(self.times, self.start, None)
+
+    def append(self, timestamp):
+        """Add the time of an event occurrence."""
+        if self.last_time is not None and timestamp < self.last_time:
+            self.ordered = False
+        self.last_time = timestamp
+        self.times.append(timestamp)
+
+    def count(self, lower_limit):
+        """Return the number of stored times which are bigger than or equal to the lower_limit."""
+        times = self.times
+        if not self.ordered:
+            return sum(1 for timestamp in islice(times, self.start, None) if timestamp >= lower_limit)
+        index = self.window_start
+        length = len(times)
+        while index < length and times[index] < lower_limit:
+            index += 1
+        self.window_start = index
+        return length - index
+
+    def prune(self, lower_limit):
+        """
+        Remove the times from the start of the window which are smaller than the lower_limit.
+        @return the number of removed times.
+        """
+        times = self.times
+        index = self.start
+        length = len(times)
+        while index < length and times[index] < lower_limit:
+            index += 1
+        removed = index - self.start
+        self.start = index
+        self.window_start = max(self.window_start, index)
+        if index == length:
+            self.times = []
+            self.start = self.window_start = 0
+            self.ordered = True
+        elif index > 64 and 2 * index > length:
+            # Delete the pruned times only when they make up most of the list to avoid moving the remaining times on every prune.
+            del times[:index]
+            self.start = 0
+            self.window_start -= index
+        return removed
+
+    def get_memory_size(self):
+        """Return the approximate number of bytes used by the window."""
+        return sys.getsizeof(self) + sys.getsizeof(self.times) + len(self.times) * sys.getsizeof(0.0)
+
+
+class BucketedEventTimeWindow:
+    """
+    This class counts the occurrences of one event in buckets of bucket_size seconds instead of storing every time. Buckets before the
+    window are removed when counting, so the memory is bounded by the number of buckets in the window. The count contains all occurrences
+    in the bucket of the lower limit, so it can exceed the exact count by the occurrences in the last bucket_size seconds before the window.
+    """
+
+    __slots__ = ("bucket_size", "buckets", "total", "expired")
+
+    def __init__(self, bucket_size):
+        """
+        Initialize the window.
+        @param bucket_size the length of the buckets in seconds.
+        """
+        self.bucket_size = bucket_size
+        # Lists of the bucket number and the number of occurrences in the bucket sorted by the bucket number.
+        self.buckets = deque()
+        self.total = 0
+        # The number of occurrences removed with their buckets since the last prune.
+        self.expired = 0
+
+    def __len__(self):
+        """Return the number of counted occurrences."""
+        return self.total + self.expired
+
+    def append(self, timestamp):
+        """Add the time of an event occurrence."""
+        bucket_number = int(timestamp // self.bucket_size)
+        buckets = self.buckets
+        self.total += 1
+        if not buckets or buckets[-1][0] < bucket_number:
+            buckets.append([bucket_number, 1])
+            return
+        if buckets[-1][0] == bucket_number:
+            buckets[-1][1] += 1
+            return
+        # Occurrences received out of order are added to the bucket of their time.
+        for index in range(len(buckets) - 1, -1, -1):
+            if buckets[index][0] == bucket_number:
+                buckets[index][1] += 1
+                return
+            if buckets[index][0] < bucket_number:
+                buckets.insert(index + 1, [bucket_number, 1])
+                return
+        buckets.appendleft([bucket_number, 1])
+
+    def count(self, lower_limit):
+        """Return the number of occurrences in the buckets ending after the lower_limit."""
+        first_bucket_number = int(lower_limit // self.bucket_size)
+        buckets = self.buckets
+        while buckets and buckets[0][0] < first_bucket_number:
+            occurrences = buckets.popleft()[1]
+            self.total -= occurrences
+            self.expired += occurrences
+        return self.total
+
+    def prune(self, lower_limit):
+        """
+        Remove the buckets ending before the lower_limit.
+        @return the number of removed occurrences.
+        """
+        self.count(lower_limit)
+        removed = self.expired
+        self.expired = 0
+        return removed
+
+    def get_memory_size(self):
+        """Return the approximate number of bytes used by the window."""
+        return sys.getsizeof(self) + sys.getsizeof(self.buckets) + len(self.buckets) * (sys.getsizeof([0, 0]) + 2 * sys.getsizeof(1 << 40))
+
+
 class SlidingEventFrequencyDetector(AtomHandlerInterface):
     """This class creates events when event or value frequencies exceed the set limit."""
 
     def __init__(self, aminer_config, anomaly_event_handlers, set_upper_limit, target_path_list=None, scoring_path_list=None,
                  window_size=600, local_maximum_threshold=0.2, persistence_id="Default", learn_mode=False, output_logline=True,
                  ignore_list=None, constraint_list=None, stop_learning_time=None, stop_learning_no_anomaly_time=None,
-                 log_resource_ignore_list=None):
+                 log_resource_ignore_list=None, bucket_size=None):
         """
         Initialize the detector.
         @param aminer_config configuration from analysis_context.
@@ -44,6 +193,10 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
         @param ignore_list list of paths that are not considered for analysis, i.e., events that contain one of these paths are omitted.
                The default value is [] as None is not iterable.
         @param constraint_list list of paths that have to be present in the log atom to be analyzed.
+        @param log_resource_ignore_list list of log resources that are not considered for analysis.
+        @param bucket_size when set, the occurrences are counted in buckets of bucket_size seconds instead of storing the time of every
+               occurrence. This bounds the memory needed for large windows, but the frequencies can contain the occurrences of up to
+               bucket_size seconds before the window.
         """
         # Avoid "defined outside init" issue
         self.learn_mode, self.stop_learning_timestamp, self.next_persist_time, self.log_success, self.log_total = [None]*5
@@ -53,12 +206,17 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
             target_path_list=target_path_list, scoring_path_list=scoring_path_list, set_upper_limit=set_upper_limit,
             local_maximum_threshold=local_maximum_threshold, persistence_id=persistence_id, learn_mode=learn_mode,
             output_logline=output_logline, ignore_list=ignore_list, constraint_list=constraint_list, stop_learning_time=stop_learning_time,
-            stop_learning_no_anomaly_time=stop_learning_no_anomaly_time, log_resource_ignore_list=log_resource_ignore_list
+            stop_learning_no_anomaly_time=stop_learning_no_anomaly_time, log_resource_ignore_list=log_resource_ignore_list,
+            bucket_size=bucket_size
         )
         if not self.set_upper_limit:
             msg = "set_upper_limit must not be None."
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             raise TypeError(msg)
+        if self.bucket_size is not None and self.bucket_size > self.window_size:
+            msg = "bucket_size must not be bigger than window_size."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
         self.counts = {}
         self.scoring_value_list = {}
         self.max_frequency = {}
@@ -125,7 +283,10 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
         # Initialize the needed variables at first event occurrence
         if log_event not in self.counts:
             # Initialize counts, max_frequency, max_frequency_time exceeded_frequency_range and self.exceeded_frequency_range_time
-            self.counts[log_event] = deque()
+            if self.bucket_size is None:
+                self.counts[log_event] = EventTimeWindow()
+            else:
+                self.counts[log_event] = BucketedEventTimeWindow(self.bucket_size)
             self.max_frequency[log_event] = 0
             self.max_frequency_time[log_event] = 0
             self.max_frequency_log_atom[log_event] = None
@@ -149,10 +310,7 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
                     else:
                         scoring_value = scoring_match.match_object
                     # Save the value in the list
-                    if log_event in self.counts:
-                        self.scoring_value_list[log_event].append(scoring_value)
-                    else:
-                        self.scoring_value_list[log_event] = [scoring_value]
+                    self.scoring_value_list[log_event].append(scoring_value)
 
         # Get current frequency
         current_frequency = self.get_current_frequency(log_atom, log_event)
@@ -219,7 +377,7 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
             frequency_info["Local_maximum_timestamp"] = self.max_frequency_time[log_event]
             # In case that scoring_path_list is set, give their values to the event handlers for further analysis.
             if len(self.scoring_path_list) > 0:
-                frequency_info["IdValues"] = list(self.scoring_value_list[log_event])[:self.max_frequency[log_event]]
+                frequency_info["IdValues"] = list(islice(self.scoring_value_list[log_event], self.max_frequency[log_event]))
 
         event_data = {"AnalysisComponent": analysis_component, "FrequencyData": frequency_info}
         if first_exceeded_threshold:
@@ -241,22 +399,35 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
                 "'%s' processed %s out of %s log atoms successfully in the last 60 minutes.", component_name, self.log_success,
                 self.log_total)
         elif AminerConfig.STAT_LEVEL == 2:
+            memory_sizes = self.get_memory_sizes()
             logging.getLogger(STAT_LOG_NAME).info(
-                "'%s' processed %s out of %s log atoms successfully in the last 60 minutes.", component_name, self.log_success,
-                self.log_total)
+                "'%s' processed %s out of %s log atoms successfully in the last 60 minutes. The windows of %d events use %d bytes, "
+                "%d bytes per event in average and %d bytes at most.", component_name, self.log_success, self.log_total, len(memory_sizes),
+                sum(memory_sizes.values()), sum(memory_sizes.values()) / max(len(memory_sizes), 1), max(memory_sizes.values(), default=0))
         self.log_success = 0
         self.log_total = 0
 
     def reset_counter(self, log_atom, log_event):
         """Remove any times from counts and scoring_value_list that fell out of the time window"""
-        while len(self.counts[log_event]) > 0 and self.counts[log_event][0] < log_atom.atom_time - self.window_size:
-            self.counts[log_event].popleft()
-            if len(self.scoring_path_list) > 0:
-                self.scoring_value_list[log_event].popleft()
+        removed = self.counts[log_event].prune(log_atom.atom_time - self.window_size)
+        if len(self.scoring_path_list) > 0:
+            scoring_values = self.scoring_value_list[log_event]
+            for _ in range(min(removed, len(scoring_values))):
+                scoring_values.popleft()
 
     def get_current_frequency(self, log_atom, log_event):
         """Return current frequency of the current log event."""
-        return len([None for timestamp in self.counts[log_event] if timestamp >= log_atom.atom_time - self.window_size])
+        return self.counts[log_event].count(log_atom.atom_time - self.window_size)
+
+    def get_memory_sizes(self):
+        """Return a dictionary with the approximate number of bytes used by the window and the scoring values of every log event."""
+        memory_sizes = {}
+        for log_event, window in self.counts.items():
+            memory_sizes[log_event] = window.get_memory_size()
+            if log_event in self.scoring_value_list:
+                scoring_values = self.scoring_value_list[log_event]
+                memory_sizes[log_event] += sys.getsizeof(scoring_values) + sum(sys.getsizeof(value) for value in scoring_values)
+        return memory_sizes
 
     def get_weight_analysis_field_path(self):
         """Return the path to the list in the output of the detector which is weighted by the ScoringEventHandler."""
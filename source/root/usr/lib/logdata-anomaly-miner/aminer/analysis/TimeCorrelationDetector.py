@@ -15,6 +15,7 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 from datetime import datetime
 import random
 import logging
+import numpy as np
 
 from aminer.AminerConfig import DEBUG_LOG_NAME
 from aminer import AminerConfig
@@ -67,8 +68,20 @@ class TimeCorrelationDetector(AtomHandlerInterface):
             raise ValueError(msg)
 
         self.feature_list = []
-        self.event_count_table = [0] * parallel_check_count * parallel_check_count * 2
-        self.event_delta_table = [0] * parallel_check_count * parallel_check_count * 2
+        # The conditions of the feature rules are indexed by the path for PathExistsMatchRules and by the path and value for
+        # ValueMatchRules. The i-th condition of every feature is stored in the i-th slot as bitset of the features requiring it, so the
+        # features matching a log atom are found by combining the slots of the conditions fulfilled by its match dictionary.
+        self.condition_index = {}
+        self.value_condition_paths = set()
+        # For every slot the bitset of the indexed features with fewer conditions, which do not need to fulfill a condition in this slot.
+        self.unused_slot_bits = []
+        self.indexed_feature_bits = 0
+        # Features with conditions which can not be indexed, e.g., unhashable values, are matched with their rules.
+        self.unindexed_features = []
+        self.last_trigger_times = np.zeros(parallel_check_count)
+        # The tables store the statistics for the row feature triggering before (0) or after (1) the column feature.
+        self.event_count_table = np.zeros((parallel_check_count, parallel_check_count, 2), dtype=np.int64)
+        self.event_delta_table = np.zeros((parallel_check_count, parallel_check_count, 2), dtype=np.int64)
 
     def receive_atom(self, log_atom):
         """Receive a log atom from a source."""
@@ -87,13 +100,9 @@ class TimeCorrelationDetector(AtomHandlerInterface):
         self.last_timestamp = timestamp
 
         self.total_records += 1
-        features_found_list = []
-
-        for feature in self.feature_list:
-            if feature.rule.match(log_atom):
-                feature.trigger_count += 1
-                self.update_tables_for_feature(feature, timestamp)
-                features_found_list.append(feature)
+        feature_indices = self.get_matching_feature_indices(log_atom)
+        if feature_indices:
+            self.update_tables_for_features(feature_indices, timestamp)
 
         if len(self.feature_list) < self.parallel_check_count:
             if (random.randint(0, 1) != 0) and (self.last_unhandled_match is not None):
@@ -102,19 +111,22 @@ class TimeCorrelationDetector(AtomHandlerInterface):
             if new_rule is not None:
                 new_feature = CorrelationFeature(new_rule, len(self.feature_list), timestamp)
                 self.feature_list.append(new_feature)
-                new_feature.trigger_count = 1
-                self.update_tables_for_feature(new_feature, timestamp)
-                features_found_list.append(new_feature)
+                self.index_feature(new_feature)
+                self.update_tables_for_features([new_feature.index], timestamp)
+                feature_indices.append(new_feature.index)
 
-        for feature in features_found_list:
+        for feature_index in feature_indices:
+            feature = self.feature_list[feature_index]
+            feature.trigger_count += 1
             feature.last_trigger_time = timestamp
+            self.last_trigger_times[feature_index] = timestamp
 
-        if not features_found_list:
+        if not feature_indices:
             self.last_unhandled_match = log_atom
 
         if (self.total_records % self.record_count_before_event) == 0:
-            result = self.total_records * [""]
-            result[0] = self.analysis_status_to_string()
+            # Only the status is reported as log line, so the memory needed for the report does not grow with the number of records.
+            result = [self.analysis_status_to_string()]
             value = log_atom.raw_data
             if isinstance(value, bytes):
                 value = value.decode(AminerConfig.ENCODING)
@@ -147,6 +159,9 @@ class TimeCorrelationDetector(AtomHandlerInterface):
         """Convert a rule to a dict structure."""
         r = {"type": str(rule.__class__.__name__)}
         for var in vars(rule):
+            # The statistics counters of the rules are not part of the rule definition.
+            if var in ("log_success", "log_total"):
+                continue
             attr = getattr(rule, var, None)
             if attr is None:
                 r[var] = None
@@ -198,26 +213,83 @@ class TimeCorrelationDetector(AtomHandlerInterface):
             return sub_rules[0]
         return None
 
-    def update_tables_for_feature(self, target_feature, timestamp):
+    def index_feature(self, feature):
+        """Add the conditions of the feature rule to the condition index or match the feature with its rule if this is not possible."""
+        rules = [feature.rule]
+        if isinstance(feature.rule, Rules.AndMatchRule) and feature.rule.match_action is None:
+            rules = feature.rule.sub_rules
+        condition_keys = []
+        for rule in rules:
+            if isinstance(rule, Rules.PathExistsMatchRule) and rule.match_action is None:
+                condition_keys.append(rule.target_path)
+            elif isinstance(rule, Rules.ValueMatchRule) and rule.match_action is None and Rules.is_hashable(rule.value):
+                condition_keys.append((rule.target_path, get_condition_value(rule.value)))
+            else:
+                self.unindexed_features.append(feature)
+                return
+        feature_bit = 1 << feature.index
+        while len(self.unused_slot_bits) < len(condition_keys):
+            self.unused_slot_bits.append(self.indexed_feature_bits)
+        for slot, condition_key in enumerate(condition_keys):
+            slot_bits = self.condition_index.setdefault(condition_key, {})
+            slot_bits[slot] = slot_bits.get(slot, 0) | feature_bit
+            if isinstance(condition_key, tuple):
+                self.value_condition_paths.add(condition_key[0])
+        for slot in range(len(condition_keys), len(self.unused_slot_bits)):
+            self.unused_slot_bits[slot] |= feature_bit
+        self.indexed_feature_bits |= feature_bit
+
+    def get_matching_feature_indices(self, log_atom):
+        """Get the sorted list of the indices of all features matching the log atom."""
+        satisfied_slot_bits = [0] * len(self.unused_slot_bits)
+        condition_index = self.condition_index
+        for path, match_element in log_atom.parser_match.get_match_dictionary().items():
+            slot_bits = condition_index.get(path)
+            if slot_bits is not None:
+                for slot, bits in slot_bits.items():
+                    satisfied_slot_bits[slot] |= bits
+            if path in self.value_condition_paths and not isinstance(match_element, list):
+                try:
+                    slot_bits = condition_index.get((path, get_condition_value(match_element.match_object)))
+                except TypeError:
+                    slot_bits = None
+                if slot_bits is not None:
+                    for slot, bits in slot_bits.items():
+                        satisfied_slot_bits[slot] |= bits
+        feature_bits = self.indexed_feature_bits
+        for slot, bits in enumerate(satisfied_slot_bits):
+            feature_bits &= bits | self.unused_slot_bits[slot]
+            if not feature_bits:
+                break
+        for feature in self.unindexed_features:
+            if feature.rule.match(log_atom):
+                feature_bits |= 1 << feature.index
+
+        feature_indices = []
+        while feature_bits:
+            lowest_bit = feature_bits & -feature_bits
+            feature_indices.append(lowest_bit.bit_length() - 1)
+            feature_bits ^= lowest_bit
+        return feature_indices
+
+    def update_tables_for_features(self, feature_indices, timestamp):
         """
-        Assume that this event was the effect of a previous cause-related event.
-        Loop over all cause-related features (rows) to search for matches.
+        Assume that this event was the effect of previous cause-related events of all features triggered within the last 10 seconds.
+        The statistics of all these cause-related features (rows) and the triggered features (columns) are updated at once.
+        @param feature_indices the indices of the triggered features, which must not contain duplicates.
+        @param timestamp the time of the event.
         """
-        feature_table_pos = (target_feature.index << 1)
-        for feature in self.feature_list:
-            delta = timestamp - feature.last_trigger_time
-            if delta <= 10.0:
-                self.event_count_table[feature_table_pos] += 1
-                self.event_delta_table[feature_table_pos] += int(delta * 1000)
-            feature_table_pos += (self.parallel_check_count << 1)
-
-        feature_table_pos = ((target_feature.index * self.parallel_check_count) << 1) + 1
-        for feature in self.feature_list:
-            delta = timestamp - feature.last_trigger_time
-            if delta <= 10.0:
-                self.event_count_table[feature_table_pos] += 1
-                self.event_delta_table[feature_table_pos] -= int(delta * 1000)
-            feature_table_pos += 2
+        deltas = timestamp - self.last_trigger_times[:len(self.feature_list)]
+        cause_indices = np.flatnonzero(deltas <= 10.0)
+        if cause_indices.size == 0:
+            return
+        delta_millis = (deltas[cause_indices] * 1000).astype(np.int64)
+        rows = cause_indices[:, np.newaxis]
+        columns = np.asarray(feature_indices)
+        self.event_count_table[rows, columns, 0] += 1
+        self.event_delta_table[rows, columns, 0] += delta_millis[:, np.newaxis]
+        self.event_count_table[columns[:, np.newaxis], cause_indices, 1] += 1
+        self.event_delta_table[columns[:, np.newaxis], cause_indices, 1] -= delta_millis
 
     def analysis_status_to_string(self):
         """Get a string representation of all features."""
@@ -225,32 +297,21 @@ class TimeCorrelationDetector(AtomHandlerInterface):
         for feature in self.feature_list:
             trigger_count = feature.trigger_count
             result += f"{feature.rule} ({feature.index}) e = {trigger_count}:"
-            stat_pos = (self.parallel_check_count * feature.index) << 1
-            for feature_pos in range(len(self.feature_list)):  # skipcq: PTC-W0060
-                event_count = self.event_count_table[stat_pos]
-                ratio = "-"
-                if trigger_count != 0:
-                    # skipcq: PYL-C0209
-                    ratio = "%.2e" % (float(event_count) / trigger_count)
-                delta = "-"
-                if event_count != 0:
+            for feature_pos in range(len(self.feature_list)):
+                result += "\n  %d: {" % feature_pos  # skipcq: PYL-C0209
+                for direction in (0, 1):
+                    event_count = int(self.event_count_table[feature.index, feature_pos, direction])
+                    ratio = "-"
+                    if trigger_count != 0:
+                        # skipcq: PYL-C0209
+                        ratio = "%.2e" % (float(event_count) / trigger_count)
+                    delta = "-"
+                    if event_count != 0:
+                        # skipcq: PYL-C0209
+                        delta = "%.2e" % (float(self.event_delta_table[feature.index, feature_pos, direction]) * 0.001 / event_count)
                     # skipcq: PYL-C0209
-                    delta = "%.2e" % (float(self.event_delta_table[stat_pos]) * 0.001 / event_count)
-                # skipcq: PYL-C0209
-                result += "\n  %d: {c = %#6d r = %s dt = %s" % (feature_pos, event_count, ratio, delta)
-                stat_pos += 1
-                event_count = self.event_count_table[stat_pos]
-                ratio = "-"
-                if trigger_count != 0:
-                    # skipcq: PYL-C0209
-                    ratio = "%.2e" % (float(event_count) / trigger_count)
-                delta = "-"
-                if event_count != 0:
-                    # skipcq: PYL-C0209
-                    delta = "%.2e" % (float(self.event_delta_table[stat_pos]) * 0.001 / event_count)
-                # skipcq: PYL-C0209
-                result += " c = %#6d r = %s dt = %s}" % (event_count, ratio, delta)
-                stat_pos += 1
+                    result += "%sc = %#6d r = %s dt = %s" % (" " if direction else "", event_count, ratio, delta)
+                result += "}"
             result += "\n"
         return result
 
@@ -260,8 +321,16 @@ class TimeCorrelationDetector(AtomHandlerInterface):
             feature.creation_time = 0
             feature.last_trigger_time = 0
             feature.trigger_count = 0
-        self.event_count_table = [0] * self.parallel_check_count * self.parallel_check_count * 2
-        self.event_delta_table = [0] * self.parallel_check_count * self.parallel_check_count * 2
+        self.last_trigger_times.fill(0)
+        self.event_count_table.fill(0)
+        self.event_delta_table.fill(0)
+
+
+def get_condition_value(value):
+    """Get the value used in the condition index, as ValueMatchRules compare strings and bytes by encoding the strings."""
+    if isinstance(value, str):
+        return value.encode()
+    return value
 
 
 class CorrelationFeature:
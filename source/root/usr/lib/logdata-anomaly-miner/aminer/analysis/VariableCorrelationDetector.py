@@ -450,11 +450,13 @@ class VariableCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentIn
             i = pos_var_cor_val[0]  # Index of the first variable in discrete_indices
             j = pos_var_cor_val[1]  # Index of the second variable in discrete_indices
 
+            i_values = self.event_type_detector.values[event_index][self.discrete_indices[event_index][i]]
+            j_values = self.event_type_detector.values[event_index][self.discrete_indices[event_index][j]]
             for k in range(-1, -self.num_init-1, -1):
                 # k-th value of the i-th variable
-                i_val = self.event_type_detector.values[event_index][self.discrete_indices[event_index][i]][k]
+                i_val = i_values[k]
                 # k-th value of the j-th variable
-                j_val = self.event_type_detector.values[event_index][self.discrete_indices[event_index][j]][k]
+                j_val = j_values[k]
 
                 # Check if i_val has not appeared previously
                 if i_val not in self.rel_list[event_index][pos_var_cor_index][0]:
@@ -516,11 +518,13 @@ class VariableCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentIn
         """Initialize the first entries of w_rel_list."""
         i = self.pos_var_cor[event_index][pos_var_cor_index][0]  # Index of the first variable in discrete_indices
         j = self.pos_var_cor[event_index][pos_var_cor_index][1]  # Index of the second variable in discrete_indices
+        i_values = self.event_type_detector.values[event_index][self.discrete_indices[event_index][i]]
+        j_values = self.event_type_detector.values[event_index][self.discrete_indices[event_index][j]]
         for k in range(-1, -self.num_init-1, -1):
             # k-th value of the i-th variable
-            i_val = self.event_type_detector.values[event_index][self.discrete_indices[event_index][i]][k]
+            i_val = i_values[k]
             # k-th value of the j-th variable
-            j_val = self.event_type_detector.values[event_index][self.discrete_indices[event_index][j]][k]
+            j_val = j_values[k]
 
             # Updating both lists in w_rel_list[event_index][pos_var_cor_index] and w_rel_num_ll_to_vals[event_index][pos_var_cor_index]
             # Add an entry for i_val if necessary
@@ -603,11 +607,13 @@ class VariableCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentIn
                     failed_j_vals = []
                     new_i_vals = []
                     new_j_vals = []
+                i_values = self.event_type_detector.values[event_index][self.discrete_indices[event_index][i]]
+                j_values = self.event_type_detector.values[event_index][self.discrete_indices[event_index][j]]
                 for k in range(-1, -self.num_update-1, -1):
                     # k-th value of the i-th variable
-                    i_val = self.event_type_detector.values[event_index][self.discrete_indices[event_index][i]][k]
+                    i_val = i_values[k]
                     # k-th value of the j-th variable
-                    j_val = self.event_type_detector.values[event_index][self.discrete_indices[event_index][j]][k]
+                    j_val = j_values[k]
 
                     # Check if i_val has not appeared previously and appends the message to string or save the index in failed_i_vals
                     # if the correlation was violated
@@ -702,11 +708,13 @@ class VariableCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentIn
                 reported_values_ij = {}
                 reported_values_ji = {}
 
+                i_values = self.event_type_detector.values[event_index][self.discrete_indices[event_index][i]]
+                j_values = self.event_type_detector.values[event_index][self.discrete_indices[event_index][j]]
                 for k in range(-1, -self.num_update-1, -1):
                     # k-th value of the i-th variable
-                    i_val = self.event_type_detector.values[event_index][self.discrete_indices[event_index][i]][k]
+                    i_val = i_values[k]
                     # k-th value of the j-th variable
-                    j_val = self.event_type_detector.values[event_index][self.discrete_indices[event_index][j]][k]
+                    j_val = j_values[k]
 
                     # A new value appeared, therefore append the new value to the list reported_values_ij
                     if i_val in self.rel_list[event_index][pos_var_cor_index][0] and self.rel_list[event_index][pos_var_cor_index][0][
@@ -811,10 +819,10 @@ class VariableCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentIn
                 len(self.pos_var_cor[event_index]))]
 
         # Counting the appearance of the cases in current_appearance_list
+        discrete_values = [self.event_type_detector.values[event_index][var_index] for var_index in self.discrete_indices[event_index]]
         for k in range(-1, -self.num_update-1, -1):
             # List of the values of discrete variables, in one log line
-            vals = [self.event_type_detector.values[event_index][self.discrete_indices[event_index][i]][k] for i in range(
-                len(self.discrete_indices[event_index]))]
+            vals = [values[k] for values in discrete_values]
             for pos_var_cor_index, pos_var_cor_val in enumerate(self.pos_var_cor[event_index]):
                 # Count the appearances if the list is not empty or if new rules should be generated
                 if current_appearance_list[pos_var_cor_index] != [{}, {}] or self.generate_rules[event_index]:
@@ -1608,6 +1608,8 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
         @return a list with the first entry True/False and as the second entry the maximal value of the step functions
         """
         num_distr_val = 2 * self.num_s_gof_values
+        # The tested values are shared with the EventTypeDetector without copying them.
+        values = self.event_type_detector.get_values_array(event_index, var_index, self.num_s_gof_values)
 
         if self.used_gof_test == 'KS':
             # Calculate the critical value for the KS-test
@@ -1628,53 +1630,51 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
 
             # Scipy KS-test for uniformal distribution
             if self.var_type[event_index][var_index][0] == 'uni':
-                test_statistic = kstest(
-                    self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'uniform',
-                    args=(self.var_type[event_index][var_index][1], self.var_type[event_index][var_index][2]-self.var_type[event_index][
-                        var_index][1]))[0]
+                test_statistic = kstest(values, 'uniform', args=(
+                    self.var_type[event_index][var_index][1],
+                    self.var_type[event_index][var_index][2]-self.var_type[event_index][var_index][1]))[0]
 
             # Scipy KS-test for normal distribution
             elif self.var_type[event_index][var_index][0] == 'nor':
-                test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'norm', args=(
+                test_statistic = kstest(values, 'norm', args=(
                     self.var_type[event_index][var_index][1], self.var_type[event_index][var_index][2]))[0]
 
             # Scipy KS-test for beta distributions
             elif self.var_type[event_index][var_index][0] == 'beta':
                 if self.var_type[event_index][var_index][5] == 1:
-                    test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'beta', args=(
+                    test_statistic = kstest(values, 'beta', args=(
                         0.5, 0.5, self.var_type[event_index][var_index][3], self.var_type[event_index][var_index][4] - self.var_type[
                             event_index][var_index][3]))[0]
 
                 elif self.var_type[event_index][var_index][5] == 2:
                     # Mu and sigma of the desired distribution
                     [mu, sigma] = [5 / (5 + 2), pow(5 * 2 / (5 + 2 + 1), 1 / 2) / (5 + 2)]
-                    test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'beta', args=(
+                    test_statistic = kstest(values, 'beta', args=(
                             5, 2, self.var_type[event_index][var_index][1] - mu * self.var_type[event_index][var_index][2] / sigma,
                             self.var_type[event_index][var_index][2] / sigma))[0]
 
                 elif self.var_type[event_index][var_index][5] == 3:
                     # Mu and sigma of the desired distribution
                     [mu, sigma] = [2 / (5 + 2), pow(5 * 2 / (5 + 2 + 1), 1 / 2) / (5 + 2)]
-                    test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'beta', args=(
+                    test_statistic = kstest(values, 'beta', args=(
                             2, 5, self.var_type[event_index][var_index][1] - mu * self.var_type[event_index][var_index][2] / sigma,
                             self.var_type[event_index][var_index][2] / sigma))[0]
 
                 elif self.var_type[event_index][var_index][5] == 4:
                     # Mu and sigma of the desired distribution
                     [mu, sigma] = [1 / (5 + 1), pow(5 * 1 / (5 + 1 + 1), 1 / 2) / (5 + 1)]
-                    test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'beta', args=(
+                    test_statistic = kstest(values, 'beta', args=(
                             1, 5, self.var_type[event_index][var_index][1] - mu * self.var_type[event_index][var_index][2] / sigma,
                             self.var_type[event_index][var_index][2] / sigma))[0]
 
                 elif self.var_type[event_index][var_index][5] == 5:
                     # Mu and sigma of the desired distribution
                     [mu, sigma] = [5 / (5 + 1), pow(5 * 1 / (5 + 1 + 1), 1 / 2) / (5 + 1)]
-                    test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'beta', args=(
+                    test_statistic = kstest(values, 'beta', args=(
                             5, 1, self.var_type[event_index][var_index][1] - mu * self.var_type[event_index][var_index][2] / sigma,
                             self.var_type[event_index][var_index][2] / sigma))[0]
             else:
-                test_statistic = ks_2samp(self.distr_val[event_index][var_index], self.event_type_detector.values[event_index][var_index][
-                        -self.num_s_gof_values:])[0]
+                test_statistic = ks_2samp(self.distr_val[event_index][var_index], values)[0]
 
             if first_distr:
                 if test_statistic > crit_value:
@@ -1705,8 +1705,8 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
 
         # Two sample CM-test for uniformal distribution
         if self.var_type[event_index][var_index][0] == 'uni':
-            min_val = min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-            max_val = max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
+            min_val = values.min()
+            max_val = values.max()
             min_upd = min_val - self.min_mod_upd_uni / (1-self.min_mod_upd_uni-self.max_mod_upd_uni) * (max_val-min_val)
             max_upd = max_val + self.max_mod_upd_uni / (1-self.min_mod_upd_uni-self.max_mod_upd_uni) * (max_val-min_val)
 
@@ -1721,20 +1721,18 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
             estimated_min = min(self.var_type[event_index][var_index][1], min_upd)
             estimated_max = max(self.var_type[event_index][var_index][2], max_upd)
 
-            test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]) -
-                                            estimated_min) / (estimated_max - estimated_min), 'uniform')
+            test_statistic = cramervonmises((values - estimated_min) / (estimated_max - estimated_min), 'uniform')
 
         # Two sample CM-test for normal distribution
         elif self.var_type[event_index][var_index][0] == 'nor':
-            test_statistic = cramervonmises(np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]),
-                                            'norm', args=(self.var_type[event_index][var_index][1],
-                                                          self.var_type[event_index][var_index][2]))
+            test_statistic = cramervonmises(values, 'norm', args=(
+                self.var_type[event_index][var_index][1], self.var_type[event_index][var_index][2]))
 
         # Two sample CM-test for beta distributions
         elif self.var_type[event_index][var_index][0] == 'beta':
             if self.var_type[event_index][var_index][5] == 1:
-                min_val = min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                max_val = max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
+                min_val = values.min()
+                max_val = values.max()
                 min_upd = min_val - self.min_mod_upd_beta1 / (1-self.min_mod_upd_beta1-self.max_mod_upd_beta1) * (max_val-min_val)
                 max_upd = max_val + self.max_mod_upd_beta1 / (1-self.min_mod_upd_beta1-self.max_mod_upd_beta1) * (max_val-min_val)
 
@@ -1749,12 +1747,11 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
                 estimated_min = min(self.var_type[event_index][var_index][3], min_upd)
                 estimated_max = max(self.var_type[event_index][var_index][4], max_upd)
 
-                test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                                                - estimated_min) / (estimated_max - estimated_min), 'beta', args=(0.5, 0.5))
+                test_statistic = cramervonmises((values - estimated_min) / (estimated_max - estimated_min), 'beta', args=(0.5, 0.5))
 
             elif self.var_type[event_index][var_index][5] == 2:
-                min_val = min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                max_val = max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
+                min_val = values.min()
+                max_val = values.max()
                 min_upd = min_val - self.min_mod_upd_beta2 / (1-self.max_mod_upd_beta2-self.min_mod_upd_beta2) * (max_val-min_val)
                 max_upd = max_val + self.max_mod_upd_beta2 / (1-self.max_mod_upd_beta2-self.min_mod_upd_beta2) * (max_val-min_val)
 
@@ -1769,12 +1766,11 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
                 estimated_min = min(self.var_type[event_index][var_index][3], min_upd)
                 estimated_max = max(self.var_type[event_index][var_index][4], max_upd)
 
-                test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                                                - estimated_min) / (estimated_max - estimated_min), 'beta', args=(5, 2))
+                test_statistic = cramervonmises((values - estimated_min) / (estimated_max - estimated_min), 'beta', args=(5, 2))
 
             elif self.var_type[event_index][var_index][5] == 3:
-                min_val = min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                max_val = max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
+                min_val = values.min()
+                max_val = values.max()
                 min_upd = min_val - self.max_mod_upd_beta2 / (1-self.max_mod_upd_beta2-self.min_mod_upd_beta2) * (max_val-min_val)
                 max_upd = max_val + self.min_mod_upd_beta2 / (1-self.max_mod_upd_beta2-self.min_mod_upd_beta2) * (max_val-min_val)
 
@@ -1789,50 +1785,40 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
                 estimated_min = min(self.var_type[event_index][var_index][3], min_upd)
                 estimated_max = max(self.var_type[event_index][var_index][4], max_upd)
 
-                test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                                                - estimated_min) / (estimated_max - estimated_min), 'beta', args=(2, 5))
+                test_statistic = cramervonmises((values - estimated_min) / (estimated_max - estimated_min), 'beta', args=(2, 5))
 
             elif self.var_type[event_index][var_index][5] == 4:
-                ev_upd = (self.var_type[event_index][var_index][1] * self.num_init + np.mean(
-                        self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]) *
-                        self.num_s_gof_values) / (self.num_init + self.num_s_gof_values)
-                estimated_min = min(min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]),
-                                    self.var_type[event_index][var_index][3])
+                ev_upd = (self.var_type[event_index][var_index][1] * self.num_init + np.mean(values) * self.num_s_gof_values) / (
+                        self.num_init + self.num_s_gof_values)
+                estimated_min = min(values.min(), self.var_type[event_index][var_index][3])
 
                 # Check if the estimated min and max differ more than the critical distance and return a negative test result
-                if (abs(min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]) -
-                        self.var_type[event_index][var_index][3]) >
+                if (abs(values.min() - self.var_type[event_index][var_index][3]) >
                         self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]['beta4'][0]) or (
                         max(ev_upd / self.var_type[event_index][var_index][1], self.var_type[event_index][var_index][1] / ev_upd) >
                         self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]['beta4'][1]):
                     return [False, 1]
 
-                test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                                                - estimated_min) / (ev_upd-estimated_min) * (1 / (5 + 1)-self.min_mod_upd_beta4) +
+                test_statistic = cramervonmises((values - estimated_min) / (ev_upd-estimated_min) * (1 / (5 + 1)-self.min_mod_upd_beta4) +
                                                 self.min_mod_upd_beta4, 'beta', args=(1, 5))
 
             elif self.var_type[event_index][var_index][5] == 5:
-                ev_upd = (self.var_type[event_index][var_index][1] * self.num_init + np.mean(
-                        self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]) *
-                        self.num_s_gof_values) / (self.num_init + self.num_s_gof_values)
-                estimated_max = max(max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]),
-                                    self.var_type[event_index][var_index][4])
+                ev_upd = (self.var_type[event_index][var_index][1] * self.num_init + np.mean(values) * self.num_s_gof_values) / (
+                        self.num_init + self.num_s_gof_values)
+                estimated_max = max(values.max(), self.var_type[event_index][var_index][4])
 
                 # Check if the estimated min and max differ more than the critical distance and return a negative test result
-                if (abs(max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]) -
-                        self.var_type[event_index][var_index][4]) >
+                if (abs(values.max() - self.var_type[event_index][var_index][4]) >
                         self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]['beta4'][0]) or (
                         max(ev_upd / self.var_type[event_index][var_index][1], self.var_type[event_index][var_index][1] / ev_upd) >
                         self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]['beta4'][1]):
                     return [False, 1]
 
-                test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                                                - estimated_max) / (estimated_max - ev_upd) * (1 / (5 + 1)-self.min_mod_upd_beta4) + 1 -
-                                                self.min_mod_upd_beta4, 'beta', args=(5, 1))
+                test_statistic = cramervonmises((values - estimated_max) / (estimated_max - ev_upd) * (1 / (5 + 1)-self.min_mod_upd_beta4) +
+                                                1 - self.min_mod_upd_beta4, 'beta', args=(5, 1))
 
         else:
-            test_statistic = cramervonmises2(self.distr_val[event_index][var_index], self.event_type_detector.values[event_index][
-                    var_index][-self.num_s_gof_values:])
+            test_statistic = cramervonmises2(self.distr_val[event_index][var_index], values)
 
         if first_distr:
             if test_statistic > crit_value:
@@ -0,0 +1,248 @@
+"""
+This module defines an event handler that forwards events to another event handler from a background thread.
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import collections
+import copy
+import logging
+import sys
+import threading
+import time
+from aminer import AminerConfig
+from aminer.AminerConfig import DEBUG_LOG_NAME, STAT_LOG_NAME
+from aminer.events.EventInterfaces import EventHandlerInterface
+from aminer.events.JsonConverterHandler import JsonConverterHandler
+from aminer.events.ScoringEventHandler import ScoringEventHandler
+
+OVERFLOW_POLICY_BLOCK = "block"
+OVERFLOW_POLICY_DROP_OLDEST = "drop_oldest"
+OVERFLOW_POLICY_SAMPLE = "sample"
+OVERFLOW_POLICIES = (OVERFLOW_POLICY_BLOCK, OVERFLOW_POLICY_DROP_OLDEST, OVERFLOW_POLICY_SAMPLE)
+
+
+class AsyncEventHandler(EventHandlerInterface):
+    """
+    This class implements an event record listener, that puts the events into a bounded queue and forwards them to another event handler
+    from a background thread. Slow event handlers, e.g. sending mails or writing to Kafka, do not stall the analysis this way. The events
+    are forwarded in the order they were received. When the queue is full, the overflow policy decides what happens:
+    * block: wait until the background thread has taken an event from the queue.
+    * drop_oldest: drop the oldest event in the queue.
+    * sample: only keep every sample_interval-th overflowing event by dropping the oldest event in the queue and drop all others.
+    The batches of wrapped JsonConverterHandlers are sent from the background thread, when no event arrives within their batch_timeout.
+    """
+
+    def __init__(self, event_handler, analysis_context, queue_size=1000, overflow_policy=OVERFLOW_POLICY_BLOCK, sample_interval=10,
+                 handler_name=None):
+        """
+        Initialize the event handler.
+        @param event_handler the event handler to which the events are forwarded.
+        @param analysis_context the analysis context used to get the component.
+        @param queue_size the maximum number of events waiting in the queue.
+        @param overflow_policy one of "block", "drop_oldest" or "sample" defining how events are handled when the queue is full.
+        @param sample_interval the interval of overflowing events kept with the "sample" overflow policy.
+        @param handler_name the name of the event handler used in the statistics. The class name of the event_handler is used if None.
+        """
+        if not isinstance(event_handler, EventHandlerInterface):
+            msg = "event_handler has to implement the EventHandlerInterface."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        for name, value in (("queue_size", queue_size), ("sample_interval", sample_interval)):
+            if not isinstance(value, int) or isinstance(value, bool):
+                msg = f"{name} has to be of the type integer."
+                logging.getLogger(DEBUG_LOG_NAME).error(msg)
+                raise TypeError(msg)
+            if value < 1:
+                msg = f"{name} must be at least 1."
+                logging.getLogger(DEBUG_LOG_NAME).error(msg)
+                raise ValueError(msg)
+        if overflow_policy not in OVERFLOW_POLICIES:
+            msg = f"overflow_policy must be one of {OVERFLOW_POLICIES}."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        if handler_name is None:
+            handler_name = event_handler.__class__.__name__
+        self.event_handler = event_handler
+        self.analysis_context = analysis_context
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.sample_interval = sample_interval
+        self.handler_name = handler_name
+        self.event_queue = collections.deque()
+        # The condition is notified whenever an event was added to or taken from the queue and when an event was handled.
+        self.queue_condition = threading.Condition()
+        self.handling_event = False
+        self.stop_flag = False
+        self.worker_thread = None
+        self.overflow_count = 0
+        self.queued_count = 0
+        self.handled_count = 0
+        self.dropped_count = 0
+        self.max_queue_depth = 0
+        self.latency_sum = 0
+        self.max_latency = 0
+        # The batches of the wrapped JsonConverterHandlers are flushed by the background thread, as they may not be flushed from the
+        # analysis loop.
+        self.batch_event_handlers = []
+        event_handlers = [event_handler]
+        while event_handlers:
+            wrapped_event_handler = event_handlers.pop()
+            if isinstance(wrapped_event_handler, JsonConverterHandler):
+                if wrapped_event_handler.batch_size > 1 and wrapped_event_handler.batch_timeout > 0:
+                    self.batch_event_handlers.append(wrapped_event_handler)
+            elif isinstance(wrapped_event_handler, ScoringEventHandler):
+                event_handlers += wrapped_event_handler.event_handlers
+
+    def receive_event(self, event_type, event_message, sorted_loglines, event_data, log_atom, event_source):
+        """
+        Receive information about a detected event and put it into the queue.
+        @param event_type is a string with the event type class this event belongs to. This information can be used to interpret
+               type-specific event_data objects. Together with the eventMessage and sorted_loglines, this can be used to create generic log
+               messages.
+        @param event_message the first output line of the event.
+        @param sorted_loglines sorted list of log lines that were considered when generating the event, as far as available to the time
+               of the event. The list has to contain at least one line.
+        @param event_data type-specific event data object, should not be used unless listener really knows about the event_type.
+        @param log_atom the log atom which produced the event.
+        @param event_source reference to detector generating the event.
+        """
+        if hasattr(event_source, "output_event_handlers") and event_source.output_event_handlers is not None:
+            if self not in event_source.output_event_handlers:
+                return
+            if self.event_handler not in event_source.output_event_handlers:
+                event_source = copy.copy(event_source)
+                event_source.output_event_handlers.append(self.event_handler)
+        with self.queue_condition:
+            if len(self.event_queue) >= self.queue_size:
+                if self.overflow_policy == OVERFLOW_POLICY_BLOCK:
+                    while len(self.event_queue) >= self.queue_size:
+                        self.queue_condition.wait()
+                else:
+                    self.overflow_count += 1
+                    self.dropped_count += 1
+                    if self.overflow_policy == OVERFLOW_POLICY_SAMPLE and self.overflow_count % self.sample_interval != 0:
+                        return
+                    self.event_queue.popleft()
+            self.event_queue.append((time.time(), event_type, event_message, sorted_loglines, event_data, log_atom, event_source))
+            self.queued_count += 1
+            self.max_queue_depth = max(self.max_queue_depth, len(self.event_queue))
+            self.queue_condition.notify_all()
+        if self.worker_thread is None:
+            self.worker_thread = threading.Thread(target=self.run_worker, name=f"{self.__class__.__name__}-{self.handler_name}",
+                                                  daemon=True)
+            self.worker_thread.start()
+
+    def run_worker(self):
+        """Forward the events from the queue to the event handler until the handler is closed."""
+        while True:
+            with self.queue_condition:
+                while not self.event_queue and not self.stop_flag:
+                    if not self.queue_condition.wait(self.get_batch_wait_time()):
+                        break
+                if not self.event_queue:
+                    if self.stop_flag:
+                        return
+                    # The wait timed out, so send the batches whose batch_timeout expired.
+                    event = None
+                    self.handling_event = True
+                else:
+                    queued_time, *event = self.event_queue.popleft()
+                    self.handling_event = True
+                    self.queue_condition.notify_all()
+            if event is None:
+                try:
+                    for batch_event_handler in self.batch_event_handlers:
+                        batch_event_handler.flush_batches(time.time())
+                except Exception as e:  # skipcq: PYL-W0703
+                    msg = f"{self.handler_name} failed to send the batched events: {e}"
+                    logging.getLogger(DEBUG_LOG_NAME).error(msg)
+                    print("ERROR: " + msg, file=sys.stderr)
+                with self.queue_condition:
+                    self.handling_event = False
+                    self.queue_condition.notify_all()
+                continue
+            try:
+                self.event_handler.receive_event(*event)
+            except Exception as e:  # skipcq: PYL-W0703
+                msg = f"{self.handler_name} failed to handle an event: {e}"
+                logging.getLogger(DEBUG_LOG_NAME).error(msg)
+                print("ERROR: " + msg, file=sys.stderr)
+            latency = time.time() - queued_time
+            with self.queue_condition:
+                self.handled_count += 1
+                self.latency_sum += latency
+                self.max_latency = max(self.max_latency, latency)
+                self.handling_event = False
+                self.queue_condition.notify_all()
+
+    def get_batch_wait_time(self):
+        """@return the number of seconds until the batches of the wrapped event handlers have to be checked or None without batches."""
+        wait_time = None
+        current_time = time.time()
+        for batch_event_handler in self.batch_event_handlers:
+            batch_start_time = batch_event_handler.batch_start_time
+            if batch_start_time is None:
+                batch_wait_time = batch_event_handler.batch_timeout
+            else:
+                batch_wait_time = max(0, batch_start_time + batch_event_handler.batch_timeout - current_time)
+            if wait_time is None or batch_wait_time < wait_time:
+                wait_time = batch_wait_time
+        return wait_time
+
+    def flush(self):
+        """Wait until all queued events were handled."""
+        with self.queue_condition:
+            while self.worker_thread is not None and (self.event_queue or self.handling_event):
+                self.queue_condition.wait()
+
+    def close(self):
+        """Handle all queued events and stop the background thread."""
+        self.flush()
+        if self.worker_thread is None:
+            return
+        with self.queue_condition:
+            self.stop_flag = True
+            self.queue_condition.notify_all()
+        self.worker_thread.join()
+        self.worker_thread = None
+        self.stop_flag = False
+
+    def get_queue_statistics(self):
+        """@return a dictionary with the current queue depth and the statistics since the last call of log_statistics()."""
+        with self.queue_condition:
+            average_latency = 0
+            if self.handled_count > 0:
+                average_latency = self.latency_sum / self.handled_count
+            return {"QueueDepth": len(self.event_queue), "MaxQueueDepth": self.max_queue_depth, "QueuedEvents": self.queued_count,
+                    "HandledEvents": self.handled_count, "DroppedEvents": self.dropped_count, "AverageLatency": average_latency,
+                    "MaxLatency": self.max_latency}
+
+    def log_statistics(self, component_name):
+        """
+        Log the queue depth, the number of queued, handled and dropped events and the latency between queueing and handling the events
+        since the last call.
+        @param component_name the name of the component which is printed in the log line.
+        """
+        statistics = self.get_queue_statistics()
+        if AminerConfig.STAT_LEVEL > 0:
+            logging.getLogger(STAT_LOG_NAME).info(
+                "'%s' queued %d events, handled %d events and dropped %d events in the last 60 minutes. The queue contains %d events "
+                "(maximum %d) and the average latency was %.3f seconds (maximum %.3f seconds).", component_name,
+                statistics["QueuedEvents"], statistics["HandledEvents"], statistics["DroppedEvents"], statistics["QueueDepth"],
+                statistics["MaxQueueDepth"], statistics["AverageLatency"], statistics["MaxLatency"])
+        with self.queue_condition:
+            self.queued_count = 0
+            self.handled_count = 0
+            self.dropped_count = 0
+            self.max_queue_depth = len(self.event_queue)
+            self.latency_sum = 0
+            self.max_latency = 0
@@ -24,6 +24,9 @@ class EventHandlerInterface(metaclass=abc.ABCMeta):
     to be performed asynchronously.
     """
 
+    # Event handlers setting this to True accept batches of newline-delimited JSON objects from the JsonConverterHandler.
+    supports_batches = False
+
     @abc.abstractmethod
     def receive_event(self, event_type, event_message, sorted_loglines, event_data, log_atom, event_source):
         """
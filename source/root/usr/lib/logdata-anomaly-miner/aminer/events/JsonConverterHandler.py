@@ -12,26 +12,107 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
 import json
+import logging
+import threading
 import time
 import copy
 
 from aminer.events.EventInterfaces import EventHandlerInterface
 from aminer import AminerConfig
+from aminer.AminerConfig import DEBUG_LOG_NAME
+
+import orjson
+
+
+def encode_json_line(data):
+    """
+    Serialize data to a compact JSON line for the batches with orjson, which is much faster than the json module. Unlike json.dumps,
+    orjson writes non-ASCII characters as UTF-8 instead of escaping them and serializes NaN and Infinity as null. The json module is used
+    for data orjson can not serialize, e.g. integers with more than 64 bits.
+    @param data the data to be serialized.
+    """
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(data, separators=(",", ":"))
+
+
+def decode_match_object(match_object):
+    """Decode a match object for the AnnotatedMatchElement."""
+    if isinstance(match_object, bytes):
+        return match_object.decode(AminerConfig.ENCODING)
+    return str(match_object)
 
 
 class JsonConverterHandler(EventHandlerInterface):
-    """This class implements an event record listener, that will convert event data to JSON format."""
+    """
+    This class implements an event record listener, that will convert event data to JSON format.
+    Event handlers with the supports_batches attribute set to True, e.g. the Kafka and ZeroMQ event handlers, can receive the events in
+    batches of newline-delimited JSON objects, so they only have to send one message per batch.
+    """
 
-    def __init__(self, json_event_handlers, analysis_context, pretty_print=True):
+    def __init__(self, json_event_handlers, analysis_context, pretty_print=True, batch_size=1, batch_timeout=1):
         """
         Initialize the event handler.
         @param json_event_handlers the event handlers to which the json converted data is sent.
         @param analysis_context the analysis context used to get the component.
         @param pretty_print if true, the json is printed pretty; otherwise the json is printed with less space needed.
+        @param batch_size the maximum number of events sent in one batch to event handlers supporting batches. Events are not batched if
+               the batch_size is 1.
+        @param batch_timeout the maximum number of seconds an event waits in a batch before the batch is sent.
         """
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool):
+            msg = "batch_size has to be of the type integer."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        if batch_size < 1:
+            msg = "batch_size must be at least 1."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        if not isinstance(batch_timeout, (int, float)) or isinstance(batch_timeout, bool):
+            msg = "batch_timeout has to be of the type integer or float."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        if batch_timeout < 0:
+            msg = "batch_timeout must not be negative."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
         self.json_event_handlers = json_event_handlers
         self.analysis_context = analysis_context
         self.pretty_print = pretty_print
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        # The static part of the AnalysisComponent data of every registered component, which would otherwise be searched in the
+        # analysis context for every event.
+        self.component_data_cache = {}
+        # The batched JSON lines and the last event of every event handler supporting batches.
+        self.batches = {}
+        self.batch_start_time = None
+        # The batches may be flushed from the analysis loop while events are received in the thread of an AsyncEventHandler.
+        self.batch_lock = threading.Lock()
+
+    def get_component_data(self, event_source):
+        """
+        Get the AnalysisComponent data, which does not change for an event source. The data is cached for registered components.
+        @param event_source reference to detector generating the event.
+        @return a dictionary with the identifier, type and name of the component.
+        """
+        component_data = self.component_data_cache.get(id(event_source))
+        # The cached data is only used for the cached component and as long as the component was not renamed.
+        if component_data is not None and component_data[0] is event_source and \
+                self.analysis_context.registered_components_by_name.get(component_data[1]["AnalysisComponentName"]) is event_source:
+            return component_data[1]
+        component_id = self.analysis_context.get_id_by_component(event_source)
+        component_data = {'AnalysisComponentIdentifier': component_id}
+        if event_source.__class__.__name__ == 'ExtractedData_class':
+            component_data['AnalysisComponentType'] = 'DistributionDetector'
+        else:
+            component_data['AnalysisComponentType'] = str(event_source.__class__.__name__)
+        component_data['AnalysisComponentName'] = self.analysis_context.get_name_by_component(event_source)
+        # Copies of registered components and other unregistered event sources are not cached to keep the cache bounded.
+        if component_id is not None:
+            self.component_data_cache[id(event_source)] = (event_source, component_data)
+        return component_data
 
     def receive_event(self, event_type, event_message, sorted_loglines, event_data, log_atom, event_source):
         """
@@ -49,8 +130,8 @@ class JsonConverterHandler(EventHandlerInterface):
         if hasattr(event_source, 'output_event_handlers') and event_source.output_event_handlers is not None and self not in \
                 event_source.output_event_handlers:
             return
-        component_name = self.analysis_context.get_name_by_component(event_source)
-        if component_name in self.analysis_context.suppress_detector_list:
+        component_data = self.get_component_data(event_source)
+        if component_data['AnalysisComponentName'] in self.analysis_context.suppress_detector_list:
             return
         if 'StatusInfo' in event_data:
             # No anomaly; do nothing on purpose
@@ -68,26 +149,16 @@ class JsonConverterHandler(EventHandlerInterface):
             log_data['DetectionTimestamp'] = round(time.time(), 2)
             log_data['LogLinesCount'] = len(sorted_loglines)
             if log_atom.parser_match is not None and hasattr(event_source, 'output_logline') and event_source.output_logline:
-                log_data['AnnotatedMatchElement'] = {}
+                annotated_match_element = {}
                 for path, match in log_atom.parser_match.get_match_dictionary().items():
                     if isinstance(match, list):
                         for match_element_id, match_element in enumerate(match):
-                            if isinstance(match_element.match_object, bytes):
-                                log_data['AnnotatedMatchElement'][path + '/' + str(match_element_id)] = match_element.match_object.decode(
-                                    AminerConfig.ENCODING)
-                            else:
-                                log_data['AnnotatedMatchElement'][path + '/' + str(match_element_id)] = str(match_element.match_object)
-                    elif isinstance(match.match_object, bytes):
-                        log_data['AnnotatedMatchElement'][path] = match.match_object.decode(AminerConfig.ENCODING)
+                            annotated_match_element[f"{path}/{match_element_id}"] = decode_match_object(match_element.match_object)
                     else:
-                        log_data['AnnotatedMatchElement'][path] = str(match.match_object)
-
-            analysis_component = {'AnalysisComponentIdentifier': self.analysis_context.get_id_by_component(event_source)}
-            if event_source.__class__.__name__ == 'ExtractedData_class':
-                analysis_component['AnalysisComponentType'] = 'DistributionDetector'
-            else:
-                analysis_component['AnalysisComponentType'] = str(event_source.__class__.__name__)
-            analysis_component['AnalysisComponentName'] = self.analysis_context.get_name_by_component(event_source)
+                        annotated_match_element[path] = decode_match_object(match.match_object)
+                log_data['AnnotatedMatchElement'] = annotated_match_element
+
+            analysis_component = component_data.copy()
             analysis_component['Message'] = event_message
             if hasattr(event_source, "persistence_id"):
                 analysis_component['PersistenceFileName'] = event_source.persistence_id
@@ -113,16 +184,77 @@ class JsonConverterHandler(EventHandlerInterface):
             if aminer_id is not None:
                 event_data['AminerId'] = aminer_id
 
-        if self.pretty_print is True:
-            json_data = json.dumps(event_data, indent=2)
-        else:
-            json_data = json.dumps(event_data)
-        res = [''] * len(sorted_loglines)
-        res[0] = str(json_data)
-
+        json_data = None
+        json_line = None
+        missing_event_handlers = []
         for listener in self.json_event_handlers:
             if hasattr(event_source, "output_event_handlers") and event_source.output_event_handlers is not None \
                     and listener not in event_source.output_event_handlers:
-                event_source = copy.copy(event_source)
-                event_source.output_event_handlers.append(listener)
+                missing_event_handlers.append(listener)
+        if missing_event_handlers:
+            # Copy the event source only once for all listeners.
+            event_source = copy.copy(event_source)
+            event_source.output_event_handlers = event_source.output_event_handlers + missing_event_handlers
+
+        for listener in self.json_event_handlers:
+            if self.batch_size > 1 and getattr(listener, "supports_batches", False):
+                if json_line is None:
+                    json_line = encode_json_line(event_data)
+                self.add_to_batch(listener, json_line, event_type, log_atom, event_source)
+                continue
+            if json_data is None:
+                if self.pretty_print:
+                    json_data = json.dumps(event_data, indent=2)
+                else:
+                    json_data = json.dumps(event_data)
+                res = [''] * len(sorted_loglines)
+                res[0] = json_data
             listener.receive_event(event_type, None, res, json_data, log_atom, event_source)
+        if self.batch_start_time is not None and time.time() - self.batch_start_time >= self.batch_timeout:
+            self.flush_batches()
+
+    def add_to_batch(self, listener, json_line, event_type, log_atom, event_source):
+        """
+        Add a JSON line to the batch of the listener and send the batch if it is full.
+        @param listener the event handler supporting batches.
+        @param json_line the compact JSON serialized event.
+        @param event_type the event type, which is passed with the batch if json_line is the last line in the batch.
+        @param log_atom the log atom, which is passed with the batch if json_line is the last line in the batch.
+        @param event_source the event source, which is passed with the batch if json_line is the last line in the batch.
+        """
+        with self.batch_lock:
+            batch = self.batches.get(listener)
+            if batch is None:
+                batch = [[], None]
+                self.batches[listener] = batch
+            if self.batch_start_time is None:
+                self.batch_start_time = time.time()
+            batch[0].append(json_line)
+            batch[1] = (event_type, log_atom, event_source)
+            if len(batch[0]) < self.batch_size:
+                return
+            json_lines = batch[0]
+            batch[0] = []
+        self.send_batch(listener, json_lines, event_type, log_atom, event_source)
+
+    def send_batch(self, listener, json_lines, event_type, log_atom, event_source):
+        """Send the newline-delimited JSON lines to the listener."""
+        json_data = "\n".join(json_lines)
+        listener.receive_event(event_type, None, [json_data], json_data, log_atom, event_source)
+
+    def flush_batches(self, current_time=None):
+        """
+        Send all batched events.
+        @param current_time if not None, the batches are only sent when the oldest batched event waited at least batch_timeout seconds.
+        """
+        with self.batch_lock:
+            if self.batch_start_time is None or (current_time is not None and current_time - self.batch_start_time < self.batch_timeout):
+                return
+            self.batch_start_time = None
+            pending_batches = []
+            for listener, batch in self.batches.items():
+                if batch[0]:
+                    pending_batches.append((listener, batch[0], *batch[1]))
+                    batch[0] = []
+        for pending_batch in pending_batches:
+            self.send_batch(*pending_batch)
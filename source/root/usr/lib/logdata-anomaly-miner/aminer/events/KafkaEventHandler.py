@@ -21,6 +21,8 @@ from aminer.events.EventInterfaces import EventHandlerInterface
 class KafkaEventHandler(EventHandlerInterface):
     """This class implements an event record listener, that will forward Json-objects to a Kafka queue."""
 
+    supports_batches = True
+
     def __init__(self, analysis_context, topic, options):
         """
         Initialize the event handler.
@@ -22,6 +22,8 @@ import zmq
 class ZmqEventHandler(EventHandlerInterface):
     """This class implements an event record listener, that will forward Json-objects to a ZeroMQ queue."""
 
+    supports_batches = True
+
     def __init__(self, analysis_context, topic=None, url="ipc:///tmp/aminer"):
         """
         Initialize the event handler.
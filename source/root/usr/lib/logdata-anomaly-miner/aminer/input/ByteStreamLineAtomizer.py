@@ -15,25 +15,26 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 import logging
 import sys
 import time
+from collections import deque
 from aminer.AminerConfig import DEBUG_LOG_NAME
 from aminer.input.LogAtom import LogAtom
 from aminer.input.InputInterfaces import StreamAtomizer
-from aminer.input.JsonStateMachine import json_machine
+from aminer.input.JsonObjectScanner import JsonObjectScanner, SCAN_COMPLETE, SCAN_INCOMPLETE, SCAN_OVERLONG
 from aminer.parsing.MatchContext import MatchContext
 from aminer.parsing.ParserMatch import ParserMatch
 
 
-breakout = False
-data = None
 line = None
 
 
-def found_json(_data):
-    """Set the breakout variable if the JsonStateMachine finished."""
-    global breakout  # skipcq: PYL-W0603
-    breakout = True
-    global data  # skipcq: PYL-W0603
-    data = _data
+def copy_stream_data(stream_data, start, end=None):
+    """
+    Copy a slice of the stream data to a bytes object.
+    Slicing the bytearray buffer directly would create an intermediate bytearray copy. The memoryview is released immediately, as the
+    buffer can not be resized by the LogStream while it is still exported.
+    """
+    with memoryview(stream_data)[start:end] as data_view:
+        return bytes(data_view)
 
 
 class ByteStreamLineAtomizer(StreamAtomizer):
@@ -47,12 +48,17 @@ class ByteStreamLineAtomizer(StreamAtomizer):
     COUNTER = 0
 
     def __init__(self, parsing_model, atom_handler_list, event_handler_list, max_line_length, default_timestamp_path_list, eol_sep=b'\n',
-                 json_format=False, xml_format=False, use_real_time=False, resource_name=None, continuous_timestamp_missing_warning=True):
+                 json_format=False, xml_format=False, use_real_time=False, resource_name=None, continuous_timestamp_missing_warning=True,
+                 parser_process_pool=None, compile_parsing_model=False):
         """
         Create the atomizer.
         @param event_handler_list when not None, send events to those handlers. The list might be empty at invocation and populated
         later on.
         @param max_line_length the maximal line length including the final line separator.
+        @param parser_process_pool when not None, complete lines are parsed in batches by the worker processes of this ParserProcessPool.
+        The parsed atoms are still dispatched in the original order. This is not supported with json_format or xml_format.
+        @param compile_parsing_model if True, the match function of the parsing model is built once with build_match_function and used
+        for parsing instead of calling get_match_element on the model tree.
         """
         self.parsing_model = parsing_model
         self.atom_handler_list = atom_handler_list
@@ -66,6 +72,8 @@ class ByteStreamLineAtomizer(StreamAtomizer):
             sys.exit(-1)
         self.eol_sep = eol_sep
         self.json_format = json_format
+        # The scanner keeps the state of incomplete JSON objects, so they are not scanned again with the next consume_data call.
+        self.json_object_scanner = JsonObjectScanner()
         self.xml_format = xml_format
         if json_format is True and xml_format is True:
             msg = "json_format and xml_format can not be true at the same time."
@@ -75,6 +83,17 @@ class ByteStreamLineAtomizer(StreamAtomizer):
         self.use_real_time = use_real_time
         self.printed_warning = False
         self.continuous_timestamp_missing_warning = continuous_timestamp_missing_warning
+        self.match_function = None
+        if compile_parsing_model and parsing_model is not None:
+            self.match_function = parsing_model.build_match_function('')
+
+        self.parser_process_pool = parser_process_pool
+        self.parsing_model_index = None
+        if parser_process_pool is not None and parsing_model is not None and not json_format and not xml_format:
+            self.parsing_model_index = parser_process_pool.register_parsing_model(parsing_model)
+        # Log atoms already parsed in the parser_process_pool. Each entry is a tuple of the start offset of the line in the current
+        # stream_data and the log atom. The offsets are only valid during one consume_data call.
+        self.parsed_log_atoms = deque()
 
         self.in_overlong_line_flag = False
         # If consuming of data was already attempted but the downstream handlers refused to handle it, keep the data and the parsed
@@ -93,7 +112,7 @@ class ByteStreamLineAtomizer(StreamAtomizer):
         if self.xml_format:
             if len(stream_data) == 0:
                 return -1
-            log_atom = self.parse_log_atom(stream_data)
+            log_atom = self.parse_log_atom(bytes(stream_data))
             if self.dispatch_atom(log_atom):
                 return len(stream_data)
         while True:
@@ -109,25 +128,18 @@ class ByteStreamLineAtomizer(StreamAtomizer):
                 break
 
             line_end = None
-            global breakout  # skipcq: PYL-W0603
-            breakout = False
-            global data  # skipcq: PYL-W0603
-            data = None
             valid_json = False
             if self.json_format:
-                state = json_machine(found_json)
-                i = 0
-                for i, char in enumerate(stream_data[consumed_length:]):
-                    state = state(char)
-                    if breakout or state is None or i > self.max_line_length:
-                        break
+                scan_result, json_end = self.json_object_scanner.scan(stream_data, consumed_length, self.max_line_length)
                 # check if the json is still valid, but the stream_data is at the end
-                if not breakout and state is not None and i + consumed_length == len(stream_data) - 1 and not end_of_stream_flag:
-                    return consumed_length
-                if 0 < i <= self.max_line_length and b'{' in stream_data[consumed_length:consumed_length+i+1] and data is not None:
-                    line_end = consumed_length + i + 1
+                if scan_result == SCAN_INCOMPLETE:
+                    if not end_of_stream_flag:
+                        return consumed_length
+                    self.json_object_scanner.reset()
+                elif scan_result == SCAN_COMPLETE:
+                    line_end = json_end
                     valid_json = True
-                elif i > self.max_line_length:
+                elif scan_result == SCAN_OVERLONG:
                     self.in_overlong_line_flag = True
             if line_end is None:
                 line_end = stream_data.find(self.eol_sep, consumed_length)
@@ -136,7 +148,7 @@ class ByteStreamLineAtomizer(StreamAtomizer):
                 if line_end < 0:
                     consumed_length = len(stream_data)
                     if end_of_stream_flag:
-                        self.dispatch_event('Overlong line terminated by end of stream', stream_data)
+                        self.dispatch_event('Overlong line terminated by end of stream', bytes(stream_data))
                         self.in_overlong_line_flag = False
                     break
                 consumed_length = line_end + len(self.eol_sep)
@@ -147,49 +159,92 @@ class ByteStreamLineAtomizer(StreamAtomizer):
             if line_end < 0:
                 tail_length = len(stream_data) - consumed_length
                 if tail_length > self.max_line_length:
-                    self.dispatch_event('Start of overlong line detected', stream_data[consumed_length:])
+                    self.dispatch_event('Start of overlong line detected', copy_stream_data(stream_data, consumed_length))
                     self.in_overlong_line_flag = True
                     consumed_length = len(stream_data)
                     # Stay in loop to handle also endOfStreamFlag!
                     continue
                 if end_of_stream_flag and (tail_length != 0):
-                    self.dispatch_event('Incomplete last line', stream_data[consumed_length:])
+                    self.dispatch_event('Incomplete last line', copy_stream_data(stream_data, consumed_length))
                     consumed_length = len(stream_data)
                 break
 
             # This is at least a complete/overlong line.
             line_length = line_end + len(self.eol_sep) - consumed_length
             if line_length > self.max_line_length and not valid_json:
-                self.dispatch_event('Overlong line detected', stream_data[consumed_length:line_end])
+                self.dispatch_event('Overlong line detected', copy_stream_data(stream_data, consumed_length, line_end))
                 consumed_length = line_end + len(self.eol_sep)
                 continue
 
             # This is a normal line.
-            line_data = stream_data[consumed_length:line_end]
-            log_atom = self.parse_log_atom(line_data)
+            if self.parsing_model_index is not None:
+                log_atom = self.parse_log_atom_batch(stream_data, consumed_length, line_end)
+            else:
+                line_data = copy_stream_data(stream_data, consumed_length, line_end)
+                log_atom = self.parse_log_atom(line_data)
             if self.dispatch_atom(log_atom):
                 consumed_length = line_end + len(self.eol_sep) - (
-                        valid_json and stream_data[line_end:line_end+len(self.eol_sep)] != self.eol_sep)
+                        valid_json and not stream_data.startswith(self.eol_sep, line_end))
                 continue
             if consumed_length == 0:
                 # Downstream did not want the data, so tell upstream to block for a while.
                 consumed_length = -1
             break
+        # Atoms parsed ahead but not dispatched are parsed again with the next call, as the stream_data offsets will change.
+        self.parsed_log_atoms.clear()
         return consumed_length
 
     def parse_log_atom(self, parse_data):
         """Parse a log atom."""
-        log_atom = LogAtom(parse_data, None, None, self)
+        match_element = None
         if self.parsing_model is not None:
             match_context = MatchContext(parse_data)
-            match_element = self.parsing_model.get_match_element('', match_context)
-            if (match_element is not None) and not match_context.match_data:
-                log_atom.parser_match = ParserMatch(match_element)
-                for default_timestamp_path in self.default_timestamp_path_list:
-                    ts_match = log_atom.parser_match.get_match_dictionary().get(default_timestamp_path, None)
-                    if ts_match is not None:
-                        log_atom.set_timestamp(ts_match.match_object)
-                        break
+            if self.match_function is not None:
+                match_element = self.match_function(match_context)
+            else:
+                match_element = self.parsing_model.get_match_element('', match_context)
+            if match_context.offset < len(match_context.data):
+                match_element = None
+        return self.create_log_atom(parse_data, match_element)
+
+    def parse_log_atom_batch(self, stream_data, start_pos, line_end):
+        """
+        Get the log atom for the complete line starting at start_pos and ending at line_end.
+        When the line was not already parsed, all following complete lines up to the batch size of the parser_process_pool are parsed
+        together in the worker processes. Overlong lines end the batch, as they are handled by consume_data.
+        """
+        while self.parsed_log_atoms:
+            pos, log_atom = self.parsed_log_atoms.popleft()
+            if pos == start_pos:
+                return log_atom
+        positions = []
+        lines = []
+        pos = start_pos
+        while line_end >= 0 and len(lines) < self.parser_process_pool.batch_size:
+            if line_end + len(self.eol_sep) - pos > self.max_line_length:
+                break
+            positions.append(pos)
+            lines.append(copy_stream_data(stream_data, pos, line_end))
+            pos = line_end + len(self.eol_sep)
+            line_end = stream_data.find(self.eol_sep, pos)
+        if len(lines) == 1:
+            # Sending a single line to the worker processes is slower than parsing it directly.
+            return self.parse_log_atom(lines[0])
+        match_elements = self.parser_process_pool.parse_lines(self.parsing_model_index, lines)
+        for pos, line_data, match_element in zip(positions, lines, match_elements):
+            self.parsed_log_atoms.append((pos, self.create_log_atom(line_data, match_element)))
+        return self.parsed_log_atoms.popleft()[1]
+
+    def create_log_atom(self, parse_data, match_element):
+        """Create the log atom for the parse_data and the root MatchElement or None if the parsing model did not match."""
+        log_atom = LogAtom(parse_data, None, None, self)
+        if match_element is not None:
+            log_atom.parser_match = ParserMatch(match_element)
+            for default_timestamp_path in self.default_timestamp_path_list:
+                ts_match = log_atom.parser_match.get_match_dictionary().get(default_timestamp_path, None)
+                if ts_match is not None:
+                    log_atom.set_timestamp(ts_match.match_object)
+                    break
         if log_atom.atom_time is None:
             if self.use_real_time:
                 log_atom.atom_time = time.time()
@@ -36,6 +36,15 @@ class AtomizerFactory(metaclass=abc.ABCMeta):
         @return a StreamAtomizer object
         """
 
+    def start(self):
+        """
+        Start the resources shared by the atomizers of this factory. This is called once before the analysis starts any other threads.
+        Override this method when the factory holds such resources.
+        """
+
+    def close(self):
+        """Release all resources shared by the atomizers of this factory. Override this method when the factory holds such resources."""
+
 
 class StreamAtomizer(metaclass=abc.ABCMeta):
     """
@@ -50,7 +59,8 @@ class StreamAtomizer(metaclass=abc.ABCMeta):
         """
         Consume data from the underlying stream for atomizing. Data should only be consumed after splitting of an atom.
         The caller has to keep unconsumed data till the next invocation.
-        @param stream_data the data offered to be consumed or zero length data when endOfStreamFlag is True (see below).
+        @param stream_data the data offered to be consumed or zero length data when endOfStreamFlag is True (see below). The data might be
+        the bytearray buffer of the LogDataResource, which is modified after consuming, so data kept by the atomizer has to be copied.
         @param end_of_stream_flag this flag is used to indicate, that the streamData offered is the last from the input stream.
         If the streamData does not form a complete atom, no rollover is expected or rollover would have honoured the atom boundaries,
         then the StreamAtomizer should treat that as an error. With rollover, consuming of the stream end data will signal the
@@ -101,7 +111,7 @@ class AtomHandlerInterface(metaclass=abc.ABCMeta):
             "num_stat_stop_update", "num_updates_until_var_reduction", "var_reduction_thres", "num_skipped_ind_for_weights",
             "num_ind_for_weights", "used_multinomial_test", "use_empiric_distr", "used_range_test", "range_alpha", "range_threshold",
             "num_reinit_range", "range_limits_factor", "dw_alpha", "save_statistics", "idf", "norm", "add_normal", "check_empty_windows",
-            "unique_path_list", "default_freqs", "var_factor", "avg_factor", "log_resource_ignore_list"
+            "unique_path_list", "default_freqs", "var_factor", "avg_factor", "log_resource_ignore_list", "bucket_size"
         ]
         self.log_success = 0
         self.log_total = 0
@@ -196,7 +206,7 @@ class AtomHandlerInterface(metaclass=abc.ABCMeta):
             "time_period_length", "max_time_diff", "num_reduce_time_list", "min_anomaly_score", "num_update", "new_vals_alarm_thres",
             "num_bt", "num_update_unq", "num_s_gof_values", "num_s_gof_bt", "num_d_bt", "num_pause_discrete", "num_var_type_hist_ref",
             "num_update_var_type_hist_ref", "num_var_type_considered_ind", "num_stat_stop_update", "num_updates_until_var_reduction",
-            "num_skipped_ind_for_weights", "num_ind_for_weights", "num_reinit_range", "range_limits_factor", "dw_alpha"]
+            "num_skipped_ind_for_weights", "num_ind_for_weights", "num_reinit_range", "range_limits_factor", "dw_alpha", "bucket_size"]
         zero_to_one = [
             "generation_probability", "generation_factor", "p0", "alpha", "confidence_factor", "prob_thresh", "anomaly_threshold",
             "alpha", "alpha_bt", "acf_pause_interval_percentage", "acf_threshold", "round_time_interval_threshold", "min_variance",
@@ -205,7 +215,7 @@ class AtomHandlerInterface(metaclass=abc.ABCMeta):
             "match_disc_distr_threshold", "validate_cor_cover_vals_thres", "validate_cor_distinct_thres", "gof_alpha", "s_gof_alpha",
             "s_gof_bt_alpha", "d_alpha", "d_bt_alpha", "div_thres", "sim_thres", "indicator_thres", "var_reduction_thres", "range_alpha",
             "range_threshold", "dw_alpha"]
-        nullable = ["stop_learning_time", "stop_learning_no_anomaly_time", "set_lower_limit", "set_upper_limit", "timeout"]
+        nullable = ["stop_learning_time", "stop_learning_no_anomaly_time", "set_lower_limit", "set_upper_limit", "timeout", "bucket_size"]
         for attr in set([] + integer_only + non_negative + non_zero_or_negative + zero_to_one):
             if hasattr(self, attr):
                 attr_val = self.__getattribute__(attr)
@@ -0,0 +1,128 @@
+"""
+This module defines a scanner for finding the end of JSON objects in a stream of bytes.
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import re
+
+# Outside of strings only quotes, brackets and commas change the state of the scanner, inside of strings only quotes and backslashes.
+STRUCTURE_REGEX = re.compile(rb'[{}\[\]",]')
+STRING_REGEX = re.compile(rb'["\\]')
+NON_WHITESPACE_REGEX = re.compile(rb'[^\t\n\r ]')
+
+SCAN_COMPLETE = 0
+SCAN_INCOMPLETE = 1
+SCAN_INVALID = 2
+SCAN_OVERLONG = 3
+
+
+class JsonObjectScanner:
+    """
+    This class finds the end of JSON objects in a stream of bytes by tracking the brackets and strings. The data is searched for the
+    characters changing the state with regular expressions instead of handling every byte on its own. When the data ends before the
+    object, the state is kept, so the data is not scanned again when the scan is continued with more data. Objects have to start with "{"
+    after optional whitespace, brackets have to match and every key has to start with a quote, but the values are not validated.
+    """
+
+    def __init__(self):
+        """Initialize the scanner."""
+        # The offset relative to the start of the object up to which the object was already scanned.
+        self.offset = 0
+        self.in_string = False
+        # The closing brackets of all objects and arrays which were opened, but not closed yet.
+        self.closing_brackets = bytearray()
+
+    def reset(self):
+        """Discard the state of the current object, so the next scan starts with a new object."""
+        self.offset = 0
+        self.in_string = False
+        self.closing_brackets = bytearray()
+
+    def scan(self, data, start, max_length):
+        """
+        Scan the data for the end of the object starting at the start position. Whitespace before the object is part of it.
+        @param data the bytes or bytearray containing the object.
+        @param start the position of the object in the data. If the scan of the object was not completed with the previous call, the data
+               has to contain the same object at this position and only the part after the previously scanned data is scanned.
+        @param max_length the object is overlong when its last bracket is not within the max_length + 1 bytes after the start position.
+        @return a tuple of the result (SCAN_COMPLETE, SCAN_INCOMPLETE, SCAN_INVALID or SCAN_OVERLONG) and the position after the object
+                if it is complete.
+        """
+        end = start + max_length + 1
+        limit = min(end, len(data))
+        position = start + self.offset
+        if position > len(data):
+            # The data does not contain the previously scanned object anymore.
+            self.reset()
+            position = start
+        in_string = self.in_string
+        closing_brackets = self.closing_brackets
+        while True:
+            if in_string:
+                match = STRING_REGEX.search(data, position, limit)
+                if match is None:
+                    position = limit
+                    break
+                index = match.start()
+                if data[index] == 0x5c:  # \
+                    if index + 1 == limit:
+                        position = index
+                        break
+                    position = index + 2
+                    continue
+                in_string = False
+                position = index + 1
+                continue
+
+            if closing_brackets:
+                match = STRUCTURE_REGEX.search(data, position, limit)
+            else:
+                match = NON_WHITESPACE_REGEX.search(data, position, limit)
+            if match is None:
+                position = limit
+                break
+            index = match.start()
+            char = data[index]
+            if not closing_brackets and char != 0x7b:  # {
+                self.reset()
+                return SCAN_INVALID, None
+            if char == 0x22:  # "
+                in_string = True
+            elif char in (0x7d, 0x5d):  # } ]
+                if closing_brackets.pop() != char:
+                    self.reset()
+                    return SCAN_INVALID, None
+                if not closing_brackets:
+                    self.reset()
+                    return SCAN_COMPLETE, index + 1
+            elif char == 0x5b:  # [
+                closing_brackets.append(0x5d)
+            elif char == 0x7b or closing_brackets[-1] == 0x7d:  # { or , in an object
+                # A key or the end of an empty object has to follow.
+                key_match = NON_WHITESPACE_REGEX.search(data, index + 1, limit)
+                if key_match is None:
+                    # Scan the bracket or comma again when more data is available.
+                    position = index
+                    break
+                if data[key_match.start()] != 0x22 and (char != 0x7b or data[key_match.start()] != 0x7d):
+                    self.reset()
+                    return SCAN_INVALID, None
+                if char == 0x7b:
+                    closing_brackets.append(0x7d)
+            position = index + 1
+
+        if len(data) > end:
+            self.reset()
+            return SCAN_OVERLONG, None
+        self.offset = position - start
+        self.in_string = in_string
+        return SCAN_INCOMPLETE, None
@@ -15,6 +15,7 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 import base64
 import errno
 import hashlib
+import mmap
 import os
 import socket
 import stat
@@ -33,6 +34,9 @@ class FileLogDataResource(LogDataResource):
     The characteristics of this type of resource is, that reopening and repositioning of the stream has to be possible.
     """
 
+    # The number of bytes copied from a memory mapped file into the buffer by one fill_buffer() call.
+    mapped_block_size = 1 << 22
+
     def __init__(self, log_resource_name, log_stream_fd, default_buffer_size=1 << 16, repositioning_data=None):
         """
         Create a new file type resource.
@@ -49,9 +53,16 @@ class FileLogDataResource(LogDataResource):
         self.stat_data = None
         if self.log_file_fd >= 0:
             self.stat_data = os.fstat(log_stream_fd)
-        self.buffer = b''
+        # The consumed data is deleted from the front of the bytearray, which only advances its start and does not copy the remaining data.
+        # The atomizer gets the buffer itself, so only complete lines are copied when they are parsed.
+        self.buffer = bytearray()
+        # New data is read into this block, which is reused for all reads.
+        self.read_block = memoryview(bytearray(default_buffer_size))
         self.default_buffer_size = default_buffer_size
         self.total_consumed_length = 0
+        # The memory mapping of the file and the position up to which the mapped data was already copied to the buffer, see map_file().
+        self.mapped_data = None
+        self.mapped_position = 0
         # Create a hash for repositioning. There is no need to be cryptographically secure here: if upstream can manipulate the content,
         # to provoke hash collisions, correct positioning would not matter anyway.
         # skipcq: PTC-W1003, BAN-B324
@@ -154,15 +165,50 @@ class FileLogDataResource(LogDataResource):
         Fill the buffer data of this resource. The repositioning information is not updated, update_position() has to be used.
         @return the number of bytes read or -1 on error or end.
         """
-        data = os.read(self.log_file_fd, self.default_buffer_size)
-        self.buffer += data
-        return len(data)
+        if self.mapped_data is not None:
+            if self.mapped_position < len(self.mapped_data):
+                length = min(self.mapped_block_size, len(self.mapped_data) - self.mapped_position)
+                with memoryview(self.mapped_data) as mapped_view:
+                    self.buffer += mapped_view[self.mapped_position:self.mapped_position + length]
+                self.mapped_position += length
+                return length
+            # All mapped data was copied, continue reading data appended after the file was mapped.
+            self.unmap_file()
+        length = os.readv(self.log_file_fd, [self.read_block])
+        self.buffer += self.read_block[:length]
+        return length
+
+    def map_file(self):
+        """
+        Map the file into memory, so that fill_buffer() copies large blocks directly from the mapping instead of reading them. This is used
+        to replay complete files in offline mode. The file must not be truncated while it is mapped.
+        @return True if the file was mapped or False if it is no regular file or there is no data left to be read.
+        """
+        if self.mapped_data is not None:
+            return True
+        stat_data = os.fstat(self.log_file_fd)
+        read_position = os.lseek(self.log_file_fd, 0, os.SEEK_CUR)
+        if not stat.S_ISREG(stat_data.st_mode) or stat_data.st_size <= read_position:
+            return False
+        self.mapped_data = mmap.mmap(self.log_file_fd, stat_data.st_size, access=mmap.ACCESS_READ)
+        self.mapped_position = read_position
+        return True
+
+    def unmap_file(self):
+        """Remove the memory mapping and move the file position behind the data already copied to the buffer."""
+        if self.mapped_data is None:
+            return
+        os.lseek(self.log_file_fd, self.mapped_position, os.SEEK_SET)
+        self.mapped_data.close()
+        self.mapped_data = None
 
     def update_position(self, length):
         """Update the positioning information and discard the buffer data afterwards."""
-        self.repositioning_digest.update(self.buffer[:length])
+        # The view has to be released before the buffer can be resized.
+        with memoryview(self.buffer) as buffer_view:
+            self.repositioning_digest.update(buffer_view[:length])
         self.total_consumed_length += length
-        self.buffer = self.buffer[length:]
+        del self.buffer[:length]
 
     def get_repositioning_data(self):
         """Get the data for repositioning the stream. The returned structure has to be JSON serializable."""
@@ -170,6 +216,7 @@ class FileLogDataResource(LogDataResource):
 
     def close(self):
         """Close the log file."""
+        self.unmap_file()
         os.close(self.log_file_fd)
         self.log_file_fd = -1
 
@@ -194,7 +241,9 @@ class UnixSocketLogDataResource(LogDataResource):
             raise Exception(msg)
         self.log_resource_name = log_resource_name
         self.log_stream_fd = log_stream_fd
-        self.buffer = b''
+        # The buffer is handled the same way as in the FileLogDataResource.
+        self.buffer = bytearray()
+        self.read_block = memoryview(bytearray(default_buffer_size))
         self.default_buffer_size = default_buffer_size
         self.total_consumed_length = 0
 
@@ -243,14 +292,14 @@ class UnixSocketLogDataResource(LogDataResource):
         Fill the buffer data of this resource. The repositioning information is not updated, update_position() has to be used.
         @return the number of bytes read or -1 on error or end.
         """
-        data = os.read(self.log_stream_fd, self.default_buffer_size)
-        self.buffer += data
-        return len(data)
+        length = os.readv(self.log_stream_fd, [self.read_block])
+        self.buffer += self.read_block[:length]
+        return length
 
     def update_position(self, length):
         """Update the positioning information and discard the buffer data afterwards."""
         self.total_consumed_length += length
-        self.buffer = self.buffer[length:]
+        del self.buffer[:length]
 
     # skipcq: PYL-R0201
     def get_repositioning_data(self):
@@ -0,0 +1,175 @@
+"""
+This module provides a pool of worker processes to parse log lines in parallel.
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import concurrent.futures
+import functools
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+from aminer.AminerConfig import DEBUG_LOG_NAME
+from aminer.parsing.MatchContext import MatchContext
+
+# The match functions of the parsing models known in a worker process. The models are inherited from the parent process when the
+# worker is forked.
+worker_match_functions = None
+
+
+def build_match_functions(parsing_models, compile_parsing_model):
+    """Build the match functions of the parsing models."""
+    if compile_parsing_model:
+        return [parsing_model.build_match_function('') for parsing_model in parsing_models]
+    return [functools.partial(parsing_model.get_match_element, '') for parsing_model in parsing_models]
+
+
+def init_worker(parsing_models, compile_parsing_model):
+    """Build the match functions in the worker process and leave the signal handling to the parent process."""
+    global worker_match_functions  # skipcq: PYL-W0603
+    worker_match_functions = build_match_functions(parsing_models, compile_parsing_model)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def parse_lines(model_index, lines):
+    """
+    Parse a batch of lines with the parsing model at model_index in a worker process.
+    @return a list with the root MatchElement for each line or None, when the model did not match the complete line.
+    """
+    return match_lines(worker_match_functions[model_index], lines)
+
+
+def match_lines(match_function, lines):
+    """
+    Parse a batch of lines with the match_function.
+    @return a list with the root MatchElement for each line or None, when the model did not match the complete line.
+    """
+    result = []
+    for line_data in lines:
+        match_context = MatchContext(line_data)
+        match_element = match_function(match_context)
+        if match_element is not None and match_context.offset < len(match_context.data):
+            match_element = None
+        result.append(match_element)
+    return result
+
+
+class ParserProcessPool:
+    """
+    This class distributes the parsing of line batches over a pool of forked worker processes.
+    The parsing models have to be registered before the workers are started, as the workers receive them when they are forked. The
+    workers should be started with start() before any other thread is running, as a forked process only inherits the calling thread and
+    locks held by other threads would never be released in the worker. The results are returned in the original order of the lines.
+    Parsing model elements keeping state between lines, e.g. the year detection in DateTimeModelElement, track that state separately in
+    each worker process. When a worker process dies, e.g. killed by the OOM killer, the remaining lines are parsed in the calling process,
+    as forking new workers is not safe anymore.
+    """
+
+    def __init__(self, process_count, batch_size=1000, compile_parsing_model=False):
+        """
+        Create the pool. The worker processes are started with start() or the first parsing request.
+        @param process_count the number of worker processes used for parsing.
+        @param batch_size the maximum number of lines parsed in one batch.
+        @param compile_parsing_model if True, the workers parse with the match functions built by build_match_function.
+        """
+        if not isinstance(process_count, int) or isinstance(process_count, bool):
+            msg = "process_count has to be of the type integer."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        if process_count < 1:
+            msg = "process_count must be at least 1."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool):
+            msg = "batch_size has to be of the type integer."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        if batch_size < 1:
+            msg = "batch_size must be at least 1."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        self.process_count = process_count
+        self.batch_size = batch_size
+        self.compile_parsing_model = compile_parsing_model
+        self.parsing_models = []
+        self.executor = None
+        # The match functions used in the calling process after a worker process died.
+        self.local_match_functions = None
+
+    def register_parsing_model(self, parsing_model):
+        """
+        Register a parsing model to be used in the worker processes.
+        @return the index of the model, which has to be used when parsing lines or None when the workers are already running.
+        """
+        for index, model in enumerate(self.parsing_models):
+            if model is parsing_model:
+                return index
+        if self.executor is not None or self.local_match_functions is not None:
+            msg = f"The parser process pool is already running, parsing model {parsing_model.__class__.__name__} can not be " \
+                  f"registered anymore."
+            logging.getLogger(DEBUG_LOG_NAME).warning(msg)
+            return None
+        self.parsing_models.append(parsing_model)
+        return len(self.parsing_models) - 1
+
+    def start(self):
+        """Fork all worker processes, if they are not running yet."""
+        if self.executor is not None or self.local_match_functions is not None:
+            return
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            self.process_count, mp_context=multiprocessing.get_context('fork'), initializer=init_worker,
+            initargs=(self.parsing_models, self.compile_parsing_model))
+        # The executor forks the worker processes when tasks are submitted, so submit one task per worker to fork all of them now.
+        try:
+            for future in [self.executor.submit(os.getpid) for _ in range(self.process_count)]:
+                future.result()
+        except concurrent.futures.process.BrokenProcessPool as e:
+            self.handle_broken_pool(e)
+            return
+        logging.getLogger(DEBUG_LOG_NAME).info("Started %d parser worker processes.", self.process_count)
+
+    def parse_lines(self, model_index, lines):
+        """
+        Parse the lines with the registered parsing model in the worker processes.
+        @return a list with the root MatchElement for each line or None, when the model did not match the complete line.
+        """
+        self.start()
+        if self.executor is not None:
+            # Give every worker a few chunks to balance different line lengths.
+            chunk_size = max(1, len(lines) // (self.process_count * 4))
+            chunks = [lines[i:i + chunk_size] for i in range(0, len(lines), chunk_size)]
+            result = []
+            try:
+                for chunk_result in self.executor.map(parse_lines, [model_index] * len(chunks), chunks):
+                    result += chunk_result
+                return result
+            except concurrent.futures.process.BrokenProcessPool as e:
+                self.handle_broken_pool(e)
+        return match_lines(self.local_match_functions[model_index], lines)
+
+    def handle_broken_pool(self, error):
+        """Stop the remaining worker processes after a worker died and parse all further lines in the calling process."""
+        msg = f"A parser worker process terminated abruptly, parsing all lines in the analysis process from now on: {error}"
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        print("ERROR: " + msg, file=sys.stderr)
+        self.executor.shutdown(wait=True)
+        self.executor = None
+        self.local_match_functions = build_match_functions(self.parsing_models, self.compile_parsing_model)
+
+    def close(self):
+        """Stop all worker processes."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
@@ -15,6 +15,7 @@ import logging
 from aminer.AminerConfig import DEBUG_LOG_NAME
 from aminer.input.InputInterfaces import AtomizerFactory
 from aminer.input.ByteStreamLineAtomizer import ByteStreamLineAtomizer
+from aminer.input.ParserProcessPool import ParserProcessPool
 
 
 class SimpleByteStreamLineAtomizerFactory(AtomizerFactory):
@@ -25,11 +26,16 @@ class SimpleByteStreamLineAtomizerFactory(AtomizerFactory):
 
     def __init__(self, parsing_model, atom_handler_list, event_handler_list, default_timestamp_path_list=None, eol_sep=b'\n',
                  json_format=False, xml_format=False, parser_model_dict=None, log_resources=None, use_real_time=False,
-                 continuous_timestamp_missing_warning=True):
+                 continuous_timestamp_missing_warning=True, parser_process_count=0, parser_batch_size=1000, compile_parsing_model=False):
         """
         Create the factory to forward data and events to the given lists for each newly created atomizer.
         @param default_timestamp_path_list if not empty list, the value of this timestamp field is extracted from parsed atoms and stored
         as default timestamp for that atom.
+        @param parser_process_count if bigger than 0, lines are parsed in batches by this number of worker processes, which are shared by
+        all atomizers created by this factory.
+        @param parser_batch_size the maximum number of lines parsed in one batch by the worker processes.
+        @param compile_parsing_model if True, the atomizers parse with the match functions built once by build_match_function of the
+        parsing models instead of calling get_match_element of the model tree for each line.
         """
         self.parsing_model = parsing_model
         self.atom_handler_list = atom_handler_list
@@ -49,6 +55,16 @@ class SimpleByteStreamLineAtomizerFactory(AtomizerFactory):
         self.log_resources = log_resources
         self.use_real_time = use_real_time
         self.continuous_timestamp_missing_warning = continuous_timestamp_missing_warning
+        self.compile_parsing_model = compile_parsing_model
+        self.parser_process_pool = None
+        if parser_process_count > 0:
+            self.parser_process_pool = ParserProcessPool(parser_process_count, parser_batch_size, compile_parsing_model)
+            # The worker processes are forked with the first parsed batch, so all parsing models have to be registered now.
+            self.parser_process_pool.register_parsing_model(parsing_model)
+            if log_resources is not None:
+                for resource in log_resources.values():
+                    if resource["parser_id"] is not None:
+                        self.parser_process_pool.register_parsing_model(self.parser_model_dict[resource["parser_id"]])
 
     def get_atomizer_for_resource(self, resource_name):  # skipcq: PYL-W0613
         """
@@ -69,7 +85,19 @@ class SimpleByteStreamLineAtomizerFactory(AtomizerFactory):
                 parser = self.parser_model_dict[resource["parser_id"]]
             return ByteStreamLineAtomizer(
                 parser, self.atom_handler_list, self.event_handler_list, 1 << 16, self.default_timestamp_path_list, self.eol_sep, json,
-                xml, self.use_real_time, resource_name, self.continuous_timestamp_missing_warning)
+                xml, self.use_real_time, resource_name, self.continuous_timestamp_missing_warning, self.parser_process_pool,
+                self.compile_parsing_model)
         return ByteStreamLineAtomizer(
             self.parsing_model, self.atom_handler_list, self.event_handler_list, 1 << 16, self.default_timestamp_path_list, self.eol_sep,
-            self.json_format, self.xml_format, self.use_real_time, resource_name, self.continuous_timestamp_missing_warning)
+            self.json_format, self.xml_format, self.use_real_time, resource_name, self.continuous_timestamp_missing_warning,
+            self.parser_process_pool, self.compile_parsing_model)
+
+    def start(self):
+        """Fork the parser worker processes shared by the atomizers of this factory."""
+        if self.parser_process_pool is not None:
+            self.parser_process_pool.start()
+
+    def close(self):
+        """Stop the parser worker processes shared by the atomizers of this factory."""
+        if self.parser_process_pool is not None:
+            self.parser_process_pool.close()
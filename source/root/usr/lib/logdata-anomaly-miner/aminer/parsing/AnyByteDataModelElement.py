@@ -24,8 +24,8 @@ class AnyByteDataModelElement(ModelElementInterface):
         @param path to be printed in the MatchElement.
         @param match_context the match_context to be analyzed.
         """
-        match_data = match_context.match_data
-        if not match_data:
+        if match_context.offset >= len(match_context.data):
             return None
+        match_data = match_context.match_data
         match_context.update(match_data)
         return MatchElement(f"{path}/{self.element_id}", match_data, match_data, None)
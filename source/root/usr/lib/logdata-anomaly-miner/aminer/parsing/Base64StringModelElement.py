@@ -27,7 +27,7 @@ class Base64StringModelElement(ModelElementInterface):
         @param element_id an identifier for the ModelElement which is shown in the path.
         """
         super().__init__(element_id)
-        self.regex = re.compile(b"^(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?")
+        self.regex = re.compile(b"(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?")
 
     def get_match_element(self, path: str, match_context):
         """
@@ -36,12 +36,10 @@ class Base64StringModelElement(ModelElementInterface):
         @param match_context the match_context to be analyzed.
         @return a match when at least one byte being a digit was found.
         """
-        match = self.regex.match(match_context.match_data)
-        if match is None or match.span()[1] == 0:
+        match = self.regex.match(match_context.data, match_context.offset)
+        if match is None or match.end() == match_context.offset:
             return None
-        match_len = match.span()[1]
-
-        match_string = match_context.match_data[:match_len]
+        match_string = match.group()
         match_context.update(match_string)
         try:
             match_value = base64.b64decode(match_string)
@@ -14,6 +14,7 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 
 
 import sys
+import re
 import time
 import logging
 import locale
@@ -59,6 +60,8 @@ timezone_info = {
     "WITA": 8 * 3600, "WST": 14 * 3600, "WT": 0 * 3600, "X": -11 * 3600, "Y": -12 * 3600, "YAKST": 10 * 3600, "YAKT": 9 * 3600,
     "YAPT": 10 * 3600, "YEKST": 6 * 3600, "YEKT": 5 * 3600, "Z": 0 * 3600}
 
+DIGITS_REGEX = re.compile(rb"\d+")
+
 search_tz_dict = {}
 keys = list(timezone_info.keys())
 keys.sort()
@@ -73,8 +76,14 @@ class DateTimeModelElement(ModelElementInterface):
     The element is similar to the strptime function but does not use it due to the numerous problems associated with it, e.g. no leap year
     support for semiqualified years, no %s (seconds since epoch) format in Python strptime, no %f support in libc strptime, no support to
     determine the length of the parsed string.
+    Consecutive log lines usually have the same timestamp down to the second. Therefore, the seconds since the epoch are cached by the bytes
+    of the date prefix containing all fields except the fraction of seconds, when this prefix has a fixed length. On a cache hit only the
+    fraction of seconds, the timezone and the year wraparound have to be handled.
     """
 
+    # The maximum number of cached date prefixes. The cache is cleared when it is full.
+    parse_cache_size = 1000
+
     # skipcq: PYL-W0613
     def __init__(self, element_id: str, date_format: bytes, time_zone: timezone = None, text_locale: Union[str, tuple] = None,
                  start_year: int = None, max_time_jump_seconds: int = 86400, timestamp_scale: int = 1):
@@ -128,6 +137,44 @@ class DateTimeModelElement(ModelElementInterface):
         self.last_parsed_seconds = 0
         self.epoch_start_time = datetime.fromtimestamp(0, self.time_zone)
 
+        self.parse_cache: dict[bytes, tuple] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_prefix_length = None
+        self.cache_prefix_part_count = 0
+        self.init_parse_cache()
+        # Dates only consisting of the seconds since the epoch are parsed without the generic parsing logic.
+        self.epoch_seconds_format = self.date_format_parts == [(7, -1, int)] and not self.format_has_tz_specifier
+
+    def init_parse_cache(self):
+        """
+        Find the date prefix used as key of the parse cache. The prefix must only contain fixed length fields and has to contain all year,
+        month, day, hour, minute and second fields of the date format. The month and day are mandatory, as the current date would be used
+        otherwise.
+        """
+        field_positions = [part_pos for part_pos, part in enumerate(self.date_format_parts) if not isinstance(part, bytes)]
+        field_types = {self.date_format_parts[part_pos][0] for part_pos in field_positions}
+        if not {1, 2}.issubset(field_types) or 7 in field_types:
+            return
+        prefix_part_count = max(part_pos for part_pos in field_positions if self.date_format_parts[part_pos][0] <= 5) + 1
+        prefix_length = 0
+        for part in self.date_format_parts[:prefix_part_count]:
+            if isinstance(part, bytes):
+                prefix_length += len(part)
+            elif part[0] > 5 or part[1] < 0:
+                return
+            else:
+                prefix_length += part[1]
+        self.cache_prefix_length = prefix_length
+        self.cache_prefix_part_count = prefix_part_count
+
+    def get_cache_statistics(self):
+        """@return a dictionary with the number of cache hits and misses and the hit rate of the parse cache."""
+        hit_rate = 0
+        if self.cache_hits + self.cache_misses > 0:
+            hit_rate = self.cache_hits / (self.cache_hits + self.cache_misses)
+        return {"CacheHits": self.cache_hits, "CacheMisses": self.cache_misses, "HitRate": hit_rate, "CachedDates": len(self.parse_cache)}
+
     def scan_date_format(self, date_format: bytes):
         """Scan the date format."""
         if len(self.date_format_parts) > 0:
@@ -208,12 +255,40 @@ class DateTimeModelElement(ModelElementInterface):
         @return None when there is no match, MatchElement otherwise. The match_object returned is a tuple containing the datetime
                 object and the seconds since 1970.
         """
-        parse_pos = 0
+        data = match_context.data
+        start_pos = match_context.offset
+        if self.epoch_seconds_format:
+            digits_match = DIGITS_REGEX.match(data, start_pos)
+            if digits_match is None:
+                return None
+            date_str = digits_match.group()
+            total_seconds = int(date_str) / self.timestamp_scale
+            # A value of 0 is handled like a date without any fields by the generic parsing logic.
+            if total_seconds != 0:
+                match_context.update(date_str)
+                return MatchElement(f"{path}/{self.element_id}", date_str, total_seconds, None)
+        parse_pos = start_pos
+        first_part_pos = 0
+        cached_seconds = None
+        if self.cache_prefix_length is not None:
+            cache_entry = self.parse_cache.get(data[start_pos:start_pos + self.cache_prefix_length])
+            # Dates without year are only taken from the cache, if they were cached for the current start year and do not need a year
+            # wraparound. Otherwise, the date is parsed again.
+            if cache_entry is not None and cache_entry[0] == self.start_year and (
+                    self.format_has_year_flag or self.last_parsed_seconds == 0 or
+                    abs(self.last_parsed_seconds - cache_entry[1]) <= self.max_time_jump_seconds):
+                cached_seconds = cache_entry[1]
+                first_part_pos = self.cache_prefix_part_count
+                parse_pos += self.cache_prefix_length
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
         # Year, month, day, hour, minute, second, fraction, gmt-seconds:
         result: List = [0, 0, 0, 0, 0, 0, 0, 0]
-        for part_pos, date_format_part in enumerate(self.date_format_parts):
+        for part_pos in range(first_part_pos, len(self.date_format_parts)):
+            date_format_part = self.date_format_parts[part_pos]
             if isinstance(date_format_part, bytes):
-                if not match_context.match_data[parse_pos:].startswith(date_format_part):
+                if not data.startswith(date_format_part, parse_pos):
                     return None
                 parse_pos += len(date_format_part)
                 continue
@@ -224,22 +299,20 @@ class DateTimeModelElement(ModelElementInterface):
                 if (part_pos + 1) < len(self.date_format_parts):
                     next_part = self.date_format_parts[part_pos + 1]
                     if isinstance(next_part, bytes):
-                        end_pos = match_context.match_data.find(next_part, parse_pos)
+                        end_pos = data.find(next_part, parse_pos)
                         if end_pos < 0:
                             return None
                         next_length = end_pos - parse_pos
                 if next_length < 0:
                     # No separator, so get the number of decimal digits.
                     next_length = 0
-                    for digit_ord in match_context.match_data[parse_pos:]:
-                        if (digit_ord < 0x30) or (digit_ord > 0x39):
-                            break
+                    while parse_pos + next_length < len(data) and 0x30 <= data[parse_pos + next_length] <= 0x39:
                         next_length += 1
                     if next_length == 0:
                         return None
-                next_data = match_context.match_data[parse_pos:parse_pos + next_length]
+                next_data = data[parse_pos:parse_pos + next_length]
             else:
-                next_data = match_context.match_data[parse_pos:parse_pos + next_length]
+                next_data = data[parse_pos:parse_pos + next_length]
                 if len(next_data) != next_length:
                     return None
             parse_pos += next_length
@@ -260,13 +333,18 @@ class DateTimeModelElement(ModelElementInterface):
                     # Parsing failed, most likely due to wrong format.
                     return None
 
-        date_str = match_context.match_data[:parse_pos]
+        date_str = data[start_pos:parse_pos]
         result[7] /= self.timestamp_scale
 
         # Now combine the values and build the final value.
         parsed_date_time = None
         total_seconds = result[7]
-        if total_seconds != 0:  # skipcq: PTC-W0048
+        if cached_seconds is not None:
+            total_seconds = cached_seconds
+            if not self.format_has_year_flag:
+                self.last_parsed_seconds = total_seconds
+            total_seconds += result[6]
+        elif total_seconds != 0:  # skipcq: PTC-W0048
             total_seconds += result[6]
         # For epoch second formats, the datetime value usually is not important. So stay with parsed_date_time to none.
         else:
@@ -340,6 +418,12 @@ class DateTimeModelElement(ModelElementInterface):
                                 logging.getLogger(DEBUG_LOG_NAME).warning(msg)
                                 print("WARNING: " + msg, file=sys.stderr)
 
+            # Only cache the seconds if they were calculated with the start year, as cache entries are only used with this start year.
+            if self.cache_prefix_length is not None and (self.format_has_year_flag or parsed_date_time.year == self.start_year):
+                if len(self.parse_cache) >= self.parse_cache_size:
+                    self.parse_cache.clear()
+                self.parse_cache[data[start_pos:start_pos + self.cache_prefix_length]] = (self.start_year, total_seconds)
+
             # We discarded the parsed_date_time microseconds beforehand, use the full float value here instead of the rounded integer.
             if result[6] is not None:
                 total_seconds += result[6]
@@ -348,14 +432,14 @@ class DateTimeModelElement(ModelElementInterface):
             valid_tz_specifier = True
             offset_allowed = True
             tz_specifier_offset = 0.
-            if match_context.match_data[parse_pos] == ord(b" "):
+            if data[parse_pos] == ord(b" "):
                 parse_pos += 1
                 resulting_key = None
                 # only if the next character is in A-Z, a valid resulting_key can exist.
-                if match_context.match_data[parse_pos] in search_tz_dict:
+                if data[parse_pos] in search_tz_dict:
                     # search the first fitting resulting_key in the sorted tz_dict and break the loop.
-                    for key in search_tz_dict[match_context.match_data[parse_pos]]:
-                        if match_context.match_data[parse_pos:].startswith(key):
+                    for key in search_tz_dict[data[parse_pos]]:
+                        if data.startswith(key, parse_pos):
                             resulting_key = key
                             break
                     # an offset is only allowed with UTC and GMT.
@@ -366,21 +450,21 @@ class DateTimeModelElement(ModelElementInterface):
                         tz_specifier_offset = timezone_info[resulting_key.decode()]
                         parse_pos += len(resulting_key)
 
-            if match_context.match_data[parse_pos] in (ord(b"+"), ord(b"-")) and offset_allowed and valid_tz_specifier:
+            if data[parse_pos] in (ord(b"+"), ord(b"-")) and offset_allowed and valid_tz_specifier:
                 sign = -1
-                if match_context.match_data[parse_pos] == ord(b"+"):
+                if data[parse_pos] == ord(b"+"):
                     sign = 1
                 parse_pos += 1
                 cnt_digits = 0
                 colon_shift = 0
                 # parse data as long as there is more data.
-                while parse_pos < len(match_context.match_data):
+                while parse_pos < len(data):
                     # shift the position and count to the next position, if the current character is a digit.
-                    if chr(match_context.match_data[parse_pos]).isdigit():
+                    if chr(data[parse_pos]).isdigit():
                         cnt_digits += 1
                         parse_pos += 1
                     # if the current character is no digit and cnt_digits is 2, a colon is allowed.
-                    elif cnt_digits == 2 and match_context.match_data[parse_pos] == ord(b":"):
+                    elif cnt_digits == 2 and data[parse_pos] == ord(b":"):
                         parse_pos += 1
                         colon_shift = 1
                     else:
@@ -396,19 +480,19 @@ class DateTimeModelElement(ModelElementInterface):
                 else:
                     # only one hour position was found.
                     if cnt_digits == 1:
-                        tz_specifier_offset = sign * int(chr(match_context.match_data[parse_pos-1])) * 3600
+                        tz_specifier_offset = sign * int(chr(data[parse_pos-1])) * 3600
                     # two hours specifiers were found.
                     elif cnt_digits == 2:
-                        tz_specifier_offset = sign * int(match_context.match_data[parse_pos-2:parse_pos].decode()) * 3600
+                        tz_specifier_offset = sign * int(data[parse_pos-2:parse_pos].decode()) * 3600
                     # four time specifiers were found with an optional colon.
                     elif cnt_digits == 4:
-                        tz_specifier_offset = sign * int(match_context.match_data[parse_pos-4-colon_shift:parse_pos-2-colon_shift]) * \
-                                              3600 + int(match_context.match_data[parse_pos-2:parse_pos] * 60)
+                        tz_specifier_offset = sign * int(data[parse_pos-4-colon_shift:parse_pos-2-colon_shift]) * \
+                                              3600 + int(data[parse_pos-2:parse_pos] * 60)
 
-            if parse_pos < len(match_context.match_data) and match_context.match_data[parse_pos] == ord(b"Z"):
+            if parse_pos < len(data) and data[parse_pos] == ord(b"Z"):
                 parse_pos += 1
             if valid_tz_specifier:
-                date_str = match_context.match_data[:parse_pos]
+                date_str = data[start_pos:parse_pos]
                 # the offset must be subtracted, because the timestamp should always be UTC.
                 total_seconds -= tz_specifier_offset
         match_context.update(date_str)
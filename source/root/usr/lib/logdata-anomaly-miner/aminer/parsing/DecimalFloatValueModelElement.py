@@ -55,62 +55,56 @@ class DecimalFloatValueModelElement(ModelElementInterface):
         @param match_context the match_context to be analyzed.
         @return a match when at least one byte being a digit was found
         """
-        data = match_context.match_data
+        data = match_context.data
+        offset = match_context.offset
+        data_length = len(data)
 
-        if not data or (data[0] not in self.start_characters):
+        if offset >= data_length or (data[offset] not in self.start_characters):
             return None
-        match_len = 1
+        match_end = offset + 1
 
-        if self.pad_characters == b"" and data.startswith(b"0") and not data.startswith(b"0.") and len(data) > 1 and \
-                data[1] in self.digits:
+        if self.pad_characters == b"" and data.startswith(b"0", offset) and not data.startswith(b"0.", offset) and \
+                data_length > match_end and data[match_end] in self.digits:
             return None
 
-        for test_byte in data[match_len:]:
-            if test_byte not in self.pad_characters:
-                break
-            match_len += 1
-        num_start_pos = match_len
-        for test_byte in data[match_len:]:
-            if test_byte not in self.digits:
-                break
-            match_len += 1
-
-        if match_len == 1:  # skipcq: PTC-W0048
-            if data[0] not in self.digits:
+        while match_end < data_length and data[match_end] in self.pad_characters:
+            match_end += 1
+        num_start_pos = match_end
+        while match_end < data_length and data[match_end] in self.digits:
+            match_end += 1
+
+        if match_end == offset + 1:  # skipcq: PTC-W0048
+            if data[offset] not in self.digits:
                 return None
-        elif num_start_pos == match_len and match_len == 1:  # only return None if match_len is 1 to allow 00 with zero padding.
+        elif num_start_pos == match_end and match_end == offset + 1:  # only return None if one byte matched to allow 00 with zero padding.
             return None
 
         # See if there is decimal part after decimal point.
-        if (match_len < len(data)) and (chr(data[match_len]) == "."):
-            match_len += 1
-            post_point_start = match_len
-            for test_byte in data[match_len:]:
-                if test_byte not in self.digits:
-                    break
-                match_len += 1
-            if match_len == post_point_start - 1:
+        if (match_end < data_length) and (data[match_end] == ord(".")):
+            match_end += 1
+            post_point_start = match_end
+            while match_end < data_length and data[match_end] in self.digits:
+                match_end += 1
+            if match_end == post_point_start - 1:
                 # There has to be at least one digit after the decimal point.
                 return None
 
         # See if there could be any exponent following the number.
-        if (self.exponent_type != DecimalFloatValueModelElement.EXP_TYPE_NONE) and (match_len + 1 < len(data)) and (
-                data[match_len] in b"eE"):
-            match_len += 1
-            if data[match_len] in b"+-":
-                match_len += 1
-            exp_number_start = match_len
-            for test_byte in data[match_len:]:
-                if test_byte not in self.digits:
-                    break
-                match_len += 1
-            if match_len == exp_number_start:
+        if (self.exponent_type != DecimalFloatValueModelElement.EXP_TYPE_NONE) and (match_end + 1 < data_length) and (
+                data[match_end] in b"eE"):
+            match_end += 1
+            if data[match_end] in b"+-":
+                match_end += 1
+            exp_number_start = match_end
+            while match_end < data_length and data[match_end] in self.digits:
+                match_end += 1
+            if match_end == exp_number_start:
                 # No exponent number found.
                 return None
         elif self.exponent_type == DecimalFloatValueModelElement.EXP_TYPE_MANDATORY:
             return None
 
-        match_string = data[:match_len]
+        match_string = data[offset:match_end]
         if self.pad_characters == b" " and match_string[0] in b"+-":
             if b" " in match_string.replace(b" ", b"", 1):
                 return None
@@ -119,3 +113,7 @@ class DecimalFloatValueModelElement(ModelElementInterface):
             match_value = float(match_string)
         match_context.update(match_string)
         return MatchElement(f"{path}/{self.element_id}", match_string, match_value, None)
+
+    def get_start_bytes(self):
+        """@return the allowed start characters of the number."""
+        return set(self.start_characters)
@@ -63,33 +63,31 @@ class DecimalIntegerValueModelElement(ModelElementInterface):
         @param match_context the match_context to be analyzed.
         @return a match when at least one byte being a digit was found.
         """
-        data = match_context.match_data
+        data = match_context.data
+        offset = match_context.offset
+        data_length = len(data)
 
-        if not data or (data[0] not in self.start_characters):
+        if offset >= data_length or (data[offset] not in self.start_characters):
             return None
-        match_len = 1
+        match_end = offset + 1
 
-        if self.pad_characters == b"" and data.startswith(b"0") and not data.startswith(b"0.") and len(data) > 1 and \
-                data[1] in self.digits:
+        if self.pad_characters == b"" and data.startswith(b"0", offset) and not data.startswith(b"0.", offset) and \
+                data_length > match_end and data[match_end] in self.digits:
             return None
 
-        for test_byte in data[match_len:]:
-            if test_byte not in self.pad_characters:
-                break
-            match_len += 1
-        num_start_pos = match_len
-        for test_byte in data[match_len:]:
-            if test_byte not in self.digits:
-                break
-            match_len += 1
-
-        if match_len == 1:  # skipcq: PTC-W0048
-            if data[0] not in self.digits:
+        while match_end < data_length and data[match_end] in self.pad_characters:
+            match_end += 1
+        num_start_pos = match_end
+        while match_end < data_length and data[match_end] in self.digits:
+            match_end += 1
+
+        if match_end == offset + 1:  # skipcq: PTC-W0048
+            if data[offset] not in self.digits:
                 return None
-        elif num_start_pos == match_len and match_len == 1:  # only return None if match_len is 1 to allow 00 with zero padding.
+        elif num_start_pos == match_end and match_end == offset + 1:  # only return None if one byte matched to allow 00 with zero padding.
             return None
 
-        match_string = data[:match_len]
+        match_string = data[offset:match_end]
         try:
             if self.pad_characters == b" " and match_string[0] in b"+-":
                 match_value = int(match_string.replace(b" ", b"", 1))
@@ -99,3 +97,7 @@ class DecimalIntegerValueModelElement(ModelElementInterface):
             return None
         match_context.update(match_string)
         return MatchElement(f"{path}/{self.element_id}", match_string, match_value, None)
+
+    def get_start_bytes(self):
+        """@return the allowed start characters of the number."""
+        return set(self.start_characters)
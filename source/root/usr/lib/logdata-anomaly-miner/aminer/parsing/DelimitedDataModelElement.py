@@ -29,24 +29,26 @@ class DelimitedDataModelElement(ModelElementInterface):
         @param consume_delimiter True if the delimiter character should also be consumed.
         """
         super().__init__(element_id, delimiter=delimiter, escape=escape, consume_delimiter=consume_delimiter)
+        if escape is not None:
+            self.escaped_delimiter_regex = re.compile(rb"(?<!" + re.escape(escape) + rb")" + re.escape(delimiter))
 
     def get_match_element(self, path: str, match_context):
         """
         Find the maximum number of bytes before encountering the non-escaped delimiter.
         @return a match when at least one byte was found but not the delimiter itself.
         """
-        data = match_context.match_data
-        match_len = -1
+        data = match_context.data
+        offset = match_context.offset
+        # A delimiter at the current position is no match. The escape lookbehind must not see the data before the offset.
+        if data.startswith(self.delimiter, offset):
+            return None
         if self.escape is None:
-            search = re.search(re.escape(self.delimiter), data)
-            if search is not None:
-                match_len = search.start()
+            end = data.find(self.delimiter, offset)
         else:
-            search = re.search(rb"(?<!" + re.escape(self.escape) + rb")" + re.escape(self.delimiter), data)
-            if search is not None:
-                match_len = search.start()
-        if match_len < 1:
+            search = self.escaped_delimiter_regex.search(data, offset)
+            end = -1 if search is None else search.start()
+        if end < 0:
             return None
-        match_data = data[:match_len + len(self.delimiter) * (self.consume_delimiter is True)]
+        match_data = data[offset:end + len(self.delimiter) * (self.consume_delimiter is True)]
         match_context.update(match_data)
         return MatchElement(f"{path}/{self.element_id}", match_data, match_data, None)
@@ -46,7 +46,7 @@ class ElementValueBranchModelElement(ModelElementInterface):
         @return the matchElement or None if the test model did not match, no branch was selected or the branch did not match.
         """
         current_path = f"{path}/{self.element_id}"
-        start_data = match_context.match_data
+        start_offset = match_context.offset
         model_match = self.value_model.get_match_element(current_path, match_context)
         if model_match is None:
             return None
@@ -82,7 +82,11 @@ class ElementValueBranchModelElement(ModelElementInterface):
             if branch_model is not None:
                 branch_match = branch_model.get_match_element(current_path, match_context)
         if branch_match is None:
-            match_context.match_data = start_data
+            match_context.offset = start_offset
             return None
-        return MatchElement(current_path, start_data[:len(start_data) - len(match_context.match_data)],
-                            start_data[:len(start_data) - len(match_context.match_data)], [model_match, branch_match])
+        match_string = match_context.data[start_offset:match_context.offset]
+        return MatchElement(current_path, match_string, match_string, [model_match, branch_match])
+
+    def get_start_bytes(self):
+        """@return the start bytes of the value model."""
+        return self.value_model.get_start_bytes()
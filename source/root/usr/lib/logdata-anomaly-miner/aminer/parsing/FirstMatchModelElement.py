@@ -11,11 +11,18 @@ You should have received a copy of the GNU General Public License along with
 this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
+import logging
+from aminer import AminerConfig
+from aminer.AminerConfig import STAT_LOG_NAME
 from aminer.parsing.ModelElementInterface import ModelElementInterface
 
 
 class FirstMatchModelElement(ModelElementInterface):
-    """This class defines a model element to return the match from the the first matching child model within a given list."""
+    """
+    This class defines a model element to return the match from the the first matching child model within a given list.
+    The children are indexed by the bytes their matches can start with, so only children possibly matching the first byte of the data
+    are tried. The order of the children is kept, so the first matching child is still taken.
+    """
 
     def __init__(self, element_id: str, children: list):
         """
@@ -24,15 +31,84 @@ class FirstMatchModelElement(ModelElementInterface):
         @param children a list of child elements to be iterated through.
         """
         super().__init__(element_id, children=children)
+        children_start_bytes = [child_element.get_start_bytes() for child_element in self.children]
+        # The indices of all children, which have to be tried for data starting with an unknown byte or for empty data.
+        self.unrestricted_child_indices = tuple(
+            child_index for child_index, start_bytes in enumerate(children_start_bytes) if start_bytes is None)
+        self.child_indices_by_start_byte: dict[int, tuple] = {}
+        for start_bytes in children_start_bytes:
+            if start_bytes is None:
+                continue
+            for start_byte in start_bytes:
+                if start_byte not in self.child_indices_by_start_byte:
+                    self.child_indices_by_start_byte[start_byte] = tuple(
+                        child_index for child_index, child_start_bytes in enumerate(children_start_bytes)
+                        if child_start_bytes is None or start_byte in child_start_bytes)
+        self.tried_counts = [0] * len(self.children)
+        self.matched_counts = [0] * len(self.children)
+
+    def get_child_indices(self, match_context):
+        """@return the indices of all children, which can match the data starting at the offset of the match_context."""
+        if match_context.offset < len(match_context.data):
+            return self.child_indices_by_start_byte.get(match_context.data[match_context.offset], self.unrestricted_child_indices)
+        return self.unrestricted_child_indices
 
     def get_match_element(self, path: str, match_context):
         """@return None when there is no match, MatchElement otherwise."""
         current_path = f"{path}/{self.element_id}"
 
-        match_data = match_context.match_data
-        for child_element in self.children:
-            child_match = child_element.get_match_element(current_path, match_context)
+        start_offset = match_context.offset
+        for child_index in self.get_child_indices(match_context):
+            self.tried_counts[child_index] += 1
+            child_match = self.children[child_index].get_match_element(current_path, match_context)
             if child_match is not None:
+                self.matched_counts[child_index] += 1
                 return child_match
-            match_context.match_data = match_data
+            match_context.offset = start_offset
         return None
+
+    def build_match_function(self, path):
+        """Build the match function with the match functions of all children computed in advance."""
+        current_path = f"{path}/{self.element_id}"
+        child_match_functions = [child_element.build_match_function(current_path) for child_element in self.children]
+        get_child_indices = self.get_child_indices
+        tried_counts = self.tried_counts
+        matched_counts = self.matched_counts
+
+        def match_function(match_context):
+            start_offset = match_context.offset
+            for child_index in get_child_indices(match_context):
+                tried_counts[child_index] += 1
+                child_match = child_match_functions[child_index](match_context)
+                if child_match is not None:
+                    matched_counts[child_index] += 1
+                    return child_match
+                match_context.offset = start_offset
+            return None
+        return match_function
+
+    def get_start_bytes(self):
+        """@return the start bytes of all children or None, when the start bytes of any child are not restricted."""
+        if self.unrestricted_child_indices:
+            return None
+        return set(self.child_indices_by_start_byte)
+
+    def get_branch_statistics(self):
+        """@return a list of tuples with the element_id of each child, the number of times it was tried and the number of matches."""
+        return [(child_element.element_id, self.tried_counts[child_index], self.matched_counts[child_index]) for child_index, child_element
+                in enumerate(self.children)]
+
+    def log_statistics(self, component_name):
+        """
+        Log how often each child was tried and matched since the last call. Children matching often should be moved to the front of the
+        list. Register the model element as component to get these statistics periodically.
+        @param component_name the name of the component which is printed in the log line.
+        """
+        if AminerConfig.STAT_LEVEL > 0:
+            for element_id, tried_count, matched_count in self.get_branch_statistics():
+                logging.getLogger(STAT_LOG_NAME).info(
+                    "'%s' tried the child '%s' %d times and it matched %d times in the last 60 minutes.", component_name, element_id,
+                    tried_count, matched_count)
+        # Reset the lists in place, as they are also referenced by the built match functions.
+        self.tried_counts[:] = [0] * len(self.children)
+        self.matched_counts[:] = [0] * len(self.children)
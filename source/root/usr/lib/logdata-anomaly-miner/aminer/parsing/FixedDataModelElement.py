@@ -32,7 +32,23 @@ class FixedDataModelElement(ModelElementInterface):
 
     def get_match_element(self, path: str, match_context):
         """@return None when there is no match, MatchElement otherwise."""
-        if not match_context.match_data.startswith(self.fixed_data):
+        if not match_context.data.startswith(self.fixed_data, match_context.offset):
             return None
         match_context.update(self.fixed_data)
         return MatchElement(f"{path}/{self.element_id}", self.fixed_data, self.fixed_data, None)
+
+    def build_match_function(self, path):
+        """Build the match function with the current path computed in advance."""
+        current_path = f"{path}/{self.element_id}"
+        fixed_data = self.fixed_data
+
+        def match_function(match_context):
+            if not match_context.data.startswith(fixed_data, match_context.offset):
+                return None
+            match_context.update(fixed_data)
+            return MatchElement(current_path, fixed_data, fixed_data, None)
+        return match_function
+
+    def get_start_bytes(self):
+        """@return the first byte of the fixed data."""
+        return {self.fixed_data[0]}
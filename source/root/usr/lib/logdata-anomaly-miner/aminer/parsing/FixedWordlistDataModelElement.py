@@ -34,11 +34,12 @@ class FixedWordlistDataModelElement(ModelElementInterface):
 
     def get_match_element(self, path: str, match_context):
         """@return None when there is no match, MatchElement otherwise."""
-        data = match_context.match_data
+        data = match_context.data
+        offset = match_context.offset
         match_data = None
         word_pos = 0
         for word in self.wordlist:
-            if data.startswith(word):
+            if data.startswith(word, offset):
                 match_data = word
                 break
             word_pos += 1
@@ -48,3 +49,24 @@ class FixedWordlistDataModelElement(ModelElementInterface):
 
         match_context.update(match_data)
         return MatchElement(f"{path}/{self.element_id}", match_data, word_pos, None)
+
+    def build_match_function(self, path):
+        """Build the match function with the current path computed in advance."""
+        current_path = f"{path}/{self.element_id}"
+        wordlist = self.wordlist
+
+        def match_function(match_context):
+            data = match_context.data
+            offset = match_context.offset
+            for word_pos, word in enumerate(wordlist):
+                if data.startswith(word, offset):
+                    match_context.update(word)
+                    return MatchElement(current_path, word, word_pos, None)
+            return None
+        return match_function
+
+    def get_start_bytes(self):
+        """@return the first bytes of all words or None, when the empty word is in the wordlist."""
+        if b"" in self.wordlist:
+            return None
+        return {word[0] for word in self.wordlist}
@@ -32,12 +32,10 @@ class HexStringModelElement(ModelElementInterface):
         Find the maximum number of bytes forming a integer number according to the parameters specified.
         @return a match when at least one byte being a digit was found
         """
-        m = self.hex_regex.match(match_context.match_data)
+        m = self.hex_regex.match(match_context.data, match_context.offset)
         if m is None:
             return None
-        match_len = m.span(0)[1]
-
-        match_object = match_context.match_data[:match_len]
+        match_object = m.group()
         try:
             pad = ""
             if len(match_object.decode(AminerConfig.ENCODING)) % 2 != 0:
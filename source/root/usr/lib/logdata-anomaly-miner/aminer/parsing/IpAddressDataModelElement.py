@@ -15,6 +15,8 @@ import re
 from aminer.parsing.MatchElement import MatchElement
 from aminer.parsing.ModelElementInterface import ModelElementInterface
 
+ipv4_regex = re.compile(br"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}")
+
 
 class IpAddressDataModelElement(ModelElementInterface):
     """This class defines a model element that matches an IP address."""
@@ -30,7 +32,7 @@ class IpAddressDataModelElement(ModelElementInterface):
         if not ipv6:
             # self.regex = re.compile(br"((2[0-4][0-9]|1[0-9][0-9]|25[0-5]|[1-9]?[0-9])\.){3}(2[0-4][0-9]|1[0-9][0-9]|25[0-5]|[1-9]?[0-9])")
             # use a simpler regex to improve the performance.
-            self.regex = re.compile(br"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}")
+            self.regex = ipv4_regex
             self.extract = extract_ipv4_address
         else:
             # modified regex from https://community.helpsystems.com/forums/intermapper/miscellaneous-topics/
@@ -51,22 +53,29 @@ class IpAddressDataModelElement(ModelElementInterface):
         Allowed formats for IPv6 addresses are defined in RFC4291 section 2.2.
         However, trailing IPv4 addresses (for example ::FFFF:129.144.52.38) are not allowed.
         """
-        data = match_context.match_data
-        m = self.regex.match(data)
+        data = match_context.data
+        offset = match_context.offset
+        m = self.regex.match(data, offset)
         if m is None:
             return None
-        match_len = m.span(0)[1]
-        if self.extract is extract_ipv6_address and (b"." in m.group()[:match_len].split(b":")[-1] or (len(data) > match_len and (
-                re.compile(br"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}").match(data[data.rfind(b":", 0, match_len) + 1:]) is not None or (
-                data.find(b"::", match_len) == match_len and b"::" in data)))):
+        match_string = m.group()
+        match_len = len(match_string)
+        end = m.end()
+        if self.extract is extract_ipv6_address and (b"." in match_string.split(b":")[-1] or (len(data) > end and (
+                ipv4_regex.match(data, max(data.rfind(b":", offset, end) + 1, offset)) is not None or data.find(b"::", end) == end))):
             return None
-        extracted_address = self.extract(m.group(), match_len)
+        extracted_address = self.extract(match_string, match_len)
         if extracted_address is None:
             return None
-        match_string = data[:match_len]
         match_context.update(match_string)
         return MatchElement(f"{path}/{self.element_id}", match_string, extracted_address, None)
 
+    def get_start_bytes(self):
+        """@return the bytes an IP address can start with."""
+        if self.extract is extract_ipv6_address:
+            return set(b"0123456789abcdefABCDEF:")
+        return set(b"0123456789")
+
 
 def extract_ipv4_address(data: bytes, match_len: int):
     """Calculate integer values from ipv4 addresses."""
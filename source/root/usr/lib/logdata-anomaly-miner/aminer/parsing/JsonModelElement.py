@@ -13,6 +13,7 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
 import json
+import re
 import warnings
 import logging
 from typing import List, Union, Any
@@ -26,6 +27,12 @@ from aminer.AminerConfig import DEBUG_LOG_NAME
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 debug_log_prefix = "JsonModelElement: "
 
+# Backslashes with the escaped character, quotes, newlines, carriage returns and tabs are the only positions where JSON data is repaired.
+REPAIR_REGEX = re.compile(rb'\\.|["\n\r\t]', re.DOTALL)
+REPAIR_NEEDED_REGEX = re.compile(rb"[\\\n\r\t]")
+VALID_ESCAPE_CHARS = b"\\'\"abfnrtv/"
+CONTROL_CHAR_ESCAPES = {ord("\n"): b"\\n", ord("\r"): b"\\r", ord("\t"): b"\\t"}
+
 
 def format_float(val):
     """This function formats the float-value and parses the sign and the exponent."""
@@ -49,11 +56,22 @@ def format_float(val):
     return float(val)
 
 
+def find_from(data: bytes, sub: bytes, start: int):
+    """Return the same position as data[start:].find(sub) without copying the data."""
+    if start < 0:
+        start = max(len(data) + start, 0)
+    start = min(start, len(data))
+    position = data.find(sub, start)
+    if position == -1:
+        return -1
+    return position - start
+
+
 class JsonModelElement(ModelElementInterface):
     """Parse single- or multi-lined JSON data."""
 
     def __init__(self, element_id: str, key_parser_dict: dict, optional_key_prefix: str = "optional_key_", nullable_key_prefix: str = "+",
-                 allow_all_fields: bool = False):
+                 allow_all_fields: bool = False, strict_json: bool = False):
         """
         Initialize the JsonModelElement.
         @param element_id: The ID of the element.
@@ -65,9 +83,11 @@ class JsonModelElement(ModelElementInterface):
         @param optional_key_prefix: If some key starts with the optional_key_prefix it will be considered optional.
         @param nullable_key_prefix: The value of this key may be null instead of any expected value.
         @param allow_all_fields: Unknown fields are skipped without parsing with any parsing model.
+        @param strict_json: The data must be well-formed JSON and is decoded without repairing invalid escape sequences or unescaped control
+               characters in strings first.
         """
         super().__init__(element_id, key_parser_dict=key_parser_dict, optional_key_prefix=optional_key_prefix,
-                         nullable_key_prefix=nullable_key_prefix, allow_all_fields=allow_all_fields)
+                         nullable_key_prefix=nullable_key_prefix, allow_all_fields=allow_all_fields, strict_json=strict_json)
         self.dec_escapes = False
         self.validate_key_parser_dict(key_parser_dict)
 
@@ -124,20 +144,43 @@ class JsonModelElement(ModelElementInterface):
         return key.startswith(self.nullable_key_prefix) or (
                 key.startswith(self.optional_key_prefix) and key[len(self.optional_key_prefix):].startswith(self.nullable_key_prefix))
 
-    def get_unescaped_quotes(self, data):
-        quotes = [i for i in range(len(data)) if data.startswith(b"\"", i)]
-        result_quotes = []
-        for quote in quotes:
-            if bytes([data[quote - 1]]) != b"\\":
-                result_quotes.append(quote)
-        return result_quotes
-
-    def index_is_in_json_string(self, quotes, index):
-        """Check if index is in json string."""
-        for i in range(len(quotes)-1):
-            if quotes[i] < index < quotes[i+1] and i % 2 == 0:
-                return True
-        return False
+    def repair_json_data(self, data: bytes):  # skipcq: PYL-R0201
+        """
+        Repair the JSON data in a single pass over all backslashes, quotes and control characters. Backslashes not starting a valid escape
+        sequence are escaped and newlines, carriage returns and tabs in strings are replaced with their escape sequences. The last byte of
+        the data is never repaired.
+        @param data the JSON data to be repaired.
+        @return the repaired data or the data itself if nothing had to be repaired.
+        """
+        last_index = len(data) - 1
+        if REPAIR_NEEDED_REGEX.search(data, 0, last_index) is None:
+            return data
+        result = []
+        position = 0
+        in_string = False
+        for match in REPAIR_REGEX.finditer(data):
+            index = match.start()
+            char = data[index]
+            if char == 34:  # "
+                in_string = not in_string
+                continue
+            if char == 92:  # \
+                if index == last_index or data[index + 1] in VALID_ESCAPE_CHARS:
+                    continue
+                result.append(data[position:index])
+                result.append(b"\\")
+                position = index
+                # The character after the backslash is not escaped anymore.
+                index += 1
+                char = data[index]
+                if char not in CONTROL_CHAR_ESCAPES:
+                    continue
+            if in_string and index < last_index:
+                result.append(data[position:index])
+                result.append(CONTROL_CHAR_ESCAPES[char])
+                position = index + 1
+        result.append(data[position:])
+        return b"".join(result)
 
     def get_match_element(self, path: str, match_context):
         """
@@ -148,64 +191,52 @@ class JsonModelElement(ModelElementInterface):
         @return the matchElement or None if model did not match.
         """
         current_path = f"{path}/{self.element_id}"
-        old_match_data = match_context.match_data
+        # The data is rewritten while parsing, so the original data and offset are restored afterwards.
+        old_data = match_context.data
+        old_offset = match_context.offset
         matches: Union[List[Union[MatchElement, None]]] = []
         try:
-            index = 0
-            # There can be a valid case in which the text contains for example \x2d, \\x2d or \\\\x2d, which basically should be decoded
-            # into the unicode form.
-            while index != -1:
-                index = match_context.match_data.find(rb"\x")
-                if index != -1:
-                    try:
-                        match_context.match_data = match_context.match_data.decode("unicode-escape").encode()
-                    except UnicodeDecodeError:
-                        break
-            index = 0
-            quotes = self.get_unescaped_quotes(match_context.match_data)
-            while index != -1:
-                index = match_context.match_data.find(b"\\", index)
-                if index != -1 and len(match_context.match_data) - 1 > index and match_context.match_data[
-                        index + 1] not in b"\\'\"abfnrtv/":
-                    match_context.match_data = match_context.match_data[:index] + b"\\" + match_context.match_data[index:]
-                    index += 2
-                elif index != -1:
-                    index += 2
-            for num in b"\n\r\t":
+            if not self.strict_json:
                 index = 0
-                char = bytes([num])
+                # There can be a valid case in which the text contains for example \x2d, \\x2d or \\\\x2d, which basically should be
+                # decoded into the unicode form.
                 while index != -1:
-                    index = match_context.match_data.find(char, index)
-                    if index != -1 and len(match_context.match_data) - 1 > index and self.index_is_in_json_string(quotes, index):
-                        escaped = (bytes([match_context.match_data[index]]).replace(b"\n", b"\\n").replace(b"\t", b"\\t"))
-                        match_context.match_data = match_context.match_data[:index] + escaped + match_context.match_data[index + 1:]
-                        index += 2
-                    elif index != -1:
-                        index += 2
+                    index = match_context.match_data.find(rb"\x")
+                    if index != -1:
+                        try:
+                            match_context.match_data = match_context.match_data.decode("unicode-escape").encode()
+                        except UnicodeDecodeError:
+                            break
+                match_context.match_data = self.repair_json_data(match_context.match_data)
             logging.getLogger(DEBUG_LOG_NAME).debug(repr(match_context.match_data))
             json_match_data = json.loads(match_context.match_data, parse_float=format_float)
 
             if not isinstance(json_match_data, dict):
+                match_context.data = old_data
+                match_context.offset = old_offset
                 return None
         except JSONDecodeError as e:
             logging.getLogger(DEBUG_LOG_NAME).debug(e)
+            match_context.data = old_data
+            match_context.offset = old_offset
             return None
         self.dec_escapes = True
-        if self.is_ascii(match_context.match_data.decode()):
+        if match_context.match_data.isascii():
             match_context.match_data = match_context.match_data.decode("unicode-escape").encode()
             self.dec_escapes = False
         matches += self.parse_json_dict(self.key_parser_dict, json_match_data, current_path, match_context)
-        remove_chars = [b' ', b'}', b']', b'"', b'\r', b'\n']
-        match_data = match_context.match_data
-        for c in remove_chars:
-            match_data = match_data.replace(c, b"")
+        # Only spaces, closing brackets and quotes may remain after all keys were parsed.
+        match_data = match_context.match_data.translate(None, b' }]"\r\n')
         if None in matches or (match_data != b"" and len(matches) > 0):
             logging.getLogger(DEBUG_LOG_NAME).debug(
                 debug_log_prefix + "get_match_element_main NONE RETURNED\n" + match_context.match_data.strip(b' }]"\r\n').decode())
-            match_context.match_data = old_match_data
+            match_context.data = old_data
+            match_context.offset = old_offset
             return None
         # remove all remaining spaces and brackets.
         match_context.update(match_context.match_data)
+        match_context.data = old_data
+        match_context.offset = len(old_data)
         if len(matches) == 0:
             resulting_matches = None
         else:
@@ -491,17 +522,28 @@ class JsonModelElement(ModelElementInterface):
                     debug_log_prefix + f"Data length not matching! match_string: {len(match_element.match_string)}, data: {data_len},"
                                        f" data: {data.decode()}")
                 match_element = None
-            index = max([match_context.match_data.replace(b"\\", b"").find(split_key.encode()),
-                         match_context.match_data.find(split_key.encode()), match_context.match_data.decode().find(split_key)])
-            index += match_context.match_data[index:].find(split_key.encode() + b'":') + len(split_key.encode() + b'":')
-            try:
-                index += max([match_context.match_data.decode(enc)[index:].find(data.decode(enc)),
-                              match_context.match_data.replace(b"\\", b"")[index:].find(data), match_context.match_data[index:].find(data)])
-            except UnicodeDecodeError:
-                index += max([match_context.match_data.decode()[index:].find(data.decode()),
-                              match_context.match_data.replace(b"\\", b"")[index:].find(data), match_context.match_data[index:].find(data)])
-            index += len(match_context.match_data[index:]) - len(match_context.match_data[index:].lstrip(b" \r\t\n"))
-            if match_context.match_data[index:].find(b'"') == 0:
+            match_data = match_context.match_data
+            encoded_key = split_key.encode()
+            # The data is only copied without backslashes or decoded if it contains backslashes or non-ascii characters. Otherwise all
+            # searches find the same positions.
+            unescaped_data = match_data.replace(b"\\", b"") if b"\\" in match_data else match_data
+            is_ascii_data = match_data.isascii()
+            index = max(unescaped_data.find(encoded_key), match_data.find(encoded_key))
+            if not is_ascii_data:
+                index = max(index, match_data.decode().find(split_key))
+            index += find_from(match_data, encoded_key + b'":', index) + len(encoded_key + b'":')
+            if is_ascii_data and enc == "utf-8":
+                index += max(find_from(unescaped_data, data, index), find_from(match_data, data, index))
+            else:
+                try:
+                    index += max([match_data.decode(enc)[index:].find(data.decode(enc)), find_from(unescaped_data, data, index),
+                                  find_from(match_data, data, index)])
+                except UnicodeDecodeError:
+                    index += max([match_data.decode()[index:].find(data.decode()), find_from(unescaped_data, data, index),
+                                  find_from(match_data, data, index)])
+            remaining_data = match_data[index:]
+            index += len(remaining_data) - len(remaining_data.lstrip(b" \r\t\n"))
+            if match_data.startswith(b'"', index):
                 index += len(b'"')
             # for example float scientific representation is converted to normal float..
             if index == -1 and match_element is not None and isinstance(json_match_data[split_key], float):
@@ -147,10 +147,11 @@ class JsonStringModelElement(ModelElementInterface):
     def get_match_element(self, path: str, match_context):
         """Just return a match including all data from the context."""
         current_path = f"{ path }/ { self.element_id }"
-        logging.getLogger(DEBUG_LOG_NAME).info("JsonStringModelElement %s/%s", path, match_context.match_data.decode('utf-8'))
+        match_data = match_context.match_data
+        logging.getLogger(DEBUG_LOG_NAME).info("JsonStringModelElement %s/%s", path, match_data.decode('utf-8'))
         matches = []
         try:
-            jdict = orjson.loads(match_context.match_data)
+            jdict = orjson.loads(match_data)
             if self.strict_mode:
                 jdictjao = JsonAccessObject(jdict)
                 if len(jdictjao.collection) != len(self.jao.collection):
@@ -200,11 +201,10 @@ class JsonStringModelElement(ModelElementInterface):
                         return None
                     matches += [child_match]
         except orjson.JSONDecodeError as exception:
-            msg = f"JsonStringModelElement { exception }: { match_context.match_data.decode('utf-8') }"
+            msg = f"JsonStringModelElement { exception }: { match_data.decode('utf-8') }"
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             return None
 
-        match_data = match_context.match_data
         if not match_data:
             return None
         match_context.update(match_data)
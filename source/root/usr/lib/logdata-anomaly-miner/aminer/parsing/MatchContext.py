@@ -22,6 +22,8 @@ class MatchContext:
     This class allows storage of data relevant during the matching process, e.g. the root node and the remaining unmatched data.
     Then searching for non-atomic matches, e.g. sequences, the context might be modified by model subelements, even if the main model
     element will not return a match. In that case, those non-atomic model elements have to care to restore the context before returning.
+    The data is never copied while matching. Instead, the offset of the first unmatched byte in data is moved forward, so model elements
+    should read from data starting at offset and restore the offset when they do not match.
     """
 
     def __init__(self, match_data: bytes):
@@ -33,7 +35,27 @@ class MatchContext:
             msg = "match_data has to be of the type bytes."
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             raise TypeError(msg)
-        self.match_data = match_data
+        self.data = match_data
+        self.offset = 0
+
+    @property
+    def match_data(self):
+        """
+        Get the data still to be matched. This property is kept for compatibility with model elements not using the offset, but it
+        copies the remaining data every time it is read.
+        """
+        if self.offset == 0:
+            return self.data
+        return self.data[self.offset:]
+
+    @match_data.setter
+    def match_data(self, match_data: bytes):
+        """Set the data still to be matched. When the data is a suffix of the current data, only the offset is moved."""
+        if len(match_data) <= len(self.data) and self.data.endswith(match_data):
+            self.offset = len(self.data) - len(match_data)
+        else:
+            self.data = match_data
+            self.offset = 0
 
     def update(self, match_string: bytes):
         """
@@ -41,7 +63,7 @@ class MatchContext:
         This method does not check, if the removed data is the same as the trailing match data for performance reasons. This is done
         only in the DebugMatchContext class.
         """
-        self.match_data = self.match_data[len(match_string):]
+        self.offset += len(match_string)
 
 
 class DebugMatchContext(MatchContext):
@@ -77,7 +99,7 @@ class DebugMatchContext(MatchContext):
             msg = "Illegal state"
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             raise ValueError(msg)
-        self.match_data = self.match_data[len(match_string):]
+        self.offset += len(match_string)
         self.last_match_data = self.match_data
         if (self.shortest_unmatched_data is None) or (len(self.match_data) < len(self.shortest_unmatched_data)):
             self.shortest_unmatched_data = self.match_data
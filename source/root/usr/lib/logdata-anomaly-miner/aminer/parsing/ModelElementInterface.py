@@ -13,6 +13,7 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
 import abc
+import functools
 import locale
 import logging
 import re
@@ -107,6 +108,8 @@ class ModelElementInterface(metaclass=abc.ABCMeta):
         @param optional_attribute_prefix: If some attribute starts with this prefix it will be considered optional.
         @param empty_allowed_prefix: If an element starts with this prefix, it may be empty.
         @param xml_header_expected: True if the xml header is expected.
+        @param strict_json: The data must be well-formed JSON and is decoded without repairing invalid escape sequences or unescaped control
+               characters in strings first.
         """
         allowed_kwargs = [
             "date_format", "time_zone", "text_locale", "start_year", "max_time_jump_seconds", "value_sign_type", "value_pad_type",
@@ -114,7 +117,7 @@ class ModelElementInterface(metaclass=abc.ABCMeta):
             "children", "fixed_data", "wordlist", "ipv6", "key_parser_dict", "optional_key_prefix", "nullable_key_prefix",
             "allow_all_fields", "optional_element", "repeated_element", "min_repeat", "max_repeat", "upper_case", "alphabet",
             "strict_mode", "ignore_null", "timestamp_scale", "root_element", "attribute_prefix", "optional_attribute_prefix",
-            "empty_allowed_prefix", "xml_header_expected"
+            "empty_allowed_prefix", "xml_header_expected", "strict_json"
         ]
         for argument, value in list(locals().items())[1:-1]:  # skip self parameter and kwargs
             if value is not None:
@@ -491,6 +494,11 @@ class ModelElementInterface(metaclass=abc.ABCMeta):
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             raise TypeError(msg)
 
+        if hasattr(self, "strict_json") and not isinstance(self.strict_json, bool):
+            msg = "strict_json has to be of the type bool."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+
     @abc.abstractmethod
     def get_match_element(self, path, match_context):
         """
@@ -500,3 +508,21 @@ class ModelElementInterface(metaclass=abc.ABCMeta):
         @param match_context an instance of MatchContext class holding the data context to match against.
         @return the match_element or None if model did not match.
         """
+
+    def build_match_function(self, path):
+        """
+        Build a function returning the same result as get_match_element with the given path, but only taking the match_context.
+        Model elements can override this method to compute their paths and the match functions of their children only once instead of
+        doing it for every parsed log atom. The function has to be built again, when the model element is changed afterwards.
+        @param path the model path to the parent model element invoking the function.
+        @return a function taking the match_context and returning the match_element or None if the model did not match.
+        """
+        return functools.partial(self.get_match_element, path)
+
+    def get_start_bytes(self):  # skipcq: PYL-R0201
+        """
+        Get all byte values the data has to start with to be matched by this model element. Model elements like the
+        FirstMatchModelElement use this information to skip children, which can not match the data anyway.
+        @return a set of byte values or None, when the first byte is not restricted or the model element can match empty data.
+        """
+        return None
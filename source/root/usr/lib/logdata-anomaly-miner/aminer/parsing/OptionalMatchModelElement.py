@@ -42,11 +42,26 @@ class OptionalMatchModelElement(ModelElementInterface):
         """@return the embedded child match or an empty match."""
         current_path = f"{path}/{self.element_id}"
 
-        start_data = match_context.match_data
+        start_offset = match_context.offset
         match = self.optional_element.get_match_element(current_path, match_context)
         if match is None:
             self.empty_match_element.path = current_path
             return self.empty_match_element
 
-        return MatchElement(current_path, start_data[:len(start_data) - len(match_context.match_data)],
-                            start_data[:len(start_data) - len(match_context.match_data)], [match])
+        match_string = match_context.data[start_offset:match_context.offset]
+        return MatchElement(current_path, match_string, match_string, [match])
+
+    def build_match_function(self, path):
+        """Build the match function with the current path and the match function of the optional element computed in advance."""
+        current_path = f"{path}/{self.element_id}"
+        optional_match_function = self.optional_element.build_match_function(current_path)
+        empty_match_element = MatchElement(current_path, b"", None, None)
+
+        def match_function(match_context):
+            start_offset = match_context.offset
+            match = optional_match_function(match_context)
+            if match is None:
+                return empty_match_element
+            match_string = match_context.data[start_offset:match_context.offset]
+            return MatchElement(current_path, match_string, match_string, [match])
+        return match_function
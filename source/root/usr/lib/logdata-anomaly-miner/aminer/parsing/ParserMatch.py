@@ -16,6 +16,11 @@ from aminer.AminerConfig import DEBUG_LOG_NAME
 from aminer.parsing.MatchElement import MatchElement
 from collections import deque
 
+# The paths of repeated matches suffixed by their index. They are shared by all match dictionaries to avoid building the same strings
+# for every log atom. The cache is cleared when it is full, as the indices of unbounded repetitions would let it grow without limit.
+indexed_paths: dict = {}
+indexed_paths_cache_size = 10000
+
 
 class ParserMatch:
     """
@@ -40,7 +45,11 @@ class ParserMatch:
         return self.match_element
 
     def get_match_dictionary(self):
-        """Return a dictionary of all children matches."""
+        """
+        Return a dictionary of all children matches.
+        When sibling matches share the same path, each of them is also stored with the path suffixed by the index of its match_object
+        in the order of appearance. Equal match objects get the same index. The list of all matches is stored with the path itself.
+        """
         if self.match_dictionary is not None:
             return self.match_dictionary
         stack = deque()
@@ -48,24 +57,60 @@ class ParserMatch:
         result_dict = {}
         while stack:
             match_list = stack.pop()
-            counter_dict = {}
-            for test_match in match_list:
-                if test_match.path in counter_dict.keys():  # skipcq: PYL-C0201
-                    counter_dict[test_match.path] = 0
-                    result_dict[test_match.path] = []
-                else:
-                    counter_dict[test_match.path] = None
+            # The state of all paths occurring more than once in the match_list: the list of the matches, the number of distinct
+            # match objects and the indices of the first occurrence of each hashable match object per type.
+            repeated_paths = {}
+            if len(match_list) > 1 and len({test_match.path for test_match in match_list}) != len(match_list):
+                seen_paths = set()
+                for test_match in match_list:
+                    if test_match.path in repeated_paths:
+                        continue
+                    if test_match.path in seen_paths:
+                        match_list_of_path = []
+                        result_dict[test_match.path] = match_list_of_path
+                        repeated_paths[test_match.path] = [match_list_of_path, 0, {}]
+                    else:
+                        seen_paths.add(test_match.path)
+            if not repeated_paths:
+                for test_match in match_list:
+                    result_dict[test_match.path] = test_match
+                    if test_match.children is not None:
+                        stack.append(test_match.children)
+                continue
             for test_match in match_list:
                 path = test_match.path
-                if counter_dict[path] is not None:
+                if path in repeated_paths:
+                    repeated_path = repeated_paths[path]
+                    match_list_of_path = repeated_path[0]
+                    match_object = test_match.match_object
+                    pos = None
                     try:
-                        pos = next(i for i, x in enumerate(result_dict[test_match.path]) if not isinstance(x, list) and isinstance(
-                            test_match.match_object, type(x.match_object)) and test_match.match_object == x.match_object)
-                        path += f"/{pos}"
-                    except StopIteration:
-                        path += "/%d" % counter_dict[path]
-                        counter_dict[test_match.path] += 1
-                    result_dict[test_match.path].append(test_match)
+                        first_occurrences = repeated_path[2].get(match_object)
+                    except TypeError:
+                        # Unhashable match objects are compared with all previous matches.
+                        first_occurrences = None
+                        pos = next((i for i, x in enumerate(match_list_of_path) if isinstance(
+                            match_object, type(x.match_object)) and match_object == x.match_object), None)
+                    else:
+                        if first_occurrences is None:
+                            first_occurrences = []
+                            repeated_path[2][match_object] = first_occurrences
+                        for i, object_type in first_occurrences:
+                            if isinstance(match_object, object_type) and match_object == match_list_of_path[i].match_object:
+                                pos = i
+                                break
+                        if not any(object_type is type(match_object) for _, object_type in first_occurrences):
+                            first_occurrences.append((len(match_list_of_path), type(match_object)))
+                    if pos is None:
+                        pos = repeated_path[1]
+                        repeated_path[1] += 1
+                    match_list_of_path.append(test_match)
+                    path = indexed_paths.get((path, pos))
+                    if path is None:
+                        path = f"{test_match.path}/{pos}"
+                        if len(indexed_paths) >= indexed_paths_cache_size:
+                            indexed_paths.clear()
+                        indexed_paths[(test_match.path, pos)] = path
                 result_dict[path] = test_match
                 children = test_match.children
                 if children is not None:
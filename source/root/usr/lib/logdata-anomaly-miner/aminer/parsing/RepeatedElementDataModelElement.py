@@ -31,7 +31,7 @@ class RepeatedElementDataModelElement(ModelElementInterface):
         """Find a suitable number of repeats."""
         current_path = f"{path}/{self.element_id}"
 
-        start_data = match_context.match_data
+        start_offset = match_context.offset
         matches = []
         match_count = 0
         while match_count != self.max_repeat + 1:
@@ -41,8 +41,40 @@ class RepeatedElementDataModelElement(ModelElementInterface):
             matches += [child_match]
             match_count += 1
         if match_count < self.min_repeat or match_count > self.max_repeat:
-            match_context.match_data = start_data
+            match_context.offset = start_offset
             return None
 
-        return MatchElement(current_path, start_data[:len(start_data) - len(match_context.match_data)],
-                            start_data[:len(start_data) - len(match_context.match_data)], matches)
+        match_string = match_context.data[start_offset:match_context.offset]
+        return MatchElement(current_path, match_string, match_string, matches)
+
+    def build_match_function(self, path):
+        """Build the match function. The match functions for each repetition are built when the repetition is found the first time."""
+        current_path = f"{path}/{self.element_id}"
+        repeated_match_functions = []
+        max_repeat = self.max_repeat
+        min_repeat = self.min_repeat
+
+        def match_function(match_context):
+            start_offset = match_context.offset
+            matches = []
+            match_count = 0
+            while match_count != max_repeat + 1:
+                if match_count == len(repeated_match_functions):
+                    repeated_match_functions.append(self.repeated_element.build_match_function(f"{current_path}/{match_count}"))
+                child_match = repeated_match_functions[match_count](match_context)
+                if child_match is None:
+                    break
+                matches.append(child_match)
+                match_count += 1
+            if match_count < min_repeat or match_count > max_repeat:
+                match_context.offset = start_offset
+                return None
+            match_string = match_context.data[start_offset:match_context.offset]
+            return MatchElement(current_path, match_string, match_string, matches)
+        return match_function
+
+    def get_start_bytes(self):
+        """@return the start bytes of the repeated element or None, when no repetition is required."""
+        if self.min_repeat < 1:
+            return None
+        return self.repeated_element.get_start_bytes()
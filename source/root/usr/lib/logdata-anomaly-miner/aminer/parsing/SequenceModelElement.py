@@ -36,14 +36,36 @@ class SequenceModelElement(ModelElementInterface):
         @return the matchElement or None if model did not match.
         """
         current_path = f"{path}/{self.element_id}"
-        start_data = match_context.match_data
+        start_offset = match_context.offset
         matches = []
         for child_element in self.children:
             child_match = child_element.get_match_element(current_path, match_context)
             if child_match is None:
-                match_context.match_data = start_data
+                match_context.offset = start_offset
                 return None
             matches += [child_match]
 
-        return MatchElement(current_path, start_data[:len(start_data) - len(match_context.match_data)],
-                            start_data[:len(start_data) - len(match_context.match_data)], matches)
+        match_string = match_context.data[start_offset:match_context.offset]
+        return MatchElement(current_path, match_string, match_string, matches)
+
+    def build_match_function(self, path):
+        """Build the match function with the current path and the match functions of all children computed in advance."""
+        current_path = f"{path}/{self.element_id}"
+        child_match_functions = [child_element.build_match_function(current_path) for child_element in self.children]
+
+        def match_function(match_context):
+            start_offset = match_context.offset
+            matches = []
+            for child_match_function in child_match_functions:
+                child_match = child_match_function(match_context)
+                if child_match is None:
+                    match_context.offset = start_offset
+                    return None
+                matches.append(child_match)
+            match_string = match_context.data[start_offset:match_context.offset]
+            return MatchElement(current_path, match_string, match_string, matches)
+        return match_function
+
+    def get_start_bytes(self):
+        """@return the start bytes of the first child."""
+        return self.children[0].get_start_bytes()
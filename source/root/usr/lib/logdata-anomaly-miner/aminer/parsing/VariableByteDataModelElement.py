@@ -11,6 +11,7 @@ FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
 You should have received a copy of the GNU General Public License along with
 this program. If not, see <http://www.gnu.org/licenses/>.
 """
+import re
 from aminer.parsing.MatchElement import MatchElement
 from aminer.parsing.ModelElementInterface import ModelElementInterface
 
@@ -25,21 +26,16 @@ class VariableByteDataModelElement(ModelElementInterface):
         @param alphabet the allowed letters to match data.
         """
         super().__init__(element_id, alphabet=alphabet)
+        self.alphabet_regex = re.compile(b"[" + b"".join(re.escape(bytes([byte])) for byte in alphabet) + b"]+")
 
     def get_match_element(self, path, match_context):
         """
         Find the maximum number of bytes matching the given alphabet.
         @return a match when at least one byte was found within alphabet.
         """
-        data = match_context.match_data
-        match_len = 0
-        for test_byte in data:
-            if test_byte not in self.alphabet:
-                break
-            match_len += 1
-
-        if match_len == 0:
+        match = self.alphabet_regex.match(match_context.data, match_context.offset)
+        if match is None:
             return None
-        match_data = data[:match_len]
+        match_data = match.group()
         match_context.update(match_data)
         return MatchElement(f"{path}/{self.element_id}", match_data, match_data, None)
@@ -11,9 +11,12 @@ FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
 You should have received a copy of the GNU General Public License along with
 this program. If not, see <http://www.gnu.org/licenses/>.
 """
+import re
 from aminer.parsing.MatchElement import MatchElement
 from aminer.parsing.ModelElementInterface import ModelElementInterface
 
+non_white_space_regex = re.compile(b"[^ \t]+")
+
 
 class WhiteSpaceLimitedDataModelElement(ModelElementInterface):
     """This class defines a model element that represents a variable amount of characters delimited by a white space."""
@@ -23,15 +26,9 @@ class WhiteSpaceLimitedDataModelElement(ModelElementInterface):
         Find the maximum number of bytes before encountering whitespace or end of data.
         @return a match when at least one byte was found.
         """
-        data = match_context.match_data
-        match_len = 0
-        for test_byte in data:
-            if test_byte in b" \t":
-                break
-            match_len += 1
-
-        if match_len == 0:
+        match = non_white_space_regex.match(match_context.data, match_context.offset)
+        if match is None:
             return None
-        match_data = data[:match_len]
+        match_data = match.group()
         match_context.update(match_data)
         return MatchElement(f"{path}/{self.element_id}", match_data, match_data, None)
@@ -129,7 +129,9 @@ class XmlModelElement(ModelElementInterface):
         @return the matchElement or None if model did not match.
         """
         current_path = f"{path}/{self.element_id}"
-        old_match_data = match_context.match_data
+        # The data is rewritten while parsing, so the original data and offset are restored afterwards.
+        old_data = match_context.data
+        old_offset = match_context.offset
         matches: Union[List[Union[MatchElement, None]]] = []
         try:
             index = 0
@@ -156,9 +158,13 @@ class XmlModelElement(ModelElementInterface):
             if xml_string.startswith(b"<?xml "):
                 xml_string = xml_string.split(b"?>", 1)[1]
             if not isinstance(xml_match_data, dict):
+                match_context.data = old_data
+                match_context.offset = old_offset
                 return None
         except xml.ParseError as e:
             logging.getLogger(debug_log_prefix + DEBUG_LOG_NAME).debug(e)
+            match_context.data = old_data
+            match_context.offset = old_offset
             return None
         self.dec_escapes = True
         if self.is_escaped_unicode(match_context.match_data.decode()):
@@ -172,10 +178,13 @@ class XmlModelElement(ModelElementInterface):
         if None in matches or (match_data != b"" and len(matches) > 0):
             logging.getLogger(DEBUG_LOG_NAME).debug(
                 debug_log_prefix + "get_match_element_main NONE RETURNED\n" + match_context.match_data.decode())
-            match_context.match_data = old_match_data
+            match_context.data = old_data
+            match_context.offset = old_offset
             return None
         # remove all remaining spaces and brackets.
         match_context.update(match_context.match_data)
+        match_context.data = old_data
+        match_context.offset = len(old_data)
         if len(matches) == 0:
             resulting_matches = None
         else:
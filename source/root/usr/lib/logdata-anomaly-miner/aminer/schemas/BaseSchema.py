@@ -38,6 +38,29 @@
             'default': 600,
             'min': 1
         },
+        'Core.PersistenceCodec': {
+            'required': False,
+            'type': 'string',
+            'allowed': ['json', 'binary'],
+            'default': 'json'
+        },
+        'Core.BackgroundPersistence': {
+            'required': False,
+            'type': 'boolean',
+            'default': False
+        },
+        'Core.BackupMode': {
+            'required': False,
+            'type': 'string',
+            'allowed': ['copy', 'snapshot'],
+            'default': 'copy'
+        },
+        'Core.BackupRetention': {
+            'required': False,
+            'type': 'integer',
+            'min': 0,
+            'default': 0
+        },
         'MailAlerting.TargetAddress': {
             'required': False,
             'type': 'string',
@@ -165,7 +188,10 @@
                 'json_format': {'type': 'boolean', 'required': False, 'default': False},
                 'use_real_time': {'type': 'boolean', 'required': False, 'default': False},
                 'xml_format': {'type': 'boolean', 'required': False, 'default': False},
-                'continuous_timestamp_missing_warning': {'type': 'boolean', 'required': False, 'default': False}
+                'continuous_timestamp_missing_warning': {'type': 'boolean', 'required': False, 'default': False},
+                'parser_process_count': {'type': 'integer', 'required': False, 'default': 0, 'min': 0},
+                'parser_batch_size': {'type': 'integer', 'required': False, 'default': 1000, 'min': 1},
+                'compile_parsing_model': {'type': 'boolean', 'required': False, 'default': False}
             }
         }
 }
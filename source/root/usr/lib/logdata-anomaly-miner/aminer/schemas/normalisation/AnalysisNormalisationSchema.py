@@ -215,6 +215,7 @@
                 'set_lower_limit': {'type': 'integer', 'min': 0, 'nullable': True, 'default': None},
                 'set_upper_limit': {'type': 'integer', 'min': 0, 'nullable': True, 'default': None},
                 'local_maximum_threshold': {'type': 'float', 'default': 0.2},
+                'bucket_size': {'type': ['integer', 'float'], 'nullable': True, 'default': None},
                 'combine_values': {'type': 'boolean', 'nullable': True, 'default': True},
                 'season': {'type': 'float', 'nullable': True, 'default': None},
                 'stop_learning_time': {'type': ['integer', 'float'], 'nullable': True, 'default': None, 'min': 0.000001},
@@ -18,9 +18,15 @@
                 'options': {'type': 'dict', 'schema': {'id': {'type': 'string'}, 'type': {'type': ['string', 'list', 'integer']}}},
                 'output_file_path': {'type': 'string'},
                 'pretty': {'type': 'boolean', 'default': True},
+                'batch_size': {'type': 'integer', 'default': 1, 'min': 1},
+                'batch_timeout': {'type': 'number', 'default': 1, 'min': 0},
                 'weights': {'type': 'dict', 'nullable': True, 'default': None},
                 'auto_weights': {'type': 'boolean', 'default': False},
-                'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1}
+                'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1},
+                'async': {'type': 'boolean', 'default': False},
+                'queue_size': {'type': 'integer', 'default': 1000, 'min': 1},
+                'overflow_policy': {'type': 'string', 'allowed': ['block', 'drop_oldest', 'sample'], 'default': 'block'},
+                'sample_interval': {'type': 'integer', 'default': 10, 'min': 1}
             }
         }
     }
@@ -32,6 +32,7 @@
                 'max_time_jump_seconds': {'type': 'integer', 'default': 86400},
                 'timestamp_scale': {'type': 'integer', 'default': 1},
                 'allow_all_fields': {'type': 'boolean', 'default': False},
+                'strict_json': {'type': 'boolean', 'default': False},
                 'xml_header_expected': {'type': 'boolean', 'default': False},
                 'attribute_prefix': {'type': 'string', 'default': '+'},
                 'optional_attribute_prefix': {'type': 'string', 'default': '_'},
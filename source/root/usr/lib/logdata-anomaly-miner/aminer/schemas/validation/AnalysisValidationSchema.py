@@ -236,6 +236,7 @@
                     'window_size': {'type': ['integer', 'float'], 'min': 0.001},
                     'set_upper_limit': {'type': ['integer', 'float'], 'min': 0},
                     'local_maximum_threshold': {'type': 'float', 'min': 0.000001, 'max': 1.0},
+                    'bucket_size': {'type': ['integer', 'float'], 'nullable': True, 'min': 0.001},
                     'persistence_id': {'type': 'string', 'empty': False},
                     'learn_mode': {'type': 'boolean'},
                     'output_logline': {'type': 'boolean'},
@@ -13,7 +13,11 @@
                     'type': {'type': 'string', 'forbidden': [
                         'KafkaEventHandler', 'ZmqEventHandler', 'StreamPrinterEventHandler', 'SyslogWriterEventHandler'], 'required': True},
                     'json': {'type': 'boolean'},
-                    'score': {'type': 'boolean'}
+                    'score': {'type': 'boolean'},
+                    'async': {'type': 'boolean'},
+                    'queue_size': {'type': 'integer', 'min': 1},
+                    'overflow_policy': {'type': 'string', 'allowed': ['block', 'drop_oldest', 'sample']},
+                    'sample_interval': {'type': 'integer', 'min': 1}
                 },
                 {
                     'id': {'type': 'string', 'required': True, 'empty': False},
@@ -24,6 +28,12 @@
                     'weights': {'type': 'dict', 'nullable': True},
                     'auto_weights': {'type': 'boolean'},
                     'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1},
+                    'async': {'type': 'boolean'},
+                    'queue_size': {'type': 'integer', 'min': 1},
+                    'overflow_policy': {'type': 'string', 'allowed': ['block', 'drop_oldest', 'sample']},
+                    'sample_interval': {'type': 'integer', 'min': 1},
+                    'batch_size': {'type': 'integer', 'min': 1},
+                    'batch_timeout': {'type': 'number', 'min': 0},
                     'topic': {'type': 'string', 'required': False},
                     'url': {'type': 'string', 'empty': False},
                 },
@@ -36,6 +46,12 @@
                     'weights': {'type': 'dict', 'nullable': True},
                     'auto_weights': {'type': 'boolean'},
                     'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1},
+                    'async': {'type': 'boolean'},
+                    'queue_size': {'type': 'integer', 'min': 1},
+                    'overflow_policy': {'type': 'string', 'allowed': ['block', 'drop_oldest', 'sample']},
+                    'sample_interval': {'type': 'integer', 'min': 1},
+                    'batch_size': {'type': 'integer', 'min': 1},
+                    'batch_timeout': {'type': 'number', 'min': 0},
                     'topic': {'type': 'string', 'required': True, 'empty': False},
                     'cfgfile': {'type': 'string', 'empty': False},
                     'options': {'type': 'dict', 'schema': {
@@ -50,6 +66,10 @@
                     'weights': {'type': 'dict', 'nullable': True},
                     'auto_weights': {'type': 'boolean'},
                     'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1},
+                    'async': {'type': 'boolean'},
+                    'queue_size': {'type': 'integer', 'min': 1},
+                    'overflow_policy': {'type': 'string', 'allowed': ['block', 'drop_oldest', 'sample']},
+                    'sample_interval': {'type': 'integer', 'min': 1},
                     'output_file_path': {'type': 'string', 'empty': False}
                 },
                 {
@@ -61,6 +81,10 @@
                     'weights': {'type': 'dict', 'nullable': True},
                     'auto_weights': {'type': 'boolean'},
                     'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1},
+                    'async': {'type': 'boolean'},
+                    'queue_size': {'type': 'integer', 'min': 1},
+                    'overflow_policy': {'type': 'string', 'allowed': ['block', 'drop_oldest', 'sample']},
+                    'sample_interval': {'type': 'integer', 'min': 1},
                     'instance_name': {'type': 'string', 'default': 'aminer', 'empty': False}
                 }
             ]
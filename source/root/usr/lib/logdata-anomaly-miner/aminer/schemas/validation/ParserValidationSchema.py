@@ -81,7 +81,8 @@
                     'key_parser_dict': {'type': 'dict', 'required': True},
                     'optional_key_prefix': {'type': 'string'},
                     'nullable_key_prefix': {'type': 'string'},
-                    'allow_all_fields': {'type': 'boolean'}
+                    'allow_all_fields': {'type': 'boolean'},
+                    'strict_json': {'type': 'boolean'}
                 },
                 {
                     'id': {'type': 'string', 'required': True, 'empty': False},
@@ -0,0 +1,203 @@
+"""
+This module converts python objects to a compact binary format and back.
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import logging
+import struct
+import numpy as np
+
+from aminer.AminerConfig import DEBUG_LOG_NAME
+
+# Every binary encoded object starts with this header, so it can be distinguished from JSON data.
+BINARY_FORMAT_HEADER = b"\x00AMINER\x01"
+
+# Every value starts with one of these type tags. Strings, bytes and big integers are followed by their length and data, lists, tuples,
+# sets, frozensets and dicts by their number of elements and the elements. Dicts store the key and value of every item after each other.
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_BIG_INT = 4
+TAG_FLOAT = 5
+TAG_STR = 6
+TAG_BYTES = 7
+TAG_LIST = 8
+TAG_TUPLE = 9
+TAG_SET = 10
+TAG_FROZENSET = 11
+TAG_DICT = 12
+# Numpy arrays are stored with their dtype string and shape followed by the raw data in C order.
+TAG_NDARRAY = 13
+CONTAINER_TAGS = {list: TAG_LIST, tuple: TAG_TUPLE, set: TAG_SET, frozenset: TAG_FROZENSET}
+CONTAINER_TYPES = {TAG_TUPLE: tuple, TAG_SET: set, TAG_FROZENSET: frozenset}
+
+INT_STRUCT = struct.Struct("<q")
+FLOAT_STRUCT = struct.Struct("<d")
+LENGTH_STRUCT = struct.Struct("<I")
+MIN_INT = -(1 << 63)
+MAX_INT = (1 << 63) - 1
+
+
+def dump_as_binary(input_object):
+    """Dump an input object encoded as bytes."""
+    buffer = bytearray(BINARY_FORMAT_HEADER)
+    encode_object(input_object, buffer)
+    return bytes(buffer)
+
+
+def load_binary(input_bytes):
+    """Load bytes encoded by dump_as_binary() as object structure."""
+    if not input_bytes.startswith(BINARY_FORMAT_HEADER):
+        msg = "The data does not start with the binary format header."
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise ValueError(msg)
+    try:
+        decoded_object, position = decode_object(input_bytes, len(BINARY_FORMAT_HEADER))
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        msg = f"Truncated or invalid binary data: {e}"
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise ValueError(msg)
+    if position != len(input_bytes):
+        msg = "Unexpected data after the end of the binary encoded object."
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise ValueError(msg)
+    return decoded_object
+
+
+def encode_object(term, buffer):
+    """
+    Append the binary encoding of the term to the buffer.
+    @param term the object to be encoded.
+    @param buffer a bytearray to which the encoded object is appended.
+    """
+    term_type = type(term)
+    if term_type is str:
+        data = term.encode()
+        buffer.append(TAG_STR)
+        buffer += LENGTH_STRUCT.pack(len(data))
+        buffer += data
+    elif term_type is bytes:
+        buffer.append(TAG_BYTES)
+        buffer += LENGTH_STRUCT.pack(len(term))
+        buffer += term
+    elif term_type is int:
+        if MIN_INT <= term <= MAX_INT:
+            buffer.append(TAG_INT)
+            buffer += INT_STRUCT.pack(term)
+        else:
+            data = term.to_bytes(term.bit_length() // 8 + 1, "little", signed=True)
+            buffer.append(TAG_BIG_INT)
+            buffer += LENGTH_STRUCT.pack(len(data))
+            buffer += data
+    elif term_type in (list, tuple, set, frozenset):
+        buffer.append(CONTAINER_TAGS[term_type])
+        buffer += LENGTH_STRUCT.pack(len(term))
+        for item in term:
+            encode_object(item, buffer)
+    elif term_type is dict:
+        buffer.append(TAG_DICT)
+        buffer += LENGTH_STRUCT.pack(len(term))
+        for key, value in term.items():
+            encode_object(key, buffer)
+            encode_object(value, buffer)
+    elif term_type is float:
+        buffer.append(TAG_FLOAT)
+        buffer += FLOAT_STRUCT.pack(term)
+    elif term is None:
+        buffer.append(TAG_NONE)
+    elif term is True:
+        buffer.append(TAG_TRUE)
+    elif term is False:
+        buffer.append(TAG_FALSE)
+    elif isinstance(term, np.ndarray) and not term.dtype.hasobject:
+        buffer.append(TAG_NDARRAY)
+        encode_object(term.dtype.str, buffer)
+        encode_object(term.shape, buffer)
+        encode_object(np.ascontiguousarray(term).tobytes(), buffer)
+    elif isinstance(term, np.generic):
+        encode_object(term.item(), buffer)
+    elif isinstance(term, (bool, int, float, str, bytes, list, tuple, set, frozenset, dict)):
+        # Subclasses of the supported types are stored as their base type.
+        for base_type in (bool, int, float, str, bytes, list, tuple, set, frozenset, dict):
+            if isinstance(term, base_type):
+                encode_object(base_type(term), buffer)
+                break
+    else:
+        msg = f"Unencodeable object {type(term)}"
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise Exception(msg)
+
+
+def decode_object(data, position):
+    """
+    Decode the object starting at the position in the data.
+    @return a tuple of the decoded object and the position after it.
+    """
+    tag = data[position]
+    position += 1
+    if tag == TAG_STR:
+        length = LENGTH_STRUCT.unpack_from(data, position)[0]
+        position += 4
+        return data[position:position + length].decode(), position + length
+    if tag == TAG_BYTES:
+        length = LENGTH_STRUCT.unpack_from(data, position)[0]
+        position += 4
+        return data[position:position + length], position + length
+    if tag == TAG_INT:
+        return INT_STRUCT.unpack_from(data, position)[0], position + 8
+    if TAG_LIST <= tag <= TAG_FROZENSET:
+        count = LENGTH_STRUCT.unpack_from(data, position)[0]
+        position += 4
+        items = []
+        for _ in range(count):
+            # Decode floats and integers directly, as most large lists in the persistence contain numbers.
+            item_tag = data[position]
+            if item_tag == TAG_FLOAT:
+                items.append(FLOAT_STRUCT.unpack_from(data, position + 1)[0])
+                position += 9
+            elif item_tag == TAG_INT:
+                items.append(INT_STRUCT.unpack_from(data, position + 1)[0])
+                position += 9
+            else:
+                item, position = decode_object(data, position)
+                items.append(item)
+        if tag == TAG_LIST:
+            return items, position
+        return CONTAINER_TYPES[tag](items), position
+    if tag == TAG_DICT:
+        count = LENGTH_STRUCT.unpack_from(data, position)[0]
+        position += 4
+        decoded_dict = {}
+        for _ in range(count):
+            key, position = decode_object(data, position)
+            decoded_dict[key], position = decode_object(data, position)
+        return decoded_dict, position
+    if tag == TAG_FLOAT:
+        return FLOAT_STRUCT.unpack_from(data, position)[0], position + 8
+    if tag == TAG_NONE:
+        return None, position
+    if tag == TAG_TRUE:
+        return True, position
+    if tag == TAG_FALSE:
+        return False, position
+    if tag == TAG_BIG_INT:
+        length = LENGTH_STRUCT.unpack_from(data, position)[0]
+        position += 4
+        return int.from_bytes(data[position:position + length], "little", signed=True), position + length
+    if tag == TAG_NDARRAY:
+        dtype, position = decode_object(data, position)
+        shape, position = decode_object(data, position)
+        array_data, position = decode_object(data, position)
+        # Copy the array, as arrays created from bytes are read-only.
+        return np.frombuffer(array_data, dtype=np.dtype(dtype)).reshape(shape).copy(), position
+    raise ValueError(f"Unknown type tag {tag} at position {position - 1}.")
@@ -12,20 +12,79 @@ You should have received a copy of the GNU General Public License along with
 this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
+import copy
 import errno
+import fnmatch
 import os
 import logging
 import tempfile
 import shutil
 import sys
+import threading
+import numpy as np
 
 from aminer.AminerConfig import DEBUG_LOG_NAME
 from aminer.util import SecureOSFunctions
 from aminer.util import JsonUtil
+from aminer.util import BinaryUtil
 
 # Have a registry of all persistable components. Those might be happy to be invoked before python process is terminating.
 persistable_components: list = []
 SKIP_PERSISTENCE_ID_WARNING = False
+# The journal of a persistence file is stored next to it with this suffix. While a journal is compacted, it is renamed to the second suffix.
+JOURNAL_FILE_SUFFIX = ".journal"
+COMPACTED_JOURNAL_FILE_SUFFIX = ".journal.compacting"
+# The background threads writing the snapshots of PersistenceJournals.
+compaction_threads: list = []
+# The codec used to store the persistence data. Persistence files are always loaded with the codec they were stored with.
+PERSISTENCE_CODEC_JSON = "json"
+PERSISTENCE_CODEC_BINARY = "binary"
+PERSISTENCE_CODECS = (PERSISTENCE_CODEC_JSON, PERSISTENCE_CODEC_BINARY)
+persistence_codec = PERSISTENCE_CODEC_JSON
+# The writer storing the persistence data in a background thread. If None, the persistence data is stored synchronously.
+persistence_writer = None
+# Backups are stored in this subdirectory of the persistence directory. Backups are created in a directory starting with the incomplete
+# prefix and only renamed to their final name when they are complete.
+BACKUP_DIR_NAME = "backup"
+INCOMPLETE_BACKUP_PREFIX = ".incomplete-"
+BACKUP_TIME_FORMAT = "%Y-%m-%d-%H-%M-%S"
+# The copy mode copies all persistence files into every backup, while the snapshot mode hard-links the files, which did not change since
+# the previous backup.
+BACKUP_MODE_COPY = "copy"
+BACKUP_MODE_SNAPSHOT = "snapshot"
+BACKUP_MODES = (BACKUP_MODE_COPY, BACKUP_MODE_SNAPSHOT)
+# The types of values, which are never modified and therefore not copied when taking a snapshot of the persistence data.
+IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None), frozenset)
+
+
+def set_persistence_codec(codec):
+    """Set the codec used to store the persistence data."""
+    global persistence_codec  # skipcq: PYL-W0603
+    if codec not in PERSISTENCE_CODECS:
+        msg = f"The persistence codec must be one of {PERSISTENCE_CODECS}."
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise ValueError(msg)
+    persistence_codec = codec
+
+
+def encode_persistence_data(object_data, codec=None):
+    """
+    Encode the object_data with the codec.
+    @param codec the codec used to encode the data. If None, the configured persistence codec is used.
+    @return the encoded data as bytes.
+    """
+    if codec is None:
+        codec = persistence_codec
+    if codec == PERSISTENCE_CODEC_BINARY:
+        return BinaryUtil.dump_as_binary(object_data)
+    return bytes(JsonUtil.dump_as_json(object_data), "utf-8")
+
+
+def decode_persistence_data(persistence_data):
+    """Decode persistence data encoded with any of the persistence codecs."""
+    if persistence_data.startswith(BinaryUtil.BINARY_FORMAT_HEADER):
+        return BinaryUtil.load_binary(persistence_data)
+    return JsonUtil.load_json(str(persistence_data, "utf-8"))
 
 
 def add_persistable_component(component):
@@ -81,9 +140,23 @@ def replace_persistence_file(file_name, new_file_handle):
 
 
 def persist_all():
-    """Persist all persistable components in the registry."""
+    """Persist all persistable components in the registry and wait until all persistence data and journal compactions were written."""
     for component in persistable_components:
         component.do_persist()
+    wait_for_persistence_writes()
+
+
+def wait_for_persistence_writes():
+    """Wait until all persistence data stored in the background and all snapshots of journal compactions were written."""
+    if persistence_writer is not None:
+        persistence_writer.flush()
+    wait_for_compactions()
+
+
+def wait_for_compactions():
+    """Wait until the snapshots of all journal compactions running in the background were written."""
+    while compaction_threads:
+        compaction_threads.pop().join()
 
 
 def load_json(file_name):
@@ -91,11 +164,12 @@ def load_json(file_name):
     Load persistence data from file.
     @return None if file did not yet exist.
     """
+    if persistence_writer is not None:
+        persistence_writer.flush()
     persistence_data = None
     try:
         persistence_file_handle = open_persistence_file(file_name, os.O_RDONLY | os.O_NOFOLLOW)
         persistence_data = os.read(persistence_file_handle, os.fstat(persistence_file_handle).st_size)
-        persistence_data = str(persistence_data, "utf-8")
         os.close(persistence_file_handle)
     except OSError as openOsError:
         if openOsError.errno != errno.ENOENT:
@@ -105,7 +179,7 @@ def load_json(file_name):
 
     result = None
     try:
-        result = JsonUtil.load_json(persistence_data)
+        result = decode_persistence_data(persistence_data)
     except ValueError as value_error:
         msg = f"Corrupted data in {file_name, value_error}"
         logging.getLogger(DEBUG_LOG_NAME).error(msg)
@@ -114,15 +188,303 @@ def load_json(file_name):
 
 
 def store_json(file_name, object_data):
-    """Store persistence data to file."""
-    persistence_data = JsonUtil.dump_as_json(object_data)
+    """
+    Store persistence data to file encoded with the configured persistence codec. When background persistence is enabled, only a
+    snapshot of the data is taken and the file is written by the PersistenceWriter.
+    """
+    if persistence_writer is not None:
+        persistence_writer.store(file_name, object_data)
+        return
+    write_persistence_data(file_name, object_data)
+
+
+def write_persistence_data(file_name, object_data, sync=False):
+    """
+    Encode the persistence data with the configured persistence codec and replace the file with it.
+    @param sync if True, the data is flushed to the disk before the file is replaced.
+    """
+    persistence_data = encode_persistence_data(object_data)
     # Create a temporary file within persistence directory to write new persistence data to it.
     # Thus, the old data is not modified, any error creating or writing the file will not harm the old state.
     fd, _ = tempfile.mkstemp(dir=SecureOSFunctions.tmp_base_dir_path)
-    os.write(fd, bytes(persistence_data, "utf-8"))
+    try:
+        while persistence_data:
+            persistence_data = persistence_data[os.write(fd, persistence_data):]
+        if sync:
+            os.fsync(fd)
+        create_missing_directories(file_name)
+        replace_persistence_file(file_name, fd)
+    finally:
+        os.close(fd)
+
+
+def copy_persistence_data(object_data):
+    """
+    Take a snapshot of the persistence data, which is not changed when the original data is modified afterwards. Only the containers are
+    copied, while immutable values are shared, so this is much cheaper than copy.deepcopy() or encoding the data.
+    """
+    data_type = type(object_data)
+    if data_type is list:
+        return [item if type(item) in IMMUTABLE_TYPES else copy_persistence_data(item) for item in object_data]
+    if data_type is dict:
+        return {key: value if type(value) in IMMUTABLE_TYPES else copy_persistence_data(value) for key, value in object_data.items()}
+    if data_type in IMMUTABLE_TYPES:
+        return object_data
+    if data_type is tuple:
+        return tuple(item if type(item) in IMMUTABLE_TYPES else copy_persistence_data(item) for item in object_data)
+    if data_type is set:
+        # The items of sets are hashable and therefore not modified.
+        return set(object_data)
+    if data_type is np.ndarray:
+        return object_data.copy()
+    return copy.deepcopy(object_data)
+
+
+def set_background_persistence(enabled):
+    """
+    Enable or disable storing the persistence data in a background thread. Disabling waits until all pending data was written.
+    @param enabled if True, store_json() only takes a snapshot of the data, which is written by a PersistenceWriter.
+    """
+    global persistence_writer  # skipcq: PYL-W0603
+    if enabled and persistence_writer is None:
+        persistence_writer = PersistenceWriter()
+    elif not enabled and persistence_writer is not None:
+        persistence_writer.close()
+        persistence_writer = None
+
+
+class PersistenceWriter:
+    """
+    This class stores persistence data in a background thread, so the analysis is not halted while large models are encoded and written.
+    store() only takes a snapshot of the data, which is encoded, written and synced to the disk by the background thread. When a file is
+    stored again before the previous snapshot was written, only the newest snapshot is written.
+    """
+
+    def __init__(self):
+        """Initialize the writer. The background thread is started when the first data is stored."""
+        # The snapshots waiting to be written by their file names in the order they were stored.
+        self.pending_snapshots = {}
+        # The condition is notified whenever a snapshot was added or written.
+        self.condition = threading.Condition()
+        self.writing = False
+        self.stop_flag = False
+        self.worker_thread = None
+        self.written_count = 0
+        self.superseded_count = 0
+
+    def store(self, file_name, object_data):
+        """
+        Take a snapshot of the object_data, which is written to the file by the background thread.
+        @param file_name the name of the persistence file.
+        @param object_data the persistence data, which may be modified as soon as this method returns.
+        """
+        snapshot = copy_persistence_data(object_data)
+        with self.condition:
+            if self.pending_snapshots.pop(file_name, None) is not None:
+                self.superseded_count += 1
+            self.pending_snapshots[file_name] = snapshot
+            self.condition.notify_all()
+        if self.worker_thread is None:
+            self.worker_thread = threading.Thread(target=self.run_worker, name=self.__class__.__name__, daemon=True)
+            self.worker_thread.start()
+
+    def run_worker(self):
+        """Write the pending snapshots until the writer is closed."""
+        while True:
+            with self.condition:
+                while not self.pending_snapshots and not self.stop_flag:
+                    self.condition.wait()
+                if not self.pending_snapshots:
+                    return
+                file_name = next(iter(self.pending_snapshots))
+                snapshot = self.pending_snapshots.pop(file_name)
+                self.writing = True
+            try:
+                write_persistence_data(file_name, snapshot, sync=True)
+            except Exception as e:  # skipcq: PYL-W0703
+                msg = f"Failed to store the persistence data of {file_name}: {e}"
+                logging.getLogger(DEBUG_LOG_NAME).error(msg)
+                print("ERROR: " + msg, file=sys.stderr)
+            finally:
+                with self.condition:
+                    self.written_count += 1
+                    self.writing = False
+                    self.condition.notify_all()
+
+    def flush(self):
+        """Wait until all pending snapshots were written."""
+        with self.condition:
+            while self.worker_thread is not None and (self.pending_snapshots or self.writing):
+                self.condition.wait()
+
+    def close(self):
+        """Write all pending snapshots and stop the background thread."""
+        self.flush()
+        if self.worker_thread is None:
+            return
+        with self.condition:
+            self.stop_flag = True
+            self.condition.notify_all()
+        self.worker_thread.join()
+        self.worker_thread = None
+        self.stop_flag = False
+
+
+def load_journal_records(journal_file_name):
+    """
+    Load the records of a journal file.
+    @return an empty list if the journal did not exist yet.
+    """
+    journal_data = read_persistence_file(journal_file_name)
+    if journal_data is None:
+        return []
+    records = []
+    lines = journal_data.split(b"\n")
+    for line_number, line in enumerate(lines):
+        if not line:
+            continue
+        try:
+            records.append(JsonUtil.load_json(str(line, "utf-8")))
+        except ValueError as value_error:
+            # Only the last line might be incomplete when the aminer was terminated while writing to the journal.
+            if line_number != len(lines) - 1:
+                msg = f"Corrupted data in {journal_file_name, value_error}"
+                logging.getLogger(DEBUG_LOG_NAME).error(msg)
+                raise ValueError(msg)
+            msg = f"Ignoring the incomplete last record in {journal_file_name}."
+            logging.getLogger(DEBUG_LOG_NAME).warning(msg)
+            print("Warning: " + msg, file=sys.stderr)
+    return records
+
+
+class PersistenceJournal:
+    """
+    This class implements an append-only journal for persistence data, which is only extended by records, e.g. sets of learned values.
+    Instead of storing all data with store_json() in every persistence period, only the records added since the last persist are appended
+    to a journal file next to the persistence file. When the journal contains more records than the snapshot in the persistence file, the
+    journal is compacted by storing a new snapshot in a background thread. The snapshot has the same format as the persistence file of
+    components not using a journal. Replaying a record must be idempotent, as records may be replayed twice after a failed compaction.
+    """
+
+    # The journal is never compacted before it contains this number of records.
+    min_compaction_records = 10000
+
+    def __init__(self, file_name):
+        """
+        Initialize the journal.
+        @param file_name the name of the persistence file, which contains the snapshot.
+        """
+        self.file_name = file_name
+        self.journal_file_name = file_name + JOURNAL_FILE_SUFFIX
+        self.compacted_journal_file_name = file_name + COMPACTED_JOURNAL_FILE_SUFFIX
+        self.pending_records = []
+        self.journal_record_count = 0
+        self.snapshot_record_count = 0
+        self.compaction_thread = None
+
+    def load(self):
+        """
+        Load the snapshot and the records of the journal.
+        @return a tuple of the snapshot data, which is None if no snapshot was stored yet, and the list of records added afterwards.
+        """
+        self.wait_for_compaction()
+        snapshot_data = load_json(self.file_name)
+        records = load_journal_records(self.compacted_journal_file_name) + load_journal_records(self.journal_file_name)
+        self.pending_records = []
+        self.snapshot_record_count = 0
+        if snapshot_data is not None:
+            self.snapshot_record_count = len(snapshot_data)
+        self.journal_record_count = len(records)
+        return snapshot_data, records
+
+    def add_record(self, record):
+        """Add a record, which is appended to the journal with the next persist() call."""
+        self.pending_records.append(record)
+
+    def persist(self, get_snapshot_data):
+        """
+        Append the pending records to the journal and compact the journal if it contains more records than the snapshot.
+        @param get_snapshot_data a function returning all persistence data for the snapshot. It is only called when the journal is
+               compacted and the returned object must not be modified afterwards, as it is stored in a background thread.
+        """
+        if self.pending_records:
+            journal_data = "".join(JsonUtil.dump_as_json(record) + "\n" for record in self.pending_records)
+            append_persistence_file(self.journal_file_name, bytes(journal_data, "utf-8"))
+            self.journal_record_count += len(self.pending_records)
+            self.pending_records = []
+        if self.journal_record_count > max(self.min_compaction_records, self.snapshot_record_count):
+            self.compact(get_snapshot_data())
+
+    def compact(self, snapshot_data):
+        """
+        Store the snapshot_data in a background thread and remove the journal afterwards.
+        @param snapshot_data all persistence data including the data of all journal records.
+        """
+        self.wait_for_compaction()
+        # The journal is renamed, so new records are written to a new journal while the snapshot is stored. The records of a journal left
+        # by a failed compaction are kept until a snapshot was stored successfully.
+        journal_data = read_persistence_file(self.journal_file_name)
+        if journal_data is not None:
+            if os.path.exists(self.compacted_journal_file_name):
+                append_persistence_file(self.compacted_journal_file_name, journal_data)
+                SecureOSFunctions.secure_unlink_file(self.journal_file_name)
+            else:
+                SecureOSFunctions.secure_replace_file(self.journal_file_name, self.compacted_journal_file_name)
+        self.snapshot_record_count = len(snapshot_data)
+        self.journal_record_count = 0
+        self.compaction_thread = threading.Thread(target=self.store_snapshot, args=(snapshot_data,))
+        # Only the running compactions have to be waited for.
+        compaction_threads[:] = [thread for thread in compaction_threads if thread.is_alive()]
+        compaction_threads.append(self.compaction_thread)
+        self.compaction_thread.start()
+
+    def store_snapshot(self, snapshot_data):
+        """Store the snapshot and remove the compacted journal."""
+        try:
+            write_persistence_data(self.file_name, snapshot_data, sync=True)
+        except Exception as e:  # skipcq: PYL-W0703
+            msg = f"Failed to store the snapshot of {self.file_name}: {e}"
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            print("ERROR: " + msg, file=sys.stderr)
+            return
+        try:
+            SecureOSFunctions.secure_unlink_file(self.compacted_journal_file_name)
+        except FileNotFoundError:
+            pass
+
+    def wait_for_compaction(self):
+        """Wait until the snapshot of the running compaction was stored."""
+        if self.compaction_thread is not None:
+            self.compaction_thread.join()
+            self.compaction_thread = None
+
+
+def read_persistence_file(file_name):
+    """
+    Read the content of the named file.
+    @return None if the file did not exist.
+    """
+    try:
+        fd = open_persistence_file(file_name, os.O_RDONLY | os.O_NOFOLLOW)
+    except OSError as openOsError:
+        if openOsError.errno != errno.ENOENT:
+            logging.getLogger(DEBUG_LOG_NAME).error(openOsError)
+            raise openOsError
+        return None
+    with os.fdopen(fd, "rb") as persistence_file:
+        return persistence_file.read()
+
+
+def append_persistence_file(file_name, data):
+    """Append data to the named file and create it if it does not exist."""
     create_missing_directories(file_name)
-    replace_persistence_file(file_name, fd)
-    os.close(fd)
+    fd = open_persistence_file(file_name, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_NOFOLLOW)
+    try:
+        os.fchmod(fd, 0o600)
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def create_missing_directories(file_name):
@@ -152,6 +514,152 @@ def clear_persistence(persistence_dir_name):
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
 
 
+def list_backups(persistence_dir_name):
+    """@return the sorted names of all complete backups in the persistence_dir. The oldest backup is the first one."""
+    backup_dir = os.path.join(persistence_dir_name, BACKUP_DIR_NAME)
+    if not os.path.isdir(backup_dir):
+        return []
+    return sorted(name for name in os.listdir(backup_dir) if not name.startswith(INCOMPLETE_BACKUP_PREFIX) and os.path.isdir(
+        os.path.join(backup_dir, name)))
+
+
+def create_backup(persistence_dir_name, backup_name, mode=BACKUP_MODE_COPY, retention=0):
+    """
+    Back up all persistence files into the backup directory. Files and directories starting with "backup" are not backed up.
+    @param persistence_dir_name the persistence directory.
+    @param backup_name the name of the new backup directory, usually the backup time formatted with BACKUP_TIME_FORMAT.
+    @param mode with "copy" all files are copied. With "snapshot" files with the same size, modification time and permissions as in the
+           latest backup are hard-linked to the file in the latest backup and only the changed files are copied. The backups are
+           independent of each other in both modes, so any backup can be deleted or restored.
+    @param retention the number of backups to keep. The oldest backups are deleted after the backup was created. If 0, all backups are kept.
+    @return a tuple of the numbers of copied and hard-linked files.
+    """
+    if mode not in BACKUP_MODES:
+        msg = f"The backup mode must be one of {BACKUP_MODES}."
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise ValueError(msg)
+    if not isinstance(retention, int) or isinstance(retention, bool):
+        msg = "retention has to be of the type integer."
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise TypeError(msg)
+    if retention < 0:
+        msg = "retention must not be negative."
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise ValueError(msg)
+    backup_dir = os.path.join(persistence_dir_name, BACKUP_DIR_NAME)
+    backup_path = os.path.join(backup_dir, backup_name)
+    if os.path.exists(backup_path):
+        msg = f"The backup {backup_path} already exists."
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise FileExistsError(msg)
+    link_dest = None
+    backups = list_backups(persistence_dir_name)
+    if mode == BACKUP_MODE_SNAPSHOT and backups:
+        link_dest = os.path.join(backup_dir, backups[-1])
+    incomplete_backup_path = os.path.join(backup_dir, INCOMPLETE_BACKUP_PREFIX + backup_name)
+    if os.path.exists(incomplete_backup_path):
+        shutil.rmtree(incomplete_backup_path)
+    os.makedirs(incomplete_backup_path)
+    copied_files = 0
+    linked_files = 0
+    for dir_path, dir_names, file_names in os.walk(persistence_dir_name):
+        relative_dir_path = os.path.relpath(dir_path, persistence_dir_name)
+        dir_names[:] = [name for name in dir_names if not fnmatch.fnmatch(name, "backup*")]
+        target_dir_path = os.path.normpath(os.path.join(incomplete_backup_path, relative_dir_path))
+        os.makedirs(target_dir_path, exist_ok=True)
+        for file_name in file_names:
+            if fnmatch.fnmatch(file_name, "backup*"):
+                continue
+            file_path = os.path.join(dir_path, file_name)
+            target_file_path = os.path.join(target_dir_path, file_name)
+            if link_dest is not None and link_unchanged_file(file_path, os.path.join(link_dest, relative_dir_path, file_name),
+                                                             target_file_path):
+                linked_files += 1
+                continue
+            # Persistence files are replaced by unlinking the old file first, so the file might be missing for a moment.
+            for attempt in range(3):
+                try:
+                    shutil.copy2(file_path, target_file_path)
+                    copied_files += 1
+                    break
+                except FileNotFoundError:
+                    if attempt == 2:
+                        msg = f"{file_path} was removed while creating the backup."
+                        logging.getLogger(DEBUG_LOG_NAME).warning(msg)
+        shutil.copystat(dir_path, target_dir_path)
+    os.rename(incomplete_backup_path, backup_path)
+    if retention > 0:
+        for name in list_backups(persistence_dir_name)[:-retention]:
+            shutil.rmtree(os.path.join(backup_dir, name))
+    return copied_files, linked_files
+
+
+def link_unchanged_file(file_path, previous_file_path, target_file_path):
+    """
+    Hard-link the target_file_path to the previous_file_path if the file at file_path did not change since the previous backup.
+    @return True if the file was linked.
+    """
+    try:
+        file_stat = os.stat(file_path)
+        previous_file_stat = os.stat(previous_file_path)
+        if file_stat.st_size != previous_file_stat.st_size or file_stat.st_mtime_ns != previous_file_stat.st_mtime_ns or \
+                file_stat.st_mode != previous_file_stat.st_mode:
+            return False
+        os.link(previous_file_path, target_file_path)
+    except OSError:
+        return False
+    return True
+
+
+def convert_persistence(persistence_dir_name, codec):
+    """
+    Convert all persistence files in the persistence_dir to the codec. Backups, journals and files which are no persistence files are not
+    converted.
+    @return the number of converted files.
+    """
+    if codec not in PERSISTENCE_CODECS:
+        msg = f"The persistence codec must be one of {PERSISTENCE_CODECS}."
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise ValueError(msg)
+    converted_files = 0
+    for dir_path, dir_names, file_names in os.walk(persistence_dir_name):
+        if os.path.samefile(dir_path, persistence_dir_name) and "backup" in dir_names:
+            dir_names.remove("backup")
+        for file_name in file_names:
+            if file_name.endswith((JOURNAL_FILE_SUFFIX, COMPACTED_JOURNAL_FILE_SUFFIX)):
+                continue
+            file_path = os.path.join(dir_path, file_name)
+            if os.path.islink(file_path) or not os.path.isfile(file_path):
+                continue
+            with open(file_path, "rb") as persistence_file:
+                persistence_data = persistence_file.read()
+            # Files already stored with the codec are not decoded, as the json codec does not preserve all types.
+            if persistence_data.startswith(BinaryUtil.BINARY_FORMAT_HEADER) == (codec == PERSISTENCE_CODEC_BINARY):
+                continue
+            try:
+                object_data = decode_persistence_data(persistence_data)
+            except ValueError:
+                msg = f"Skipping {file_path}, as it is no persistence file."
+                logging.getLogger(DEBUG_LOG_NAME).warning(msg)
+                continue
+            converted_data = encode_persistence_data(object_data, codec)
+            # Replace the file atomically and keep its owner and permissions.
+            file_stat = os.stat(file_path)
+            fd, tmp_file_path = tempfile.mkstemp(dir=dir_path)
+            try:
+                while converted_data:
+                    converted_data = converted_data[os.write(fd, converted_data):]
+                os.fchmod(fd, file_stat.st_mode & 0o7777)
+                os.fchown(fd, file_stat.st_uid, file_stat.st_gid)
+                # The old file must not be replaced by an incompletely written file after a crash.
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file_path, file_path)
+            converted_files += 1
+    return converted_files
+
+
 def copytree(src, dst, symlinks=False, ignore=None):
     """Copy a directory recursively. This method has no issue with the destination directory existing (shutil.copytree has)."""
     for item in os.listdir(src):
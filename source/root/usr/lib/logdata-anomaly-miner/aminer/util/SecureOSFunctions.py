@@ -139,6 +139,60 @@ def secure_open_file(file_name, flags):
     return ret_fd
 
 
+def secure_open_file_directory(file_name):
+    """
+    Open the directory of a file in the same way as secure_open_file() does.
+    @param file_name is the absolute file name as byte string
+    @return a tuple of the directory file descriptor, the name of the file relative to it and a flag telling if the caller has to close
+    the directory file descriptor.
+    """
+    if isinstance(file_name, str):
+        file_name = file_name.encode()
+    if not file_name.startswith(b'/'):
+        msg = 'Secure open on relative path not supported'
+        logging.getLogger(DEBUG_LOG_NAME).error(msg)
+        raise ValueError(msg)
+    if base_dir_path is not None:
+        if file_name.startswith(base_dir_path):
+            return base_dir_fd, file_name.replace(base_dir_path, b'').lstrip(b'/'), False
+        return base_dir_fd, file_name, False
+    dir_fd = os.open(os.path.dirname(file_name), os.O_RDONLY | os.O_NOFOLLOW | os.O_NOCTTY | os.O_DIRECTORY)
+    return dir_fd, os.path.basename(file_name), True
+
+
+def secure_unlink_file(file_name):
+    """
+    Remove a file. Like secure_open_file() the file is resolved relative to the base directory, if it was opened.
+    @param file_name is the absolute file name as byte string
+    """
+    dir_fd, base_name, close_dir_fd = secure_open_file_directory(file_name)
+    try:
+        os.unlink(base_name, dir_fd=dir_fd)  # dir_fd is ignored with absolute paths.
+    finally:
+        if close_dir_fd:
+            os.close(dir_fd)
+
+
+def secure_replace_file(src_file_name, dst_file_name):
+    """
+    Rename a file and replace the destination file if it exists. Like secure_open_file() the files are resolved relative to the base
+    directory, if it was opened.
+    @param src_file_name is the absolute file name of the renamed file as byte string
+    @param dst_file_name is the absolute new file name as byte string
+    """
+    src_dir_fd, src_base_name, close_src_dir_fd = secure_open_file_directory(src_file_name)
+    try:
+        dst_dir_fd, dst_base_name, close_dst_dir_fd = secure_open_file_directory(dst_file_name)
+        try:
+            os.replace(src_base_name, dst_base_name, src_dir_fd=src_dir_fd, dst_dir_fd=dst_dir_fd)
+        finally:
+            if close_dst_dir_fd:
+                os.close(dst_dir_fd)
+    finally:
+        if close_src_dir_fd:
+            os.close(src_dir_fd)
+
+
 def send_annotated_file_descriptor(send_socket, send_fd, type_info, annotation_data):
     """
     Send file descriptor and associated annotation data via SCM_RIGHTS.
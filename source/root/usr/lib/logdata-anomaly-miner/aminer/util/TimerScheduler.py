@@ -0,0 +1,64 @@
+"""
+This module contains a scheduler running timer callbacks when they are due.
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import heapq
+
+
+class TimerScheduler:
+    """
+    This class keeps timer callbacks in a heap ordered by their trigger time, so only the callbacks being due have to be looked at.
+    The callbacks have the same semantics as TimeTriggeredComponentInterface.do_timer(): they are invoked with the trigger time and return
+    the number of seconds until they have to be invoked again or None, when they should not be invoked anymore.
+    """
+
+    def __init__(self):
+        """Create an empty scheduler."""
+        # The heap contains tuples of the trigger time, a sequence number keeping the order of callbacks with the same trigger time and the
+        # callback itself.
+        self.timer_heap = []
+        self.next_sequence_number = 0
+
+    def schedule(self, trigger_time, callback):
+        """
+        Schedule a callback.
+        @param trigger_time the time when the callback is due.
+        @param callback the function invoked with the trigger time.
+        """
+        heapq.heappush(self.timer_heap, (trigger_time, self.next_sequence_number, callback))
+        self.next_sequence_number += 1
+
+    def get_next_trigger_time(self):
+        """@return the time when the next callback is due or None if no callback is scheduled."""
+        if not self.timer_heap:
+            return None
+        return self.timer_heap[0][0]
+
+    def run_due_timers(self, current_time, trigger_time=None):
+        """
+        Invoke all callbacks due at current_time and schedule them again relative to current_time. Each callback is invoked at most once,
+        even when it requests to be invoked again immediately.
+        @param current_time the current time of the clock used for scheduling.
+        @param trigger_time the time passed to the callbacks. If None, current_time is used.
+        @return the number of invoked callbacks.
+        """
+        if trigger_time is None:
+            trigger_time = current_time
+        due_callbacks = []
+        while self.timer_heap and self.timer_heap[0][0] <= current_time:
+            due_callbacks.append(heapq.heappop(self.timer_heap)[2])
+        for callback in due_callbacks:
+            delay = callback(trigger_time)
+            if delay is not None:
+                self.schedule(current_time + delay, callback)
+        return len(due_callbacks)